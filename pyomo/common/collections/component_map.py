@@ -51,6 +51,22 @@ class _Hasher(collections.defaultdict):
 _hasher = _Hasher()
 
 
+class _ComponentMapItemsView(collections.abc.ItemsView):
+    __slots__ = ()
+
+    # The underlying dict already stores the (obj, val) tuples: iterate
+    # over them directly (instead of looking up every key)
+    def __iter__(self):
+        return iter(self._mapping._dict.values())
+
+
+class _ComponentMapValuesView(collections.abc.ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return (val for obj, val in self._mapping._dict.values())
+
+
 class ComponentMap(AutoSlots.Mixin, collections.abc.MutableMapping):
     """
     This class is a replacement for dict that allows Pyomo
@@ -162,6 +178,14 @@ class ComponentMap(AutoSlots.Mixin, collections.abc.MutableMapping):
     def __contains__(self, obj):
         return _hasher[obj.__class__](obj) in self._dict
 
+    def items(self):
+        "D.items() -> a set-like object providing a view on D's items"
+        return _ComponentMapItemsView(self)
+
+    def values(self):
+        "D.values() -> an object providing a view on D's values"
+        return _ComponentMapValuesView(self)
+
     def clear(self):
         'D.clear() -> None.  Remove all items from D.'
         self._dict.clear()
@@ -49,6 +49,25 @@ class TestComponentMap(unittest.TestCase):
         self.assertIn((1, (2, m.v)), m.cm)
         self.assertNotIn((1, (2, m.v)), i.cm)
 
+    def test_views(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        cm = ComponentMap([(m.x[2], 5), (m.x[1], 10)])
+        items = cm.items()
+        values = cm.values()
+        self.assertEqual(len(items), 2)
+        self.assertEqual(len(values), 2)
+        self.assertEqual(list(items), [(m.x[2], 5), (m.x[1], 10)])
+        self.assertEqual(list(values), [5, 10])
+        self.assertIn((m.x[1], 10), items)
+        self.assertNotIn((m.x[1], 5), items)
+        self.assertIn(10, values)
+        # The views are dynamic
+        cm[m.x[1]] = 20
+        del cm[m.x[2]]
+        self.assertEqual(list(items), [(m.x[1], 20)])
+        self.assertEqual(list(values), [20])
+
 
 class TestDefaultComponentMap(unittest.TestCase):
     def test_default_component_map(self):
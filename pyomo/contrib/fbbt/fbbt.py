@@ -365,6 +365,7 @@ _prop_bnds_leaf_to_root_map = defaultdict(
         numeric_expr.NegationExpression: _prop_bnds_leaf_to_root_NegationExpression,
         numeric_expr.UnaryFunctionExpression: _prop_bnds_leaf_to_root_UnaryFunctionExpression,
         numeric_expr.LinearExpression: _prop_bnds_leaf_to_root_SumExpression,
+        numeric_expr.LinearArrayExpression: _prop_bnds_leaf_to_root_SumExpression,
         numeric_expr.AbsExpression: _prop_bnds_leaf_to_root_abs,
         _GeneralExpressionData: _prop_bnds_leaf_to_root_GeneralExpression,
         ScalarExpression: _prop_bnds_leaf_to_root_GeneralExpression,
@@ -943,6 +944,9 @@ _prop_bnds_root_to_leaf_map[numeric_expr.UnaryFunctionExpression] = (
 _prop_bnds_root_to_leaf_map[numeric_expr.LinearExpression] = (
     _prop_bnds_root_to_leaf_SumExpression
 )
+_prop_bnds_root_to_leaf_map[numeric_expr.LinearArrayExpression] = (
+    _prop_bnds_root_to_leaf_SumExpression
+)
 _prop_bnds_root_to_leaf_map[numeric_expr.AbsExpression] = _prop_bnds_root_to_leaf_abs
 
 _prop_bnds_root_to_leaf_map[_GeneralExpressionData] = (
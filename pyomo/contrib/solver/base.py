@@ -10,8 +10,11 @@
 #  ___________________________________________________________________________
 
 import abc
+import asyncio
 import enum
-from typing import Sequence, Dict, Optional, Mapping, NoReturn, List, Tuple
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Sequence, Dict, Optional, Mapping, NoReturn, List, Tuple, Iterable
 import os
 
 from pyomo.core.base.constraint import Constraint, _GeneralConstraintData
@@ -126,6 +129,88 @@ class SolverBase(abc.ABC):
             A results object
         """
 
+    async def solve_async(self, model: _BlockData, **kwargs) -> Results:
+        """
+        Solve a Pyomo model without blocking the running event loop.
+
+        The (blocking) :meth:`solve` method is run in the event loop's
+        default executor (a thread pool).  Solvers that run as an
+        external process (e.g., ipopt) do not hold the GIL while the
+        solver is running, so several independent models can be solved
+        concurrently::
+
+            results = await asyncio.gather(*(opt.solve_async(m) for m in models))
+
+        Note that persistent solvers hold a single solver instance, so
+        concurrent calls to a persistent solver must solve the same
+        model.
+
+        Parameters
+        ----------
+        model: _BlockData
+            The Pyomo model to be solved
+        **kwargs
+            Keyword arguments passed on to :meth:`solve`
+
+        Returns
+        -------
+        results: :class:`Results<pyomo.contrib.solver.results.Results>`
+            A results object
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.solve, model, **kwargs)
+        )
+
+    def solve_many(
+        self, models: Iterable[_BlockData], max_workers: Optional[int] = None, **kwargs
+    ) -> List[Results]:
+        """
+        Solve several independent Pyomo models concurrently.
+
+        Up to `max_workers` calls to :meth:`solve` are run at the same
+        time (in a thread pool).  The solutions are loaded into each
+        model (subject to the ``load_solutions`` option) as the
+        individual solves finish, and each Results object records the
+        timing for its own solve.  Persistent solvers solve the models
+        one at a time.
+
+        Parameters
+        ----------
+        models: Iterable[_BlockData]
+            The Pyomo models to be solved
+        max_workers: int, optional
+            The maximum number of concurrent solves.  Defaults to the
+            :class:`ThreadPoolExecutor<concurrent.futures.ThreadPoolExecutor>`
+            default.
+        **kwargs
+            Keyword arguments passed on to every call to :meth:`solve`
+
+        Returns
+        -------
+        results: List[:class:`Results<pyomo.contrib.solver.results.Results>`]
+            The results objects, in the same order as `models`
+        """
+        models = list(models)
+        if self.is_persistent():
+            max_workers = 1
+        results = [None] * len(models)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.solve, model, **kwargs): i
+                for i, model in enumerate(models)
+            }
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            except:
+                # Do not start any more solves; the solves that are
+                # already running will finish before we return
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+
     @abc.abstractmethod
     def available(self) -> bool:
         """Test if the solver is available on this system.
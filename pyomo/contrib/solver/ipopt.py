@@ -14,10 +14,16 @@ import os
 import subprocess
 import datetime
 import io
+import threading
 from typing import Mapping, Optional, Sequence
 
 from pyomo.common import Executable
-from pyomo.common.config import ConfigValue, document_kwargs_from_configdict, ConfigDict
+from pyomo.common.config import (
+    Bool,
+    ConfigValue,
+    document_kwargs_from_configdict,
+    ConfigDict,
+)
 from pyomo.common.errors import (
     PyomoException,
     DeveloperError,
@@ -32,7 +38,8 @@ from pyomo.contrib.solver.base import SolverBase
 from pyomo.contrib.solver.config import SolverConfig
 from pyomo.contrib.solver.results import Results, TerminationCondition, SolutionStatus
 from pyomo.contrib.solver.sol_reader import parse_sol_file
-from pyomo.contrib.solver.solution import SolSolutionLoader
+from pyomo.contrib.solver.solution import SolSolutionLoader, _unscaled_values
+from pyomo.contrib.solver.warm_start import WarmStartCache, initial_values
 from pyomo.common.tee import TeeStream
 from pyomo.core.expr.visitor import replace_expressions
 from pyomo.core.expr.numvalue import value
@@ -76,9 +83,49 @@ class IpoptConfig(SolverConfig):
         self.writer_config: ConfigDict = self.declare(
             'writer_config', NLWriter.CONFIG()
         )
+        self.warm_start: bool = self.declare(
+            'warm_start',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description="If True, start ipopt from the solution of the "
+                "previous (warm start enabled) solve of this model (or, if "
+                "there is none, of the most recently solved model, mapped onto "
+                "this model by ComponentUID): the cached primal values, "
+                "constraint duals, and bound multipliers are passed to ipopt "
+                "(with warm_start_init_point=yes).  Within solve_many(), models "
+                "are only warm started from their own solutions.  The time and "
+                "iterations saved relative to the first (cold) solve are "
+                "reported in "
+                "results.timing_info.warm_start_time_saved and "
+                "results.extra_info.warm_start_iterations_saved.",
+            ),
+        )
 
 
 class IpoptSolutionLoader(SolSolutionLoader):
+    def _warm_start_data(self):
+        """Return the primal values, the constraint duals and the ipopt
+        bound multipliers (in the NL file order)
+
+        The bound multipliers are returned as the ``ipopt_zL_in`` /
+        ``ipopt_zU_in`` suffix values (maps of variable positions to
+        values).  Note that they are not unscaled: the NL writer exports
+        these suffixes verbatim (only the 'dual' suffix is scaled by the
+        writer).
+        """
+        nl_info = self._nl_info
+        scaling = nl_info.scaling
+        primals = _unscaled_values(
+            self._sol_data.primals, scaling.variables if scaling else None
+        )
+        var_suffixes = {}
+        for name in ('ipopt_zL', 'ipopt_zU'):
+            data = self._sol_data.var_suffixes.get(name + '_out', None)
+            if data:
+                var_suffixes[name + '_in'] = data
+        return primals, self._unscaled_duals(), var_suffixes
+
     def get_reduced_costs(
         self, vars_to_load: Optional[Sequence[_GeneralVarData]] = None
     ) -> Mapping[_GeneralVarData, float]:
@@ -202,9 +249,15 @@ class Ipopt(SolverBase):
     def __init__(self, **kwds):
         super().__init__(**kwds)
         self._writer = NLWriter()
+        # The writer (and its configuration and incremental cache) is
+        # shared by all calls to solve(): serialize access to it so that
+        # models can be solved concurrently (see solve_many())
+        self._writer_lock = threading.Lock()
         self._available_cache = None
         self._version_cache = None
         self._version_timeout = 2
+        # The solutions of the solves run with warm_start=True
+        self.warm_start_cache = WarmStartCache()
 
     def available(self, config=None):
         if config is None:
@@ -294,6 +347,19 @@ class Ipopt(SolverBase):
             timer = HierarchicalTimer()
         else:
             timer = config.timer
+        warm_start_primals = None
+        writer_options = {}
+        if config.warm_start and self.warm_start_cache:
+            timer.start('warm_start')
+            warm_start = self.warm_start_cache.retrieve(model)
+            if warm_start is not None:
+                warm_start_primals, duals, export_suffixes = warm_start
+                if duals:
+                    export_suffixes['dual'] = duals
+                writer_options['export_suffixes'] = export_suffixes
+                if 'warm_start_init_point' not in config.solver_options:
+                    config.solver_options['warm_start_init_point'] = 'yes'
+            timer.stop('warm_start')
         StaleFlagManager.mark_all_as_stale()
         with TempfileManager.new_context() as tempfile:
             if config.working_dir is None:
@@ -311,18 +377,20 @@ class Ipopt(SolverBase):
                 basename + '.row', 'w'
             ) as row_file, open(basename + '.col', 'w') as col_file:
                 timer.start('write_nl_file')
-                self._writer.config.set_value(config.writer_config)
-                try:
-                    nl_info = self._writer.write(
-                        model,
-                        nl_file,
-                        row_file,
-                        col_file,
-                        symbolic_solver_labels=config.symbolic_solver_labels,
-                    )
-                    proven_infeasible = False
-                except InfeasibleConstraintException:
-                    proven_infeasible = True
+                with self._writer_lock, initial_values(warm_start_primals or {}):
+                    self._writer.config.set_value(config.writer_config)
+                    try:
+                        nl_info = self._writer.write(
+                            model,
+                            nl_file,
+                            row_file,
+                            col_file,
+                            symbolic_solver_labels=config.symbolic_solver_labels,
+                            **writer_options,
+                        )
+                        proven_infeasible = False
+                    except InfeasibleConstraintException:
+                        proven_infeasible = True
                 timer.stop('write_nl_file')
             if not proven_infeasible and len(nl_info.variables) > 0:
                 # Get a copy of the environment to pass to the subprocess
@@ -464,6 +532,11 @@ class Ipopt(SolverBase):
                     )
                 )
 
+        if config.warm_start:
+            timer.start('warm_start')
+            self._update_warm_start(model, results, warm_start_primals is not None)
+            timer.stop('warm_start')
+
         results.solver_configuration = config
         if not proven_infeasible and len(nl_info.variables) > 0:
             results.solver_log = ostreams[0].getvalue()
@@ -477,6 +550,38 @@ class Ipopt(SolverBase):
         results.timing_info.timer = timer
         return results
 
+    def solve_many(self, models, max_workers=None, **kwargs):
+        # The concurrent solves finish in an arbitrary order: only warm
+        # start each model from its own cached solution
+        with self.warm_start_cache.isolated():
+            return super().solve_many(models, max_workers=max_workers, **kwargs)
+
+    def _update_warm_start(self, model, results, warm_started):
+        loader = results.solution_loader
+        if results.solution_status in {
+            SolutionStatus.feasible,
+            SolutionStatus.optimal,
+        } and isinstance(loader, IpoptSolutionLoader):
+            primals, duals, var_suffixes = loader._warm_start_data()
+            self.warm_start_cache.store(
+                model,
+                loader._nl_info.variables,
+                loader._nl_info.constraints,
+                primals,
+                duals,
+                var_suffixes,
+            )
+        solve_time = None
+        if 'total_seconds' in results.timing_info:
+            solve_time = results.timing_info.total_seconds
+        time_saved, iterations_saved = self.warm_start_cache.record_solve(
+            warm_started, solve_time, results.iteration_count
+        )
+        results.extra_info.warm_start = warm_started
+        if warm_started:
+            results.timing_info.warm_start_time_saved = time_saved
+            results.extra_info.warm_start_iterations_saved = iterations_saved
+
     def _parse_ipopt_output(self, stream: io.StringIO):
         """
         Parse an IPOPT output file and return:
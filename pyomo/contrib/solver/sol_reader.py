@@ -12,7 +12,10 @@
 
 from typing import Tuple, Dict, Any, List
 import io
+import warnings
+from itertools import islice
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.repn.plugins.nl_writer import NLWriterInfo
 from pyomo.contrib.solver.results import Results, SolutionStatus, TerminationCondition
@@ -20,6 +23,8 @@ from pyomo.contrib.solver.results import Results, SolutionStatus, TerminationCon
 
 class SolFileData:
     def __init__(self) -> None:
+        # Note: parse_sol_file() stores the primals and duals as numpy
+        # arrays (when numpy is available)
         self.primals: List[float] = list()
         self.duals: List[float] = list()
         self.var_suffixes: Dict[str, Dict[int, Any]] = dict()
@@ -29,6 +34,48 @@ class SolFileData:
         self.other: List(str) = list()
 
 
+def _parse_numbers(text, n):
+    """Convert the `n` whitespace-separated numbers in `text` to an array
+
+    Returns None if numpy is not available or if `text` does not
+    contain exactly `n` numbers, so that the caller can fall back on the
+    (slower) line-by-line parser, which raises the appropriate
+    exception for malformed files.
+
+    """
+    if not numpy_available:
+        return None
+    with warnings.catch_warnings():
+        # numpy warns (and will eventually raise) if the text contains
+        # anything other than numbers
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            data = np.fromstring(text, sep=' ')
+        except ValueError:
+            return None
+    if len(data) != n:
+        return None
+    return data
+
+
+def _parse_suffix_entries(lines, convert_function):
+    """Return the (index, value) pairs for the suffix entry `lines`"""
+    data = _parse_numbers(''.join(lines), 2 * len(lines))
+    if data is not None:
+        data = data.reshape(-1, 2)
+        index = data[:, 0].astype(np.int64)
+        vals = data[:, 1]
+        if convert_function is int:
+            int_vals = vals.astype(np.int64)
+            if (int_vals != vals).any():
+                data = None
+            vals = int_vals
+        if data is not None and (index == data[:, 0]).all():
+            return zip(index.tolist(), vals.tolist())
+    lines = [line.split() for line in lines]
+    return ((int(line[0]), convert_function(line[1])) for line in lines)
+
+
 def parse_sol_file(
     sol_file: io.TextIOBase, nl_info: NLWriterInfo, result: Results
 ) -> Tuple[Results, SolFileData]:
@@ -77,8 +124,26 @@ developers.
     assert number_of_cons == len(nl_info.constraints)
     assert number_of_vars == len(nl_info.variables)
 
-    duals = [float(sol_file.readline()) for i in range(number_of_cons)]
-    variable_vals = [float(sol_file.readline()) for i in range(number_of_vars)]
+    # The duals and primals (one number per line) are followed by the
+    # "objno" line.  Convert the entire block at once (this is
+    # significantly faster than calling float() on each line for large
+    # models).
+    remainder = sol_file.read()
+    end = remainder.find('objno')
+    if end < 0:
+        end = len(remainder)
+    values = _parse_numbers(remainder[:end], number_of_cons + number_of_vars)
+    if values is not None:
+        duals = values[:number_of_cons]
+        variable_vals = values[number_of_cons:]
+        sol_file = io.StringIO(remainder[end:])
+    else:
+        sol_file = io.StringIO(remainder)
+        duals = [float(sol_file.readline()) for i in range(number_of_cons)]
+        variable_vals = [float(sol_file.readline()) for i in range(number_of_vars)]
+        if numpy_available:
+            duals = np.array(duals, dtype=float)
+            variable_vals = np.array(variable_vals, dtype=float)
 
     # Parse the exit code line and capture it
     exit_code = [0, 0]
@@ -171,37 +236,21 @@ developers.
             # Add any arbitrary string lines to the "other" list
             for line in range(number_of_string_lines):
                 sol_data.other.append(sol_file.readline())
+            lines = list(islice(sol_file, number_of_entries))
+            if len(lines) != number_of_entries:
+                raise PyomoException(
+                    f"ERROR READING `sol` FILE. Expected {number_of_entries} "
+                    f"entries for suffix '{suffix_name}'; received {len(lines)}."
+                )
+            entries = _parse_suffix_entries(lines, convert_function)
             if data_type == 0:  # Var
-                sol_data.var_suffixes[suffix_name] = dict()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    var_ndx = int(suf_line[0])
-                    sol_data.var_suffixes[suffix_name][var_ndx] = convert_function(
-                        suf_line[1]
-                    )
+                sol_data.var_suffixes[suffix_name] = dict(entries)
             elif data_type == 1:  # Con
-                sol_data.con_suffixes[suffix_name] = dict()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    con_ndx = int(suf_line[0])
-                    sol_data.con_suffixes[suffix_name][con_ndx] = convert_function(
-                        suf_line[1]
-                    )
+                sol_data.con_suffixes[suffix_name] = dict(entries)
             elif data_type == 2:  # Obj
-                sol_data.obj_suffixes[suffix_name] = dict()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    obj_ndx = int(suf_line[0])
-                    sol_data.obj_suffixes[suffix_name][obj_ndx] = convert_function(
-                        suf_line[1]
-                    )
+                sol_data.obj_suffixes[suffix_name] = dict(entries)
             elif data_type == 3:  # Prob
-                sol_data.problem_suffixes[suffix_name] = list()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    sol_data.problem_suffixes[suffix_name].append(
-                        convert_function(suf_line[1])
-                    )
+                sol_data.problem_suffixes[suffix_name] = [val for _, val in entries]
             line = sol_file.readline()
 
     return result, sol_data
@@ -16,6 +16,7 @@ from pyomo.core.base.constraint import _GeneralConstraintData
 from pyomo.core.base.var import _GeneralVarData
 from pyomo.core.expr import value
 from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.errors import DeveloperError
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.contrib.solver.sol_reader import SolFileData
@@ -23,6 +24,23 @@ from pyomo.repn.plugins.nl_writer import NLWriterInfo
 from pyomo.core.expr.visitor import replace_expressions
 
 
+def _unscaled_values(values, scale):
+    """Return the list of `values` divided by the scaling factors `scale`
+
+    The values read from a sol file are numpy arrays (if numpy is
+    available): this unscales them in bulk and converts them to native
+    Python floats.
+
+    """
+    if numpy_available and isinstance(values, np.ndarray):
+        if scale is not None:
+            values = values / np.asarray(scale, dtype=float)
+        return values.tolist()
+    if scale is None:
+        return list(values)
+    return [val / s for val, s in zip(values, scale)]
+
+
 class SolutionLoaderBase(abc.ABC):
     """
     Base class for all future SolutionLoader classes.
@@ -152,16 +170,14 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
-            if self._nl_info.scaling:
-                for v, val, scale in zip(
-                    self._nl_info.variables,
-                    self._sol_data.primals,
-                    self._nl_info.scaling.variables,
-                ):
-                    v.set_value(val / scale, skip_validation=True)
-            else:
-                for v, val in zip(self._nl_info.variables, self._sol_data.primals):
-                    v.set_value(val, skip_validation=True)
+            scaling = self._nl_info.scaling
+            for v, val in zip(
+                self._nl_info.variables,
+                _unscaled_values(
+                    self._sol_data.primals, scaling.variables if scaling else None
+                ),
+            ):
+                v.set_value(val, skip_validation=True)
 
         for v, v_expr in self._nl_info.eliminated_vars:
             v.value = value(v_expr)
@@ -180,14 +196,15 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
-            if self._nl_info.scaling is None:
-                scale_list = [1] * len(self._nl_info.variables)
-            else:
-                scale_list = self._nl_info.scaling.variables
-            for v, val, scale in zip(
-                self._nl_info.variables, self._sol_data.primals, scale_list
-            ):
-                val_map[id(v)] = val / scale
+            scaling = self._nl_info.scaling
+            val_map.update(
+                zip(
+                    map(id, self._nl_info.variables),
+                    _unscaled_values(
+                        self._sol_data.primals, scaling.variables if scaling else None
+                    ),
+                )
+            )
 
         for v, v_expr in self._nl_info.eliminated_vars:
             val = replace_expressions(v_expr, substitution_map=val_map)
@@ -204,6 +221,21 @@ class SolSolutionLoader(SolutionLoaderBase):
 
         return res
 
+    def _unscaled_duals(self):
+        """Return the list of duals for the constraints in the NL file"""
+        duals = self._sol_data.duals
+        is_array = numpy_available and isinstance(duals, np.ndarray)
+        if self._nl_info.scaling is not None:
+            scale_list = self._nl_info.scaling.constraints
+            obj_scale = self._nl_info.scaling.objectives[0]
+            if is_array:
+                duals = duals * np.asarray(scale_list, dtype=float) / obj_scale
+            else:
+                duals = [val * s / obj_scale for val, s in zip(duals, scale_list)]
+        if is_array:
+            duals = duals.tolist()
+        return duals
+
     def get_duals(
         self, cons_to_load: Optional[Sequence[_GeneralConstraintData]] = None
     ) -> Dict[_GeneralConstraintData, float]:
@@ -223,19 +255,12 @@ class SolSolutionLoader(SolutionLoaderBase):
                 "have happened. Report this error to the Pyomo Developers."
             )
         res = dict()
-        if self._nl_info.scaling is None:
-            scale_list = [1] * len(self._nl_info.constraints)
-            obj_scale = 1
-        else:
-            scale_list = self._nl_info.scaling.constraints
-            obj_scale = self._nl_info.scaling.objectives[0]
+        duals = self._unscaled_duals()
         if cons_to_load is None:
-            cons_to_load = set(self._nl_info.constraints)
+            res.update(zip(self._nl_info.constraints, duals))
         else:
             cons_to_load = set(cons_to_load)
-        for c, val, scale in zip(
-            self._nl_info.constraints, self._sol_data.duals, scale_list
-        ):
-            if c in cons_to_load:
-                res[c] = val * scale / obj_scale
+            for c, val in zip(self._nl_info.constraints, duals):
+                if c in cons_to_load:
+                    res[c] = val
         return res
@@ -55,3 +55,47 @@ class TestIpopt(unittest.TestCase):
         # Change value on a solve call
         # model = self.create_model()
         # result = solver.solve(model, tee=True)
+
+
+@unittest.skipIf(
+    not SolverFactory('ipopt').available(), "The 'ipopt' command is not available"
+)
+class TestIpoptWarmStart(unittest.TestCase):
+    def create_model(self, p=1.0):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(0, None), initialize=1)
+        m.y = pyo.Var(bounds=(0, None), initialize=1)
+        m.p = pyo.Param(initialize=p, mutable=True)
+        m.obj = pyo.Objective(expr=(m.x - m.p) ** 2 + (m.y - 2 * m.p) ** 2)
+        m.c = pyo.Constraint(expr=m.x + m.y <= 2)
+        return m
+
+    def test_warm_start(self):
+        solver = SolverFactory('ipopt')
+        m = self.create_model()
+        res = solver.solve(m, warm_start=True)
+        self.assertFalse(res.extra_info.warm_start)
+        self.assertIsNotNone(solver.warm_start_cache.cold_iterations)
+        x, y = m.x.value, m.y.value
+
+        # Re-solve a perturbed clone of the model from the cached solution
+        m2 = self.create_model(1.01)
+        m2.x.value = m2.y.value = 0
+        res = solver.solve(m2, warm_start=True)
+        self.assertTrue(res.extra_info.warm_start)
+        self.assertIsNotNone(res.timing_info.warm_start_time_saved)
+        self.assertIsNotNone(res.extra_info.warm_start_iterations_saved)
+        self.assertLessEqual(
+            res.iteration_count, solver.warm_start_cache.cold_iterations
+        )
+        self.assertNotAlmostEqual(m2.x.value, x, places=6)
+        self.assertAlmostEqual(m2.x.value + m2.y.value, 2, places=6)
+        # The original model was not modified
+        self.assertEqual((m.x.value, m.y.value), (x, y))
+
+        # Re-solving a model starts from its own cached solution
+        m.p = 1.02
+        res = solver.solve(m, warm_start=True)
+        self.assertTrue(res.extra_info.warm_start)
+        self.assertIsNone(solver.warm_start_cache._solutions[m].cuids)
+        self.assertAlmostEqual(m.x.value + m.y.value, 2, places=6)
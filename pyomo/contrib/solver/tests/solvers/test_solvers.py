@@ -1630,6 +1630,26 @@ class TestSolvers(unittest.TestCase):
             self.assertAlmostEqual(rc[m.x], 1)
             self.assertAlmostEqual(rc[m.y], 0)
 
+    @parameterized.expand(input=all_solvers)
+    def test_solve_many(self, name: str, opt_class: Type[SolverBase]):
+        opt: SolverBase = opt_class()
+        if not opt.available():
+            raise unittest.SkipTest(f'Solver {opt.name} not available.')
+        models = []
+        for i in range(6):
+            m = pe.ConcreteModel()
+            m.x = pe.Var(bounds=(i, None))
+            m.y = pe.Var()
+            m.obj = pe.Objective(expr=m.y)
+            m.c = pe.Constraint(expr=m.y >= m.x)
+            models.append(m)
+        results = opt.solve_many(models, max_workers=3)
+        for i, (m, res) in enumerate(zip(models, results)):
+            self.assertEqual(res.solution_status, SolutionStatus.optimal)
+            self.assertAlmostEqual(res.incumbent_objective, i)
+            self.assertAlmostEqual(m.x.value, i)
+            self.assertIsNotNone(res.timing_info.wall_time)
+
 
 class TestLegacySolverInterface(unittest.TestCase):
     @parameterized.expand(input=all_solvers)
@@ -9,11 +9,40 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
 import os
+import threading
 
 from pyomo.common import unittest
 from pyomo.common.config import ConfigDict
 from pyomo.contrib.solver import base
+from pyomo.contrib.solver.results import Results
+
+
+class _ConcurrentSolver(base.SolverBase):
+    """A mock solver whose solves only finish if `n` run concurrently"""
+
+    def __init__(self, n, **kwds):
+        super().__init__(**kwds)
+        self.barrier = threading.Barrier(n, timeout=10)
+        self.threads = set()
+
+    def solve(self, model, **kwds):
+        config = self.config(value=kwds)
+        self.threads.add(threading.get_ident())
+        if model is None:
+            raise RuntimeError('bad model')
+        self.barrier.wait()
+        results = Results()
+        results.iteration_count = model
+        results.solver_name = self.name
+        return results
+
+    def available(self):
+        return self.Availability.FullLicense
+
+    def version(self):
+        return (1, 0)
 
 
 class TestSolverBase(unittest.TestCase):
@@ -29,6 +58,8 @@ class TestSolverBase(unittest.TestCase):
             'available',
             'is_persistent',
             'solve',
+            'solve_async',
+            'solve_many',
             'version',
         ]
         method_list = [
@@ -76,6 +107,37 @@ class TestSolverBase(unittest.TestCase):
         self.instance = base.SolverBase(name='my_unique_name')
         self.assertEqual(self.instance.name, 'my_unique_name')
 
+    def test_solve_many(self):
+        # The barrier is only passed if all 4 solves run concurrently
+        opt = _ConcurrentSolver(4)
+        results = opt.solve_many(range(4), max_workers=4, tee=False)
+        self.assertEqual([res.iteration_count for res in results], [0, 1, 2, 3])
+        self.assertEqual(len(opt.threads), 4)
+        self.assertEqual(opt.solve_many([]), [])
+
+    def test_solve_many_error(self):
+        opt = _ConcurrentSolver(1)
+        with self.assertRaisesRegex(RuntimeError, 'bad model'):
+            opt.solve_many([0, None, 2], max_workers=1)
+
+    def test_solve_many_persistent(self):
+        # Persistent solvers solve the models one at a time
+        opt = _ConcurrentSolver(1)
+        with unittest.mock.patch.object(opt, 'is_persistent', return_value=True):
+            results = opt.solve_many(range(3), max_workers=3)
+        self.assertEqual([res.iteration_count for res in results], [0, 1, 2])
+        self.assertEqual(len(opt.threads), 1)
+
+    def test_solve_async(self):
+        opt = _ConcurrentSolver(3)
+
+        async def _solve():
+            return await asyncio.gather(*(opt.solve_async(i) for i in range(3)))
+
+        results = asyncio.run(_solve())
+        self.assertEqual([res.iteration_count for res in results], [0, 1, 2])
+        self.assertEqual(len(opt.threads), 3)
+
 
 class TestPersistentSolverBase(unittest.TestCase):
     def test_abstract_member_list(self):
@@ -121,6 +183,8 @@ class TestPersistentSolverBase(unittest.TestCase):
             'set_instance',
             'set_objective',
             'solve',
+            'solve_async',
+            'solve_many',
             'update_parameters',
             'update_variables',
             'version',
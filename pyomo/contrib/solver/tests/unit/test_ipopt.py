@@ -38,6 +38,7 @@ class TestIpoptSolverConfig(unittest.TestCase):
         # Unique to this object
         self.assertIsInstance(config.executable, type(Executable('path')))
         self.assertIsInstance(config.writer_config, type(NLWriter.CONFIG()))
+        self.assertFalse(config.warm_start)
 
     def test_custom_instantiation(self):
         config = ipopt.IpoptConfig(description="A description")
@@ -86,8 +87,11 @@ class TestIpoptInterface(unittest.TestCase):
             'available',
             'is_persistent',
             'solve',
+            'solve_async',
+            'solve_many',
             'version',
             'name',
+            'warm_start_cache',
         ]
         method_list = [method for method in dir(opt) if method.startswith('_') is False]
         self.assertEqual(sorted(expected_list), sorted(method_list))
@@ -132,6 +136,19 @@ class TestIpoptInterface(unittest.TestCase):
         self.assertIsNone(opt._version_cache[0])
         self.assertIsNone(opt._version_cache[1])
 
+    def test_solve_many_isolates_warm_start(self):
+        opt = ipopt.Ipopt()
+        isolated = []
+
+        def solve(model, **kwds):
+            isolated.append(opt.warm_start_cache._isolated)
+            return model
+
+        opt.solve = solve
+        self.assertEqual(opt.solve_many(range(3), max_workers=2), [0, 1, 2])
+        self.assertEqual(isolated, [1, 1, 1])
+        self.assertEqual(opt.warm_start_cache._isolated, 0)
+
     def test_write_options_file(self):
         # If we have no options, we should get false back
         opt = ipopt.Ipopt()
@@ -9,14 +9,34 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+import os
+
 from pyomo.common import unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.errors import PyomoException
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.contrib.solver.results import Results, SolutionStatus
 from pyomo.contrib.solver.sol_reader import parse_sol_file, SolFileData
+from pyomo.repn.plugins.nl_writer import NLWriterInfo
 
 currdir = this_file_dir()
 
 
+def _nl_info(n_vars, n_cons):
+    return NLWriterInfo(
+        var=list(range(n_vars)),
+        con=list(range(n_cons)),
+        obj=[],
+        external_libs=[],
+        row_labels=None,
+        col_labels=None,
+        eliminated_vars=[],
+        scaling=None,
+    )
+
+
 class TestSolFileData(unittest.TestCase):
     def test_default_instantiation(self):
         instance = SolFileData()
@@ -49,3 +69,79 @@ class TestSolParser(unittest.TestCase):
 
     def test_infeasible2(self):
         pass
+
+    def _parse(self, fname, n_vars, n_cons):
+        with open(os.path.join(currdir, 'sol_files', fname)) as FILE:
+            return parse_sol_file(FILE, _nl_info(n_vars, n_cons), Results())
+
+    def test_conopt_optimal(self):
+        result, sol_data = self._parse('conopt_optimal.sol', 1, 1)
+        self.assertEqual(result.solution_status, SolutionStatus.optimal)
+        self.assertEqual(list(sol_data.primals), [1])
+        self.assertEqual(list(sol_data.duals), [1])
+        self.assertEqual(sol_data.var_suffixes, {'sstatus': {0: 1}})
+        self.assertEqual(sol_data.con_suffixes, {'sstatus': {0: 3}})
+        self.assertIs(type(sol_data.var_suffixes['sstatus'][0]), int)
+
+    def test_large_solution(self):
+        result, sol_data = self._parse('infeasible1.sol', 86, 242)
+        self.assertEqual(result.solution_status, SolutionStatus.infeasible)
+        # Compare against a line-by-line parse of the file
+        with open(os.path.join(currdir, 'sol_files', 'infeasible1.sol')) as FILE:
+            lines = FILE.read().splitlines()
+        start = lines.index('Options') + 9
+        self.assertEqual(
+            list(sol_data.duals), [float(x) for x in lines[start : start + 242]]
+        )
+        self.assertEqual(
+            list(sol_data.primals),
+            [float(x) for x in lines[start + 242 : start + 242 + 86]],
+        )
+        if numpy_available:
+            self.assertIsInstance(sol_data.primals, np.ndarray)
+            self.assertIsInstance(sol_data.duals, np.ndarray)
+        self.assertEqual(
+            sorted(sol_data.var_suffixes), ['ipopt_zL_out', 'ipopt_zU_out']
+        )
+        zU = sol_data.var_suffixes['ipopt_zU_out']
+        self.assertEqual(list(zU), list(range(22, 82)))
+        self.assertEqual(zU[22], -1.327369555645263e-09)
+        self.assertIs(type(zU[22]), float)
+        zL = sol_data.var_suffixes['ipopt_zL_out']
+        self.assertEqual(len(zL), 86)
+        self.assertEqual(zL[82], 500.00000026951534)
+
+    def test_bad_values(self):
+        sol = "msg\nOptions\n3\n1\n1\n0\n1\n1\n2\n2\n1.5\n2.5\nabc\nobjno 0 0\n"
+        with self.assertRaisesRegex(ValueError, 'abc'):
+            parse_sol_file(io.StringIO(sol), _nl_info(2, 1), Results())
+        # Missing values
+        sol = "msg\nOptions\n3\n1\n1\n0\n1\n1\n2\n2\n1.5\n2.5\nobjno 0 0\n"
+        with self.assertRaisesRegex(ValueError, 'objno'):
+            parse_sol_file(io.StringIO(sol), _nl_info(2, 1), Results())
+        # Extra values
+        sol = "msg\nOptions\n3\n1\n1\n0\n1\n1\n2\n2\n1\n2\n3\n4\nobjno 0 0\n"
+        with self.assertRaisesRegex(PyomoException, 'Expected `objno`'):
+            parse_sol_file(io.StringIO(sol), _nl_info(2, 1), Results())
+
+    def test_suffixes(self):
+        sol = (
+            "msg\nOptions\n3\n1\n1\n0\n1\n1\n2\n2\n1.5\n2.5\n-1\nobjno 0 0\n"
+            "suffix 4 2 8 0 0\nzL\n1 0.5\n0 1e-3\n"
+            "suffix 0 1 8 0 0\nsstatus\n1 2\n"
+            "suffix 3 1 8 0 0\nnum\n0 7\n"
+        )
+        result, sol_data = parse_sol_file(io.StringIO(sol), _nl_info(2, 1), Results())
+        self.assertEqual(list(sol_data.duals), [1.5])
+        self.assertEqual(list(sol_data.primals), [2.5, -1])
+        self.assertEqual(sol_data.var_suffixes['zL'], {1: 0.5, 0: 1e-3})
+        self.assertEqual(sol_data.var_suffixes['sstatus'], {1: 2})
+        self.assertEqual(sol_data.problem_suffixes['num'], [7])
+        # Integer suffixes must contain integer values (and the expected
+        # number of entries)
+        bad = sol + "suffix 0 2 8 0 0\nbad\n1 2.5\n0 1\n"
+        with self.assertRaisesRegex(ValueError, '2.5'):
+            parse_sol_file(io.StringIO(bad), _nl_info(2, 1), Results())
+        bad = sol + "suffix 0 2 8 0 0\nbad\n1 2\n"
+        with self.assertRaisesRegex(PyomoException, "Expected 2 entries for suffix"):
+            parse_sol_file(io.StringIO(bad), _nl_info(2, 1), Results())
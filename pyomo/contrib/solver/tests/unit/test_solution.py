@@ -9,8 +9,17 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import pyomo.environ as pyo
 from pyomo.common import unittest
-from pyomo.contrib.solver.solution import SolutionLoaderBase, PersistentSolutionLoader
+from pyomo.common.collections import Bunch
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.contrib.solver.sol_reader import SolFileData
+from pyomo.contrib.solver.solution import (
+    SolutionLoaderBase,
+    PersistentSolutionLoader,
+    SolSolutionLoader,
+)
+from pyomo.repn.plugins.nl_writer import NLWriterInfo
 
 
 class TestSolutionLoaderBase(unittest.TestCase):
@@ -86,3 +95,48 @@ class TestPersistentSolutionLoader(unittest.TestCase):
         self.instance.invalidate()
         with self.assertRaises(RuntimeError):
             self.instance.get_primals()
+
+
+class TestSolSolutionLoader(unittest.TestCase):
+    def _loader(self, scaling=None):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3])
+        m.c = pyo.Constraint([1, 2], rule=lambda m, i: m.x[i] >= 0)
+        sol_data = SolFileData()
+        sol_data.primals = [1.5, 4.0, -3.0]
+        sol_data.duals = [2.0, -1.0]
+        if numpy_available:
+            sol_data.primals = np.array(sol_data.primals)
+            sol_data.duals = np.array(sol_data.duals)
+        nl_info = NLWriterInfo(
+            var=list(m.x.values()),
+            con=list(m.c.values()),
+            obj=[],
+            external_libs=[],
+            row_labels=None,
+            col_labels=None,
+            eliminated_vars=[],
+            scaling=scaling,
+        )
+        return m, SolSolutionLoader(sol_data, nl_info)
+
+    def test_load_vars(self):
+        m, loader = self._loader()
+        loader.load_vars()
+        self.assertEqual([m.x[i].value for i in m.x], [1.5, 4.0, -3.0])
+        # Values are loaded as native floats (not numpy scalars)
+        self.assertIs(type(m.x[1].value), float)
+        self.assertFalse(m.x[1].stale)
+        primals = loader.get_primals([m.x[2]])
+        self.assertEqual(list(primals.items()), [(m.x[2], 4.0)])
+        self.assertIs(type(primals[m.x[2]]), float)
+        self.assertEqual(loader.get_duals(), {m.c[1]: 2.0, m.c[2]: -1.0})
+        self.assertEqual(loader.get_duals([m.c[2]]), {m.c[2]: -1.0})
+
+    def test_load_scaled_vars(self):
+        scaling = Bunch(variables=[0.5, 2, 1], constraints=[4, 1], objectives=[2])
+        m, loader = self._loader(scaling)
+        loader.load_vars()
+        self.assertEqual([m.x[i].value for i in m.x], [3.0, 2.0, -3.0])
+        self.assertEqual(loader.get_primals()[m.x[1]], 3.0)
+        self.assertEqual(loader.get_duals(), {m.c[1]: 4.0, m.c[2]: -0.5})
@@ -0,0 +1,125 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import gc
+
+from pyomo.common import unittest
+from pyomo.common.collections import ComponentMap
+from pyomo.contrib.solver.warm_start import WarmStartCache, initial_values
+import pyomo.environ as pyo
+
+
+class TestWarmStartCache(unittest.TestCase):
+    def create_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2])
+        m.b = pyo.Block()
+        m.b.y = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x[1] + m.x[2] >= 1)
+        m.b.c = pyo.Constraint(expr=m.b.y <= 5)
+        return m
+
+    def store(self, cache, m):
+        cache.store(
+            m,
+            [m.x[1], m.x[2], m.b.y],
+            [m.c, m.b.c],
+            [1, 2, 3],
+            [0.5, -1],
+            {'ipopt_zL_in': {1: 4}},
+        )
+
+    def test_store_retrieve(self):
+        cache = WarmStartCache()
+        self.assertFalse(cache)
+        m = self.create_model()
+        self.assertIsNone(cache.retrieve(m))
+        self.store(cache, m)
+        self.assertTrue(cache)
+
+        # The solution is mapped back onto the same model by position
+        # (without generating ComponentUIDs)
+        m.z = pyo.Var()
+        primals, duals, var_suffixes = cache.retrieve(m)
+        self.assertEqual(list(primals.items()), [(m.x[1], 1), (m.x[2], 2), (m.b.y, 3)])
+        self.assertEqual(list(duals.items()), [(m.c, 0.5), (m.b.c, -1)])
+        self.assertEqual(list(var_suffixes['ipopt_zL_in'].items()), [(m.x[2], 4)])
+        self.assertIsNone(cache._solutions[m].cuids)
+
+        cache.clear()
+        self.assertFalse(cache)
+        self.assertIsNone(cache.retrieve(m))
+
+    def test_retrieve_other_model(self):
+        cache = WarmStartCache()
+        m = self.create_model()
+        self.store(cache, m)
+
+        # The solution is mapped onto a different model by name
+        m2 = self.create_model()
+        m2.z = pyo.Var()
+        del m2.b.c
+        primals, duals, var_suffixes = cache.retrieve(m2)
+        self.assertEqual(
+            list(primals.items()), [(m2.x[1], 1), (m2.x[2], 2), (m2.b.y, 3)]
+        )
+        self.assertEqual(list(duals.items()), [(m2.c, 0.5)])
+        self.assertEqual(list(var_suffixes), ['ipopt_zL_in'])
+        self.assertEqual(list(var_suffixes['ipopt_zL_in'].items()), [(m2.x[2], 4)])
+        self.assertEqual(
+            cache._solutions[m].cuids, (['x[1]', 'x[2]', 'b.y'], ['c', 'b.c'])
+        )
+
+        # Models with their own solution use it
+        cache.store(m2, [m2.x[1]], [], [10])
+        self.assertEqual(list(cache.retrieve(m2)[0].items()), [(m2.x[1], 10)])
+        self.assertEqual(list(cache.retrieve(m)[0].values()), [1, 2, 3])
+
+        # ... and other models use the most recent solution
+        m3 = self.create_model()
+        self.assertEqual(list(cache.retrieve(m3)[0].items()), [(m3.x[1], 10)])
+
+        # ... unless the cache is isolated
+        with cache.isolated():
+            self.assertIsNone(cache.retrieve(m3))
+            self.assertEqual(list(cache.retrieve(m2)[0].values()), [10])
+        self.assertIsNotNone(cache.retrieve(m3))
+
+        # Solutions are discarded with their models
+        del m2, primals, duals, var_suffixes
+        gc.collect()
+        self.assertIsNone(cache.retrieve(m3))
+        self.assertEqual(len(cache._solutions), 1)
+
+    def test_record_solve(self):
+        cache = WarmStartCache()
+        # Warm solves without a baseline report nothing
+        self.assertEqual(cache.record_solve(True, 1.0, 5), (None, None))
+        # The first cold solve is the baseline
+        self.assertEqual(cache.record_solve(False, 2.0, 20), (None, None))
+        self.assertEqual(cache.record_solve(False, 3.0, 30), (None, None))
+        self.assertEqual(cache.record_solve(True, 0.5, 5), (1.5, 15))
+        self.assertEqual(cache.record_solve(True, None, 4), (None, 16))
+
+    def test_initial_values(self):
+        m = self.create_model()
+        m.x[1].value = 10
+        m.x[2].fix(20)
+        m.x[1].stale = True
+        with initial_values(ComponentMap([(m.x[1], 1), (m.x[2], 2), (m.b.y, 3)])):
+            self.assertEqual(m.x[1].value, 1)
+            # fixed variables are not modified
+            self.assertEqual(m.x[2].value, 20)
+            self.assertEqual(m.b.y.value, 3)
+        self.assertEqual(m.x[1].value, 10)
+        self.assertTrue(m.x[1].stale)
+        self.assertEqual(m.x[2].value, 20)
+        self.assertIsNone(m.b.y.value)
@@ -0,0 +1,239 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Mapping, Optional, Sequence
+
+from pyomo.common.collections import ComponentMap
+from pyomo.core.base.componentuid import ComponentUID
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.var import Var
+
+
+class _WarmStartSolution(object):
+    """The solution of one model, stored in the order of the solver's
+    variable and constraint lists"""
+
+    def __init__(self, variables, constraints, primals, duals, var_suffixes):
+        self.variables = variables
+        self.constraints = constraints
+        self.primals = primals
+        self.duals = duals
+        self.var_suffixes = var_suffixes
+        # ComponentUID strings of the variables and constraints
+        # (generated on demand to warm start other models)
+        self.cuids = None
+
+    def generate_cuids(self, model):
+        cuids = ComponentUID.generate_cuid_string_map(model, ctype=(Var, Constraint))
+        self.cuids = (
+            [cuids.get(v, None) for v in self.variables],
+            [cuids.get(c, None) for c in self.constraints],
+        )
+
+
+class WarmStartCache(object):
+    """Cache the solutions of previous solves to warm start subsequent solves
+
+    The cache stores, for each solved model, the primal values, the
+    constraint duals, and any additional (solver-specific) variable
+    suffix values (e.g., Ipopt's bound multipliers) from the most
+    recent solve of that model.  The values are stored in the order of
+    the variables and constraints sent to the solver (e.g., the NL
+    file order), so re-solving the same (possibly modified) model maps
+    the cached solution back onto the model without any name lookups.
+
+    A model that has no cached solution of its own is warm started
+    from the solution of the most recently solved model, mapped onto
+    it by :py:class:`ComponentUID` (e.g., a clone of the model or
+    another scenario with the same structure).  This requires that
+    model to still exist.  Solutions are not shared between models
+    while the cache is :py:meth:`isolated` (e.g., during
+    ``solve_many()``, where the order in which the concurrent solves
+    finish is not deterministic).
+
+    The cache also records the solve time and iteration count of the
+    first solve that did not use a warm start (the "cold" solve).
+    This is used as the baseline to report the time saved by warm
+    starting.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._isolated = 0
+        self.clear()
+
+    def clear(self):
+        """Discard the cached solutions (and the cold solve baseline)"""
+        self._solutions = weakref.WeakKeyDictionary()
+        self._last_model = None
+        self.cold_solve_time: Optional[float] = None
+        self.cold_iterations: Optional[int] = None
+
+    def __bool__(self):
+        return bool(self._solutions)
+
+    @contextmanager
+    def isolated(self):
+        """Only warm start models from their own cached solutions
+
+        Within this context, models that do not have a cached solution
+        are not warm started from the solution of another model.
+
+        """
+        with self._lock:
+            self._isolated += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._isolated -= 1
+
+    def store(
+        self,
+        model,
+        variables: Sequence,
+        constraints: Sequence,
+        primals: Sequence[float],
+        duals: Optional[Sequence[float]] = None,
+        var_suffixes: Optional[Dict[str, Mapping[int, float]]] = None,
+    ):
+        """Store the solution of `model` in the cache
+
+        Parameters
+        ----------
+        model: BlockData
+            The model that was solved
+        variables: Sequence[VarData]
+            The variables sent to the solver
+        constraints: Sequence[ConstraintData]
+            The constraints sent to the solver
+        primals: Sequence[float]
+            The values of `variables`
+        duals: Sequence[float]
+            The duals of `constraints`
+        var_suffixes: Dict[str, Mapping[int, float]]
+            Map of suffix names to maps of positions in `variables` to
+            values
+
+        """
+        solution = _WarmStartSolution(
+            variables, constraints, primals, duals or (), var_suffixes or {}
+        )
+        with self._lock:
+            self._solutions[model] = solution
+            self._last_model = weakref.ref(model)
+
+    def retrieve(self, model):
+        """Map the cached solution onto the components of `model`
+
+        Returns
+        -------
+        primals: ComponentMap
+            Map of VarData to the cached values
+        duals: ComponentMap
+            Map of ConstraintData to the cached duals
+        var_suffixes: Dict[str, ComponentMap]
+            Map of suffix names to maps of VarData to the cached values
+
+        Returns None if there is no cached solution to warm start
+        `model` from.  When warm starting from the solution of another
+        model, components of `model` that are not in that solution
+        (e.g., new variables or constraints) are omitted.
+
+        """
+        with self._lock:
+            solution = self._solutions.get(model, None)
+            source = model
+            if solution is None and not self._isolated and self._last_model is not None:
+                source = self._last_model()
+                if source is not None:
+                    solution = self._solutions.get(source, None)
+            if solution is None:
+                return None
+            if source is not model and solution.cuids is None:
+                solution.generate_cuids(source)
+        variables = solution.variables
+        constraints = solution.constraints
+        if source is not model:
+            components = {
+                cuid: obj
+                for obj, cuid in ComponentUID.generate_cuid_string_map(
+                    model, ctype=(Var, Constraint)
+                ).items()
+            }
+            var_cuids, con_cuids = solution.cuids
+            variables = [components.get(cuid, None) for cuid in var_cuids]
+            constraints = [components.get(cuid, None) for cuid in con_cuids]
+
+        def _decode(components, values):
+            return ComponentMap(
+                (obj, val) for obj, val in zip(components, values) if obj is not None
+            )
+
+        return (
+            _decode(variables, solution.primals),
+            _decode(constraints, solution.duals),
+            {
+                name: ComponentMap(
+                    (variables[ndx], val)
+                    for ndx, val in data.items()
+                    if variables[ndx] is not None
+                )
+                for name, data in solution.var_suffixes.items()
+            },
+        )
+
+    def record_solve(self, warm_started, solve_time, iterations):
+        """Record the solve time and iteration count of a solve
+
+        Returns the time and the number of iterations saved relative to
+        the cold solve (None if the solve was not warm started or there
+        is no baseline).
+
+        """
+        with self._lock:
+            if not warm_started:
+                if self.cold_solve_time is None:
+                    self.cold_solve_time = solve_time
+                    self.cold_iterations = iterations
+                return None, None
+            time_saved = None
+            iterations_saved = None
+            if self.cold_solve_time is not None and solve_time is not None:
+                time_saved = self.cold_solve_time - solve_time
+            if self.cold_iterations is not None and iterations is not None:
+                iterations_saved = self.cold_iterations - iterations
+            return time_saved, iterations_saved
+
+
+@contextmanager
+def initial_values(primals: Mapping):
+    """Temporarily set the values of the (unfixed) variables in `primals`
+
+    The original values (and stale flags) are restored on exit.
+
+    """
+    original = []
+    try:
+        for var, val in primals.items():
+            if var.fixed:
+                continue
+            original.append((var, var.value, var.stale))
+            var.set_value(val, skip_validation=True)
+        yield
+    finally:
+        for var, val, stale in original:
+            var.set_value(val, skip_validation=True)
+            var.stale = stale
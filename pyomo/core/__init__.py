@@ -191,6 +191,7 @@ from pyomo.core.base.PyomoModel import (
     ConcreteModel,
     AbstractModel,
 )
+from pyomo.core.base.serialization import save_model, load_model
 from pyomo.core.base.transformation import (
     Transformation,
     TransformationFactory,
@@ -203,6 +204,7 @@ from pyomo.core.util import (
     prod,
     quicksum,
     sum_product,
+    linear_sum,
     dot_product,
     summation,
     sequence,
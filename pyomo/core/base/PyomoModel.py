@@ -767,6 +767,19 @@ arguments (which have been ignored):"""
             raise ValueError(msg % str(type(arg)))
         self._load_model_data(dp, namespaces, profile_memory=profile_memory)
 
+    def save(self, filename):
+        """Save the (constructed) model to a binary file
+
+        This is a shortcut for
+        :py:func:`~pyomo.core.base.serialization.save_model`; use
+        :py:func:`~pyomo.core.base.serialization.load_model` to
+        recreate the model.
+
+        """
+        from pyomo.core.base.serialization import save_model
+
+        save_model(self, filename)
+
     def _load_model_data(self, modeldata, namespaces, **kwds):
         """
         Load declarations from a DataPortal object.
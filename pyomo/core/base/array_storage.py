@@ -0,0 +1,47 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from pyomo.common.dependencies import numpy as np
+
+
+class _ArrayStorageMixin(object):
+    """Common methods for the (columnar) array storage of component data
+
+    Array storage classes (e.g., for ``Var(..., storage='array')`` and
+    ``Param(..., storage='array')``) assign each component data object
+    a (fixed) position ``_pos`` in the storage arrays when it is
+    created, and track the number of allocated positions in ``size``.
+
+    """
+
+    __slots__ = ()
+
+    def positions(self, component):
+        """Return the storage positions of the data in `component`
+        (ordered as :meth:`component.keys`).
+
+        This returns a slice if the positions are contiguous (and
+        ordered), and an array of positions otherwise.  The result is
+        cached on the component until data is added to (or removed
+        from) the component.
+
+        """
+        key = (self.size, len(component._data))
+        cache = component.__dict__.get('_storage_positions_cache', None)
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        pos = np.fromiter(
+            (v._pos for v in component.values()), np.intp, len(component._data)
+        )
+        if len(pos) == self.size and (pos == np.arange(len(pos))).all():
+            pos = slice(0, len(pos))
+        component._storage_positions_cache = (key, pos)
+        return pos
@@ -36,13 +36,15 @@ from pyomo.core.base.component import (
     Component,
     ActiveComponentData,
     ModelComponentFactory,
+    _caching_blocks,
+    _invalidate_component_data_caches,
 )
 from pyomo.core.base.enums import SortComponents, TraversalStrategy
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.componentuid import ComponentUID
 from pyomo.core.base.set import Any
 from pyomo.core.base.var import Var
-from pyomo.core.base.initializer import Initializer
+from pyomo.core.base.initializer import Initializer, SparseInitializer
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
     UnindexedComponent_set,
@@ -496,7 +498,14 @@ class _BlockData(ActiveComponentData):
 
     # If a writer cached a repn on this block, remove it when cloning
     #  TODO: remove repn caching from the model
-    __autoslot_mappers = {'_repn': AutoSlots.encode_as_none}
+    __autoslot_mappers__ = {
+        '_repn': AutoSlots.encode_as_none,
+        '_linear_subexpression_cache': AutoSlots.encode_as_none,
+        '_component_data_cache': AutoSlots.encode_as_none,
+    }
+
+    # Cached component_data_objects() results (see cache_component_data())
+    _component_data_cache = None
 
     def __init__(self, component):
         #
@@ -1047,6 +1056,8 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        if _caching_blocks:
+            _invalidate_component_data_caches(self)
         #
         # Propagate properties to sub-blocks:
         #   suppressed ctypes
@@ -1178,6 +1189,8 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
             del self._ctypes[obj.ctype]
+        if _caching_blocks:
+            _invalidate_component_data_caches(self)
 
         # Clear the _parent attribute
         obj._parent = None
@@ -1221,6 +1234,8 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
             return
 
         idx = self._decl[name]
+        if _caching_blocks:
+            _invalidate_component_data_caches(self)
 
         # Update the ctype linked lists
         ctype_info = self._ctypes[obj.ctype]
@@ -1270,9 +1285,26 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
 
-    def clone(self, memo=None):
-        """
-        TODO
+    def clone(self, memo=None, share_structure=False):
+        """Return a deep copy of this block (and all of its components)
+
+        Parameters
+        ----------
+        memo: dict
+            The deepcopy memo (see :py:func:`copy.deepcopy`)
+
+        share_structure: bool
+            If True, the clone shares any (immutable) expression
+            subtrees that do not reference components declared on this
+            block (e.g., subexpressions over variables and parameters
+            declared outside the block, or constant subexpressions)
+            with the original block.  Only the nodes whose arguments
+            change are duplicated, and they are rebuilt directly
+            (bypassing the generic deepcopy machinery).  Mutable
+            expressions (e.g., those being built by ``+=``) are always
+            copied.  This reduces the time and peak memory needed to
+            clone both complete models and sub-blocks.
+
         """
         # FYI: we used to remove all _parent() weakrefs before
         # deepcopying and then restore them on the original and cloned
@@ -1297,6 +1329,8 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
             memo = {}
         memo['__block_scope__'] = {id(self): True, id(None): False}
         memo[id(parent)] = parent
+        if share_structure:
+            memo['__share_structure__'] = True
 
         with PauseGC():
             new_block = copy.deepcopy(self, memo)
@@ -1552,12 +1586,112 @@ Components must now specify their rules explicitly using 'rule=' keywords."""
         block.  By default, this generator recursively
         descends into sub-blocks.
         """
+        if self._component_data_cache is not None:
+            yield from self._cached_component_data_objects(
+                ctype, active, sort, descend_into, descent_order
+            )
+            return
         dedup = _DeduplicateInfo()
         for _block in self.block_data_objects(
             active, sort, descend_into, descent_order
         ):
             yield from _block._component_data_itervalues(ctype, active, sort, dedup)
 
+    def cache_component_data(self, enable=True):
+        """Cache the results of :py:meth:`component_data_objects()`
+
+        When enabled, the results of calls to component_data_objects()
+        on this block are stored (by ctype, active flag, sort order and
+        descent options) so that repeated traversals of an unchanged
+        model only need to return the stored results.
+
+        The cache is cleared whenever a component is added to or removed
+        from this block (or any of its sub-blocks), a component data
+        object is assigned to a new index or deleted, or a component (or
+        component data) in this block is activated or deactivated.  In
+        addition, each cached result is discarded if the number of data
+        objects in any of the traversed components changed (e.g., through
+        implicitly created data objects).  Traversals that reach
+        References are not cached, as changes to the referenced
+        components are not reported to this block.
+
+        Models only track these changes while at least one block has the
+        cache enabled.
+
+        Notes
+        -----
+        A cache hit costs O(number of traversed components) (to check
+        their sizes) and not O(len(result)).  The cache only pays off for
+        models whose components each hold many data objects.
+
+        While the cache is enabled, component_data_objects() generates
+        the complete result before returning the first data object (so
+        changes to the model while iterating over the result are not
+        reflected in the iteration).
+
+        Parameters
+        ----------
+        enable: bool
+            If True, enable (and reset) the cache; if False, disable
+            the cache and discard all cached results.
+
+        """
+        if enable:
+            self._component_data_cache = {}
+            _id = id(self)
+            _caching_blocks[_id] = weakref.ref(
+                self, lambda ref: _caching_blocks.pop(_id, None)
+            )
+        else:
+            self._component_data_cache = None
+            _caching_blocks.pop(id(self), None)
+
+    def _cached_component_data_objects(
+        self, ctype, active, sort, descend_into, descent_order
+    ):
+        if ctype is not None and not isclass(ctype):
+            ctype = frozenset(ctype)
+        if not descend_into:
+            descend_ctypes = ()
+        elif descend_into is True:
+            descend_ctypes = (Block,)
+        elif isclass(descend_into):
+            descend_ctypes = (descend_into,)
+        else:
+            descend_ctypes = descend_into = tuple(descend_into)
+        key = (ctype, active, sort, descend_into, descent_order)
+        cache = self._component_data_cache
+        if key in cache:
+            ans, components, sizes = cache[key]
+            if list(map(len, components)) == sizes:
+                return ans
+        # Record all (indexed) components that we traverse or that could
+        # contribute data, so we can detect when data are added or
+        # removed.  Components added to / removed from a block (or that
+        # are activated / deactivated) clear the cache.
+        if ctype is None:
+            tracked = None
+        elif isclass(ctype):
+            tracked = {ctype, *descend_ctypes}
+        else:
+            tracked = ctype.union(descend_ctypes)
+        components = []
+        ans = []
+        dedup = _DeduplicateInfo()
+        for _block in self.block_data_objects(
+            active, sort, descend_into, descent_order
+        ):
+            components.extend(
+                comp
+                for comp in PseudoMap(_block, tracked).values()
+                if isinstance(comp, IndexedComponent)
+            )
+            ans.extend(_block._component_data_itervalues(ctype, active, sort, dedup))
+        ans = tuple(ans)
+        if not any(comp.is_reference() for comp in components):
+            cache[key] = ans, components, list(map(len, components))
+        return ans
+
     @deprecated(
         "The component_data_iterindex method is deprecated.  "
         "Components now know their index, so it is more efficient to use the "
@@ -2148,8 +2282,14 @@ class Block(ActiveIndexedComponent):
             _BlockConstruction.data[id(self)] = data
         try:
             if self.is_indexed():
+                if self._rule.__class__ is SparseInitializer:
+                    # The indices are coming in externally: only
+                    # populate those blocks
+                    for _idx in self._rule.indices():
+                        # Trigger (validation,) population & call the rule
+                        self[_idx]
                 # We can only populate Blocks with finite indexing sets
-                if self.index_set().isfinite() and (
+                elif self.index_set().isfinite() and (
                     self._dense or self._rule is not None
                 ):
                     for _idx in self.index_set():
@@ -29,6 +29,7 @@ from pyomo.common.formatting import tabular_writer, StreamIndenter
 from pyomo.common.modeling import NOTSET
 from pyomo.common.sorting import sorted_robust
 from pyomo.core.pyomoobject import PyomoObject
+from pyomo.core.expr.base import _share_structure_field_deepcopy
 from pyomo.core.base.component_namer import name_repr, index_repr
 from pyomo.core.base.global_set import UnindexedComponent_index
 
@@ -41,6 +42,29 @@ relocated_module_attribute(
 _ref_types = {type(None), weakref_ref}
 
 
+# Blocks that cache the results of component_data_objects() (see
+# _BlockData.cache_component_data()), as {id(block): weakref(block)}.
+# Structural changes to a model (adding or removing components or
+# component data, and activating or deactivating them) are only tracked
+# while this is not empty.
+_caching_blocks = {}
+
+
+def _invalidate_component_data_caches(obj):
+    """Discard the cached traversals of all blocks containing `obj`
+
+    This walks from `obj` (which may itself be a block) up through its
+    parent blocks and clears the component_data_objects() cache of
+    every block that has one.
+
+    """
+    while obj is not None:
+        cache = getattr(obj, '_component_data_cache', None)
+        if cache:
+            cache.clear()
+        obj = obj.parent_block()
+
+
 class ModelComponentFactoryClass(Factory):
     def register(self, doc=None):
         def fn(cls):
@@ -216,6 +240,10 @@ class _ComponentBase(PyomoObject):
         # sane (deepcopy-able) model, we will try to do everything in
         # one try-except block.
         #
+        if '__share_structure__' in memo:
+            _deepcopy = _share_structure_field_deepcopy
+        else:
+            _deepcopy = fast_deepcopy
         try:
             for i, comp in enumerate(component_list):
                 saved_memo = len(memo)
@@ -223,7 +251,7 @@ class _ComponentBase(PyomoObject):
                 # temporary 'state' list, significantly speeding things
                 # up.
                 memo[id(comp)].__setstate__(
-                    [fast_deepcopy(field, memo) for field in comp.__getstate__()]
+                    [_deepcopy(field, memo) for field in comp.__getstate__()]
                 )
             return memo[id(self)]
         except:
@@ -773,10 +801,14 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active = True
+        if _caching_blocks:
+            _invalidate_component_data_caches(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        if _caching_blocks:
+            _invalidate_component_data_caches(self)
 
 
 class ComponentData(_ComponentBase):
@@ -1053,7 +1085,11 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        if _caching_blocks:
+            _invalidate_component_data_caches(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        if _caching_blocks:
+            _invalidate_component_data_caches(self)
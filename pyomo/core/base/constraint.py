@@ -130,6 +130,26 @@ def simple_constraintlist_rule(rule):
 #
 
 
+def _mark_modified(con):
+    """Record that the expression of `con` was not generated by its rule
+
+    This records the index of `con` in the ``_modified_indices`` set of
+    the parent component.  Tools that rely on the component rule to
+    regenerate the constraint expressions (e.g.,
+    :py:mod:`pyomo.repn.linear_template`) use this to detect
+    constraints that were modified (or added) after construction.
+
+    """
+    comp = con.parent_component()
+    if comp is None:
+        return
+    modified = getattr(comp, '_modified_indices', None)
+    if modified is None:
+        comp._modified_indices = {con.index()}
+    else:
+        modified.add(con.index())
+
+
 class _ConstraintData(ActiveComponentData):
     """
     This class defines the data for a single constraint.
@@ -462,6 +482,9 @@ class _GeneralConstraintData(_ConstraintData):
 
     def set_value(self, expr):
         """Set the expression on this constraint."""
+        if self._expr is not None:
+            # The constraint is being modified
+            _mark_modified(self)
         # Clear any previously-cached normalized constraint
         self._lower = self._upper = self._body = self._expr = None
 
@@ -713,6 +736,9 @@ class Constraint(ActiveIndexedComponent):
             A dictionary from the index set to component data objects
         _index
             The set of valid indices
+        _modified_indices
+            The set of indices of constraints that were modified (or
+            added) after being generated by the rule (or None)
         _model
             A weakref to the model that owns this component
         _parent
@@ -722,6 +748,7 @@ class Constraint(ActiveIndexedComponent):
     """
 
     _ComponentDataClass = _GeneralConstraintData
+    _modified_indices = None
 
     class Infeasible(object):
         pass
@@ -1039,6 +1066,15 @@ class IndexedConstraint(Constraint):
 
     __getitem__ = IndexedComponent.__getitem__  # type: ignore
 
+    def __setitem__(self, index, val):
+        obj = super().__setitem__(index, val)
+        # Constraints added after construction are not generated by the
+        # (indexed) rule.  Note that modifications to existing
+        # constraints are recorded by set_value().
+        if obj is not None and self.rule.__class__ is IndexedCallInitializer:
+            _mark_modified(obj)
+        return obj
+
 
 @ModelComponentFactory.register("A list of constraint expressions.")
 class ConstraintList(IndexedConstraint):
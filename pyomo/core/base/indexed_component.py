@@ -18,7 +18,13 @@ import pyomo.core.expr as EXPR
 import pyomo.core.base as BASE
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 from pyomo.core.base.initializer import Initializer
-from pyomo.core.base.component import Component, ActiveComponent, ComponentData
+from pyomo.core.base.component import (
+    Component,
+    ActiveComponent,
+    ComponentData,
+    _caching_blocks,
+    _invalidate_component_data_caches,
+)
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_set
@@ -711,6 +717,8 @@ You can silence this warning by one of three ways:
         else:
             obj = self._data.get(index, _NotFound)
             if obj is _NotFound:
+                if _caching_blocks:
+                    _invalidate_component_data_caches(self)
                 return self._setitem_when_not_present(index, val)
             else:
                 return self._setitem_impl(index, obj, val)
@@ -739,6 +747,8 @@ You can silence this warning by one of three ways:
                 del self[idx]
         else:
             # Handle the normal deletion operation
+            if _caching_blocks:
+                _invalidate_component_data_caches(self)
             if self.is_indexed():
                 # Remove reference to this object
                 self._data[index]._component = None
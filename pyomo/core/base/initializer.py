@@ -18,6 +18,7 @@ from collections.abc import Mapping
 
 from pyomo.common.dependencies import numpy, numpy_available, pandas, pandas_available
 from pyomo.common.modeling import NOTSET
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.core.pyomoobject import PyomoObject
 
 initializer_map = {}
@@ -485,6 +486,166 @@ class DefaultInitializer(InitializerBase):
         return self._initializer.indices()
 
 
+class SparseInitializer(InitializerBase):
+    """Initializer wrapper that restricts construction to a sparse set
+    of indices.
+
+    Indexed components normally call their rule for every member of the
+    component's index set.  Wrapping the rule in a SparseInitializer
+    causes the component to only call the rule for the members of
+    `indices`.  The component's index set is not changed (so all indices
+    are still validated against it), but indices that are not in
+    `indices` never reach the rule.
+
+    Parameters
+    ----------
+    initializer:
+        the rule (or any other value accepted by :py:func:`Initializer`)
+        to call for each index
+
+    indices: iterable
+        the indices to construct.  This may be any (finite) iterable,
+        including a Pyomo Set (e.g., one declared with a
+        :py:class:`VectorizedInitializer` filter).  Generators and
+        iterators are expanded when the SparseInitializer is created.
+
+    """
+
+    __slots__ = ('_initializer', '_indices')
+
+    def __init__(self, initializer, indices):
+        self._initializer = Initializer(initializer)
+        if inspect.isgenerator(indices) or hasattr(indices, '__next__'):
+            # Generators cannot be deepcopied (cloned) or pickled, so
+            # (as in Initializer) we will immediately expand them.
+            indices = tuple(indices)
+        self._indices = indices
+
+    def __call__(self, parent, index):
+        return self._initializer(parent, index)
+
+    def contains_indices(self):
+        """Return True if this initializer contains embedded indices"""
+        return True
+
+    def indices(self):
+        return self._indices
+
+
+class VectorizedInitializer(InitializerBase):
+    """Initializer for vectorized (array) rules, notably Set filters.
+
+    The wrapped function is called as ``fcn(parent, *columns)``, where
+    each column is a NumPy array holding one dimension of the candidate
+    indices, and must return a boolean array (or a scalar that is
+    broadcast) with one result per candidate.  This allows a filter
+    (e.g., ``Set(initialize=m.I * m.J, filter=VectorizedInitializer(fcn))``)
+    to be evaluated for all candidates in a single call.  When the
+    candidates are the cross product of finite Sets, the columns are
+    generated without creating the candidate tuples, and only the
+    selected indices are ever created.
+
+    Calling the initializer for a single index calls the function with
+    scalar arguments (so it can still be used for subsequent
+    ``Set.add()`` calls).
+
+    """
+
+    __slots__ = ('_fcn',)
+
+    def __init__(self, fcn):
+        self._fcn = fcn
+
+    def __call__(self, parent, idx):
+        if idx.__class__ is tuple:
+            return self._fcn(parent, *idx)
+        else:
+            return self._fcn(parent, idx)
+
+    def _mask(self, parent, columns, n):
+        mask = numpy.asarray(self._fcn(parent, *columns), dtype=bool)
+        if mask.shape != (n,):
+            mask = numpy.broadcast_to(mask, (n,))
+        return mask
+
+    def select(self, parent, candidates):
+        """Return the list of `candidates` for which the function is True"""
+        from pyomo.core.base.indexed_component import normalize_index
+        from pyomo.core.base.set import Set, SetProduct
+
+        if isinstance(candidates, SetProduct) and normalize_index.flatten:
+            ans = self._select_from_product(parent, candidates)
+            if ans is not None:
+                return ans
+        values = []
+        for val in candidates:
+            # Support the (historical) Set.End sentinel for terminating
+            # Set initialization data
+            if val is Set.End:
+                break
+            values.append(val)
+        if not values:
+            return values
+        if values[0].__class__ is tuple:
+            columns = [_to_column(col) for col in zip(*values)]
+        else:
+            columns = [_to_column(values)]
+        mask = self._mask(parent, columns, len(values))
+        return [values[i] for i in numpy.flatnonzero(mask).tolist()]
+
+    def _select_from_product(self, parent, product):
+        leaves = list(product.subsets(expand_all_set_operators=False))
+        if not all(s.isfinite() and s.dimen for s in leaves):
+            return None
+        members = [list(s) for s in leaves]
+        shape = tuple(len(m) for m in members)
+        n = 1
+        for dim in shape:
+            n *= dim
+        if not n:
+            return []
+        # Generate the columns (in product iteration order) by
+        # broadcasting each factor's member positions
+        columns = []
+        for k, m in enumerate(members):
+            pos = numpy.arange(shape[k]).reshape(
+                [-1 if j == k else 1 for j in range(len(shape))]
+            )
+            pos = numpy.broadcast_to(pos, shape).ravel()
+            if leaves[k].dimen == 1:
+                columns.append(_to_column(m)[pos])
+            else:
+                columns.extend(_to_column(col)[pos] for col in zip(*m))
+        selected = numpy.unravel_index(
+            numpy.flatnonzero(self._mask(parent, columns, n)), shape
+        )
+        parts = [[m[i] for i in sel.tolist()] for m, sel in zip(members, selected)]
+        if all(s.dimen == 1 for s in leaves):
+            return list(zip(*parts))
+        return [
+            sum((v if v.__class__ is tuple else (v,) for v in val), ())
+            for val in zip(*parts)
+        ]
+
+
+def _to_column(values):
+    """Convert a sequence of (Set member) values to a NumPy array
+
+    NumPy converts sequences of mixed types to a common type (e.g.,
+    ``[1, 'a']`` becomes an array of strings), which would silently
+    change the result of comparisons in vectorized filters.  Unless all
+    values are of the same type (or are all numbers), the values are
+    stored in an object array.
+
+    """
+    types = set(map(type, values))
+    if len(types) > 1 and not types.issubset(native_numeric_types):
+        ans = numpy.empty(len(values), dtype=object)
+        ans[:] = values
+        return ans
+    return numpy.array(values)
+
+
 _bound_sequence_types = collections.defaultdict(None.__class__)
 
 
@@ -15,6 +15,7 @@ import weakref
 
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.log import is_debug_set
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.core.base.set_types import Any
 from pyomo.core.expr.numvalue import value
 from pyomo.core.expr.numeric_expr import LinearExpression
@@ -27,6 +28,9 @@ from collections.abc import Mapping
 
 logger = logging.getLogger('pyomo.core')
 
+_inf = float('inf')
+_ninf = -_inf
+
 
 class _MatrixConstraintData(_ConstraintData):
     """
@@ -244,6 +248,32 @@ class _MatrixConstraintData(_ConstraintData):
         index = self._index
         return comp._upper[index]
 
+    @property
+    def lb(self):
+        """Access the value of the lower bound of a constraint
+        expression (:const:`None` if the row has no lower bound)."""
+        bound = self.lower
+        if bound.__class__ not in native_numeric_types:
+            if bound is None:
+                return None
+            bound = float(value(bound))
+        if bound == _ninf:
+            return None
+        return bound
+
+    @property
+    def ub(self):
+        """Access the value of the upper bound of a constraint
+        expression (:const:`None` if the row has no upper bound)."""
+        bound = self.upper
+        if bound.__class__ not in native_numeric_types:
+            if bound is None:
+                return None
+            bound = float(value(bound))
+        if bound == _inf:
+            return None
+        return bound
+
     @property
     def equality(self):
         """A boolean indicating whether this is an equality
@@ -361,6 +391,24 @@ class MatrixConstraint(Mapping, IndexedConstraint):
     def __iter__(self):
         return iter(i for i in range(len(self)))
 
+    #
+    # Pyomo components support an extended dict API
+    #
+    def keys(self, sort=None):
+        # The 0..n-1 indices are always ordered and sorted; we can
+        # ignore the `sort` argument
+        return super().keys()
+
+    def values(self, sort=None):
+        # The 0..n-1 indices are always ordered and sorted; we can
+        # ignore the `sort` argument
+        return super().values()
+
+    def items(self, sort=None):
+        # The 0..n-1 indices are always ordered and sorted; we can
+        # ignore the `sort` argument
+        return super().items()
+
     #
     # Remove methods that allow modifying this constraint
     #
@@ -18,12 +18,23 @@ from pyomo.common.pyomo_typing import overload
 from typing import Union, Type
 
 from pyomo.common.autoslots import AutoSlots
+from pyomo.common.dependencies import (
+    numpy as np,
+    numpy_available,
+    pandas,
+    pandas_available,
+)
 from pyomo.common.deprecation import deprecation_warning, RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
-from pyomo.common.numeric_types import native_types, value as expr_value
+from pyomo.common.numeric_types import (
+    native_types,
+    native_numeric_types,
+    value as expr_value,
+)
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.numvalue import NumericValue
+from pyomo.core.base.array_storage import _ArrayStorageMixin
 from pyomo.core.base.component import ComponentData, ModelComponentFactory
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
@@ -31,7 +42,12 @@ from pyomo.core.base.indexed_component import (
     UnindexedComponent_set,
     IndexedComponent_NDArrayMixin,
 )
-from pyomo.core.base.initializer import Initializer
+from pyomo.core.base.initializer import (
+    Initializer,
+    ConstantInitializer,
+    DataFrameInitializer,
+    ItemInitializer,
+)
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
 from pyomo.core.base.set import Reals, _AnySet, SetInitializer
 from pyomo.core.base.units_container import units
@@ -39,6 +55,8 @@ from pyomo.core.expr import GetItemExpression
 
 logger = logging.getLogger('pyomo.core')
 
+_nan = float('nan')
+
 
 def _raise_modifying_immutable_error(obj, index):
     if obj.is_indexed():
@@ -252,6 +270,108 @@ class _ParamData(ComponentData, NumericValue):
         return 0
 
 
+class _ParamArrayStorage(_ArrayStorageMixin):
+    """Contiguous (array) storage for the values in a mutable Param
+
+    Each :py:class:`_ArrayParamData` is assigned a (fixed) position in
+    the value array when it is created.  Positions are never reused
+    (removing a ParamData from the component leaves a "hole" in the
+    array).  Missing values (Param.NoValue) are stored as NaN.
+
+    """
+
+    __slots__ = ('size', 'value')
+
+    def __init__(self):
+        self.size = 0
+        self.value = np.empty(0)
+
+    def reserve(self, n):
+        """Ensure there is space for `n` additional ParamData objects"""
+        if self.size + n <= len(self.value):
+            return
+        capacity = max(self.size + n, 2 * len(self.value), 16)
+        new = np.full(capacity, np.nan)
+        new[: self.size] = self.value[: self.size]
+        self.value = new
+
+    def allocate(self, n=1):
+        """Allocate `n` consecutive positions and return the first one"""
+        self.reserve(n)
+        pos = self.size
+        self.size += n
+        return pos
+
+    def populate(self, component, indices):
+        """Create (valueless) ParamData objects for `indices`
+
+        The new ParamData objects are assigned consecutive positions
+        (starting at the current storage size).
+
+        """
+        start = self.allocate(len(indices))
+        _data = component._data
+        _new = _ArrayParamData.__new__
+        _component = weakref_ref(component)
+        for pos, index in enumerate(indices, start):
+            obj = _new(_ArrayParamData)
+            obj._component = _component
+            obj._index = index
+            obj._storage = self
+            obj._pos = pos
+            _data[index] = obj
+
+
+class _ArrayParamData(_ParamData):
+    """This class defines the data for a single mutable parameter whose
+    value is stored in the value array of the owning Param component
+    (see ``Param(..., storage='array')``).
+
+    Note that values are stored as floating point numbers (so integer
+    values are returned as floats), and that only numeric values are
+    supported.
+
+    """
+
+    __slots__ = ('_storage', '_pos')
+
+    def __init__(self, component):
+        self._component = weakref_ref(component)
+        self._index = NOTSET
+        # Note: we hold a direct reference to the storage (and not just
+        # look it up through the component) so that ParamData objects
+        # that are removed from the component remain valid
+        self._storage = component._storage
+        self._pos = component._storage.allocate()
+
+    #
+    # Map the (inherited) _value attribute onto the array storage.  This
+    # allows us to reuse the _ParamData implementation of the public API.
+    #
+
+    @property
+    def _value(self):
+        val = self._storage.value.item(self._pos)
+        return Param.NoValue if val != val else val
+
+    @_value.setter
+    def _value(self, val):
+        try:
+            storage = self._storage
+        except AttributeError:
+            # We are being restored by __setstate__ (before the _storage
+            # slot): the value is restored along with the storage.
+            return
+        if val is Param.NoValue:
+            val = _nan
+        elif val.__class__ not in native_numeric_types:
+            raise ValueError(
+                "Param '%s' uses array storage, which only supports numeric "
+                "values (not '%s')." % (self.name, val)
+            )
+        storage.value[self._pos] = val
+
+
 @ModelComponentFactory.register(
     "Parameter data that is used to define a model instance."
 )
@@ -278,6 +398,16 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
         mutable: `boolean`
             Flag indicating if the value of the parameter may change between
             calls to a solver. Defaults to `False`
+        storage: `str`
+            How the values of a mutable indexed parameter are stored.
+            ``'object'`` (the default) stores the value on each
+            parameter data object.  ``'array'`` stores the values in a
+            contiguous NumPy array on the component, initializes the
+            parameter densely (i.e., for every index in the index
+            set), and enables vectorized initialization and
+            :meth:`set_values_from_array` updates.  Array storage
+            implies ``mutable=True``, only supports numeric values, and
+            is ignored for scalar parameters.
         name
             Name for this component.
         doc
@@ -325,6 +455,7 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
         default=NoValue,
         initialize_as_dense=False,
         units=None,
+        storage='object',
         name=None,
         doc=None,
     ): ...
@@ -337,6 +468,18 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
         self._default_val = kwd.pop('default', Param.NoValue)
         self._dense_initialize = kwd.pop('initialize_as_dense', False)
         self._units = kwd.pop('units', None)
+        _storage_arg = kwd.pop('storage', 'object')
+        if _storage_arg not in ('object', 'array'):
+            raise ValueError(
+                "Param 'storage' must be one of 'object' or 'array' (not '%s')"
+                % (_storage_arg,)
+            )
+        self._storage = None
+        if _storage_arg == 'array':
+            if self._mutable is None:
+                self._mutable = True
+            elif not self._mutable:
+                raise ValueError("Param storage='array' requires mutable=True")
 
         if self._mutable is None:
             if self._units is None:
@@ -350,6 +493,20 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
         kwd.setdefault('ctype', Param)
         IndexedComponent.__init__(self, *args, **kwd)
 
+        if _storage_arg == 'array':
+            if not self.is_indexed():
+                logger.warning(
+                    "ScalarParam object '%s': storage='array' is not supported "
+                    "for scalar parameters; using storage='object'" % (self.name,)
+                )
+            elif not numpy_available:
+                raise ValueError(
+                    "Param '%s': storage='array' requires numpy" % (self.name,)
+                )
+            else:
+                self._storage = _ParamArrayStorage()
+                self._ComponentDataClass = _ArrayParamData
+
         # We don't support per-index param domains, so we only need to
         # support constant initializers.
         # (after IndexedComponent.__init__ so we can call parent_block())
@@ -523,14 +680,14 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
                 # instead of incurring the penalty of checking.
                 for index, new_value in new_values.items():
                     if index not in self._data:
-                        self._data[index] = _ParamData(self)
+                        self._data[index] = self._ComponentDataClass(self)
                     self._data[index]._value = new_value
             else:
                 # For scalars, we will choose an approach based on
                 # how "dense" the Param is
                 if not self._data:  # empty
                     for index in self._index_set:
-                        p = self._data[index] = _ParamData(self)
+                        p = self._data[index] = self._ComponentDataClass(self)
                         p._value = new_values
                 elif len(self._data) == len(self._index_set):
                     for index in self._index_set:
@@ -538,7 +695,7 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
                 else:
                     for index in self._index_set:
                         if index not in self._data:
-                            self._data[index] = _ParamData(self)
+                            self._data[index] = self._ComponentDataClass(self)
                         self._data[index]._value = new_values
         else:
             #
@@ -554,6 +711,78 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             # scalars have to be handled differently
             self[None] = new_values
 
+    def set_values_from_array(self, index_array, values):
+        """Update a mutable Param from arrays of indices and values
+
+        `values` is a 1-D array (or sequence) of numeric values.  If
+        `index_array` is None, the values are ordered as :meth:`keys`.
+        Otherwise, `index_array` is a sequence of indices with the
+        same length as `values` (e.g., a list of tuples, a 2-D array
+        with one row per index, or a pandas Index or MultiIndex).  NaN
+        values clear the corresponding parameter value.
+
+        The update is vectorized for Params using array storage (only
+        the index lookups and any `validate` rule are evaluated for each
+        element).  Other Params are updated one element at a time.
+
+        """
+        if not self._mutable:
+            _raise_modifying_immutable_error(self, '*')
+        values = np.asarray(values)
+        if values.dtype.kind not in 'iuf':
+            raise ValueError(
+                "Param '%s': set_values_from_array() requires numeric values "
+                "(not an array of dtype '%s')" % (self.name, values.dtype)
+            )
+        values = values.astype(float, copy=False)
+        if index_array is None:
+            index = None
+            n = len(self)
+        else:
+            index = self._normalize_index_array(index_array)
+            n = len(index)
+        if values.shape != (n,):
+            raise ValueError(
+                "Param '%s': cannot set the values from an array of shape %s "
+                "(expected (%s,))" % (self.name, values.shape, n)
+            )
+
+        if index is None:
+            if self._storage is not None and len(self._data) == n:
+                pos = self._storage.positions(self)
+                return self._set_array_values(pos, values, None)
+            # Note: for Params with default values, this will create any
+            # missing ParamData objects
+            index = list(self.keys())
+        _data = self._data
+        try:
+            objs = list(map(_data.__getitem__, index))
+        except KeyError:
+            # __getitem__ will either validate (and create) the missing
+            # ParamData or raise the appropriate exception
+            objs = [_data[i] if i in _data else self[i] for i in index]
+        if self._storage is None:
+            for obj, idx, val in zip(objs, index, values.tolist()):
+                if val != val:
+                    obj.clear()
+                else:
+                    obj.set_value(val, idx)
+            return
+        pos = np.fromiter((obj._pos for obj in objs), np.intp, n)
+        self._set_array_values(pos, values, index)
+
+    def _normalize_index_array(self, index_array):
+        # Convert the incoming indices to a list of (native) Python index
+        # values that can be used to look up the ParamData in _data
+        if numpy_available and isinstance(index_array, np.ndarray):
+            if index_array.ndim == 2:
+                return list(map(tuple, index_array.tolist()))
+            return index_array.tolist()
+        if hasattr(index_array, 'tolist'):
+            # e.g., a pandas Index / MultiIndex
+            return index_array.tolist()
+        return list(index_array)
+
     def set_default(self, val):
         """
         Perform error checks and then set the default value for this parameter.
@@ -603,7 +832,7 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             if self._mutable:
                 # Note: _ParamData defaults to Param.NoValue
                 if self.is_indexed():
-                    ans = self._data[index] = _ParamData(self)
+                    ans = self._data[index] = self._ComponentDataClass(self)
                 else:
                     ans = self._data[index] = self
                 ans._index = index
@@ -736,7 +965,7 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
                 self._index = UnindexedComponent_index
                 return self
             elif self._mutable:
-                obj = self._data[index] = _ParamData(self)
+                obj = self._data[index] = self._ComponentDataClass(self)
                 obj.set_value(value, index)
                 obj._index = index
                 return obj
@@ -778,6 +1007,142 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
                     % (self.name, index, value, type(value))
                 )
 
+    def _set_array_values(self, pos, values, index):
+        """Set (and validate) the values at the array storage positions `pos`
+
+        `index` is the list of indices corresponding to `values` (or
+        None if the values are ordered as :meth:`keys`).  It is only
+        used for reporting errors and evaluating the `validate` rule.
+
+        """
+        storage = self._storage
+        isnan = np.isnan(values)
+        #
+        # Check the domain.  Use the domain interval (if there is one)
+        # to identify the values that could be outside the domain.
+        # Only those values are explicitly checked against the domain.
+        #
+        domain = self.domain
+        suspect = None
+        if not isinstance(domain, _AnySet):
+            interval = domain.get_interval()
+            if interval is None or interval[2] is None:
+                suspect = ~isnan
+            else:
+                lb, ub, step = interval
+                suspect = np.zeros(len(values), dtype=bool)
+                if lb is not None:
+                    suspect |= values <= lb
+                if ub is not None:
+                    suspect |= values >= ub
+                if step:
+                    suspect |= np.remainder(values, step) != 0
+                suspect &= ~isnan
+        if suspect is not None and suspect.any():
+            if index is None:
+                index = list(self.keys())
+            for i in np.flatnonzero(suspect).tolist():
+                val = values[i].item()
+                if val not in domain:
+                    # This will raise the appropriate exception
+                    self._validate_value(index[i], val)
+        #
+        # Store the values.  If there is a validation rule, then we need
+        # to set all the values before calling the rule (the rule may
+        # reference other values in this Param)
+        #
+        if self._validate:
+            old_values = storage.value[pos].copy()
+        storage.value[pos] = values
+        if self._validate:
+            if index is None:
+                index = list(self.keys())
+            try:
+                for idx, val in zip(index, values.tolist()):
+                    if val == val:
+                        self._validate_value(idx, val, False)
+            except:
+                storage.value[pos] = old_values
+                raise
+
+    def _initializer_arrays(self, rule):
+        """Return the indices and values from a "data" initializer
+
+        This returns a tuple of (index list, value array) for dict,
+        pandas Series / DataFrame, and 1-D array initializers containing
+        numeric values, and None for everything else.
+
+        """
+        if rule.__class__ is ItemInitializer:
+            src = rule._dict
+            if src.__class__ is dict:
+                index = list(src)
+                values = list(src.values())
+            elif src.__class__ in (list, tuple) or (
+                numpy_available and isinstance(src, np.ndarray)
+            ):
+                index = list(range(len(src)))
+                values = src
+            elif pandas_available and isinstance(src, pandas.Series):
+                index = src.index.tolist()
+                values = src.to_numpy()
+            else:
+                return None
+        elif rule.__class__ is DataFrameInitializer:
+            index = rule._df.index.tolist()
+            values = rule._df[rule._column].to_numpy()
+        elif (
+            rule.__class__ is ConstantInitializer
+            and rule.val.__class__ in native_numeric_types
+            and self._index_set.isfinite()
+        ):
+            index = list(self._index_set)
+            values = np.full(len(index), rule.val, dtype=float)
+        else:
+            return None
+        values = np.asarray(values)
+        if values.dtype.kind not in 'iuf' or values.shape != (len(index),):
+            return None
+        return index, values.astype(float, copy=False)
+
+    def _construct_array_storage(self):
+        """Initialize the data for a Param that uses array storage
+
+        Initializers that contain numeric data (dicts, pandas Series and
+        DataFrames, arrays, and numeric constants) are processed in bulk.
+        Everything else falls back on the (per-element) rule processing.
+
+        """
+        data = None
+        if self._rule is not None:
+            data = self._initializer_arrays(self._rule)
+        if data is None:
+            return self._construct_from_rule_using_setitem()
+        index, values = data
+        index_set = self._index_set
+        if index_set.isfinite():
+            # Checking against the set of members is significantly
+            # faster than calling __contains__ for every index
+            valid = set(index_set).issuperset(index)
+        else:
+            valid = all(map(index_set.__contains__, index))
+        if not valid:
+            # Defer to the rule processing to either normalize the
+            # indices or generate the appropriate exception
+            return self._construct_from_rule_using_setitem()
+        start = self._storage.size
+        self._storage.populate(self, index)
+        pos = slice(start, start + len(index))
+        try:
+            self._set_array_values(pos, values, index)
+        except:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed for %s '%s':\n%s: %s"
+                % (self.ctype.__name__, self.name, type(err).__name__, err)
+            )
+            raise
+
     def construct(self, data=None):
         """
         Initialize this component.
@@ -835,7 +1200,10 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             #
             # Step #1: initialize data from rule value
             #
-            self._construct_from_rule_using_setitem()
+            if self._storage is not None:
+                self._construct_array_storage()
+            else:
+                self._construct_from_rule_using_setitem()
             #
             # Step #2: allow any user-specified (external) data to override
             # the initialization
@@ -872,6 +1240,13 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             # (avoids calling _set_contains on self._index_set at runtime)
             if self._dense_initialize:
                 self.to_dense_data()
+            elif (
+                self._storage is not None
+                and self._index_set.isfinite()
+                and len(self._data) < len(self._index_set)
+            ):
+                # Array storage is always dense
+                self.to_dense_data()
         finally:
             timer.report()
 
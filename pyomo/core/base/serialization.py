@@ -0,0 +1,1038 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Compact binary serialization of constructed models
+
+This module provides :py:func:`save_model` and :py:func:`load_model`,
+which store a constructed model in a compact columnar binary format.
+Instead of pickling every component data and expression node, the
+model data is stored as a (small) header describing the components,
+followed by a set of contiguous arrays:
+
+  - component indices, variable values / bounds / fixed flags, and
+    parameter values are stored as typed (NumPy) columns
+
+  - all expressions (constraint bodies, objectives, named expressions,
+    and non-constant variable bounds) are stored as a single postfix
+    ("reverse Polish") encoding of the expression trees: an array of
+    operation codes, an array of operands (argument counts or
+    references to variables, parameters, expressions, and constants),
+    and arrays holding the numeric constants.
+
+The arrays are memory-mapped when the file is loaded.
+
+The following component types are supported: :py:class:`Block`,
+:py:class:`Set`, :py:class:`RangeSet`, :py:class:`Param`,
+:py:class:`Var`, :py:class:`Constraint`, :py:class:`Objective`, and
+:py:class:`Expression`.  Saving a model that contains any other
+component type (or References, or components with units) raises a
+``ValueError``.  Rules (e.g., initialization, validation, and filter
+functions) are not stored: the loaded model holds the same data, but
+is not rebuilt from the original rules.
+
+.. note::
+
+   The file header is stored using :py:mod:`pickle`.  As with pickle,
+   only load files from trusted sources.
+
+"""
+
+import mmap
+import pickle
+import struct
+
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_types
+from pyomo.core.base.block import Block, ScalarBlock, IndexedBlock
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.expression import Expression
+from pyomo.core.base.global_set import GlobalSets
+from pyomo.core.base.objective import Objective
+from pyomo.core.base.param import Param, _ParamData, _ImplicitAny
+from pyomo.core.base.set import (
+    Set,
+    RangeSet,
+    SetProduct,
+    SetUnion,
+    SetIntersection,
+    SetDifference,
+    SetSymmetricDifference,
+    _InsertionOrderSetData,
+    _SortedSetData,
+)
+from pyomo.core.base.var import Var
+from pyomo.core.staleflag import StaleFlagManager
+
+_MAGIC = b'PYOMOBIN'
+# Set operators that are saved as references to their operands
+_SET_OPERATORS = {
+    'union': SetUnion,
+    'intersection': SetIntersection,
+    'difference': SetDifference,
+    'symmetric_difference': SetSymmetricDifference,
+}
+_FORMAT_VERSION = 1
+# Arrays are aligned to cache-line boundaries within the file
+_ALIGN = 64
+# magic, format version, header length
+_PREAMBLE = struct.Struct('<8sIQ')
+
+# Operation codes for expression tree leaves.  Nonnegative operation
+# codes are indices into the table of expression node types.
+_FLOAT = -1
+_INT = -2
+_OBJECT = -3
+_VAR = -4
+_PARAM = -5
+_EXPR = -6
+
+# Expression node slots that are reconstructed from the argument list
+_ARGS_SLOTS = ('_args_', '_nargs')
+
+# Python ints that can be stored exactly in a float64 column
+_MAX_EXACT_INT = 2**53
+_MAX_INT64 = 2**63 - 1
+_nan = float('nan')
+_ninf = float('-inf')
+_inf = float('inf')
+_float_types = {int, float, type(None)}
+
+
+def _int_array(values):
+    """Return `values` as an array using the smallest (signed) int type"""
+    ans = np.array(values, dtype=np.int64)
+    if ans.size:
+        lb = ans.min()
+        ub = ans.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= lb and ub <= info.max:
+                return ans.astype(dtype)
+    return ans
+
+
+def save_model(model, filename):
+    """Save a constructed model to a file in a compact binary format
+
+    Parameters
+    ----------
+    model: _BlockData
+        The (constructed) model or block to save
+
+    filename: str
+        The name of the file to create
+
+    """
+    if not numpy_available:
+        raise ValueError("save_model() requires numpy")
+    _ModelWriter(model).write(filename)
+
+
+def load_model(filename):
+    """Load a model stored with :py:func:`save_model`
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file to load
+
+    Returns
+    -------
+    ConcreteModel
+
+    """
+    if not numpy_available:
+        raise ValueError("load_model() requires numpy")
+    return _ModelReader(filename).load()
+
+
+class _ModelWriter(object):
+    def __init__(self, model):
+        self.model = model
+        self.arrays = []
+        self.components = []
+        self.unsupported = []
+        self.deferred = []
+        # Map id() of components / data objects to their position in
+        # the order they are recorded (and recreated when loading)
+        self.component_id = {}
+        self.block_id = {}
+        # Map id() of Var / Param / Expression data to their (leaf
+        # operation code, position)
+        self.leaf_ref = {}
+        self.n_vars = 0
+        self.n_params = 0
+        self.n_exprs = 0
+        # The postfix expression encoding
+        self.roots = [0]
+        self.ops = []
+        self.operands = []
+        self.floats = []
+        self.ints = []
+        self.objects = []
+        self.constants = {}
+        self.node_class = {}
+        self.node_types = {}
+        self.simple_node_types = {}
+        self.extra_slots = {}
+
+    def write(self, filename):
+        with PauseGC():
+            self.block_id[id(self.model)] = 0
+            self._write_block(self.model)
+            if self.unsupported:
+                raise ValueError(
+                    "Cannot save model '%s': the following components are "
+                    "not supported by the binary model format:\n\t%s"
+                    % (self.model.name, "\n\t".join(self.unsupported))
+                )
+            # Expressions can reference any Var / Param / Expression in
+            # the model, so they are encoded after all components have
+            # been recorded
+            for fcn, args in self.deferred:
+                fcn(*args)
+            header = {
+                'name': self.model.name,
+                'blocks': len(self.block_id),
+                'components': self.components,
+                'node_types': sorted(self.node_types, key=self.node_types.get),
+                'roots': self.add_array(_int_array(self.roots)),
+                'ops': self.add_array(_int_array(self.ops)),
+                'operands': self.add_array(_int_array(self.operands)),
+                'floats': self.add_array(np.array(self.floats, dtype=np.float64)),
+                'ints': self.add_array(_int_array(self.ints)),
+                'objects': self.add_object(self.objects),
+            }
+            offset = 0
+            layout = []
+            for arr in self.arrays:
+                offset += -offset % _ALIGN
+                layout.append((arr.dtype.str, arr.shape, offset))
+                offset += arr.nbytes
+            header['arrays'] = layout
+            header = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+
+            with open(filename, 'wb') as FILE:
+                FILE.write(_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(header)))
+                FILE.write(header)
+                pos = _PREAMBLE.size + len(header)
+                start = pos + (-pos % _ALIGN)
+                for arr, (_, _, offset) in zip(self.arrays, layout):
+                    pad = start + offset - pos
+                    if pad:
+                        FILE.write(b'\0' * pad)
+                    FILE.write(arr.data)
+                    pos = start + offset + arr.nbytes
+
+    #
+    # Column encoding
+    #
+
+    def add_array(self, arr):
+        self.arrays.append(np.ascontiguousarray(arr))
+        return len(self.arrays) - 1
+
+    def add_object(self, obj):
+        return self.add_array(
+            np.frombuffer(
+                pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8
+            )
+        )
+
+    def pack_keys(self, keys):
+        """Encode a list of component indices as a column"""
+        types = set(map(type, keys))
+        if types == {int}:
+            try:
+                return ('int', self.add_array(_int_array(keys)))
+            except OverflowError:
+                pass
+        elif types == {tuple}:
+            dimen = set(map(len, keys))
+            if len(dimen) == 1 and {type(i) for k in keys for i in k} == {int}:
+                try:
+                    return ('tuple', self.add_array(_int_array(keys)))
+                except OverflowError:
+                    pass
+        return ('object', self.add_object(keys))
+
+    def pack_values(self, values):
+        """Encode a list of (numeric) values as a column
+
+        Numeric values (and None) are stored as a float64 array (with
+        None stored as NaN).  If the list contains Python ints, a
+        boolean mask of the integer entries is also stored so that the
+        original types can be restored.
+
+        """
+        types = set(map(type, values))
+        if types <= _float_types:
+            if int in types:
+                is_int = [v.__class__ is int for v in values]
+                if any(abs(v) > _MAX_EXACT_INT for v, i in zip(values, is_int) if i):
+                    return ('object', self.add_object(values))
+                is_int = self.add_array(np.array(is_int, dtype=bool))
+            else:
+                is_int = None
+            if type(None) in types:
+                values = [_nan if v is None else v for v in values]
+            return ('float', self.add_array(np.array(values, dtype=np.float64)), is_int)
+        return ('object', self.add_object(values))
+
+    def set_ref(self, s):
+        """Return a reference to the Set `s`"""
+        if s is None:
+            return None
+        if GlobalSets.get(s.local_name, None) is s:
+            return ('global', s.local_name)
+        if id(s) in self.component_id:
+            return ('component', self.component_id[id(s)])
+        if isinstance(s, SetProduct):
+            return ('product', [self.set_ref(sub) for sub in s.subsets(False)])
+        for kind, op in _SET_OPERATORS.items():
+            if isinstance(s, op):
+                return (kind, [self.set_ref(sub) for sub in s._sets])
+        if s.isfinite():
+            return ('values', self.pack_keys(list(s)))
+        raise ValueError(
+            "Cannot save model '%s': Set '%s' is not a component on the model "
+            "and is not finite" % (self.model.name, s.name)
+        )
+
+    #
+    # Components
+    #
+
+    def _write_block(self, block):
+        bid = self.block_id[id(block)]
+        for comp in block.component_objects(descend_into=False):
+            handler = self._handlers.get(comp.ctype, None)
+            if (
+                handler is None
+                or not isinstance(comp, comp.ctype)
+                or (comp.is_indexed() and comp.is_reference())
+                or getattr(comp, '_units', None) is not None
+            ):
+                self.unsupported.append("%s (%s)" % (comp.name, type(comp).__name__))
+                continue
+            record = {
+                'type': comp.ctype.__name__,
+                'block': bid,
+                'name': comp.local_name,
+                'doc': comp.doc,
+                'index': self.set_ref(comp.index_set()) if comp.is_indexed() else None,
+            }
+            self.component_id[id(comp)] = len(self.components)
+            self.components.append(record)
+            handler(self, comp, record)
+
+    def _data(self, comp, record):
+        """Record the indices of the data in `comp` and return the data"""
+        if comp.is_indexed():
+            keys = list(comp.keys())
+            record['keys'] = self.pack_keys(keys)
+            return [comp[k] for k in keys]
+        record['keys'] = None
+        return list(comp.values())
+
+    def _add_leaves(self, data, op, n):
+        """Record the (expression leaf) data objects; return the new count"""
+        self.leaf_ref.update((id(obj), (op, i)) for i, obj in enumerate(data, n))
+        return n + len(data)
+
+    def _active(self, comp, data, record):
+        record['active'] = comp.active
+        inactive = [i for i, obj in enumerate(data) if not obj.active]
+        record['inactive'] = self.add_array(_int_array(inactive)) if inactive else None
+
+    def _write_Block(self, comp, record):
+        if type(comp) not in (ScalarBlock, IndexedBlock):
+            # Custom block classes carry (unsaved) behavior
+            self.unsupported.append("%s (%s)" % (comp.name, type(comp).__name__))
+            return
+        data = self._data(comp, record)
+        self._active(comp, data, record)
+        # Number all the block data before descending into them (so
+        # the loader can number them as it creates the component)
+        for obj in data:
+            self.block_id[id(obj)] = len(self.block_id)
+        for obj in data:
+            self._write_block(obj)
+
+    def _write_Set(self, comp, record):
+        if isinstance(comp, RangeSet):
+            record['ranges'] = comp._ranges
+            record['finite'] = comp.isfinite()
+            return
+        if comp.is_indexed():
+            data_class = comp._ComponentDataClass
+        else:
+            data_class = type(comp)
+        if issubclass(data_class, _SortedSetData):
+            record['ordered'] = 'sorted'
+        elif issubclass(data_class, _InsertionOrderSetData):
+            record['ordered'] = 'insertion'
+        else:
+            record['ordered'] = None
+        data = self._data(comp, record)
+        record['domain'] = None
+        if data:
+            # Note: the dimen of indexed Sets is inferred from the data
+            dimen = data[0].dimen
+            if not comp.is_indexed() and (dimen is None or dimen.__class__ is int):
+                record['dimen'] = dimen
+            record['domain'] = self.set_ref(data[0].domain)
+        values = []
+        offsets = [0]
+        for obj in data:
+            values.extend(obj)
+            offsets.append(len(values))
+        record['values'] = self.pack_keys(values)
+        record['offsets'] = self.add_array(_int_array(offsets))
+
+    def _write_Param(self, comp, record):
+        record['mutable'] = comp.mutable
+        record['default'] = comp._default_val
+        record['storage'] = 'object' if comp._storage is None else 'array'
+        domain = comp.domain
+        record['domain'] = (
+            None if domain.__class__ is _ImplicitAny else self.set_ref(domain)
+        )
+        keys = []
+        values = []
+        undefined = []
+        NoValue = Param.NoValue
+        for k, v in comp._data.items():
+            if isinstance(v, _ParamData):
+                v = v._value
+            if v is NoValue:
+                undefined.append(k)
+            else:
+                keys.append(k)
+                values.append(v)
+        record['keys'] = self.pack_keys(keys)
+        record['values'] = self.pack_values(values)
+        record['undefined'] = self.pack_keys(undefined)
+        if comp.mutable:
+            if comp.is_indexed():
+                data = [comp._data[k] for k in keys + undefined]
+            else:
+                data = [comp]
+            self.n_params = self._add_leaves(data, _PARAM, self.n_params)
+
+    def _write_Var(self, comp, record):
+        record['storage'] = 'object' if comp._storage is None else 'array'
+        data = self._data(comp, record)
+        domains = {}
+        domain = []
+        lb = []
+        ub = []
+        bounds = []
+        for i, v in enumerate(data):
+            _lb = v._lb
+            _ub = v._ub
+            if _lb.__class__ not in _float_types or _ub.__class__ not in _float_types:
+                # Bounds that are not constants (e.g., mutable Params)
+                # are stored as expressions (see _write_var_bounds()).
+                # The other bound is still stored in its column.
+                bounds.append((i, _lb, _ub))
+                if _lb.__class__ not in _float_types:
+                    _lb = None
+                if _ub.__class__ not in _float_types:
+                    _ub = None
+            lb.append(_lb)
+            ub.append(_ub)
+            d = v._domain
+            if id(d) not in domains:
+                domains[id(d)] = (len(domains), d)
+            domain.append(domains[id(d)][0])
+        record['value'] = self.pack_values([v._value for v in data])
+        record['lb'] = self.pack_values(lb)
+        record['ub'] = self.pack_values(ub)
+        record['fixed'] = self.add_array(np.array([v._fixed for v in data], dtype=bool))
+        is_stale = StaleFlagManager.is_stale
+        record['stale'] = self.add_array(
+            np.array([is_stale(v._stale) for v in data], dtype=bool)
+        )
+        record['domains'] = [self.set_ref(d) for _, d in domains.values()]
+        record['domain'] = self.add_array(_int_array(domain))
+        self.n_vars = self._add_leaves(data, _VAR, self.n_vars)
+        if bounds:
+            self.deferred.append((self._write_var_bounds, (record, bounds)))
+        else:
+            record['bounds'] = None
+
+    def _write_var_bounds(self, record, bounds):
+        record['bounds'] = [
+            (
+                i,
+                self.encode(lb) if lb.__class__ not in _float_types else None,
+                self.encode(ub) if ub.__class__ not in _float_types else None,
+            )
+            for i, lb, ub in bounds
+        ]
+
+    def _write_Expression(self, comp, record):
+        data = self._data(comp, record)
+        self.n_exprs = self._add_leaves(data, _EXPR, self.n_exprs)
+        self.deferred.append((self._write_exprs, (record, data)))
+
+    def _write_Constraint(self, comp, record):
+        data = self._data(comp, record)
+        self._active(comp, data, record)
+        self.deferred.append((self._write_exprs, (record, data)))
+
+    def _write_Objective(self, comp, record):
+        data = self._data(comp, record)
+        self._active(comp, data, record)
+        record['sense'] = self.add_array(
+            np.array([int(obj.sense) for obj in data], dtype=np.int8)
+        )
+        self.deferred.append((self._write_exprs, (record, data)))
+
+    def _write_exprs(self, record, data):
+        record['exprs'] = self.add_array(
+            _int_array([self.encode(obj.expr) for obj in data])
+        )
+
+    _handlers = {
+        Block: _write_Block,
+        Set: _write_Set,
+        RangeSet: _write_Set,
+        Param: _write_Param,
+        Var: _write_Var,
+        Expression: _write_Expression,
+        Constraint: _write_Constraint,
+        Objective: _write_Objective,
+    }
+
+    #
+    # Expressions
+    #
+
+    def encode(self, expr):
+        """Append the postfix encoding of `expr`; return its root id"""
+        if expr is None:
+            return -1
+        ops = []
+        operands = []
+        leaf_ref = self.leaf_ref
+        node_class = self.node_class
+        simple_node_types = self.simple_node_types
+        # We generate the prefix encoding with the arguments in reverse
+        # order (which does not require tracking the position within
+        # each node's arguments), and then reverse the result to get
+        # the postfix encoding.
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            cls = node.__class__
+            is_node = node_class.get(cls, None)
+            if is_node is None:
+                is_node = self._classify(node)
+            if is_node:
+                op = simple_node_types.get((cls, node._args_.__class__), None)
+                if op is None:
+                    op = self._node_type(node)
+                args = node.args
+                ops.append(op)
+                operands.append(len(args))
+                stack.extend(args)
+            else:
+                ref = leaf_ref.get(id(node), None)
+                if ref is None:
+                    ref = self._constant(node)
+                ops.append(ref[0])
+                operands.append(ref[1])
+        ops.reverse()
+        operands.reverse()
+        self.ops.extend(ops)
+        self.operands.extend(operands)
+        self.roots.append(len(self.ops))
+        return len(self.roots) - 2
+
+    def _classify(self, node):
+        cls = node.__class__
+        ans = self.node_class[cls] = (
+            cls not in native_types
+            and node.is_expression_type()
+            and not node.is_named_expression_type()
+        )
+        return ans
+
+    def _constant(self, node):
+        if node.__class__ not in native_types:
+            if not node.is_constant():
+                raise ValueError(
+                    "Cannot save model '%s': an expression references "
+                    "'%s', which is not a component of the model (or is "
+                    "not supported by the binary model format)"
+                    % (self.model.name, node)
+                )
+            # Other constants (e.g., NumericConstant or immutable Params)
+            node = node()
+        cls = node.__class__
+        key = (cls, node)
+        try:
+            return self.constants[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable constant: do not pool it
+            key = None
+        if cls is float:
+            ans = (_FLOAT, len(self.floats))
+            self.floats.append(node)
+        elif cls is int and -_MAX_INT64 <= node <= _MAX_INT64:
+            ans = (_INT, len(self.ints))
+            self.ints.append(node)
+        else:
+            ans = (_OBJECT, len(self.objects))
+            self.objects.append(node)
+        if key is not None:
+            self.constants[key] = ans
+        return ans
+
+    def _node_type(self, node):
+        cls = node.__class__
+        extra_slots = self.extra_slots.get(cls, None)
+        if extra_slots is None:
+            if cls.__auto_slots__.has_dict or '_args_' not in cls.__auto_slots__.slots:
+                raise ValueError(
+                    "Cannot save model '%s': expression node type '%s' is not "
+                    "supported by the binary model format"
+                    % (self.model.name, cls.__name__)
+                )
+            extra_slots = self.extra_slots[cls] = tuple(
+                s for s in cls.__auto_slots__.slots if s not in _ARGS_SLOTS
+            )
+        extras = tuple(getattr(node, s) for s in extra_slots)
+        for val in extras:
+            if hasattr(val, 'is_component_type'):
+                raise ValueError(
+                    "Cannot save model '%s': expression node type '%s' "
+                    "references component '%s' (which is not supported by "
+                    "the binary model format)" % (self.model.name, cls.__name__, val)
+                )
+        args_class = node._args_.__class__
+        key = (cls, args_class is list, extras)
+        ans = self.node_types.get(key, None)
+        if ans is None:
+            ans = self.node_types[key] = len(self.node_types)
+            if not extra_slots:
+                self.simple_node_types[cls, args_class] = ans
+        return ans
+
+
+class _ModelReader(object):
+    def __init__(self, filename):
+        with open(filename, 'rb') as FILE:
+            magic, version, header_len = _PREAMBLE.unpack(FILE.read(_PREAMBLE.size))
+            if magic != _MAGIC:
+                raise ValueError(
+                    "File '%s' is not a Pyomo binary model file" % (filename,)
+                )
+            if version != _FORMAT_VERSION:
+                raise ValueError(
+                    "Pyomo binary model file '%s' uses an unsupported format "
+                    "version (%s)" % (filename, version)
+                )
+            self.header = pickle.loads(FILE.read(header_len))
+            pos = _PREAMBLE.size + header_len
+            start = pos + (-pos % _ALIGN)
+            layout = self.header['arrays']
+            FILE.seek(0, 2)
+            if FILE.tell() > start:
+                # Note: the arrays hold references to the mmap, which
+                # will be closed when the last array is released
+                buf = mmap.mmap(FILE.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buf = b''
+        self.arrays = [
+            (
+                np.frombuffer(
+                    buf,
+                    dtype=dtype,
+                    count=int(np.prod(shape, dtype=np.int64)),
+                    offset=start + offset,
+                ).reshape(shape)
+                if 0 not in shape
+                else np.empty(shape, dtype=dtype)
+            )
+            for dtype, shape, offset in layout
+        ]
+
+    #
+    # Column decoding
+    #
+
+    def array(self, aid):
+        return self.arrays[aid]
+
+    def get_object(self, aid):
+        return pickle.loads(self.arrays[aid].tobytes())
+
+    def keys(self, col):
+        if col is None:
+            return [None]
+        kind, aid = col
+        if kind == 'int':
+            return self.arrays[aid].tolist()
+        elif kind == 'tuple':
+            return list(map(tuple, self.arrays[aid].tolist()))
+        return self.get_object(aid)
+
+    def values(self, col):
+        if col[0] == 'object':
+            return self.get_object(col[1])
+        arr = self.arrays[col[1]]
+        ans = arr.tolist()
+        for i in np.flatnonzero(np.isnan(arr)).tolist():
+            ans[i] = None
+        if col[2] is not None:
+            for i in np.flatnonzero(self.arrays[col[2]]).tolist():
+                ans[i] = int(ans[i])
+        return ans
+
+    def set_ref(self, ref):
+        if ref is None:
+            return None
+        kind, val = ref
+        if kind == 'global':
+            return GlobalSets[val]
+        elif kind == 'component':
+            return self.components[val]
+        elif kind == 'product':
+            return SetProduct(*[self.set_ref(sub) for sub in val])
+        elif kind in _SET_OPERATORS:
+            return _SET_OPERATORS[kind](*[self.set_ref(sub) for sub in val])
+        ans = Set(initialize=self.keys(val))
+        ans.construct()
+        return ans
+
+    def index_args(self, record):
+        ref = record['index']
+        if ref is None:
+            return ()
+        if ref[0] == 'product':
+            return tuple(self.set_ref(sub) for sub in ref[1])
+        if ref[0] == 'values':
+            return (self.keys(ref[1]),)
+        return (self.set_ref(ref),)
+
+    #
+    # Model reconstruction
+    #
+
+    def load(self):
+        from pyomo.core.base.PyomoModel import ConcreteModel
+
+        header = self.header
+        with PauseGC():
+            model = ConcreteModel(name=header['name'])
+            self.blocks = [model]
+            self.components = []
+            self.vars = []
+            self.params = []
+            self.exprs = []
+            self.deferred = []
+            self.active = []
+            self._prepare_expressions()
+            for record in header['components']:
+                parent = self.blocks[record['block']]
+                comp = self._handlers[record['type']](self, record, parent)
+                self.components.append(comp)
+            for fcn, args in self.deferred:
+                fcn(*args)
+            for comp, data, record in self.active:
+                if not record['active']:
+                    comp.deactivate()
+                if record['inactive'] is not None:
+                    for i in self.arrays[record['inactive']].tolist():
+                        data[i].deactivate()
+        return model
+
+    def _data(self, comp, record):
+        if comp.is_indexed():
+            return [comp[k] for k in self.keys(record['keys'])]
+        return [comp]
+
+    def _load_Block(self, record, parent):
+        comp = Block(*self.index_args(record), dense=False, doc=record['doc'])
+        parent.add_component(record['name'], comp)
+        data = self._data(comp, record)
+        self.blocks.extend(data)
+        self.active.append((comp, data, record))
+        return comp
+
+    def _load_Set(self, record, parent):
+        if 'ranges' in record:
+            comp = RangeSet(
+                ranges=record['ranges'], finite=record['finite'], doc=record['doc']
+            )
+            parent.add_component(record['name'], comp)
+            return comp
+        ordered = {
+            'insertion': Set.InsertionOrder,
+            'sorted': Set.SortedOrder,
+            None: False,
+        }[record['ordered']]
+        values = self.keys(record['values'])
+        offsets = self.arrays[record['offsets']].tolist()
+        keys = self.keys(record['keys'])
+        if record['keys'] is None:
+            init = values
+        else:
+            init = {k: values[offsets[i] : offsets[i + 1]] for i, k in enumerate(keys)}
+        kwds = {}
+        if record['domain'] is not None:
+            kwds['within'] = self.set_ref(record['domain'])
+        if 'dimen' in record:
+            kwds['dimen'] = record['dimen']
+        comp = Set(
+            *self.index_args(record),
+            initialize=init,
+            ordered=ordered,
+            doc=record['doc'],
+            **kwds,
+        )
+        parent.add_component(record['name'], comp)
+        return comp
+
+    def _load_Param(self, record, parent):
+        kwds = {}
+        if record['domain'] is not None:
+            kwds['within'] = self.set_ref(record['domain'])
+        keys = self.keys(record['keys'])
+        values = self.values(record['values'])
+        if record['index'] is None:
+            if values:
+                kwds['initialize'] = values[0]
+        elif keys:
+            kwds['initialize'] = dict(zip(keys, values))
+        comp = Param(
+            *self.index_args(record),
+            mutable=record['mutable'],
+            default=record['default'],
+            storage=record['storage'],
+            doc=record['doc'],
+            **kwds,
+        )
+        parent.add_component(record['name'], comp)
+        if record['mutable']:
+            if comp.is_indexed():
+                undefined = self.keys(record['undefined'])
+                self.params.extend(comp[k] for k in keys + undefined)
+            else:
+                self.params.append(comp)
+        return comp
+
+    def _load_Var(self, record, parent):
+        kwds = {}
+        if record['index'] is not None:
+            kwds['dense'] = False
+        comp = Var(
+            *self.index_args(record),
+            storage=record['storage'],
+            doc=record['doc'],
+            **kwds,
+        )
+        parent.add_component(record['name'], comp)
+        if comp.is_indexed():
+            get = comp._getitem_when_not_present
+            data = [get(k) for k in self.keys(record['keys'])]
+        else:
+            data = [comp]
+        self.vars.extend(data)
+        domains = [self.set_ref(ref) for ref in record['domains']]
+        domain = [domains[i] for i in self.arrays[record['domain']].tolist()]
+        stale_mapper = StaleFlagManager.stale_mapper
+        stale = [
+            stale_mapper(False, flag) for flag in self.arrays[record['stale']].tolist()
+        ]
+        storage = comp._storage
+        if storage is not None and data:
+            # Array storage: the new VarData were assigned consecutive
+            # positions, so we can load the columns directly
+            start = data[0]._pos
+            end = start + len(data)
+            for name, fill in (('value', _nan), ('lb', _ninf), ('ub', _inf)):
+                col = record[name]
+                if col[0] == 'float':
+                    vals = self.arrays[col[1]]
+                    vals = np.where(np.isnan(vals), fill, vals)
+                else:
+                    vals = [fill if v is None else v for v in self.values(col)]
+                getattr(storage, name)[start:end] = vals
+            storage.fixed[start:end] = self.arrays[record['fixed']]
+            storage.stale[start:end] = stale
+            storage.domain[start:end] = domain
+        else:
+            for v, val, lb, ub, fixed, flag, d in zip(
+                data,
+                self.values(record['value']),
+                self.values(record['lb']),
+                self.values(record['ub']),
+                self.arrays[record['fixed']].tolist(),
+                stale,
+                domain,
+            ):
+                v._value = val
+                v._lb = lb
+                v._ub = ub
+                v._fixed = fixed
+                v._stale = flag
+                v._domain = d
+        if record['bounds']:
+            self.deferred.append((self._load_var_bounds, (data, record['bounds'])))
+        return comp
+
+    def _load_var_bounds(self, data, bounds):
+        for i, lb, ub in bounds:
+            v = data[i]
+            if lb is not None:
+                v.setlb(self.decode(lb))
+            if ub is not None:
+                v.setub(self.decode(ub))
+
+    def _load_Expression(self, record, parent):
+        comp = Expression(*self.index_args(record), doc=record['doc'])
+        parent.add_component(record['name'], comp)
+        data = self._data(comp, record)
+        self.exprs.extend(data)
+        self.deferred.append((self._load_named_exprs, (data, record)))
+        return comp
+
+    def _load_named_exprs(self, data, record):
+        decode = self.decode
+        for obj, root in zip(data, self.arrays[record['exprs']].tolist()):
+            obj.set_value(decode(root))
+
+    def _load_Constraint(self, record, parent):
+        comp = Constraint(*self.index_args(record), doc=record['doc'])
+        parent.add_component(record['name'], comp)
+        self.deferred.append((self._load_exprs, (comp, record)))
+        return comp
+
+    def _load_Objective(self, record, parent):
+        comp = Objective(*self.index_args(record), doc=record['doc'])
+        parent.add_component(record['name'], comp)
+        self.deferred.append((self._load_exprs, (comp, record)))
+        return comp
+
+    def _load_exprs(self, comp, record):
+        decode = self.decode
+        roots = self.arrays[record['exprs']].tolist()
+        if comp.is_indexed():
+            # Note: the indices were validated when the model was saved
+            setitem = comp._setitem_when_not_present
+            keys = self.keys(record['keys'])
+            for k, root in zip(keys, roots):
+                setitem(k, decode(root))
+            data = [comp[k] for k in keys]
+        else:
+            for root in roots:
+                comp.set_value(decode(root))
+            data = [comp] if roots else []
+        if 'sense' in record:
+            for obj, sense in zip(data, self.arrays[record['sense']].tolist()):
+                obj.sense = sense
+        self.active.append((comp, data, record))
+
+    _handlers = {
+        'Block': _load_Block,
+        'Set': _load_Set,
+        'RangeSet': _load_Set,
+        'Param': _load_Param,
+        'Var': _load_Var,
+        'Expression': _load_Expression,
+        'Constraint': _load_Constraint,
+        'Objective': _load_Objective,
+    }
+
+    #
+    # Expressions
+    #
+
+    def _prepare_expressions(self):
+        header = self.header
+        self.roots = self.arrays[header['roots']].tolist()
+        self.ops = self.arrays[header['ops']].tolist()
+        self.operands = self.arrays[header['operands']].tolist()
+        self.node_types = []
+        for cls, is_list, extras in header['node_types']:
+            slots = cls.__auto_slots__.slots
+            if extras:
+                template = [None] * len(slots)
+                extras = iter(extras)
+                for i, slot in enumerate(slots):
+                    if slot not in _ARGS_SLOTS:
+                        template[i] = next(extras)
+            else:
+                template = None
+            self.node_types.append(
+                (
+                    cls,
+                    is_list,
+                    '_nargs' in slots,
+                    template,
+                    slots.index('_args_'),
+                    slots.index('_nargs') if '_nargs' in slots else None,
+                )
+            )
+        # Note: the leaf lists are indexed by -op
+        self.leaves = [
+            None,
+            self.arrays[header['floats']].tolist(),
+            self.arrays[header['ints']].tolist(),
+            self.get_object(header['objects']),
+            self.vars,
+            self.params,
+            self.exprs,
+        ]
+
+    def decode(self, root):
+        """Rebuild the expression tree with the specified root id"""
+        if root < 0:
+            return None
+        ops = self.ops
+        operands = self.operands
+        leaves = self.leaves
+        node_types = self.node_types
+        stack = []
+        for i in range(self.roots[root], self.roots[root + 1]):
+            op = ops[i]
+            if op < 0:
+                stack.append(leaves[-op][operands[i]])
+                continue
+            n = operands[i]
+            cls, is_list, has_nargs, template, args_pos, nargs_pos = node_types[op]
+            if n:
+                args = stack[-n:]
+                del stack[-n:]
+            else:
+                args = []
+            if not is_list:
+                args = tuple(args)
+            node = cls.__new__(cls)
+            if template is None:
+                node._args_ = args
+                if has_nargs:
+                    node._nargs = n
+            else:
+                state = list(template)
+                state[args_pos] = args
+                if has_nargs:
+                    state[nargs_pos] = n
+                node.__setstate__(state)
+            stack.append(node)
+        return stack[0]
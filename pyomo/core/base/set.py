@@ -20,6 +20,7 @@ from pyomo.common.pyomo_typing import overload
 from typing import Union, Type, Any as typingAny
 from collections.abc import Iterator
 
+from pyomo.common.autoslots import AutoSlots
 from pyomo.common.collections import ComponentSet
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
@@ -41,6 +42,7 @@ from pyomo.core.base.initializer import (
     Initializer,
     CountedCallInitializer,
     IndexedCallInitializer,
+    VectorizedInitializer,
 )
 from pyomo.core.base.range import (
     NumericRange,
@@ -512,6 +514,21 @@ class _NotFound(object):
     pass
 
 
+class _SetVersion(object):
+    """Counter of changes to the members of (all) concrete Sets
+
+    The counter is incremented whenever members are added to (or removed
+    from) any _FiniteSetData object, or the ranges of a RangeSet are
+    changed.  Each modified set records the new counter value as its
+    own version.  Materialized SetOperators (see
+    :py:meth:`SetOperator.materialize`) use this to cheaply detect
+    changes to their operand sets.
+
+    """
+
+    value = 0
+
+
 # A trivial class that we can use to test if an object is a "legitimate"
 # set (either ScalarSet, or a member of an IndexedSet)
 class _SetDataBase(ComponentData):
@@ -1297,7 +1314,7 @@ class _FiniteSetMixin(object):
 class _FiniteSetData(_FiniteSetMixin, _SetData):
     """A general unordered iterable Set"""
 
-    __slots__ = ('_values', '_domain', '_validate', '_filter', '_dimen')
+    __slots__ = ('_values', '_domain', '_validate', '_filter', '_dimen', '_version')
 
     def __init__(self, component):
         _SetData.__init__(self, component=component)
@@ -1309,6 +1326,7 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
         self._validate = None
         self._filter = None
         self._dimen = UnknownSetDimen
+        self._version = 0
 
     def get(self, value, default=None):
         """
@@ -1446,15 +1464,19 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
 
     def _add_impl(self, value):
         self._values.add(value)
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     def remove(self, val):
         self._values.remove(val)
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     def discard(self, val):
         self._values.discard(val)
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     def clear(self):
         self._values.clear()
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     def set_value(self, val):
         self.clear()
@@ -1467,7 +1489,9 @@ class _FiniteSetData(_FiniteSetMixin, _SetData):
                 self.add(v)
 
     def pop(self):
-        return self._values.pop()
+        ans = self._values.pop()
+        _SetVersion.value = self._version = _SetVersion.value + 1
+        return ans
 
 
 class _ScalarOrderedSetMixin(object):
@@ -1666,12 +1690,17 @@ class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
     def _add_impl(self, value):
         self._values[value] = len(self._values)
         self._ordered_values.append(value)
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     def remove(self, val):
         idx = self._values.pop(val)
-        self._ordered_values.pop(idx)
-        for i in range(idx, len(self._ordered_values)):
-            self._values[self._ordered_values[i]] -= 1
+        _ordered = self._ordered_values
+        _ordered.pop(idx)
+        # Renumber the remaining members (zip() / dict.update() keep
+        # this loop in C, which matters when removing from the front of
+        # large sets)
+        self._values.update(zip(_ordered[idx:], range(idx, len(_ordered))))
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     def discard(self, val):
         try:
@@ -1682,6 +1711,7 @@ class _OrderedSetData(_OrderedSetMixin, _FiniteSetData):
     def clear(self):
         self._values.clear()
         self._ordered_values = []
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     def pop(self):
         try:
@@ -1807,11 +1837,15 @@ class _SortedSetData(_SortedSetMixin, _OrderedSetData):
         return super(_SortedSetData, self).__reversed__()
 
     def _add_impl(self, value):
-        # Note that the sorted status has no bearing on insertion,
-        # so there is no reason to check if the data is correctly sorted
+        # Appending a value that sorts after the current last member
+        # (e.g., extending a time horizon) preserves the sort.
+        # Otherwise, we defer sorting until the set is next accessed.
+        _ordered = self._ordered_values
+        if self._is_sorted and _ordered:
+            self._is_sorted = self._sorts_after(value, _ordered[-1])
         self._values[value] = len(self._values)
-        self._ordered_values.append(value)
-        self._is_sorted = False
+        _ordered.append(value)
+        _SetVersion.value = self._version = _SetVersion.value + 1
 
     # Note: removing data does not affect the sorted flag
     # def remove(self, val):
@@ -1847,11 +1881,29 @@ class _SortedSetData(_SortedSetMixin, _OrderedSetData):
     def sorted_data(self):
         return self.data()
 
+    def _sorts_after(self, value, last):
+        """Return True if `value` is known to sort after `last`"""
+        # We can only rely on "<" for values that sorted_robust() would
+        # have compared directly (tuples may contain mixed types, so we
+        # always defer to a full sort for them)
+        if value.__class__ is not last.__class__ or value.__class__ is tuple:
+            if (
+                value.__class__ not in native_numeric_types
+                or last.__class__ not in native_numeric_types
+            ):
+                return False
+        if self.parent_component()._sort_fcn is not sorted_robust:
+            return False
+        try:
+            return last < value
+        except TypeError:
+            return False
+
     def _sort(self):
-        self._ordered_values = list(
+        _ordered = self._ordered_values = list(
             self.parent_component()._sort_fcn(self._ordered_values)
         )
-        self._values = {j: i for i, j in enumerate(self._ordered_values)}
+        self._values = dict(zip(_ordered, range(len(_ordered))))
         self._is_sorted = True
 
 
@@ -2238,16 +2290,20 @@ class Set(IndexedComponent):
                 # should have been passed directly to the underlying sets.
                 obj._validate = self._init_validate
         if self._init_filter is not None:
-            try:
-                _filter = Initializer(self._init_filter(_block, index))
-                if _filter.constant():
-                    # _init_filter was the actual filter function; use it.
-                    _filter = self._init_filter
-            except:
-                # We will assume any exceptions raised when getting the
-                # filter for this index indicate that the function
-                # should have been passed directly to the underlying sets.
+            if self._init_filter.__class__ is VectorizedInitializer:
+                # Vectorized filters are always the actual filter function
                 _filter = self._init_filter
+            else:
+                try:
+                    _filter = Initializer(self._init_filter(_block, index))
+                    if _filter.constant():
+                        # _init_filter was the actual filter function; use it.
+                        _filter = self._init_filter
+                except:
+                    # We will assume any exceptions raised when getting the
+                    # filter for this index indicate that the function
+                    # should have been passed directly to the underlying sets.
+                    _filter = self._init_filter
         else:
             _filter = None
         if self._init_values is not None:
@@ -2280,11 +2336,17 @@ class Set(IndexedComponent):
                     )
                 )
                 raise
-            for val in val_iter:
-                if val is Set.End:
-                    break
-                if _filter is None or _filter(_block, val):
+            if _filter.__class__ is VectorizedInitializer:
+                # Evaluate the filter for all the candidate values at once
+                # (the candidates that are filtered out are never created)
+                for val in _filter.select(_block, _values):
                     obj.add(val)
+            else:
+                for val in val_iter:
+                    if val is Set.End:
+                        break
+                    if _filter is None or _filter(_block, val):
+                        obj.add(val)
         # We defer adding the filter until now so that add() doesn't
         # call it a second time.
         obj._filter = _filter
@@ -2643,6 +2705,7 @@ class _InfiniteRangeSetData(_SetData):
 
     def clear(self):
         self._ranges = ()
+        _SetVersion.value += 1
 
     def ranges(self):
         return iter(self._ranges)
@@ -3093,6 +3156,7 @@ class RangeSet(Component):
             ranges = tuple(tmp)
 
         self._ranges = ranges
+        _SetVersion.value += 1
 
         if self._init_filter is not None:
             if not self.isfinite():
@@ -3136,6 +3200,7 @@ class RangeSet(Component):
                 if i is not None:
                     new_ranges.append(r)
             self._ranges = new_ranges
+            _SetVersion.value += 1
 
         if self._init_validate is not None:
             if not self.isfinite():
@@ -3274,11 +3339,13 @@ class AbstractFiniteSimpleRangeSet(metaclass=RenamedClass):
 
 
 class SetOperator(_SetData, Set):
-    __slots__ = ('_sets',)
+    __slots__ = ('_sets', '_members')
+    __autoslot_mappers__ = {'_members': AutoSlots.encode_as_none}
 
     def __init__(self, *args, **kwds):
         _SetData.__init__(self, component=self)
         Set.__init__(self, **kwds)
+        self._members = None
         self._sets, _anonymous = zip(*(process_setarg(_set) for _set in args))
         _anonymous = tuple(filter(None, _anonymous))
         if _anonymous:
@@ -3429,6 +3496,44 @@ class SetOperator(_SetData, Set):
         for s in self._sets:
             yield from s.subsets(expand_all_set_operators=expand_all_set_operators)
 
+    def materialize(self, enable=True):
+        """Store the members of this (finite) set operator
+
+        By default, set operators do not store their members: iterating
+        over (or testing membership in) the operator is delegated to
+        the operand sets.  Materializing the operator generates (once)
+        and stores the list of members along with a hashed index of
+        their positions.  Iteration, len(), membership tests, at(), and
+        ord() are then all served from the stored members.
+
+        The stored members are regenerated the first time the operator
+        is used after any of the (concrete) operand sets change.
+
+        Parameters
+        ----------
+        enable: bool
+            If True, materialize this set operator; if False, revert to
+            the default (delegating) implementation and discard the
+            stored members.
+
+        """
+        self._members = None
+        if not enable:
+            self.__class__ = _MaterializedSetOperator.base_class.get(
+                self.__class__, self.__class__
+            )
+            return
+        if self.__class__ in _MaterializedSetOperator.base_class:
+            return
+        if self.__class__ not in _MaterializedSetOperator.materialized_class:
+            raise ValueError(
+                "Cannot materialize Set %s: only finite set operators can be "
+                "materialized" % (self.name,)
+            )
+        # Verify that we can track changes in all the operand sets
+        _MaterializedSetOperator.collect_leaves(self, self, [], [])
+        self.__class__ = _MaterializedSetOperator.materialized_class[self.__class__]
+
     @property
     @deprecated(
         "SetProduct.set_tuple is deprecated.  "
@@ -4217,6 +4322,239 @@ class SetProduct_OrderedSet(
 ############################################################################
 
 
+class _MaterializedSetOperator(object):
+    """The stored members of a materialized SetOperator
+
+    Attributes
+    ----------
+    version: int
+        The value of the global _SetVersion counter when the members
+        were last validated
+
+    sets: list
+        The concrete (_FiniteSetData) operand sets
+
+    set_versions: list
+        The _version of each concrete operand set when the members
+        were generated
+
+    range_sets: list
+        The RangeSet operand sets
+
+    ranges: list
+        The _ranges of each RangeSet when the members were generated
+
+    values: list
+        The members (in iteration order)
+
+    index: dict
+        Map of each member to its (0-based) position
+
+    """
+
+    __slots__ = (
+        'version',
+        'sets',
+        'set_versions',
+        'range_sets',
+        'ranges',
+        'values',
+        'index',
+    )
+
+    # Map the SetOperator classes to / from their materialized versions
+    # (populated below)
+    materialized_class = {}
+    base_class = {}
+
+    def __init__(self, setop, values):
+        self.sets = []
+        self.range_sets = []
+        self.collect_leaves(setop, setop, self.sets, self.range_sets)
+        self.set_versions = [s._version for s in self.sets]
+        self.ranges = [s._ranges for s in self.range_sets]
+        self.version = _SetVersion.value
+        self.values = values
+        self.index = {val: i for i, val in enumerate(values)}
+
+    def is_current(self):
+        if self.version == _SetVersion.value:
+            return True
+        if [s._version for s in self.sets] != self.set_versions or any(
+            s._ranges is not r for s, r in zip(self.range_sets, self.ranges)
+        ):
+            return False
+        self.version = _SetVersion.value
+        return True
+
+    @staticmethod
+    def collect_leaves(setop, s, sets, range_sets):
+        if isinstance(s, SetOperator):
+            for _s in s._sets:
+                _MaterializedSetOperator.collect_leaves(setop, _s, sets, range_sets)
+        elif isinstance(s, _FiniteSetData):
+            sets.append(s)
+        elif isinstance(s, _InfiniteRangeSetData):
+            range_sets.append(s)
+        elif not isinstance(s, _EmptySet):
+            raise ValueError(
+                "Cannot materialize Set %s: changes to the operand Set %s "
+                "(type %s) cannot be tracked" % (setop.name, s.name, type(s).__name__)
+            )
+
+
+class _MaterializedFiniteSetMixin(object):
+    """Mixin implementing the finite Set API using the stored members"""
+
+    __slots__ = ()
+
+    def _materialized(self):
+        members = self._members
+        if members is None or not members.is_current():
+            self._members = members = _MaterializedSetOperator(
+                self, list(super()._iter_impl())
+            )
+        return members
+
+    def get(self, value, default=None):
+        index = self._materialized().index
+        try:
+            if value in index:
+                return value
+            if not normalize_index.flatten:
+                return super().get(value, default)
+            # The stored members are normalized (and flattened), so if
+            # the normalized value is not in the index, it is not in
+            # this Set.
+            value = normalize_index(value)
+            if value in index:
+                return value
+            return default
+        except TypeError:
+            return super().get(value, default)
+
+    def _iter_impl(self):
+        return iter(self._materialized().values)
+
+    def __len__(self):
+        return len(self._materialized().values)
+
+
+class _MaterializedOrderedSetMixin(_MaterializedFiniteSetMixin):
+    """Mixin implementing the ordered Set API using the stored members"""
+
+    __slots__ = ()
+
+    def at(self, index):
+        idx = self._to_0_based_index(index)
+        try:
+            return self._materialized().values[idx]
+        except IndexError:
+            raise IndexError(f"{self.name} index out of range") from None
+
+    def ord(self, item):
+        """
+        Return the position index of the input value.
+
+        Note that Pyomo Set objects have positions starting at 1 (not 0).
+
+        If the search item is not in the Set, then an IndexError is raised.
+        """
+        index = self._materialized().index
+        try:
+            return index[item] + 1
+        except (KeyError, TypeError):
+            pass
+        val = self.get(item, _NotFound)
+        if val is _NotFound:
+            raise IndexError(
+                "Cannot identify position of %s in Set %s: item not in Set"
+                % (item, self.name)
+            )
+        try:
+            return index[val] + 1
+        except (KeyError, TypeError):
+            return super().ord(item)
+
+
+class SetUnion_MaterializedFiniteSet(_MaterializedFiniteSetMixin, SetUnion_FiniteSet):
+    __slots__ = tuple()
+
+
+class SetUnion_MaterializedOrderedSet(
+    _MaterializedOrderedSetMixin, SetUnion_OrderedSet
+):
+    __slots__ = tuple()
+
+
+class SetIntersection_MaterializedFiniteSet(
+    _MaterializedFiniteSetMixin, SetIntersection_FiniteSet
+):
+    __slots__ = tuple()
+
+
+class SetIntersection_MaterializedOrderedSet(
+    _MaterializedOrderedSetMixin, SetIntersection_OrderedSet
+):
+    __slots__ = tuple()
+
+
+class SetDifference_MaterializedFiniteSet(
+    _MaterializedFiniteSetMixin, SetDifference_FiniteSet
+):
+    __slots__ = tuple()
+
+
+class SetDifference_MaterializedOrderedSet(
+    _MaterializedOrderedSetMixin, SetDifference_OrderedSet
+):
+    __slots__ = tuple()
+
+
+class SetSymmetricDifference_MaterializedFiniteSet(
+    _MaterializedFiniteSetMixin, SetSymmetricDifference_FiniteSet
+):
+    __slots__ = tuple()
+
+
+class SetSymmetricDifference_MaterializedOrderedSet(
+    _MaterializedOrderedSetMixin, SetSymmetricDifference_OrderedSet
+):
+    __slots__ = tuple()
+
+
+class SetProduct_MaterializedFiniteSet(
+    _MaterializedFiniteSetMixin, SetProduct_FiniteSet
+):
+    __slots__ = tuple()
+
+
+class SetProduct_MaterializedOrderedSet(
+    _MaterializedOrderedSetMixin, SetProduct_OrderedSet
+):
+    __slots__ = tuple()
+
+
+for _cls in (
+    SetUnion_MaterializedFiniteSet,
+    SetUnion_MaterializedOrderedSet,
+    SetIntersection_MaterializedFiniteSet,
+    SetIntersection_MaterializedOrderedSet,
+    SetDifference_MaterializedFiniteSet,
+    SetDifference_MaterializedOrderedSet,
+    SetSymmetricDifference_MaterializedFiniteSet,
+    SetSymmetricDifference_MaterializedOrderedSet,
+    SetProduct_MaterializedFiniteSet,
+    SetProduct_MaterializedOrderedSet,
+):
+    _MaterializedSetOperator.materialized_class[_cls.__bases__[1]] = _cls
+    _MaterializedSetOperator.base_class[_cls] = _cls.__bases__[1]
+del _cls
+
+
+############################################################################
+
+
 class _AnySet(_SetData, Set):
     def __init__(self, **kwds):
         _SetData.__init__(self, component=self)
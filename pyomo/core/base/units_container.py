@@ -865,6 +865,7 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         EXPR.ExternalFunctionExpression: _get_units_ExternalFunction,
         EXPR.NPV_ExternalFunctionExpression: _get_units_ExternalFunction,
         EXPR.LinearExpression: _get_unit_for_equivalent_children,
+        EXPR.LinearArrayExpression: _get_unit_for_equivalent_children,
     }
 
     unary_function_method_map = {
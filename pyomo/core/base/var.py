@@ -16,6 +16,7 @@ from pyomo.common.pyomo_typing import overload
 from weakref import ref as weakref_ref
 from typing import Union, Type
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -30,6 +31,7 @@ from pyomo.core.expr.numvalue import (
     is_potentially_variable,
     native_numeric_types,
 )
+from pyomo.core.base.array_storage import _ArrayStorageMixin
 from pyomo.core.base.component import ComponentData, ModelComponentFactory
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.disable_methods import disable_methods
@@ -57,6 +59,7 @@ logger = logging.getLogger('pyomo.core')
 
 _inf = float('inf')
 _ninf = -_inf
+_nan = float('nan')
 _nonfinite_values = {_inf, _ninf}
 _known_global_real_domains = dict(
     [(_, True) for _ in real_global_set_ids]
@@ -643,6 +646,220 @@ class _GeneralVarData(_VarData):
         return val
 
 
+class _VarArrayStorage(_ArrayStorageMixin):
+    """Columnar (structure-of-arrays) storage for the data in a Var
+
+    This holds the values, bounds, fixed flags, stale flags, and domains
+    for all :py:class:`_ArrayVarData` objects in a Var component.  Each
+    VarData is assigned a (fixed) position in the arrays when it is
+    created.  Positions are never reused (removing a VarData from the
+    component leaves a "hole" in the arrays).  Missing values (None)
+    are stored as NaN, and missing bounds are stored as -inf / inf.
+
+    """
+
+    __slots__ = ('size', 'value', 'lb', 'ub', 'fixed', 'stale', 'domain')
+
+    def __init__(self):
+        self.size = 0
+        self.value = np.empty(0)
+        self.lb = np.empty(0)
+        self.ub = np.empty(0)
+        self.fixed = np.empty(0, dtype=bool)
+        self.stale = np.empty(0, dtype=np.int64)
+        self.domain = []
+
+    def __getstate__(self):
+        # Stale flags are only meaningful relative to the current
+        # StaleFlagManager flag: store them as booleans (as is done by
+        # the stale_mapper for _GeneralVarData)
+        n = self.size
+        return (
+            self.value[:n].copy(),
+            self.lb[:n].copy(),
+            self.ub[:n].copy(),
+            self.fixed[:n].copy(),
+            self.stale[:n] != StaleFlagManager.get_flag(None),
+            self.domain,
+        )
+
+    def __setstate__(self, state):
+        self.value, self.lb, self.ub, self.fixed, stale, self.domain = state
+        self.size = len(self.value)
+        self.stale = np.where(stale, 0, StaleFlagManager.get_flag(0))
+
+    def reserve(self, n):
+        """Ensure there is space for `n` additional VarData objects"""
+        if self.size + n <= len(self.value):
+            return
+        capacity = max(self.size + n, 2 * len(self.value), 16)
+        for name, fill in (('value', np.nan), ('lb', _ninf), ('ub', _inf)):
+            new = np.full(capacity, fill)
+            new[: self.size] = getattr(self, name)[: self.size]
+            setattr(self, name, new)
+        new = np.zeros(capacity, dtype=bool)
+        new[: self.size] = self.fixed[: self.size]
+        self.fixed = new
+        new = np.zeros(capacity, dtype=np.int64)
+        new[: self.size] = self.stale[: self.size]
+        self.stale = new
+
+    def allocate(self, n=1):
+        """Allocate `n` consecutive positions and return the first one"""
+        self.reserve(n)
+        pos = self.size
+        self.size += n
+        self.domain.extend([None] * n)
+        return pos
+
+    def broadcast(self, component, ref, indices):
+        """Create VarData objects for `indices` as copies of `ref`
+
+        This is the (vectorized) equivalent of calling
+        :py:meth:`_ArrayVarData.copy` for every index in `indices`.
+
+        """
+        n = len(indices)
+        src = ref._pos
+        start = self.allocate(n)
+        end = start + n
+        self.value[start:end] = self.value[src]
+        self.lb[start:end] = self.lb[src]
+        self.ub[start:end] = self.ub[src]
+        self.fixed[start:end] = self.fixed[src]
+        self.stale[start:end] = self.stale[src]
+        self.domain[start:end] = [self.domain[src]] * n
+        _data = component._data
+        _new = _ArrayVarData.__new__
+        _component = ref._component
+        for pos, index in enumerate(indices, start):
+            obj = _new(_ArrayVarData)
+            obj._component = _component
+            obj._index = index
+            obj._storage = self
+            obj._pos = pos
+            _data[index] = obj
+
+
+class _ArrayVarData(_VarData):
+    """This class defines the data for a single variable whose values,
+    bounds, and flags are stored in the (columnar) arrays of the owning
+    Var component (see ``Var(..., storage='array')``).
+
+    Note that values are stored as floating point numbers (so integer
+    values are returned as floats), and that bounds must be numeric
+    (i.e., not expressions).
+
+    """
+
+    __slots__ = ('_storage', '_pos')
+
+    def __init__(self, component):
+        self._component = weakref_ref(component)
+        self._index = NOTSET
+        # Note: we hold a direct reference to the storage (and not just
+        # look it up through the component) so that VarData objects
+        # that are removed from the component remain valid
+        self._storage = component._storage
+        self._pos = component._storage.allocate()
+
+    @classmethod
+    def copy(cls, src):
+        self = cls.__new__(cls)
+        self._component = src._component
+        self._index = src._index
+        self._storage = storage = src._storage
+        self._pos = pos = storage.allocate()
+        storage.value[pos] = storage.value[src._pos]
+        storage.lb[pos] = storage.lb[src._pos]
+        storage.ub[pos] = storage.ub[src._pos]
+        storage.fixed[pos] = storage.fixed[src._pos]
+        storage.stale[pos] = storage.stale[src._pos]
+        storage.domain[pos] = storage.domain[src._pos]
+        return self
+
+    #
+    # The following (private) properties map the _GeneralVarData
+    # attributes onto the columnar storage.  This allows us to reuse
+    # the _GeneralVarData implementation of the public API.
+    #
+
+    @property
+    def _value(self):
+        val = self._storage.value.item(self._pos)
+        return None if val != val else val
+
+    @_value.setter
+    def _value(self, val):
+        self._storage.value[self._pos] = _nan if val is None else val
+
+    @property
+    def _lb(self):
+        val = self._storage.lb.item(self._pos)
+        return None if val == _ninf else val
+
+    @_lb.setter
+    def _lb(self, val):
+        self._storage.lb[self._pos] = self._array_bound(val, _ninf)
+
+    @property
+    def _ub(self):
+        val = self._storage.ub.item(self._pos)
+        return None if val == _inf else val
+
+    @_ub.setter
+    def _ub(self, val):
+        self._storage.ub[self._pos] = self._array_bound(val, _inf)
+
+    @property
+    def _domain(self):
+        return self._storage.domain[self._pos]
+
+    @_domain.setter
+    def _domain(self, val):
+        self._storage.domain[self._pos] = val
+
+    @property
+    def _fixed(self):
+        return self._storage.fixed.item(self._pos)
+
+    @_fixed.setter
+    def _fixed(self, val):
+        self._storage.fixed[self._pos] = val
+
+    @property
+    def _stale(self):
+        return self._storage.stale.item(self._pos)
+
+    @_stale.setter
+    def _stale(self, val):
+        self._storage.stale[self._pos] = val
+
+    def _array_bound(self, val, default):
+        if val is None:
+            return default
+        if val.__class__ not in native_numeric_types:
+            raise ValueError(
+                "Var '%s' uses array storage, which only supports numeric "
+                "bounds (not '%s')." % (self.name, val)
+            )
+        return val
+
+    set_value = _GeneralVarData.set_value
+    value = _GeneralVarData.value
+    domain = _GeneralVarData.domain
+    bounds = _GeneralVarData.bounds
+    lb = _GeneralVarData.lb
+    ub = _GeneralVarData.ub
+    lower = _GeneralVarData.lower
+    upper = _GeneralVarData.upper
+    get_units = _GeneralVarData.get_units
+    fixed = _GeneralVarData.fixed
+    stale = _GeneralVarData.stale
+    is_fixed = _GeneralVarData.is_fixed
+    _process_bound = _GeneralVarData._process_bound
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
     """A numeric variable, which may be defined over an index.
@@ -664,6 +881,14 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             to ``True``.
         units (pyomo units expression, optional): Set the units corresponding
             to the entries in this variable.
+        storage (str, optional): How the variable data is stored.
+            ``'object'`` (the default) stores the value, bounds, and
+            flags on each variable data object.  ``'array'`` stores them
+            in contiguous NumPy arrays on the (indexed) component, which
+            reduces the per-variable memory overhead and enables the
+            vectorized :meth:`get_values` / :meth:`set_values` /
+            :meth:`fix_all` APIs.  Array storage only supports numeric
+            bounds and is ignored for scalar variables.
         name (str, optional): Name for this component.
         doc (str, optional): Text describing this component.
     """
@@ -698,6 +923,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         rule=None,
         dense=True,
         units=None,
+        storage='object',
         name=None,
         doc=None,
     ): ...
@@ -717,6 +943,13 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         self._units = kwargs.pop('units', None)
         if self._units is not None:
             self._units = units.get_units(self._units)
+        _storage_arg = kwargs.pop('storage', 'object')
+        if _storage_arg not in ('object', 'array'):
+            raise ValueError(
+                "Var 'storage' must be one of 'object' or 'array' (not '%s')"
+                % (_storage_arg,)
+            )
+        self._storage = None
         #
         # Initialize the base class
         #
@@ -731,19 +964,55 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 "for scalar variables; converting to dense=True" % (self.name,)
             )
             self._dense = True
+        if _storage_arg == 'array':
+            if not self.is_indexed():
+                logger.warning(
+                    "ScalarVar object '%s': storage='array' is not supported "
+                    "for scalar variables; using storage='object'" % (self.name,)
+                )
+            elif not numpy_available:
+                raise ValueError(
+                    "Var '%s': storage='array' requires numpy" % (self.name,)
+                )
+            else:
+                self._storage = _VarArrayStorage()
+                self._ComponentDataClass = _ArrayVarData
         self._rule_bounds = BoundInitializer(_bounds_arg, self)
 
     def flag_as_stale(self):
         """
         Set the 'stale' attribute of every variable data object to True.
         """
+        if self._storage is not None:
+            self._storage.stale[: self._storage.size] = 0  # True
+            return
         for var_data in self._data.values():
             var_data.stale = True
 
-    def get_values(self, include_fixed_values=True):
+    def get_values(self, include_fixed_values=True, as_array=False):
         """
         Return a dictionary of index-value pairs.
+
+        If `as_array` is True, the values are returned as a NumPy array
+        (ordered as :meth:`keys`), with NaN for variables that do not
+        have a value.
         """
+        if as_array:
+            if self._storage is not None:
+                pos = self._storage.positions(self)
+                ans = self._storage.value[pos]
+                if not include_fixed_values:
+                    ans = ans[~self._storage.fixed[pos]]
+                # Note: ans may be a view into the storage array
+                return ans.copy()
+            return np.fromiter(
+                (
+                    _nan if v._value is None else v._value
+                    for v in self.values()
+                    if include_fixed_values or not v.fixed
+                ),
+                float,
+            )
         if include_fixed_values:
             return {idx: vardata.value for idx, vardata in self._data.items()}
         return {
@@ -759,10 +1028,85 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         Set the values of a dictionary.
 
         The default behavior is to validate the values in the
-        dictionary.
+        dictionary.  `new_values` may also be an array of values
+        (ordered as :meth:`keys`), where NaN clears the variable value.
+        This is vectorized for Vars using array storage.
         """
-        for index, new_value in new_values.items():
-            self[index].set_value(new_value, skip_validation)
+        if hasattr(new_values, 'items'):
+            for index, new_value in new_values.items():
+                self[index].set_value(new_value, skip_validation)
+            return
+        new_values = np.asarray(new_values, dtype=float)
+        if new_values.shape != (len(self),):
+            raise ValueError(
+                "Var '%s': cannot set the values from an array of shape %s "
+                "(expected (%s,))" % (self.name, new_values.shape, len(self))
+            )
+        if self._storage is None:
+            for obj, val in zip(self.values(), new_values.tolist()):
+                obj.set_value(None if val != val else val, skip_validation)
+            return
+        storage = self._storage
+        pos = self._storage.positions(self)
+        isnan = np.isnan(new_values)
+        if not skip_validation:
+            self._validate_array_values(pos, new_values, isnan)
+        # Emulate the stale flag processing in set_value(): the flag
+        # only needs to advance once for the whole update
+        stale = storage.stale[pos]
+        flag = StaleFlagManager.get_flag(int(stale.max()) if len(stale) else 0)
+        storage.value[pos] = new_values
+        storage.stale[pos] = np.where(isnan, 0, flag)
+
+    def _validate_array_values(self, pos, new_values, isnan):
+        storage = self._storage
+        # Note: comparisons with NaN are always False
+        invalid = (new_values < storage.lb[pos]) | (new_values > storage.ub[pos])
+        bad_bounds = set(np.flatnonzero(invalid).tolist())
+        bad_domain = set()
+        if pos.__class__ is slice:
+            domains = storage.domain[pos]
+        else:
+            domains = [storage.domain[i] for i in pos.tolist()]
+        for domain in {id(d): d for d in domains}.values():
+            if domain is Reals:
+                continue
+            selected = np.flatnonzero(np.array([d is domain for d in domains]) & ~isnan)
+            # Use the domain interval (if there is one) to identify the
+            # values that could be outside the domain.  Only those
+            # values are explicitly checked against the domain.
+            interval = domain.get_interval()
+            if interval is not None:
+                lb, ub, step = interval
+                vals = new_values[selected]
+                suspect = np.zeros(len(vals), dtype=bool)
+                if lb is not None:
+                    suspect |= vals <= lb
+                if ub is not None:
+                    suspect |= vals >= ub
+                if step:
+                    suspect |= np.remainder(vals, step) != 0
+                selected = selected[suspect]
+            for i in selected.tolist():
+                if new_values[i].item() not in domain:
+                    bad_domain.add(i)
+        if not bad_bounds and not bad_domain:
+            return
+        for i, obj in enumerate(self.values()):
+            if i in bad_domain:
+                val = new_values[i].item()
+                logger.warning(
+                    "Setting Var '%s' to a value `%s` (%s) not in domain %s."
+                    % (obj.name, val, type(val).__name__, obj.domain),
+                    extra={'id': 'W1001'},
+                )
+            elif i in bad_bounds:
+                logger.warning(
+                    "Setting Var '%s' to a numeric value `%s` "
+                    "outside the bounds %s."
+                    % (obj.name, new_values[i].item(), obj.bounds),
+                    extra={'id': 'W1002'},
+                )
 
     def get_units(self):
         """Return the units expression for this Var."""
@@ -855,13 +1199,19 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                     or call_bounds_rule
                 )
                 # Initialize all the component datas with the common data
-                for index in self.index_set():
-                    self._data[index] = self._ComponentDataClass.copy(ref)
-                    # NOTE: This is a special case where a key, value pair is
-                    # added to the _data dictionary without calling
-                    # _getitem_when_not_present, which is why we need to set the
-                    # index here.
-                    self._data[index]._index = index
+                if self._storage is not None:
+                    # Array storage: keep the reference VarData for the
+                    # first index and broadcast its data to the rest
+                    # (so that the VarData positions are contiguous)
+                    self._storage.broadcast(self, ref, list(self.index_set())[1:])
+                else:
+                    for index in self.index_set():
+                        self._data[index] = self._ComponentDataClass.copy(ref)
+                        # NOTE: This is a special case where a key, value
+                        # pair is added to the _data dictionary without
+                        # calling _getitem_when_not_present, which is why
+                        # we need to set the index here.
+                        self._data[index]._index = index
                 # Now go back and initialize any index-specific data
                 block = self.parent_block()
                 if call_domain_rule:
@@ -997,9 +1347,37 @@ class IndexedVar(Var):
         :meth:`set_value`.
 
         """
+        if value is NOTSET and self._storage is not None:
+            self._storage.fixed[self._storage.positions(self)] = True
+            return
         for vardata in self.values():
             vardata.fix(value, skip_validation)
 
+    def fix_all(self, mask=None):
+        """Fix the variables selected by a boolean mask
+
+        `mask` is an array of booleans (ordered as :meth:`keys`).
+        Variables where `mask` is True are fixed at their current value;
+        the fixed status of the remaining variables is not changed.  If
+        `mask` is None, all variables are fixed.
+
+        """
+        if mask is None:
+            return self.fix()
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError(
+                "Var '%s': fix_all() mask has shape %s (expected (%s,))"
+                % (self.name, mask.shape, len(self))
+            )
+        if self._storage is not None:
+            pos = np.arange(self._storage.size)[self._storage.positions(self)]
+            self._storage.fixed[pos[mask]] = True
+            return
+        for vardata, fix in zip(self.values(), mask.tolist()):
+            if fix:
+                vardata.fix()
+
     def unfix(self):
         """Unfix all variables in this :class:`IndexedVar` (treat as variable)
 
@@ -1007,6 +1385,9 @@ class IndexedVar(Var):
         every variable in this :class:`IndexedVar`.
 
         """
+        if self._storage is not None:
+            self._storage.fixed[self._storage.positions(self)] = False
+            return
         for vardata in self.values():
             vardata.unfix()
 
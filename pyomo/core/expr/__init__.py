@@ -86,6 +86,7 @@ from .numeric_expr import (
     DivisionExpression,
     Expr_ifExpression,
     ExternalFunctionExpression,
+    LinearArrayExpression,
     LinearExpression,
     MaxExpression,
     MinExpression,
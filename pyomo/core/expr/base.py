@@ -11,7 +11,9 @@
 
 import enum
 
+from pyomo.common.autoslots import fast_deepcopy, _atomic_types
 from pyomo.common.dependencies import attempt_import
+from pyomo.common.modeling import NOTSET
 from pyomo.common.numeric_types import native_types
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.core.expr.expr_common import OperatorAssociativity
@@ -19,6 +21,130 @@ from pyomo.core.expr.expr_common import OperatorAssociativity
 visitor, _ = attempt_import('pyomo.core.expr.visitor')
 
 
+def _share_structure_deepcopy(obj, memo):
+    """Deepcopy an expression field, preserving unchanged structure
+
+    This is a version of :py:func:`fast_deepcopy` used when copying
+    expression trees with the ``'__share_structure__'`` flag set in the
+    memo (see :py:meth:`_BlockData.clone()`).  Sequences (including
+    ``list`` objects, which are used as immutable argument storage by
+    some expression nodes) are only duplicated if at least one of their
+    items changed during the copy.
+
+    """
+    cls = obj.__class__
+    if cls in _atomic_types:
+        return obj
+    ans = memo.get(id(obj), NOTSET)
+    if ans is not NOTSET:
+        return ans
+    if cls is tuple or cls is list:
+        ans = _share_structure_copy_items(obj, memo)
+        if ans is not obj:
+            memo[id(obj)] = ans
+        # Note: like _deepcopy_tuple(), we do not record unchanged
+        # sequences in the memo
+        return ans
+    if cls in _share_structure_slots:
+        return _share_structure_copy_node(obj, memo)
+    if isinstance(obj, PyomoObject):
+        # All Pyomo objects implement __deepcopy__ (and update the
+        # memo): dispatch directly to it (bypassing copy.deepcopy())
+        return obj.__deepcopy__(memo)
+    return fast_deepcopy(obj, memo)
+
+
+def _share_structure_copy_items(seq, memo):
+    """Copy the items of a tuple / list (returning `seq` if unchanged)"""
+    ans = None
+    for i, item in enumerate(seq):
+        if item.__class__ in _atomic_types:
+            new_item = item
+        else:
+            new_item = memo.get(id(item), NOTSET)
+            if new_item is NOTSET:
+                if item.__class__ in _share_structure_slots:
+                    new_item = _share_structure_copy_node(item, memo)
+                else:
+                    new_item = _share_structure_deepcopy(item, memo)
+        if ans is not None:
+            ans.append(new_item)
+        elif new_item is not item:
+            ans = list(seq[:i])
+            ans.append(new_item)
+    if ans is None:
+        return seq
+    return tuple(ans) if seq.__class__ is tuple else ans
+
+
+def _share_structure_field_deepcopy(obj, memo):
+    """Deepcopy a component field when sharing expression structure
+
+    Expression nodes are copied by :py:func:`_share_structure_copy_node`
+    (bypassing :py:func:`copy.deepcopy`); all other fields (including
+    mutable containers, which must never be shared) are copied by
+    :py:func:`fast_deepcopy`.
+
+    """
+    if obj.__class__ in _share_structure_slots:
+        ans = memo.get(id(obj), NOTSET)
+        if ans is not NOTSET:
+            return ans
+        return _share_structure_copy_node(obj, memo)
+    return fast_deepcopy(obj, memo)
+
+
+# Map of expression node classes to the slots that are copied directly
+# when sharing structure (None for classes that are always copied by
+# the default AutoSlots deepcopy)
+_share_structure_slots = {}
+# The slots of most expression nodes
+_args_slots = ('_args_',)
+
+
+def _share_structure_copy_node(node, memo):
+    """Copy an expression node, sharing it if none of its fields changed"""
+    cls = node.__class__
+    slots = _share_structure_slots.get(cls, NOTSET)
+    if slots is NOTSET:
+        info = cls.__auto_slots__
+        if (
+            info.has_dict
+            or info.slot_mappers
+            or not info.slots
+            or hasattr(cls, 'make_immutable')
+        ):
+            # Mutable expressions (e.g., _MutableSumExpression) modify
+            # their argument list in place and can never be shared
+            slots = None
+        elif info.slots == _args_slots:
+            slots = _args_slots
+        else:
+            slots = info.slots
+        _share_structure_slots[cls] = slots
+    if slots is None:
+        return super(ExpressionBase, node).__deepcopy__(memo)
+    if slots is _args_slots:
+        args = node._args_
+        new_args = _share_structure_copy_items(args, memo)
+        if new_args is args:
+            memo[id(node)] = node
+            return node
+        memo[id(node)] = ans = cls.__new__(cls)
+        ans._args_ = new_args
+        return ans
+    state = [getattr(node, attr) for attr in slots]
+    new_state = [_share_structure_deepcopy(field, memo) for field in state]
+    for old, new in zip(state, new_state):
+        if old is not new:
+            memo[id(node)] = ans = cls.__new__(cls)
+            for attr, val in zip(slots, new_state):
+                setattr(ans, attr, val)
+            return ans
+    memo[id(node)] = node
+    return node
+
+
 class ExpressionBase(PyomoObject):
     """The base class for all Pyomo expression systems.
 
@@ -42,6 +168,15 @@ class ExpressionBase(PyomoObject):
     """
     ASSOCIATIVITY = OperatorAssociativity.LEFT_TO_RIGHT
 
+    def __deepcopy__(self, memo):
+        if '__share_structure__' not in memo:
+            return super().__deepcopy__(memo)
+        # Expression nodes are immutable: when sharing structure (see
+        # _BlockData.clone()), only duplicate this node if the copy
+        # changes at least one of its fields (i.e., the subtree
+        # references a component that is being cloned)
+        return _share_structure_copy_node(self, memo)
+
     def nargs(self):
         """Returns the number of child nodes.
 
@@ -357,6 +357,7 @@ _diff_map[_expr.NegationExpression] = _diff_NegationExpression
 _diff_map[_expr.UnaryFunctionExpression] = _diff_UnaryFunctionExpression
 _diff_map[_expr.ExternalFunctionExpression] = _diff_ExternalFunctionExpression
 _diff_map[_expr.LinearExpression] = _diff_SumExpression
+_diff_map[_expr.LinearArrayExpression] = _diff_SumExpression
 _diff_map[_expr.AbsExpression] = _diff_abs
 
 _diff_map[_expr.NPV_ProductExpression] = _diff_ProductExpression
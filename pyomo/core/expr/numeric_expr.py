@@ -1360,6 +1360,98 @@ class NPV_SumExpression(Numeric_NPV_Mixin, LinearExpression):
     __slots__ = ()
 
 
+class LinearArrayExpression(LinearExpression):
+    """A :py:class:`LinearExpression` stored as parallel arrays.
+
+    This expression holds the constant, the list of coefficients, and
+    the list of variables directly.  The
+    :py:class:`MonomialTermExpression` arguments are only generated
+    when something (e.g., a generic expression walker) asks for the
+    expression :py:attr:`args`.  Writers that recognize this class can
+    process the coefficient and variable arrays directly.
+
+    Args:
+        constant: the constant term (a native number or NPV expression)
+        linear_coefs (list): the coefficients (native numbers or NPV
+            expressions)
+        linear_vars (list): the variables (:py:class:`_VarData`)
+
+    """
+
+    __slots__ = ('_constant', '_linear_coefs', '_linear_vars')
+
+    def __init__(self, constant, linear_coefs, linear_vars):
+        # Note: copy the lists so that later changes made by the caller
+        # do not alter this (immutable) expression
+        linear_coefs = list(linear_coefs)
+        linear_vars = list(linear_vars)
+        if len(linear_vars) != len(linear_coefs):
+            raise ValueError(
+                f"linear_vars ({tostr(linear_vars)}) is not compatible "
+                f"with linear_coefs ({tostr(linear_coefs)})"
+            )
+        self._constant = constant
+        self._linear_coefs = linear_coefs
+        self._linear_vars = linear_vars
+        self._nargs = len(linear_vars)
+        # Filter 0, but only if it is a native type
+        if constant.__class__ not in native_types or constant:
+            self._nargs += 1
+
+    def _get_args_(self):
+        try:
+            return NumericExpression._args_.__get__(self)
+        except AttributeError:
+            pass
+        args = []
+        if self._nargs > len(self._linear_vars):
+            args.append(self._constant)
+        args.extend(
+            map(MonomialTermExpression, zip(self._linear_coefs, self._linear_vars))
+        )
+        NumericExpression._args_.__set__(self, args)
+        return args
+
+    def _set_args_(self, args):
+        NumericExpression._args_.__set__(self, args)
+
+    # The (MonomialTermExpression) args are generated on demand
+    _args_ = property(_get_args_, _set_args_)
+
+    @property
+    def constant(self):
+        return self._constant
+
+    @property
+    def linear_coefs(self):
+        return self._linear_coefs
+
+    @property
+    def linear_vars(self):
+        return self._linear_vars
+
+    def _trunc_append(self, other):
+        # Extending this expression creates a regular LinearExpression
+        # (that shares the generated args list)
+        _args = self._args_
+        if len(_args) > self._nargs:
+            _args = _args[: self._nargs]
+        _args.append(other)
+        return LinearExpression(_args)
+
+    def _trunc_extend(self, other):
+        _args = self._args_
+        if len(_args) > self._nargs:
+            _args = _args[: self._nargs]
+        _args.extend(other.args)
+        return LinearExpression(_args)
+
+    def create_node_with_local_data(self, args, classtype=None):
+        if classtype is None:
+            classtype = LinearExpression
+        return super().create_node_with_local_data(args, classtype)
+
+
 class _MutableSumExpression(SumExpression):
     """
     A mutable SumExpression
@@ -13,6 +13,7 @@
 #
 
 from io import StringIO
+import gc
 import os
 import sys
 import types
@@ -45,6 +46,7 @@ from pyomo.environ import (
     RangeSet,
     SolverFactory,
     value,
+    exp,
     sum_product,
     ComponentUID,
     Any,
@@ -57,7 +59,9 @@ from pyomo.core.base.block import (
     _BlockData,
     declare_custom_block,
 )
+from pyomo.core.base.component import _caching_blocks
 import pyomo.core.expr as EXPR
+from pyomo.core.expr.numeric_expr import _MutableSumExpression
 from pyomo.opt import check_available_solvers
 
 from pyomo.gdp import Disjunct
@@ -2454,6 +2458,103 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (m.x, m.y[1], nb.x, nb.y[1])),
         )
 
+    def test_clone_subblock_share_structure(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var([1])
+        m.p = Param(mutable=True, initialize=3)
+        m.b = Block()
+        m.b.x = Var()
+        m.b.y = Var([1, 2])
+        m.b.c = Constraint(expr=m.p * m.x**2 + m.y[1] + m.b.x**2 + m.b.y[1] <= 10)
+        m.b.d = Constraint(expr=m.x**2 + m.y[1] <= 5)
+        m.b.e = Constraint(expr=m.b.x >= 1)
+
+        nb = m.b.clone(share_structure=True)
+
+        self.assertIs(nb.parent_block(), None)
+        self.assertIsNot(m.b.c, nb.c)
+        self.assertIs(nb.c.parent_block(), nb)
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(nb.c.body)),
+            sorted(id(x) for x in (m.x, m.y[1], nb.x, nb.y[1])),
+        )
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(m.b.c.body)),
+            sorted(id(x) for x in (m.x, m.y[1], m.b.x, m.b.y[1])),
+        )
+        # Subtrees that only reference components outside the block
+        # are shared
+        self.assertIsNot(m.b.c.body, nb.c.body)
+        self.assertIs(m.b.c.body.arg(0), nb.c.body.arg(0))
+        self.assertIs(m.b.c.body.arg(1), nb.c.body.arg(1))
+        self.assertIsNot(m.b.c.body.arg(2), nb.c.body.arg(2))
+        self.assertIs(m.b.d.body, nb.d.body)
+        self.assertIsNot(m.b.e.body, nb.e.body)
+        self.assertIs(nb.e.body, nb.x)
+
+        # Updating the shared (mutable) leaves is reflected in both
+        m.p = 5
+        m.x = 2
+        m.y[1] = 1
+        nb.x = 0
+        nb.y[1] = 0
+        self.assertEqual(value(nb.c.body), 21)
+        m.b.x = 1
+        m.b.y[1] = 1
+        self.assertEqual(value(m.b.c.body), 23)
+
+        # The (default) clone duplicates the entire expression
+        nb = m.b.clone()
+        self.assertIsNot(m.b.d.body, nb.d.body)
+        self.assertIsNot(m.b.c.body.arg(0), nb.c.body.arg(0))
+
+    def test_clone_model_share_structure(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 5))
+        m.p = Param(mutable=True, initialize=3)
+        m.q = Param(initialize=2)
+        m.e = Expression(expr=_MutableSumExpression([1, 2]))
+        m.c = Constraint(expr=m.p * m.x[1] + exp(m.q * 4) + m.x[2] ** 2 <= 10)
+        m.d = Constraint(expr=sum(m.x.values()) >= 1)
+        m.x[1] = 1
+        m.x[2] = 2
+
+        i = m.clone(share_structure=True)
+
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(i.c.body)),
+            sorted(id(x) for x in (i.x[1], i.x[2])),
+        )
+        self.assertEqual(
+            [id(p) for p in EXPR.identify_mutable_parameters(i.c.body)], [id(i.p)]
+        )
+        self.assertIsNot(m.c.body, i.c.body)
+        self.assertIsNot(m.d.body, i.d.body)
+        buf_m = StringIO()
+        buf_i = StringIO()
+        m.pprint(ostream=buf_m)
+        i.pprint(ostream=buf_i)
+        self.assertEqual(buf_m.getvalue(), buf_i.getvalue())
+
+        # Mutable expressions are never shared
+        self.assertIsNot(m.e.expr, i.e.expr)
+        self.assertIsNot(m.e.expr.args, i.e.expr.args)
+        self.assertIs(type(i.e.expr), _MutableSumExpression)
+        i.e.expr += 3
+        self.assertEqual(value(m.e), 3)
+        self.assertEqual(value(i.e), 6)
+
+        # The models are independent
+        i.x[1] = 4
+        i.x[2].setub(10)
+        i.p = 1
+        i.c.deactivate()
+        self.assertEqual(value(m.c.body), 3 + exp(8) + 4)
+        self.assertEqual(value(i.c.body), 4 + exp(8) + 4)
+        self.assertEqual(m.x[2].ub, 5)
+        self.assertTrue(m.c.active)
+
     def test_clone_indexed_subblock(self):
         m = ConcreteModel()
 
@@ -3298,6 +3399,114 @@ class TestBlock(unittest.TestCase):
             ],
         )
 
+    def test_cache_component_data(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.c = Constraint(
+            [1, 2, 4], rule=lambda m, i: m.x[i] >= i if i < 4 else Constraint.Skip
+        )
+        m.b = Block([1, 2], dense=False)
+        m.b[1].c = Constraint(expr=m.x[1] <= 5)
+
+        def cdo(ctype=Constraint, **kwds):
+            # Verify the cached result against a full model traversal
+            ans = list(m.component_data_objects(ctype, **kwds))
+            cache, m._component_data_cache = m._component_data_cache, None
+            try:
+                self.assertEqual(ans, list(m.component_data_objects(ctype, **kwds)))
+            finally:
+                m._component_data_cache = cache
+            return ans
+
+        m.cache_component_data()
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.b[1].c])
+        self.assertEqual(len(m._component_data_cache), 1)
+        self.assertIs(
+            m._cached_component_data_objects(Constraint, None, False, True, None),
+            m._cached_component_data_objects(Constraint, None, False, True, None),
+        )
+        self.assertEqual(cdo(descend_into=False), [m.c[1], m.c[2]])
+        self.assertEqual(
+            cdo([Constraint, Var], descend_into=[Block]),
+            [m.x[1], m.x[2], m.c[1], m.c[2], m.b[1].c],
+        )
+
+        # (de)activation
+        m.c[2].deactivate()
+        self.assertEqual(cdo(active=True), [m.c[1], m.b[1].c])
+        m.c[2].activate()
+        m.b[1].deactivate()
+        self.assertEqual(cdo(active=True), [m.c[1], m.c[2]])
+        m.b[1].activate()
+        self.assertEqual(cdo(active=True), [m.c[1], m.c[2], m.b[1].c])
+
+        # new / removed component data
+        del m.c[1]
+        self.assertEqual(cdo(), [m.c[2], m.b[1].c])
+        m.c[1] = m.x[1] >= 1
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.b[1].c])
+        m.b[2].c = Constraint(expr=m.x[2] <= 5)
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.b[1].c, m.b[2].c])
+        # delete + insert (the number of data objects is unchanged)
+        old = m.c[1]
+        del m.c[1]
+        m.c[4] = m.x[2] >= 4
+        self.assertEqual(cdo(), [m.c[2], m.c[4], m.b[1].c, m.b[2].c])
+        self.assertNotIn(old, cdo())
+        del m.c[4]
+        m.c[1] = m.x[1] >= 1
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.b[1].c, m.b[2].c])
+
+        # new / removed components
+        m.d = Constraint(expr=m.x[1] == m.x[2])
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.d, m.b[1].c, m.b[2].c])
+        m.del_component(m.d)
+        m.b[1].del_component(m.b[1].c)
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.b[2].c])
+
+        # Changes to other models do not clear the cache
+        other = ConcreteModel()
+        other.c = Constraint([1, 2], rule=lambda o, i: m.x[i] >= 0)
+        other.c[1].deactivate()
+        other.d = Constraint(expr=m.x[1] <= 1)
+        del other.c[2]
+        self.assertEqual(len(m._component_data_cache), 1)
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.b[2].c])
+
+        # Traversals that reach References are not cached (as changes to
+        # the referenced components are not reported to this block)
+        other.c[2] = m.x[2] >= 0
+        m.r = Reference(other.c)
+        m._component_data_cache.clear()
+        self.assertEqual(cdo(active=True), [m.c[1], m.c[2], other.c[2], m.b[2].c])
+        self.assertEqual(len(m._component_data_cache), 0)
+        other.c[1].activate()
+        self.assertEqual(
+            cdo(active=True), [m.c[1], m.c[2], other.c[1], other.c[2], m.b[2].c]
+        )
+        m.del_component(m.r)
+
+        # The cache is not cloned
+        i = m.clone()
+        self.assertIsNone(i._component_data_cache)
+        self.assertEqual(
+            list(i.component_data_objects(Constraint)), [i.c[1], i.c[2], i.b[2].c]
+        )
+
+        m.cache_component_data(False)
+        self.assertIsNone(m._component_data_cache)
+        self.assertEqual(cdo(), [m.c[1], m.c[2], m.b[2].c])
+
+        # Model changes are only tracked while a block is caching
+        self.assertNotIn(id(m), _caching_blocks)
+        tmp = ConcreteModel()
+        tmp.cache_component_data()
+        _id = id(tmp)
+        self.assertIn(_id, _caching_blocks)
+        del tmp
+        gc.collect()
+        self.assertNotIn(_id, _caching_blocks)
+
     def test_deduplicate_component_data_iterindex(self):
         m = ConcreteModel()
         m.b = Block()
@@ -1902,6 +1902,28 @@ class MiscConTests(unittest.TestCase):
         ):
             m.c = EqualityExpression((m.x, None))
 
+    def test_modified_indices(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= i)
+        m.d = Constraint(m.I, rule={i: m.x[i] <= i for i in m.I})
+        m.l = ConstraintList(rule=[m.x[1] >= 0, m.x[2] >= 0])
+        m.l.add(m.x[3] >= 0)
+        # Constraints generated at construction are not recorded
+        self.assertIsNone(m.c._modified_indices)
+        self.assertIsNone(m.d._modified_indices)
+        self.assertIsNone(m.l._modified_indices)
+
+        m.c[2].set_value(m.x[2] >= 5)
+        self.assertEqual(m.c._modified_indices, {2})
+        m.c[3] = m.x[3] >= 5
+        self.assertEqual(m.c._modified_indices, {2, 3})
+        del m.c[1]
+        m.c[1] = m.x[1] >= 5
+        self.assertEqual(m.c._modified_indices, {1, 2, 3})
+        self.assertEqual(m.clone().c._modified_indices, {1, 2, 3})
+
 
 if __name__ == "__main__":
     unittest.main()
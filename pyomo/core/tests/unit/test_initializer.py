@@ -35,9 +35,10 @@ from pyomo.core.base.initializer import (
     CountedCallGenerator,
     DataFrameInitializer,
     DefaultInitializer,
+    SparseInitializer,
+    VectorizedInitializer,
 )
-from pyomo.environ import ConcreteModel, Var
-
+from pyomo.environ import Block, ConcreteModel, Constraint, Set, Var
 
 is_pypy = platform.python_implementation().lower().startswith("pypy")
 
@@ -805,3 +806,112 @@ class Test_Initializer(unittest.TestCase):
         self.assertEqual(a(None, 'opt_1'), 1)
         self.assertEqual(a(None, 'opt_3'), 3)
         self.assertEqual(a(None, 'opt_5'), 5)
+
+    def test_sparse_initializer(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=['a', 'b'])
+        m.x = Var(m.I, m.J)
+
+        a = SparseInitializer(lambda m, i, j: m.x[i, j] >= 0, [(1, 'b'), (3, 'a')])
+        self.assertIs(Initializer(a), a)
+        self.assertFalse(a.constant())
+        self.assertTrue(a.contains_indices())
+        self.assertEqual(list(a.indices()), [(1, 'b'), (3, 'a')])
+        self.assertExpressionsEqual(a(m, (1, 'b')), m.x[1, 'b'] >= 0)
+
+        # Generators are expanded (so the initializer can be cloned)
+        a = SparseInitializer(_init_indexed, (i for i in range(3)))
+        self.assertEqual(a.indices(), (0, 1, 2))
+        self.assertEqual(a(None, 2), 3)
+
+        calls = []
+
+        def rule(m, i, j):
+            calls.append((i, j))
+            return m.x[i, j] >= 0
+
+        m.c = Constraint(m.I, m.J, rule=SparseInitializer(rule, [(1, 'b'), (3, 'a')]))
+        self.assertEqual(calls, [(1, 'b'), (3, 'a')])
+        self.assertEqual(list(m.c), [(1, 'b'), (3, 'a')])
+        self.assertEqual(len(m.c.index_set()), 6)
+
+        m.b = Block(m.I, rule=SparseInitializer(lambda b, i: None, m.I - [2]))
+        self.assertEqual(list(m.b), [1, 3])
+
+        i = m.clone()
+        self.assertEqual(list(i.c), [(1, 'b'), (3, 'a')])
+        self.assertEqual(list(i.b), [1, 3])
+
+        with self.assertRaisesRegex(KeyError, "Index '4' is not valid"):
+            m.d = Block(m.I, rule=SparseInitializer(lambda b, i: None, [1, 4]))
+
+        # Other initializers that contain indices (e.g., dicts) still
+        # populate Blocks by iterating over the index set
+        m.e = Block(m.I, rule={3: None, 1: None, 2: None})
+        self.assertEqual(list(m.e), [1, 2, 3])
+        with self.assertRaises(KeyError):
+            m.f = Block(m.I, rule={1: None, 3: None})
+
+    @unittest.skipUnless(numpy_available, "VectorizedInitializer requires numpy")
+    def test_vectorized_initializer(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3, 4])
+        m.J = Set(initialize=['a', 'b', 'c'])
+        m.K = Set(initialize=[(1, 2), (3, 4)], dimen=2)
+
+        calls = []
+
+        def fcn(m, i, j):
+            calls.append((i, j))
+            return (i % 2 == 0) & (j != 'b')
+
+        a = VectorizedInitializer(fcn)
+        self.assertIs(Initializer(a), a)
+        self.assertFalse(a.contains_indices())
+        # Scalar evaluation
+        self.assertTrue(a(m, (2, 'a')))
+        self.assertFalse(a(m, (2, 'b')))
+        # The cross product is evaluated with a single call
+        calls = []
+        self.assertEqual(
+            a.select(m, m.I * m.J), [(2, 'a'), (2, 'c'), (4, 'a'), (4, 'c')]
+        )
+        self.assertEqual(len(calls), 1)
+        self.assertIsInstance(calls[0][0], np.ndarray)
+        self.assertEqual(len(calls[0][0]), 12)
+        # ... as are lists of candidates
+        self.assertEqual(a.select(m, [(1, 'a'), (2, 'c'), (4, 'b')]), [(2, 'c')])
+        self.assertEqual(a.select(m, []), [])
+
+        # Multi-dimensional product terms are flattened
+        a = VectorizedInitializer(lambda m, i, k1, k2: i + k1 > 4)
+        self.assertEqual(
+            a.select(m, m.I * m.K), [(2, 3, 4), (3, 3, 4), (4, 1, 2), (4, 3, 4)]
+        )
+        # Scalar results are broadcast
+        a = VectorizedInitializer(lambda m, i: True)
+        self.assertEqual(a.select(m, m.I), [1, 2, 3, 4])
+
+        # Set integration
+        m.IJ = Set(initialize=m.I * m.J, filter=VectorizedInitializer(fcn))
+        self.assertEqual(list(m.IJ), [(2, 'a'), (2, 'c'), (4, 'a'), (4, 'c')])
+        m.IJ.add((1, 'a'), (4, 'b'))
+        self.assertEqual(len(m.IJ), 4)
+        m.L = Set(
+            initialize=[5, 6, 7, Set.End, 8],
+            filter=VectorizedInitializer(lambda m, i: i > 5),
+        )
+        self.assertEqual(list(m.L), [6, 7])
+
+        # Members of different types are not converted to a common type
+        # (i.e., 1 is not compared as '1')
+        m.M = Set(initialize=[1, 'a', 2, 'b'])
+        a = VectorizedInitializer(lambda m, i: i == 1)
+        self.assertEqual(a.select(m, m.M), [1])
+        self.assertEqual(a.select(m, list(m.M)), [1])
+        a = VectorizedInitializer(lambda m, i, j: (i == 2) & (j > 2))
+        self.assertEqual(a.select(m, m.M * m.I), [(2, 3), (2, 4)])
+        # ... but mixed numeric types are
+        a = VectorizedInitializer(lambda m, i: i > 1)
+        self.assertEqual(a.select(m, [1, 1.5, 2]), [1.5, 2])
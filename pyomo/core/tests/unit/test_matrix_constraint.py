@@ -9,10 +9,16 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from io import StringIO
+
 import pyomo.common.unittest as unittest
 import pyomo.environ as pyo
 
+from pyomo.common.dependencies import numpy as np, numpy_available, scipy_available
 from pyomo.core.base.matrix_constraint import MatrixConstraint
+from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.repn.plugins.nl_writer import NLWriter
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
 
 
 def _create_variable_list(size, **kwds):
@@ -93,6 +99,89 @@ class TestMatrixConstraint(unittest.TestCase):
             self.assertEqual(c.upper, 1)
             self.assertEqual(c.equality, True)
 
+    def test_bounds(self):
+        m = pyo.ConcreteModel()
+        m.v = _create_variable_list(3)
+        data, indices, indptr = _get_csr(3, 3, 1.0)
+        m.c = MatrixConstraint(
+            data,
+            indices,
+            indptr,
+            lb=[None, float('-inf'), 1],
+            ub=[float('inf'), 2, pyo.value(1)],
+            x=list(m.v.values()),
+        )
+        self.assertEqual([c.lb for c in m.c.values()], [None, None, 1])
+        self.assertEqual([c.ub for c in m.c.values()], [None, 2, 1])
+        self.assertEqual(
+            list(m.component_data_objects(pyo.Constraint)), list(m.c.values())
+        )
+
+    def _check_writers(self, data, indices, indptr, lb, ub):
+        # Compare the writer output for a MatrixConstraint (that may be
+        # built from numpy arrays) against the equivalent Constraint
+        def build(model):
+            model.v = _create_variable_list(4)
+            model.v[2].fix(3)
+            model.o = pyo.Objective(expr=model.v[0] + model.v[3])
+            return model
+
+        m = build(pyo.ConcreteModel())
+        m.c = MatrixConstraint(data, indices, indptr, lb, ub, x=list(m.v.values()))
+
+        ref = build(pyo.ConcreteModel())
+        data, indices, indptr = map(list, (data, indices, indptr))
+        lb = [None if b == float('-inf') else b for b in lb]
+        ub = [None if b == float('inf') else b for b in ub]
+        ref.c = pyo.Constraint(
+            range(len(lb)),
+            rule=lambda b, i: (
+                lb[i],
+                sum(
+                    data[p] * ref.v[indices[p]] for p in range(indptr[i], indptr[i + 1])
+                ),
+                ub[i],
+            ),
+        )
+
+        def lp(model):
+            OUT = StringIO()
+            LPWriter().write(model, OUT)
+            return OUT.getvalue()
+
+        def nl(model):
+            OUT = StringIO()
+            NLWriter().write(model, OUT, StringIO(), StringIO())
+            return OUT.getvalue()
+
+        self.assertEqual(lp(m), lp(ref))
+        self.assertEqual(nl(m), nl(ref))
+        if scipy_available:
+            repn = LinearStandardFormCompiler().write(m)
+            ref_repn = LinearStandardFormCompiler().write(ref)
+            self.assertTrue(np.all(repn.c.toarray() == ref_repn.c.toarray()))
+            self.assertTrue(np.all(repn.A.toarray() == ref_repn.A.toarray()))
+            self.assertTrue(np.all(repn.rhs == ref_repn.rhs))
+
+    def test_writers(self):
+        # Note: includes a fixed variable (v[2]), a zero coefficient,
+        # and a variable (v[1]) that first appears after v[3]
+        data = [1.5, 2.0, 0.0, -1.0, 3.0, 4.0, 5.0]
+        indices = [0, 3, 1, 2, 1, 0, 3]
+        indptr = [0, 3, 5, 7]
+        lb = [None, 1, 2]
+        ub = [4, None, 2]
+        self._check_writers(data, indices, indptr, lb, ub)
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_writers_numpy(self):
+        data = np.array([1.5, 2.0, 0.0, -1.0, 3.0, 4.0, 5.0])
+        indices = np.array([0, 3, 1, 2, 1, 0, 3])
+        indptr = np.array([0, 3, 5, 7])
+        lb = np.array([-np.inf, 1, 2])
+        ub = np.array([4, np.inf, 2])
+        self._check_writers(data, indices, indptr, lb, ub)
+
 
 if __name__ == "__main__":
     unittest.main()
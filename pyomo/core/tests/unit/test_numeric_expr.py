@@ -24,6 +24,7 @@ currdir = dirname(abspath(__file__)) + os.sep
 
 from filecmp import cmp
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.log import LoggingIntercept
 from io import StringIO
 
@@ -62,6 +63,7 @@ from pyomo.environ import (
     value,
     quicksum,
     sum_product,
+    linear_sum,
     is_fixed,
     is_constant,
 )
@@ -87,6 +89,7 @@ from pyomo.core.expr.numeric_expr import (
     linear_expression,
     MonomialTermExpression,
     LinearExpression,
+    LinearArrayExpression,
     DivisionExpression,
     NPV_NegationExpression,
     NPV_ProductExpression,
@@ -5675,6 +5678,112 @@ class TestDirect_LinearExpression(unittest.TestCase):
         self.assertEqual(polynomial_degree(m.c1.body), 1)
 
 
+class TestLinearArrayExpression(unittest.TestCase):
+    def setUp(self):
+        self.m = m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize={1: 1, 2: 2, 3: 3})
+        m.p = Param(initialize=2, mutable=True)
+
+    def test_construct(self):
+        m = self.m
+        coefs = [1, 2, 3]
+        e = LinearArrayExpression(5, coefs, m.x.values())
+        coefs[0] = 10
+        self.assertIsInstance(e, LinearExpression)
+        self.assertEqual(e.constant, 5)
+        self.assertEqual(e.linear_coefs, [1, 2, 3])
+        self.assertEqual(e.linear_vars, [m.x[1], m.x[2], m.x[3]])
+        self.assertEqual(e.nargs(), 4)
+        self.assertExpressionsEqual(
+            LinearExpression(e.args),
+            LinearExpression(
+                [
+                    5,
+                    MonomialTermExpression((1, m.x[1])),
+                    MonomialTermExpression((2, m.x[2])),
+                    MonomialTermExpression((3, m.x[3])),
+                ]
+            ),
+        )
+        self.assertEqual(str(e), "5 + x[1] + 2*x[2] + 3*x[3]")
+        self.assertEqual(value(e), 19)
+        self.assertEqual(polynomial_degree(e), 1)
+
+        e = LinearArrayExpression(0, [m.p], [m.x[2]])
+        self.assertEqual(e.nargs(), 1)
+        self.assertEqual(str(e), "p*x[2]")
+        self.assertEqual(value(e), 4)
+
+        with self.assertRaisesRegex(ValueError, "is not compatible with"):
+            LinearArrayExpression(0, [1, 2], [m.x[1]])
+
+    def test_linear_sum(self):
+        m = self.m
+        e = linear_sum([4, 5, 6], m.x)
+        self.assertIs(e.__class__, LinearArrayExpression)
+        self.assertEqual(e.linear_vars, [m.x[1], m.x[2], m.x[3]])
+        self.assertEqual(e.linear_coefs, [4, 5, 6])
+        self.assertEqual(e.constant, 0)
+        self.assertEqual(str(e), "4*x[1] + 5*x[2] + 6*x[3]")
+
+        e = linear_sum([m.p, 1], [m.x[3], m.x[1]], constant=m.p)
+        self.assertEqual(str(e), "p + p*x[3] + x[1]")
+        self.assertEqual(value(e), 9)
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_linear_sum_numpy(self):
+        m = self.m
+        e = linear_sum(numpy.array([1.5, 2.5, 3.5]), m.x)
+        self.assertEqual(e.linear_coefs, [1.5, 2.5, 3.5])
+        self.assertIs(type(e.linear_coefs[0]), float)
+        self.assertEqual(value(e), 17)
+
+    def test_operators(self):
+        m = self.m
+        e = linear_sum([1, 2], [m.x[1], m.x[2]])
+        f = e + m.x[3]
+        self.assertIs(f.__class__, LinearExpression)
+        self.assertEqual(str(f), "x[1] + 2*x[2] + x[3]")
+        # The original expression is unchanged
+        self.assertEqual(e.nargs(), 2)
+        self.assertEqual(str(e), "x[1] + 2*x[2]")
+
+        f = e + e
+        self.assertIs(f.__class__, LinearExpression)
+        self.assertEqual(str(f), "x[1] + 2*x[2] + x[1] + 2*x[2]")
+
+        f = m.x[3] * e
+        self.assertEqual(str(f), "x[3]*(x[1] + 2*x[2])")
+
+        with linear_expression() as f:
+            f += e
+            f += 3
+        self.assertEqual(str(f), "x[1] + 2*x[2] + 3")
+
+    def test_clone_and_pickle(self):
+        m = self.m
+        m.e = Expression(expr=linear_sum([1, 2], [m.x[1], m.x[2]], 3))
+        i = m.clone()
+        self.assertIs(i.e.expr.__class__, LinearArrayExpression)
+        self.assertIs(i.e.expr.linear_vars[0], i.x[1])
+        self.assertEqual(str(i.e.expr), "3 + x[1] + 2*x[2]")
+
+        i = pickle.loads(pickle.dumps(m))
+        self.assertIs(i.e.expr.linear_vars[1], i.x[2])
+        self.assertEqual(value(i.e), 8)
+
+        e = clone_expression(m.e.expr, substitute={id(m.x[2]): m.x[3]})
+        self.assertEqual(str(e), "3 + x[1] + 2*x[3]")
+
+    def test_standard_repn(self):
+        m = self.m
+        e = linear_sum([1, m.p], [m.x[1], m.x[2]], 3)
+        repn = generate_standard_repn(e)
+        self.assertEqual(repn.constant, 3)
+        self.assertEqual(repn.linear_coefs, (1, 2))
+        self.assertEqual(repn.linear_vars, (m.x[1], m.x[2]))
+
+
 class TestEvaluation(unittest.TestCase):
     def test_log_error(self):
         m = ConcreteModel()
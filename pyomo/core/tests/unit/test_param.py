@@ -21,6 +21,7 @@
 
 import math
 import os
+import pickle
 import sys
 
 import pyomo.common.unittest as unittest
@@ -62,10 +63,16 @@ from pyomo.environ import (
     acosh,
     atanh,
 )
+from pyomo.common.dependencies import (
+    numpy as np,
+    numpy_available,
+    pandas as pd,
+    pandas_available,
+)
 from pyomo.common.errors import PyomoException
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.tempfiles import TempfileManager
-from pyomo.core.base.param import _ParamData
+from pyomo.core.base.param import _ParamData, _ArrayParamData
 from pyomo.core.base.set import _SetData
 from pyomo.core.base.units_container import units, pint_available, UnitsError
 
@@ -1757,6 +1764,179 @@ class MiscNonIndexedParamBehaviorTests(unittest.TestCase):
         self.assertEqual(3.0, value(model.CON[None].lower))
 
 
+@unittest.skipUnless(numpy_available, "Param array storage requires numpy")
+class TestArrayStorageParam(unittest.TestCase):
+    def _values(self, p):
+        return {k: v(exception=False) for k, v in p.items()}
+
+    def test_construct(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=['a', 'b'])
+        m.p = Param(
+            m.I,
+            m.J,
+            initialize={(1, 'a'): 1.5, (2, 'b'): 3},
+            default=7,
+            storage='array',
+        )
+        self.assertTrue(m.p.mutable)
+        self.assertIs(type(m.p[1, 'a']), _ArrayParamData)
+        # Array storage is dense
+        self.assertEqual(len(m.p._data), 6)
+        self.assertEqual(
+            self._values(m.p),
+            {
+                (1, 'a'): 1.5,
+                (1, 'b'): 7,
+                (2, 'a'): 7,
+                (2, 'b'): 3,
+                (3, 'a'): 7,
+                (3, 'b'): 7,
+            },
+        )
+        self.assertEqual(m.p._storage.size, 6)
+
+        m.q = Param(m.I, initialize=2, storage='array')
+        self.assertEqual(m.q._storage.positions(m.q), slice(0, 3))
+        self.assertEqual(self._values(m.q), {1: 2, 2: 2, 3: 2})
+
+        m.r = Param(m.I, initialize=lambda m, i: i / 2, storage='array')
+        self.assertEqual(self._values(m.r), {1: 0.5, 2: 1, 3: 1.5})
+
+        m.t = Param(range(3), initialize=np.array([2.0, 3.0, 4.0]), storage='array')
+        self.assertEqual(self._values(m.t), {0: 2, 1: 3, 2: 4})
+        m.s = Param(m.I, initialize={1: 5}, storage='array')
+        self.assertIsNone(m.s[2](exception=False))
+        self.assertEqual(value(m.s[1] * m.r[3]), 7.5)
+        m.s[2] = 4
+        self.assertEqual(m.s[2].value, 4)
+        m.s[2].clear()
+        self.assertIsNone(m.s[2](exception=False))
+
+    def test_construct_errors(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegex(ValueError, "requires mutable=True"):
+            m.p = Param([1, 2], mutable=False, storage='array')
+        with self.assertRaisesRegex(ValueError, "must be one of 'object' or 'array'"):
+            m.p = Param([1, 2], storage='columns')
+        with LoggingIntercept() as LOG:
+            m.p = Param(initialize=5, storage='array')
+        self.assertIn("storage='array' is not supported", LOG.getvalue())
+        self.assertFalse(m.p.is_indexed())
+        self.assertIsNone(m.p._storage)
+        m.q = Param([1, 2], within=Any, storage='array')
+        with self.assertRaisesRegex(
+            ValueError, "Param 'q\\[1\\]' uses array storage, which only supports"
+        ):
+            m.q[1] = 'a'
+        self.assertIsNone(m.q[1](exception=False))
+        with self.assertRaisesRegex(ValueError, "Value not in parameter domain"):
+            m.r = Param(
+                [1, 2],
+                initialize={1: 1, 2: -1},
+                within=NonNegativeReals,
+                storage='array',
+            )
+
+    def test_set_values_from_array(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=[10, 20])
+        m.p = Param(m.I, m.J, initialize=0, storage='array')
+        m.p.set_values_from_array(None, np.arange(6))
+        self.assertEqual(
+            self._values(m.p),
+            {(1, 10): 0, (1, 20): 1, (2, 10): 2, (2, 20): 3, (3, 10): 4, (3, 20): 5},
+        )
+        m.p.set_values_from_array([(3, 20), (1, 10)], [1.5, np.nan])
+        self.assertEqual(m.p[3, 20].value, 1.5)
+        self.assertIsNone(m.p[1, 10](exception=False))
+        m.p.set_values_from_array(np.array([[2, 10], [2, 20]]), np.array([7, 8]))
+        self.assertEqual(m.p[2, 10].value, 7)
+        self.assertEqual(m.p[2, 20].value, 8)
+
+        with self.assertRaisesRegex(ValueError, "array of shape \\(2,\\)"):
+            m.p.set_values_from_array(None, [1, 2])
+        with self.assertRaisesRegex(ValueError, "requires numeric values"):
+            m.p.set_values_from_array([(1, 10)], ['a'])
+        with self.assertRaisesRegex(KeyError, "Index '\\(4, 10\\)' is not valid"):
+            m.p.set_values_from_array([(4, 10)], [1])
+
+        # Object storage is updated element-by-element
+        m.q = Param(m.I, mutable=True)
+        m.q.set_values_from_array([3, 1], [3, 1])
+        self.assertEqual(self._values(m.q), {3: 3, 1: 1})
+        m.q.set_values_from_array(None, [np.nan, 5])
+        self.assertEqual(self._values(m.q), {1: None, 3: 5})
+
+        m.r = Param(m.I, initialize=1)
+        with self.assertRaisesRegex(TypeError, "immutable parameter r\\[\\*\\]"):
+            m.r.set_values_from_array(None, [1, 2, 3])
+
+    def test_set_values_validation(self):
+        m = ConcreteModel()
+        m.p = Param(
+            [1, 2, 3], initialize=1, within=NonNegativeIntegers, storage='array'
+        )
+        with self.assertRaisesRegex(
+            ValueError, "Invalid parameter value: p\\[2\\] = '2.5'"
+        ):
+            m.p.set_values_from_array(None, [1, 2.5, 3])
+        self.assertEqual(self._values(m.p), {1: 1, 2: 1, 3: 1})
+        m.p.set_values_from_array(None, [0, 2, np.nan])
+        self.assertEqual(self._values(m.p), {1: 0, 2: 2, 3: None})
+
+        m.q = Param(
+            [1, 2, 3],
+            initialize=1,
+            validate=lambda m, v, i: v <= 2 * i,
+            storage='array',
+        )
+        with self.assertRaisesRegex(
+            ValueError, "Invalid parameter value: q\\[1\\] = '3.0'"
+        ):
+            m.q.set_values_from_array(None, [3, 2, 1])
+        self.assertEqual(self._values(m.q), {1: 1, 2: 1, 3: 1})
+        m.q.set_values_from_array(None, [2, 4, 6])
+        self.assertEqual(self._values(m.q), {1: 2, 2: 4, 3: 6})
+
+    def test_clone_pickle(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2, 3], initialize={1: 1, 2: 2}, storage='array')
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            i.p[3] = 30
+            self.assertEqual(self._values(i.p), {1: 1, 2: 2, 3: 30})
+            self.assertIsNot(i.p._storage, m.p._storage)
+            self.assertIs(i.p[1]._storage, i.p._storage)
+            self.assertIs(i.p[1].parent_component(), i.p)
+        self.assertEqual(self._values(m.p), {1: 1, 2: 2, 3: None})
+
+    @unittest.skipUnless(pandas_available, "test requires pandas")
+    def test_pandas(self):
+        m = ConcreteModel()
+        idx = pd.MultiIndex.from_tuples([(1, 'a'), (1, 'b'), (2, 'a')])
+        m.p = Param(
+            [1, 2],
+            ['a', 'b'],
+            initialize=pd.Series([1, 2, 3], index=idx),
+            storage='array',
+        )
+        self.assertEqual(
+            self._values(m.p), {(1, 'a'): 1, (1, 'b'): 2, (2, 'a'): 3, (2, 'b'): None}
+        )
+        m.q = Param(
+            [1, 2],
+            initialize=pd.DataFrame({'v': [5, 6]}, index=[1, 2]),
+            storage='array',
+        )
+        self.assertEqual(self._values(m.q), {1: 5, 2: 6})
+        m.p.set_values_from_array(idx, pd.Series([4, 5, 6]))
+        self.assertEqual(
+            self._values(m.p), {(1, 'a'): 4, (1, 'b'): 5, (2, 'a'): 6, (2, 'b'): None}
+        )
+
+
 # Add test methods for all intrinsic functions
 assignTestsNonIndexedParamTests(MiscNonIndexedParamBehaviorTests, intrinsic_test_list)
 
@@ -0,0 +1,176 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the binary model format
+#
+
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy_available
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.environ import (
+    ConcreteModel,
+    Block,
+    Set,
+    RangeSet,
+    Param,
+    Var,
+    Expression,
+    Constraint,
+    Objective,
+    Suffix,
+    Binary,
+    Integers,
+    exp,
+    log,
+    inequality,
+    maximize,
+    save_model,
+    load_model,
+    value,
+)
+from pyomo.core.base.serialization import _MAGIC
+
+
+def _pprint(m):
+    OUT = StringIO()
+    m.pprint(ostream=OUT)
+    return OUT.getvalue()
+
+
+@unittest.skipUnless(numpy_available, "binary model format requires numpy")
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        TempfileManager.push()
+        self.fname = TempfileManager.create_tempfile(suffix='.pbin')
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _model(self):
+        m = ConcreteModel(name='test')
+        m.I = Set(initialize=[3, 1, 2])
+        m.J = RangeSet(4)
+        m.K = Set(initialize=['a', ('b', 1)], dimen=None)
+        m.S = Set(m.I, initialize={1: [1, 2], 2: [], 3: [5]})
+        m.T = Set(initialize=[(2, 3), (1, 2)], ordered=Set.SortedOrder)
+        m.p = Param(m.I, initialize={1: 1, 2: 2.5}, mutable=True, default=7)
+        m.q = Param(initialize=4)
+        m.r = Param(m.J, initialize=lambda m, j: j * 2, within=Integers)
+        m.s = Param(mutable=True)
+        m.x = Var(m.I, m.J, bounds=(0, 10), initialize=1.5)
+        m.y = Var(within=Binary)
+        m.z = Var([1, 'a'], bounds=(m.p[1], None))
+        m.w = Var(m.J, storage='array', initialize=2)
+        m.x[1, 2].fix(3)
+        m.e = Expression(expr=m.y**2 + exp(m.z[1]))
+        m.c = Constraint(
+            m.I, rule=lambda m, i: sum(m.p[i] * m.x[i, j] for j in m.J) + m.e <= m.q
+        )
+        m.d = Constraint(expr=inequality(0, m.z['a'] + m.s, 5))
+        m.f = Constraint(expr=m.y == abs(m.z[1]) * 3)
+        m.o = Objective(expr=sum(m.w[j] for j in m.J) - log(m.y + 1), sense=maximize)
+        m.b = Block([1, 2])
+        m.b[1].v = Var()
+        m.b[2].c = Constraint(expr=m.b[1].v + m.x[3, 1] >= 1)
+        m.c[2].deactivate()
+        m.s.value = 3
+        return m
+
+    def test_round_trip(self):
+        m = self._model()
+        save_model(m, self.fname)
+        n = load_model(self.fname)
+        self.assertEqual(n.name, 'test')
+        self.assertEqual(_pprint(m), _pprint(n))
+        self.assertFalse(n.c[2].active)
+        self.assertTrue(n.c[1].active)
+        self.assertTrue(n.x[1, 2].fixed)
+        self.assertEqual(list(n.T), [(1, 2), (2, 3)])
+        m.y.value = n.y.value = 1
+        self.assertEqual(value(n.o), value(m.o))
+
+    def test_mixed_var_bounds(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=1)
+        m.y = Var([1, 2], bounds=(m.p, 10))
+        m.z = Var(bounds=(-5, m.p))
+        save_model(m, self.fname)
+        n = load_model(self.fname)
+        self.assertEqual(_pprint(m), _pprint(n))
+        self.assertEqual(n.y[1].bounds, (1, 10))
+        self.assertEqual(n.z.bounds, (-5, 1))
+        n.p = 3
+        self.assertEqual(n.y[2].bounds, (3, 10))
+        self.assertEqual(n.z.bounds, (-5, 3))
+
+    def test_set_operator_index(self):
+        m = ConcreteModel()
+        m.s = Set(initialize=[1, 2])
+        m.t = Set(initialize=[2, 3])
+        m.u = Var(m.s | m.t, initialize=1)
+        m.i = Var(m.s & m.t)
+        m.d = Var(m.s - m.t)
+        m.x = Var(m.s ^ m.t)
+        m.p = Param((m.s | [5]) * m.t, initialize=0)
+        save_model(m, self.fname)
+        n = load_model(self.fname)
+        self.assertEqual(_pprint(m), _pprint(n))
+        self.assertIn('Index=s | t', _pprint(n))
+        self.assertEqual(n.u.index_set()._sets, (n.s, n.t))
+
+    def test_model_save(self):
+        m = self._model()
+        m.save(self.fname)
+        self.assertEqual(_pprint(m), _pprint(load_model(self.fname)))
+
+    def test_leaf_references(self):
+        m = self._model()
+        save_model(m, self.fname)
+        n = load_model(self.fname)
+        # Expressions reference the loaded components (not copies)
+        self.assertIs(n.z[1].lower, n.p[1])
+        n.p[1] = 0.5
+        self.assertEqual(n.z[1].lb, 0.5)
+        self.assertIs(n.c[1].body.args[1], n.e)
+        n.y.value = 0
+        n.z[1].value = 0
+        self.assertEqual(value(n.e), 1)
+
+    def test_array_storage(self):
+        m = self._model()
+        m.w[3].value = 5
+        save_model(m, self.fname)
+        n = load_model(self.fname)
+        self.assertIsNotNone(n.w._storage)
+        self.assertEqual([n.w[j].value for j in n.J], [2, 2, 5, 2])
+
+    def test_unsupported_component(self):
+        m = self._model()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        with self.assertRaisesRegex(ValueError, r"dual \(Suffix\)"):
+            save_model(m, self.fname)
+
+    def test_bad_file(self):
+        with open(self.fname, 'wb') as FILE:
+            FILE.write(b'NOTAMODEL' + b'\0' * 64)
+        with self.assertRaisesRegex(ValueError, "is not a Pyomo binary model file"):
+            load_model(self.fname)
+        m = ConcreteModel()
+        save_model(m, self.fname)
+        with open(self.fname, 'rb') as FILE:
+            self.assertEqual(FILE.read(len(_MAGIC)), _MAGIC)
+        self.assertEqual(len(list(load_model(self.fname).component_objects())), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
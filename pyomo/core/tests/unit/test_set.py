@@ -81,6 +81,8 @@ from pyomo.core.base.set import (
     SetProduct_InfiniteSet,
     SetProduct_FiniteSet,
     SetProduct_OrderedSet,
+    SetProduct_MaterializedOrderedSet,
+    SetUnion_MaterializedFiniteSet,
     _SetData,
     _FiniteSetData,
     _InsertionOrderSetData,
@@ -3465,6 +3467,121 @@ J : Size=1, Index=None, Ordered=False
         self.assertNotIn((2, 5, 3), m.Z)
 
 
+class TestMaterializedSetOperator(unittest.TestCase):
+    def _check(self, s, ref, members):
+        # Compare a materialized Set to the reference (delegating) Set
+        self.assertEqual(list(s), list(ref))
+        self.assertEqual(len(s), len(ref))
+        for v in members:
+            self.assertEqual(v in s, v in ref)
+            if v in ref and ref.isordered():
+                self.assertEqual(s.ord(v), list(ref).index(ref.get(v)) + 1)
+        if ref.isordered():
+            for i in range(1, len(ref) + 1):
+                self.assertEqual(s.at(i), ref.at(i))
+                self.assertEqual(s.at(-i), ref.at(-i))
+
+    def test_product(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.J = Set(initialize=[(1, 'a'), (2, 'b')])
+        m.K = Set(initialize=[1, (2, 3), (4, 5, 6)], dimen=None)
+        m.R = RangeSet(2)
+        m.P = m.I * m.J * m.K * m.R
+        m.ref = m.I * m.J * m.K * m.R
+        m.P.materialize()
+        self.assertIs(type(m.P), SetProduct_MaterializedOrderedSet)
+        members = [
+            (3, 1, 'a', 1, 2),
+            (3, (1, 'a'), 1, 2),
+            [3, 1, 'a', 1, 2],
+            (1, 2, 'b', 4, 5, 6, 1),
+            (1, 2, 'b', (4, 5, 6), 1),
+            (1, 2, 'b', 4, 5, 6, 3),
+            (1, 2, 'b', 7, 1),
+            (1, 2),
+            'a',
+        ]
+        self._check(m.P, m.ref, members)
+        self.assertEqual(m.P.ord((3, (1, 'a'), 1, 2)), 2)
+        self.assertEqual(m.P.next((3, 1, 'a', 1, 1)), (3, 1, 'a', 1, 2))
+        with self.assertRaisesRegex(IndexError, "item not in Set"):
+            m.P.ord((1, 2, 'b', 7, 1))
+        with self.assertRaisesRegex(IndexError, "P index out of range"):
+            m.P.at(len(m.P) + 1)
+
+        # Changes to the operands are reflected in the materialized set
+        m.I.add(0)
+        m.K.remove((2, 3))
+        m.K.add('x')
+        self._check(m.P, m.ref, members + [(0, 2, 'b', 'x', 2)])
+        self.assertIn((0, 2, 'b', 'x', 2), m.P)
+        m.R.construct()
+        m.J.clear()
+        self._check(m.P, m.ref, members)
+        self.assertEqual(len(m.P), 0)
+
+    def test_union_intersection_difference(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3], ordered=False)
+        m.J = Set(initialize=[4, 2, 5], ordered=False)
+        m.K = Set(initialize=[6, 1, 4])
+        ops = {
+            'U': lambda: m.I | m.J,
+            'A': lambda: m.K & m.J,
+            'D': lambda: m.K - m.J,
+            'X': lambda: m.K ^ m.J,
+            'N': lambda: (m.I | m.J) * m.K,
+        }
+        for name, op in ops.items():
+            m.add_component(name, op())
+            m.add_component(name + '_ref', op())
+            m.component(name).materialize()
+        self.assertIs(type(m.U), SetUnion_MaterializedFiniteSet)
+        members = list(range(8)) + [(1, 1), (2, 6), (7, 1)]
+        for name in ops:
+            self._check(m.component(name), m.component(name + '_ref'), members)
+        m.J.add(6)
+        m.K.add(7)
+        for name in ops:
+            self._check(m.component(name), m.component(name + '_ref'), members)
+
+    def test_materialize_errors(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2])
+        m.Z = m.I * Integers
+        with self.assertRaisesRegex(
+            ValueError, "only finite set operators can be materialized"
+        ):
+            m.Z.materialize()
+        m.S = m.I * SetOf([3, 4])
+        with self.assertRaisesRegex(
+            ValueError, "changes to the operand Set .* cannot be tracked"
+        ):
+            m.S.materialize()
+        self.assertIs(type(m.S), SetProduct_OrderedSet)
+
+    def test_clone_pickle_unmaterialize(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2])
+        m.J = Set(initialize=[3, 4])
+        m.P = m.I * m.J
+        m.P.materialize()
+        self.assertEqual(list(m.P), [(1, 3), (1, 4), (2, 3), (2, 4)])
+        self.assertIsNotNone(m.P._members)
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIs(type(i.P), SetProduct_MaterializedOrderedSet)
+            self.assertIsNone(i.P._members)
+            i.J.add(5)
+            self.assertEqual(len(i.P), 6)
+            self.assertIn((2, 5), i.P)
+            self.assertEqual(len(m.P), 4)
+        m.P.materialize(False)
+        self.assertIs(type(m.P), SetProduct_OrderedSet)
+        self.assertIsNone(m.P._members)
+        self.assertEqual(len(m.P), 4)
+
+
 class TestGlobalSets(unittest.TestCase):
     def test_globals(self):
         self.assertEqual(Reals.__class__.__name__, 'GlobalSet')
@@ -4867,9 +4984,14 @@ I : Size=2, Index={1, 2, 3, 4, 5}, Ordered=Insertion
         self.assertFalse(I.add(i))
         self.assertTrue(I._is_sorted)
 
-        # adding a new value clears _is_sorted
+        # adding a new value that sorts after the last element does not
+        # affect _is_sorted
         self.assertTrue(I._is_sorted)
         self.assertTrue(I.add(1))
+        self.assertTrue(I._is_sorted)
+
+        # adding any other new value clears _is_sorted
+        self.assertTrue(I.add(-1))
         self.assertFalse(I._is_sorted)
 
         # __str__
@@ -5069,6 +5191,45 @@ I : Size=2, Index={1, 2, 3, 4, 5}, Ordered=Insertion
         self.assertEqual(I.ord(0), i + 1)
         self.assertTrue(I._is_sorted)
 
+    def test_sorted_append_remove(self):
+        m = ConcreteModel()
+        m.I = Set(ordered=Set.SortedOrder, initialize=[3, 1, 2])
+        self.assertEqual(list(m.I), [1, 2, 3])
+        self.assertTrue(m.I._is_sorted)
+
+        # Appending values in order keeps the set sorted
+        m.I.add(4)
+        m.I.add(4.5)
+        self.assertTrue(m.I._is_sorted)
+        self.assertEqual(m.I.ord(4.5), 5)
+        self.assertEqual(m.I.last(), 4.5)
+
+        # Out-of-order (and non-comparable) values trigger a re-sort
+        m.I.add(0)
+        self.assertFalse(m.I._is_sorted)
+        self.assertEqual(list(m.I), [0, 1, 2, 3, 4, 4.5])
+        m.I.add('a')
+        self.assertFalse(m.I._is_sorted)
+        self.assertEqual(list(m.I), [0, 1, 2, 3, 4, 4.5, 'a'])
+        m.I.add(5)
+        self.assertFalse(m.I._is_sorted)
+        self.assertEqual(list(m.I), [0, 1, 2, 3, 4, 4.5, 5, 'a'])
+
+        # Removing values renumbers the remaining positions
+        m.I.remove(0)
+        m.I.remove(3)
+        self.assertEqual(list(m.I), [1, 2, 4, 4.5, 5, 'a'])
+        self.assertEqual([m.I.ord(i) for i in m.I], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(m.I.at(3), 4)
+
+        m.J = Set(ordered=Set.InsertionOrder, initialize=[5, 3, 1, 2])
+        m.J.remove(5)
+        m.J.add(0)
+        m.J.remove(1)
+        self.assertEqual(list(m.J), [3, 2, 0])
+        self.assertEqual([m.J.ord(i) for i in m.J], [1, 2, 3])
+        self.assertEqual(m.J.at(3), 0)
+
     def test_sorted_operations(self):
         I = UnindexedComponent_set
         self.assertEqual(len(I), 1)
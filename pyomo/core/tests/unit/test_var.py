@@ -16,6 +16,7 @@
 #
 
 import os
+import pickle
 from os.path import abspath, dirname
 
 currdir = dirname(abspath(__file__)) + os.sep
@@ -23,9 +24,11 @@ currdir = dirname(abspath(__file__)) + os.sep
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
 from pyomo.core.base import IntegerSet
+from pyomo.core.base.var import _ArrayVarData
 from pyomo.core.expr.numeric_expr import (
     NPV_ProductExpression,
     NPV_MaxExpression,
@@ -1825,5 +1828,149 @@ class MiscVarTests(unittest.TestCase):
         self.assertEqual(x.bounds, (0, 1))
 
 
+@unittest.skipUnless(numpy_available, "array storage requires numpy")
+class TestArrayStorageVar(unittest.TestCase):
+    def test_construct(self):
+        m = ConcreteModel()
+        m.I = RangeSet(5)
+        m.x = Var(m.I, bounds=(0, 10), initialize={1: 1, 3: 3, 5: 5}, storage='array')
+        m.y = Var(m.I, domain=lambda m, i: Binary if i % 2 else Reals, storage='array')
+        self.assertEqual(len(m.x), 5)
+        self.assertIs(type(m.x[1]), _ArrayVarData)
+        self.assertIs(m.x[1], m.x[1])
+        self.assertEqual(m.x._storage.size, 5)
+        self.assertEqual([v.value for v in m.x.values()], [1, None, 3, None, 5])
+        self.assertEqual(m.x[2].bounds, (0, 10))
+        self.assertEqual(m.x[2].lb, 0)
+        self.assertIsNone(m.x[2].value)
+        self.assertTrue(m.x[2].stale)
+        self.assertFalse(m.x[3].stale)
+        self.assertIs(m.y[1].domain, Binary)
+        self.assertIs(m.y[2].domain, Reals)
+        self.assertEqual(m.y[1].bounds, (0, 1))
+
+        m.v = VarList(storage='array')
+        m.v.add()
+        m.v.add().value = 3
+        self.assertEqual(m.v[2].value, 3)
+        self.assertEqual(m.v._storage.size, 2)
+
+        with self.assertRaisesRegex(ValueError, "Var 'storage' must be one of"):
+            Var(m.I, storage='columnar')
+
+        with LoggingIntercept() as LOG:
+            m.z = Var(storage='array')
+        self.assertIn("storage='array' is not supported for scalar", LOG.getvalue())
+        self.assertIsNone(m.z._storage)
+
+    def test_vardata_api(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=5)
+        m.x = Var([1, 2, 3], storage='array')
+        m.x[1].value = 2
+        m.x[1].setlb(1)
+        m.x[1].setub(4)
+        self.assertEqual(m.x[1].bounds, (1, 4))
+        self.assertEqual(m.x[2].bounds, (None, None))
+        m.x[2].fix(3)
+        self.assertTrue(m.x[2].fixed)
+        self.assertTrue(m.x[2].is_fixed())
+        self.assertEqual(m.x[2].value, 3)
+        m.x[2].unfix()
+        self.assertFalse(m.x[2].fixed)
+        m.x[3].domain = NonNegativeReals
+        self.assertEqual(m.x[3].bounds, (0, None))
+        with self.assertRaisesRegex(
+            ValueError, "Var 'x\\[1\\]' uses array storage, which only supports"
+        ):
+            m.x[1].setub(m.p)
+        with LoggingIntercept() as LOG:
+            m.x[1].value = 10
+        self.assertIn("outside the bounds (1.0, 4.0)", LOG.getvalue())
+        m.x[1].value = None
+        self.assertIsNone(m.x[1].value)
+        self.assertTrue(m.x[1].stale)
+
+        # Removed VarData remain valid
+        x3 = m.x[3]
+        x3.value = 7
+        del m.x[3]
+        self.assertEqual(len(m.x), 2)
+        self.assertEqual(x3.value, 7)
+        self.assertEqual(x3.bounds, (0, None))
+
+    def test_get_set_values(self):
+        for storage in ('object', 'array'):
+            m = ConcreteModel()
+            m.x = Var([3, 1, 2], bounds=(0, 10), storage=storage)
+            m.y = Var([1, 2, 3], domain=Binary, storage=storage)
+            m.x.set_values(np.array([1, 2, float('nan')]))
+            self.assertEqual(m.x.get_values(), {3: 1, 1: 2, 2: None})
+            self.assertFalse(m.x[3].stale)
+            self.assertTrue(m.x[2].stale)
+            self.assertStructuredAlmostEqual(
+                m.x.get_values(as_array=True).tolist()[:2], [1, 2]
+            )
+            self.assertTrue(np.isnan(m.x.get_values(as_array=True)[2]))
+
+            m.x.fix_all([False, True, False])
+            self.assertEqual([v.fixed for v in m.x.values()], [False, True, False])
+            self.assertEqual(
+                m.x.get_values(include_fixed_values=False, as_array=True).tolist()[:1],
+                [1],
+            )
+            m.x.unfix()
+            self.assertEqual([v.fixed for v in m.x.values()], [False] * 3)
+            m.x.fix()
+            self.assertEqual([v.fixed for v in m.x.values()], [True] * 3)
+
+            with LoggingIntercept() as LOG:
+                m.x.set_values([1, 20, -1])
+            self.assertEqual(
+                LOG.getvalue().replace('\n', ' ').count("outside the bounds"), 2
+            )
+            self.assertIn("'x[1]' to a numeric value `20", LOG.getvalue())
+            with LoggingIntercept() as LOG:
+                m.y.set_values([0, 0.5, 1])
+            self.assertIn(
+                "'y[2]' to a value `0.5` (float) not in domain", LOG.getvalue()
+            )
+            with LoggingIntercept() as LOG:
+                m.y.set_values([0, 0.5, 1], skip_validation=True)
+            self.assertEqual(LOG.getvalue(), "")
+            self.assertEqual(m.y[2].value, 0.5)
+
+            with self.assertRaisesRegex(ValueError, "cannot set the values"):
+                m.x.set_values([1, 2])
+            with self.assertRaisesRegex(ValueError, "fix_all\\(\\) mask has shape"):
+                m.x.fix_all([True])
+
+    def test_stale(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], storage='array')
+        m.x.set_values([1, 2, 3])
+        self.assertEqual([v.stale for v in m.x.values()], [False] * 3)
+        StaleFlagManager.mark_all_as_stale(delayed=True)
+        m.x[1].value = 5
+        self.assertEqual([v.stale for v in m.x.values()], [False, True, True])
+        m.x.flag_as_stale()
+        self.assertEqual([v.stale for v in m.x.values()], [True] * 3)
+
+    def test_clone_pickle(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, 5), storage='array')
+        m.x.set_values([1, 2, 3])
+        m.x[2].fix()
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIsNot(i.x._storage, m.x._storage)
+            self.assertIs(i.x[1]._storage, i.x._storage)
+            self.assertEqual(i.x.get_values(), {1: 1, 2: 2, 3: 3})
+            self.assertEqual(i.x[2].bounds, (0, 5))
+            self.assertTrue(i.x[2].fixed)
+            self.assertFalse(i.x[1].stale)
+            i.x[1].value = 4
+            self.assertEqual(m.x[1].value, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
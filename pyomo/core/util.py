@@ -13,9 +13,14 @@
 # Utility functions
 #
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.core.expr.numvalue import native_numeric_types
-from pyomo.core.expr.numeric_expr import mutable_expression, NPV_SumExpression
+from pyomo.core.expr.numeric_expr import (
+    mutable_expression,
+    NPV_SumExpression,
+    LinearArrayExpression,
+)
 from pyomo.core.base.var import Var
 from pyomo.core.base.expression import Expression
 from pyomo.core.base.component import _ComponentBase
@@ -208,6 +213,43 @@ def sum_product(*args, **kwds):
         )
 
 
+def linear_sum(coefs, variables, constant=0):
+    """Construct a linear expression from parallel arrays of
+    coefficients and variables.
+
+    This builds the linear expression `constant + sum_i(coefs[i] *
+    variables[i])` directly, without creating the intermediate product
+    and sum expressions generated by (for example) ``sum(c[i] * x[i]
+    for i in I)``.  The resulting
+    :class:`LinearArrayExpression <pyomo.core.expr.LinearArrayExpression>`
+    is processed directly by the LP and NL writers.
+
+    Parameters
+    ----------
+    coefs: Iterable
+        The coefficients (numbers or NPV expressions).  This may be a
+        NumPy vector.
+
+    variables: Iterable or Var
+        The variables.  If an indexed :class:`Var` is provided, its
+        data objects are used in index order.
+
+    constant: Any
+        The constant term.  Defaults to 0.
+
+    Returns
+    -------
+    LinearArrayExpression
+
+    """
+    if isinstance(variables, Var):
+        variables = variables.values()
+    if numpy_available and isinstance(coefs, np.ndarray):
+        # Convert to native Python numbers
+        coefs = coefs.tolist()
+    return LinearArrayExpression(constant, coefs, variables)
+
+
 #: An alias for :func:`sum_product <pyomo.core.expr.util>`
 dot_product = sum_product
 
@@ -164,20 +164,19 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
-            return point
-        elif point > max(self._fe):
+        # This works because the list _fe is always sorted
+        i = bisect.bisect_left(self._fe, point)
+        if i == len(self._fe):
             logger.warning(
                 "The point '%s' exceeds the upper bound "
                 "of the ContinuousSet '%s'. Returning the upper bound"
                 % (str(point), self.name)
             )
-            return max(self._fe)
+            return self._fe[-1]
+        elif self._fe[i] == point:
+            return point
         else:
-            for i in self._fe:
-                # This works because the list _fe is always sorted
-                if i > point:
-                    return i
+            return self._fe[i]
 
     def get_lower_element_boundary(self, point):
         """Returns the first finite element point that is less than or
@@ -191,29 +190,26 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
+        # This works because the list _fe is always sorted
+        i = bisect.bisect_left(self._fe, point)
+        if i < len(self._fe) and self._fe[i] == point:
             if 'scheme' in self._discretization_info:
                 if self._discretization_info['scheme'] == 'LAGRANGE-RADAU':
                     # Because Radau Collocation has a collocation point on the
                     # upper finite element bound this if statement ensures that
                     # the desired finite element bound is returned
-                    tmp = self._fe.index(point)
-                    if tmp != 0:
-                        return self._fe[tmp - 1]
+                    if i != 0:
+                        return self._fe[i - 1]
             return point
-        elif point < min(self._fe):
+        elif i == 0:
             logger.warning(
                 "The point '%s' is less than the lower bound "
                 "of the ContinuousSet '%s'. Returning the lower bound "
                 % (str(point), self.name)
             )
-            return min(self._fe)
+            return self._fe[0]
         else:
-            rev_fe = list(self._fe)
-            rev_fe.reverse()
-            for i in rev_fe:
-                if i < point:
-                    return i
+            return self._fe[i - 1]
 
     def construct(self, values=None):
         """Constructs a :py:class:`ContinuousSet` component"""
@@ -275,9 +271,13 @@ class ContinuousSet(SortedScalarSet):
         -------
         `float` or `None`
         """
+        # Search the (sorted) set members directly rather than copying
+        # them into a new list
+        if not self._is_sorted:
+            self._sort()
+        arr = self._ordered_values
         lo = 0
-        hi = len(self)
-        arr = list(self)
+        hi = len(arr)
         i = bisect.bisect_right(arr, target, lo=lo, hi=hi)
         # i is the index at which target should be inserted if it is to be
         # right of any equal components.
@@ -265,6 +265,12 @@ class TestContinuousSet(unittest.TestCase):
         i = m.time.find_nearest_index(0, tolerance=0)
         self.assertEqual(i, 1)
 
+        # Points added after construction are found
+        m.time.add(3.3)
+        i = m.time.find_nearest_index(3.31, tolerance=0.1)
+        self.assertEqual(i, 12)
+        self.assertEqual(m.time.at(i), 3.3)
+
         # This test fails. I get:
         # delta_left == 2.075-2.0 == 0.07500000000000018
         # delta_right == 2.15-2.075 == 0.07499999999999973
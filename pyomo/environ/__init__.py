@@ -238,6 +238,8 @@ from pyomo.core import (
     Model,
     ConcreteModel,
     AbstractModel,
+    save_model,
+    load_model,
     ModelComponentFactory,
     Transformation,
     TransformationFactory,
@@ -249,6 +251,7 @@ from pyomo.core import (
     prod,
     quicksum,
     sum_product,
+    linear_sum,
     dot_product,
     summation,
     sequence,
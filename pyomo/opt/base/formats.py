@@ -89,6 +89,10 @@ def guess_format(filename):
     formats['json'] = ResultsFormat.json
     formats['results'] = ResultsFormat.yaml
     if filename:
-        return formats.get(filename.split('.')[-1].strip(), None)
+        parts = filename.split('.')
+        # Look through compression suffixes (e.g., 'model.lp.gz')
+        if len(parts) > 2 and parts[-1].strip() in ('gz', 'zst'):
+            parts.pop()
+        return formats.get(parts[-1].strip(), None)
     else:
         return None
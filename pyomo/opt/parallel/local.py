@@ -9,7 +9,12 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import multiprocessing
+import multiprocessing.connection
+import os
 import time
+import traceback
+from collections import deque
 
 from pyomo.common.collections import OrderedDict
 
@@ -20,6 +25,8 @@ from pyomo.opt.parallel.async_solver import (
     SolverManagerFactory,
 )
 
+_fork_available = 'fork' in multiprocessing.get_all_start_methods()
+
 
 @SolverManagerFactory.register("serial", doc="Synchronously execute solvers locally")
 class SolverManager_Serial(AsynchronousSolverManager):
@@ -77,3 +84,223 @@ class SolverManager_Serial(AsynchronousSolverManager):
                 "executes solvers synchronously"
             ),
         )
+
+
+def _relabel_solutions(instance, results):
+    """Convert the solutions in `results` to use component names
+
+    The solutions returned by the (legacy) solver plugins are labeled
+    with the symbols from a symbol map that references the solved
+    instance.  That symbol map cannot be shared with another process,
+    so this relabels the solutions with the component names (which
+    ModelSolutions.load_from() resolves against the original model).
+
+    """
+    smap = results.__dict__.get('_smap', None)
+    if smap is None:
+        smap_id = results.__dict__.get('_smap_id', None)
+        if smap_id is None:
+            return
+        smap = instance.solutions.symbol_map[smap_id]
+        instance.solutions.delete_symbol_map(smap_id)
+    for i in range(len(results.solution)):
+        soln = results.solution(i)
+        soln._cuid = False
+        for category in ('objective', 'variable', 'constraint'):
+            relabeled = {}
+            for symbol, val in getattr(soln, category).items():
+                obj = smap.bySymbol.get(symbol, None)
+                if obj is None:
+                    obj = smap.aliases.get(symbol, None)
+                    if obj is None:
+                        continue
+                relabeled[obj.name] = val
+            setattr(soln, category, relabeled)
+    results._smap = None
+    results._smap_id = None
+
+
+def _solve_job(opt, args, kwds):
+    """Solve a single queued job, returning solutions labeled by name"""
+    from pyomo.core.base.block import _BlockData
+
+    time_start = time.time()
+    if isinstance(opt, str):
+        with pyomo.opt.SolverFactory(opt) as _opt:
+            results = _opt.solve(*args, **kwds)
+    else:
+        results = opt.solve(*args, **kwds)
+    results.pyomo_solve_time = time.time() - time_start
+    if args and isinstance(args[0], _BlockData):
+        _relabel_solutions(args[0], results)
+    return results
+
+
+def _solve_in_worker(conn, opt, args, kwds):
+    """Target for the forked worker processes
+
+    The instance (and solver) are inherited from the parent process
+    (so they do not need to be picklable); only the SolverResults are
+    sent back to the parent.
+
+    """
+    try:
+        results = _solve_job(opt, args, kwds)
+    except:
+        conn.send((False, traceback.format_exc()))
+    else:
+        conn.send((True, results))
+    finally:
+        conn.close()
+
+
+@SolverManagerFactory.register(
+    "processpool", doc="Asynchronously execute solvers in local worker processes"
+)
+class SolverManager_ProcessPool(AsynchronousSolverManager):
+    """Solver manager that runs queued solves in parallel local processes
+
+    Each queued solve (writing the problem file, running the solver, and
+    reading the solver output) is executed in a worker process forked
+    from this process, with at most `max_workers` (default:
+    ``os.cpu_count()``) solves running at the same time.  Solutions are
+    loaded into the queued instances in this process as the solves
+    finish (subject to the ``load_solutions`` option).
+
+    The workers are forked when the solve starts (not when it is
+    queued), so instances should not be modified after they are queued.
+    On platforms that do not support the 'fork' start method, the solves
+    are executed synchronously (as with the 'serial' solver manager).
+
+    """
+
+    def __init__(self, max_workers=None, **kwds):
+        super().__init__(**kwds)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super().clear()
+        self._terminate_workers()
+        # ActionHandles (and the solve arguments) waiting for a worker
+        self._pending = deque()
+        # Map of running worker connections to (ah, process, args, load_args)
+        self._running = {}
+        # Solves that were executed synchronously
+        self._finished = deque()
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__)
+            )
+        from pyomo.core.base.block import _BlockData
+
+        load_args = None
+        if args and isinstance(args[0], _BlockData):
+            # The solutions are loaded into the instance in this
+            # process: the workers only return the results
+            load_args = (
+                kwds.pop('load_solutions', True),
+                kwds.pop('select', 0),
+                kwds.pop('default_variable_value', None),
+            )
+            kwds['load_solutions'] = False
+        self._pending.append((ah, opt, args, kwds, load_args))
+        self._start_pending()
+        return ah
+
+    def _start_pending(self):
+        while self._pending and len(self._running) < self.max_workers:
+            ah, opt, args, kwds, load_args = self._pending.popleft()
+            if not _fork_available:
+                try:
+                    results = (True, _solve_job(opt, args, kwds))
+                except:
+                    results = (False, traceback.format_exc())
+                self._finished.append((ah, args, load_args, results))
+                continue
+            ctx = multiprocessing.get_context('fork')
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_solve_in_worker, args=(send_conn, opt, args, kwds)
+            )
+            process.start()
+            # Close our copy of the worker's end of the pipe so that we
+            # see EOF if the worker dies before sending the results
+            send_conn.close()
+            self._running[recv_conn] = (ah, process, args, load_args)
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if self._finished:
+            ah, args, load_args, (ok, results) = self._finished.popleft()
+        elif self._running:
+            conn = multiprocessing.connection.wait(list(self._running))[0]
+            ah, process, args, load_args = self._running.pop(conn)
+            try:
+                ok, results = conn.recv()
+            except EOFError:
+                ok = False
+                results = None
+            conn.close()
+            process.join()
+            if results is None:
+                results = "Worker process exited with code %s" % (process.exitcode,)
+            self._start_pending()
+        else:
+            return ActionHandle(
+                error=True,
+                explanation=(
+                    "No queued evaluations available in "
+                    "the 'processpool' solver manager"
+                ),
+            )
+
+        if not ok:
+            ah.status = ActionStatus.error
+            self.event_handle[ah.id].update(ah)
+            raise ActionManagerError("Solve of action %s failed:\n%s" % (ah, results))
+
+        if load_args is not None:
+            load_solutions, select, default_variable_value = load_args
+            if load_solutions:
+                args[0].solutions.load_from(
+                    results,
+                    select=select,
+                    default_variable_value=default_variable_value,
+                )
+                results.solution.clear()
+
+        self.results[ah.id] = results
+        ah.status = ActionStatus.done
+        self.event_handle[ah.id].update(ah)
+        return ah
+
+    def _terminate_workers(self):
+        for conn, (ah, process, args, load_args) in getattr(
+            self, '_running', {}
+        ).items():
+            process.terminate()
+            process.join()
+            conn.close()
+
+    def __exit__(self, t, v, traceback):
+        self._terminate_workers()
+        self._running = {}
@@ -0,0 +1,150 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the local solver managers
+#
+
+import multiprocessing
+import os
+
+import pyomo.common.unittest as unittest
+from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.environ import ConcreteModel, Var, Objective, Constraint, Suffix
+from pyomo.opt import SolverResults, SolverStatus, SolverManagerFactory
+from pyomo.opt.parallel.local import (
+    SolverManager_ProcessPool,
+    SolverManager_Serial,
+    _fork_available,
+)
+from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus
+from pyomo.opt.results.solution import Solution
+
+
+class MockSolver(object):
+    """A mock legacy solver that "solves" a model by setting x = 2 * lb
+
+    This mimics OptSolver.solve(): the solution is labeled with the
+    symbols from a symbol map, and is loaded into the model when
+    load_solutions=True.
+
+    """
+
+    def __init__(self, barrier=None):
+        self.barrier = barrier
+
+    def solve(self, model, load_solutions=True, fail=False):
+        if self.barrier is not None:
+            self.barrier.wait()
+        if fail:
+            raise RuntimeError("mock solver failure")
+        smap = SymbolMap()
+        smap.addSymbol(model.x, 'x1')
+        smap.addSymbol(model.o, 'o1')
+        smap.addSymbol(model.c, 'c1')
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        results.solver.message = str(os.getpid())
+        soln = Solution()
+        soln.variable['x1'] = {'Value': 2 * model.x.lb}
+        soln.objective['o1'] = {'Value': 2 * model.x.lb}
+        soln.constraint['c1'] = {'Dual': 1.5}
+        results.solution.insert(soln)
+        model.solutions.add_symbol_map(smap)
+        results._smap_id = id(smap)
+        results._smap = None
+        if load_solutions:
+            model.solutions.load_from(results)
+            results._smap_id = None
+            results.solution.clear()
+        else:
+            results._smap = smap
+            model.solutions.delete_symbol_map(id(smap))
+        return results
+
+
+def _model(lb):
+    m = ConcreteModel()
+    m.x = Var(bounds=(lb, None))
+    m.o = Objective(expr=m.x)
+    # Note: the rule is not picklable; the workers inherit the models
+    m.c = Constraint(rule=lambda m: m.x >= lb)
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    return m
+
+
+class TestSolverManagers(unittest.TestCase):
+    def _check(self, m, lb):
+        self.assertEqual(m.x.value, 2 * lb)
+        self.assertEqual(m.dual[m.c], 1.5)
+
+    def test_serial(self):
+        m = _model(1)
+        with SolverManager_Serial() as manager:
+            results = manager.solve(m, opt=MockSolver())
+        self._check(m, 1)
+        self.assertEqual(results.solver.message, str(os.getpid()))
+
+    def test_factory(self):
+        manager = SolverManagerFactory('processpool', max_workers=2)
+        self.assertIsInstance(manager, SolverManager_ProcessPool)
+        self.assertEqual(manager.max_workers, 2)
+        self.assertIsNotNone(SolverManagerFactory.doc('processpool'))
+
+    def test_process_pool(self):
+        models = [_model(i) for i in range(1, 5)]
+        barrier = None
+        if _fork_available:
+            # The solves only pass the barrier if they run concurrently
+            barrier = multiprocessing.get_context('fork').Barrier(2, timeout=10)
+        with SolverManager_ProcessPool(max_workers=2) as manager:
+            ahs = [manager.queue(m, opt=MockSolver(barrier)) for m in models]
+            manager.wait_all(ahs)
+            self.assertEqual(manager.num_queued(), 0)
+            results = [manager.get_results(ah) for ah in ahs]
+        for i, m in enumerate(models):
+            self._check(m, i + 1)
+            self.assertEqual(ahs[i].status, ActionStatus.done)
+            self.assertEqual(len(results[i].solution), 0)
+        if _fork_available:
+            pids = {res.solver.message for res in results}
+            self.assertEqual(len(pids), 4)
+            self.assertNotIn(str(os.getpid()), pids)
+
+    def test_process_pool_solve_all(self):
+        models = [_model(i) for i in range(1, 4)]
+        with SolverManager_ProcessPool(max_workers=2) as manager:
+            manager.solve_all(MockSolver(), models)
+        for i, m in enumerate(models):
+            self._check(m, i + 1)
+
+    def test_process_pool_no_load(self):
+        m = _model(3)
+        with SolverManager_ProcessPool() as manager:
+            results = manager.solve(m, opt=MockSolver(), load_solutions=False)
+        self.assertIsNone(m.x.value)
+        self.assertEqual(len(results.solution), 1)
+        # The solutions are labeled by component name
+        self.assertEqual(results.solution(0).variable, {'x': {'Value': 6}})
+        m.solutions.load_from(results)
+        self._check(m, 3)
+
+    def test_process_pool_error(self):
+        with SolverManager_ProcessPool() as manager:
+            with self.assertRaisesRegex(ActionManagerError, "mock solver failure"):
+                manager.solve(_model(1), opt=MockSolver(), fail=True)
+            ah = manager.wait_any()
+            self.assertEqual(ah.id, -1)
+            with self.assertRaisesRegex(ActionManagerError, "No solver passed"):
+                manager.queue(_model(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
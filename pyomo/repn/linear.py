@@ -11,7 +11,7 @@
 
 import logging
 import sys
-from operator import itemgetter
+from operator import attrgetter, itemgetter
 from itertools import filterfalse
 
 from pyomo.common.deprecation import deprecation_warning
@@ -30,6 +30,7 @@ from pyomo.core.expr.numeric_expr import (
     Expr_ifExpression,
     MonomialTermExpression,
     LinearExpression,
+    LinearArrayExpression,
     SumExpression,
     ExternalFunctionExpression,
     mutable_expression,
@@ -385,12 +386,16 @@ _exit_node_handlers[AbsExpression] = _exit_node_handlers[UnaryFunctionExpression
 def _handle_named_constant(visitor, node, arg1):
     # Record this common expression
     visitor.subexpression_cache[id(node)] = arg1
+    if visitor.repn_cache is not None:
+        visitor.repn_cache.store(visitor, node, arg1)
     return arg1
 
 
 def _handle_named_ANY(visitor, node, arg1):
     # Record this common expression
     visitor.subexpression_cache[id(node)] = arg1
+    if visitor.repn_cache is not None:
+        visitor.repn_cache.store(visitor, node, arg1)
     _type, arg1 = arg1
     return _type, arg1.duplicate()
 
@@ -537,6 +542,7 @@ class LinearBeforeChildDispatcher(BeforeChildDispatcher):
         # Special linear / summation expressions
         self[MonomialTermExpression] = self._before_monomial
         self[LinearExpression] = self._before_linear
+        self[LinearArrayExpression] = self._before_linear_array
         self[SumExpression] = self._before_general_expression
 
     @staticmethod
@@ -684,17 +690,58 @@ class LinearBeforeChildDispatcher(BeforeChildDispatcher):
         else:
             return False, (_CONSTANT, const)
 
+    @staticmethod
+    def _before_linear_array(visitor, child):
+        const = child.constant
+        coefs = child.linear_coefs
+        var_list = child.linear_vars
+        # We can build the linear map directly from the expression
+        # arrays for the common case of nonzero native coefficients and
+        # (unfixed) variables.  Anything else is processed term-by-term.
+        if (
+            const.__class__ not in native_numeric_types
+            or not native_numeric_types.issuperset(map(type, coefs))
+            or 0 in coefs
+        ):
+            return LinearBeforeChildDispatcher._before_linear(visitor, child)
+        var_map = visitor.var_map
+        ids = list(map(id, var_list))
+        if not all(map(var_map.__contains__, ids)):
+            for _id, var in zip(ids, var_list):
+                if _id not in var_map:
+                    if var.fixed:
+                        return LinearBeforeChildDispatcher._before_linear(
+                            visitor, child
+                        )
+                    LinearBeforeChildDispatcher._record_var(visitor, var)
+        linear = dict(zip(ids, coefs))
+        if len(linear) != len(ids):
+            # Repeated variables: accumulate the coefficients
+            return LinearBeforeChildDispatcher._before_linear(visitor, child)
+        if not linear:
+            return False, (_CONSTANT, const)
+        ans = visitor.Result()
+        ans.constant = const
+        ans.linear = linear
+        return False, (_LINEAR, ans)
+
     @staticmethod
     def _before_named_expression(visitor, child):
         _id = id(child)
         if _id in visitor.subexpression_cache:
             _type, expr = visitor.subexpression_cache[_id]
-            if _type is _CONSTANT:
-                return False, (_type, expr)
-            else:
-                return False, (_type, expr.duplicate())
+        elif visitor.repn_cache is not None:
+            ans = visitor.repn_cache.lookup(visitor, child)
+            if ans is None:
+                return True, None
+            visitor.subexpression_cache[_id] = ans
+            _type, expr = ans
         else:
             return True, None
+        if _type is _CONSTANT:
+            return False, (_type, expr)
+        else:
+            return False, (_type, expr.duplicate())
 
     @staticmethod
     def _before_external(visitor, child):
@@ -710,6 +757,130 @@ class LinearBeforeChildDispatcher(BeforeChildDispatcher):
 
 
 _before_child_dispatcher = LinearBeforeChildDispatcher()
+_get_fixed = attrgetter('fixed')
+_get_value = attrgetter('value')
+
+
+class _SubexpressionLeafCollector(StreamBasedExpressionVisitor):
+    """Collect the leaves that a compiled named expression depends on"""
+
+    def initializeWalker(self, expr):
+        self.variables = []
+        self.parameters = []
+        self.named_expressions = [(expr, expr.expr)]
+        return True, expr
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in native_types:
+            return False, None
+        if child.__class__ is MonomialTermExpression:
+            coef, var = child.args
+            if coef.__class__ not in native_types:
+                if not coef.is_parameter_type():
+                    return True, None
+                self.parameters.append(coef)
+            self.variables.append(var)
+            return False, None
+        if child.is_expression_type():
+            if child.is_named_expression_type():
+                self.named_expressions.append((child, child.expr))
+            return True, None
+        if child.is_variable_type():
+            self.variables.append(child)
+        elif child.is_parameter_type():
+            self.parameters.append(child)
+        return False, None
+
+
+class LinearSubexpressionCache(object):
+    """A persistent cache of the compiled representations of named
+    Expressions.
+
+    The ``subexpression_cache`` on each :py:class:`LinearRepnVisitor`
+    only lives for a single walk (i.e., a single call to a writer).
+    This cache is attached to a model (see :py:meth:`on`) and is
+    shared by every writer that uses the :py:class:`LinearRepnVisitor`
+    (or a derived visitor), so unchanged (and frequently reused) named
+    expressions are not re-walked across writes.
+
+    Entries are keyed on the named expression and the type of
+    representation generated by the visitor.  An entry is only reused
+    if the named expression (and any nested named expression) still
+    holds the same expression object (i.e., ``set_value()`` was not
+    called), the free variables are still free, and the values of the
+    fixed variables and mutable parameters are unchanged.  Results
+    with quadratic or nonlinear terms are not cached.
+
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._collector = _SubexpressionLeafCollector()
+
+    @staticmethod
+    def on(model):
+        """Return the cache attached to `model` (creating it if necessary)"""
+        cache = getattr(model, '_linear_subexpression_cache', None)
+        if cache is None:
+            cache = LinearSubexpressionCache()
+            model._linear_subexpression_cache = cache
+        return cache
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def store(self, visitor, node, result):
+        _type, repn = result
+        if _type is not _CONSTANT and (
+            repn.nonlinear is not None or getattr(repn, 'quadratic', None)
+        ):
+            return
+        collector = self._collector
+        collector.walk_expression(node)
+        free = []
+        fixed = []
+        for v in collector.variables:
+            if v.fixed:
+                fixed.append(v)
+            elif _type is not _CONSTANT and id(v) in repn.linear:
+                free.append(v)
+        params = collector.parameters
+        self._cache[visitor.Result, id(node)] = (
+            result,
+            free,
+            fixed,
+            list(map(_get_value, fixed)),
+            params,
+            list(map(_get_value, params)),
+            collector.named_expressions,
+        )
+
+    def lookup(self, visitor, node):
+        key = visitor.Result, id(node)
+        entry = self._cache.get(key, None)
+        if entry is None:
+            return None
+        result, free, fixed, fixed_vals, params, param_vals, named = entry
+        if (
+            # Note that holding the named expression in the entry
+            # prevents its id() from being reused
+            named[0][0] is not node
+            or any(e.expr is not expr for e, expr in named)
+            or any(map(_get_fixed, free))
+            or not all(map(_get_fixed, fixed))
+            or list(map(_get_value, fixed)) != fixed_vals
+            or list(map(_get_value, params)) != param_vals
+        ):
+            del self._cache[key]
+            return None
+        var_map = visitor.var_map
+        for v in free:
+            if id(v) not in var_map:
+                _before_child_dispatcher._record_var(visitor, v)
+        return result
 
 
 #
@@ -735,9 +906,13 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
     expand_nonlinear_products = False
     max_exponential_expansion = 1
 
-    def __init__(self, subexpression_cache, var_map, var_order, sorter):
+    def __init__(
+        self, subexpression_cache, var_map, var_order, sorter, repn_cache=None
+    ):
         super().__init__()
         self.subexpression_cache = subexpression_cache
+        # Optional LinearSubexpressionCache that persists across walks
+        self.repn_cache = repn_cache
         self.var_map = var_map
         self.var_order = var_order
         self.sorter = sorter
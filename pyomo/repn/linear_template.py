@@ -0,0 +1,431 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Compile indexed constraint rules into reusable linear templates.
+
+Every constraint in an :py:class:`IndexedConstraint` is generated by the
+same rule.  Instead of walking the (constructed) body of every
+constraint, this module templatizes the rule once (see
+:py:func:`templatize_rule`) and generates a Python function from the
+resulting template expression.  Calling the generated function for a
+specific index directly builds the :py:class:`LinearRepn` for that
+constraint without visiting (or creating) any expression nodes.
+
+"""
+
+import logging
+
+from pyomo.common.errors import TemplateExpressionError
+from pyomo.common.numeric_types import native_types, value
+from pyomo.core.base.constraint import IndexedConstraint, _GeneralConstraintData
+from pyomo.core.base.initializer import IndexedCallInitializer
+from pyomo.core.base.param import Param
+from pyomo.core.base.var import Var
+from pyomo.core.expr.expr_common import ExpressionType
+from pyomo.core.expr.numeric_expr import (
+    NegationExpression,
+    ProductExpression,
+    MonomialTermExpression,
+    DivisionExpression,
+    LinearExpression,
+    SumExpression,
+    NPV_NegationExpression,
+    NPV_ProductExpression,
+    NPV_DivisionExpression,
+    NPV_PowExpression,
+    NPV_SumExpression,
+)
+from pyomo.core.expr.relational_expr import tuple_to_relational_expr
+from pyomo.core.expr.template_expr import (
+    GetItemExpression,
+    IndexTemplate,
+    TemplateSumExpression,
+    templatize_rule,
+)
+from pyomo.repn.linear import LinearBeforeChildDispatcher
+
+logger = logging.getLogger(__name__)
+
+_npv_operators = {
+    NPV_SumExpression: ' + ',
+    NPV_ProductExpression: ' * ',
+    NPV_DivisionExpression: ' / ',
+    NPV_PowExpression: ' ** ',
+}
+
+
+class _NonlinearTemplate(Exception):
+    """Raised when a template expression cannot be compiled"""
+
+
+class _LinearTemplateCodeGenerator(object):
+    """Generate the source for a function that evaluates a linear template
+
+    The generated function has the signature ``fcn(visitor, repn,
+    index)`` and adds the linear terms and constant for the template
+    evaluated at `index` to the LinearRepn `repn`.  Index values are
+    held in local variables (and not set on the IndexTemplate objects),
+    the sums over Sets are generated as `for` loops, and components are
+    accessed through their underlying `_data` dictionaries.
+
+    """
+
+    def __init__(self):
+        self.namespace = {
+            'id': id,
+            '_record_var': LinearBeforeChildDispatcher._record_var,
+            '_value': value,
+        }
+        self.lines = []
+        self.indent = 1
+        self._symbols = {}
+        self._templates = {}
+        self._locals = {}
+        self._inline = 0
+        self._ntmp = 0
+
+    def generate(self, body, indices):
+        self.emit('linear = repn.linear')
+        self.emit('var_map = visitor.var_map')
+        self.emit('check_constant = visitor.check_constant')
+        self.emit('const = 0')
+        self.emit(f'{self.bind_templates(indices)} = index')
+        if self.is_constant(body):
+            self.emit(f'const += {self.constant(body)}')
+        else:
+            self.linear(body, None)
+        self.emit('repn.constant = const')
+        # Pass all referenced objects as default arguments so that they
+        # are (fast) local variables in the generated function
+        args = ''.join(f', {name}={name}' for name in self.namespace)
+        return '\n'.join(
+            [f'def _linear_template(visitor, repn, index{args}):'] + self.lines
+        )
+
+    def emit(self, line):
+        self.lines.append('    ' * self.indent + line)
+
+    def set_members(self, _set):
+        # Iterating over a tuple is significantly faster than iterating
+        # over (most) Pyomo Sets.  The compiled template is only used
+        # within a single call to a writer, so we can assume that the
+        # Set will not change.
+        return self.symbol(tuple(_set))
+
+    def symbol(self, obj):
+        _id = id(obj)
+        if _id not in self._symbols:
+            name = self._symbols[_id] = f'_o{len(self._symbols)}'
+            self.namespace[name] = obj
+        return self._symbols[_id]
+
+    def tmp(self):
+        self._ntmp += 1
+        return f'_t{self._ntmp}'
+
+    def local(self, expr):
+        # Assign expr to a local variable (reusing the variable if the
+        # same expression was already assigned within this scope)
+        if self._inline:
+            # Generator expressions cannot contain assignments
+            return expr
+        if expr not in self._locals:
+            self._locals[expr] = (self.tmp(), self.indent)
+            self.emit(f'{self._locals[expr][0]} = {expr}')
+        return self._locals[expr][0]
+
+    def dedent(self, indent):
+        # Leaving a block: forget any locals assigned within the block
+        self.indent = indent
+        for expr, (name, level) in list(self._locals.items()):
+            if level > indent:
+                del self._locals[expr]
+
+    def bind_templates(self, iterGroup):
+        # Map the IndexTemplates for one set (iterGroup) to local
+        # variable names, returning the assignment / loop target.  This
+        # mirrors how IndexTemplate.set_value() maps set members to
+        # template values.
+        _set = iterGroup[0]._set
+        dimen = _set.dimen
+        names = []
+        for it in iterGroup:
+            names.append(f'_i{len(self._templates)}')
+            self._templates[id(it)] = names[-1]
+        if len(iterGroup) == 1:
+            if (iterGroup[0]._index is None) ^ (dimen == 1):
+                return names[0]
+        elif dimen == len(iterGroup) and all(
+            it._index == i for i, it in enumerate(iterGroup)
+        ):
+            return '(' + ', '.join(names) + ')'
+        raise _NonlinearTemplate(_set)
+
+    def is_constant(self, node):
+        return node.__class__ in native_types or not node.is_potentially_variable()
+
+    def getitem(self, node):
+        base = node.arg(0)
+        if not getattr(base, 'is_component_type', lambda: False)() or (
+            not base.is_indexed()
+        ):
+            raise _NonlinearTemplate(node)
+        index = [self.constant(arg) for arg in node.args[1:]]
+        if len(index) == 1:
+            index = index[0]
+        else:
+            # Store the index tuple in a temporary, as the same index is
+            # commonly used for multiple components (e.g., p[i,j]*x[i,j])
+            index = self.local('(' + ', '.join(index) + ')')
+        return base, f'{self.symbol(base._data)}[{index}]'
+
+    def constant(self, node):
+        """Return a Python expression that evaluates a non-variable node"""
+        if node.__class__ in native_types:
+            return self.symbol(node)
+        if node.__class__ is IndexTemplate:
+            if id(node) not in self._templates:
+                raise _NonlinearTemplate(node)
+            return self._templates[id(node)]
+        if node.__class__ is TemplateSumExpression:
+            targets = ' '.join(
+                f'for {self.bind_templates(g)} in {self.set_members(g[0]._set)}'
+                for g in node._iters
+            )
+            self._inline += 1
+            arg = self.constant(node._local_args_[0])
+            self._inline -= 1
+            return f'sum({arg} {targets})'
+        if isinstance(node, GetItemExpression):
+            base, ans = self.getitem(node)
+            if base.ctype is Param:
+                # Immutable Params store the raw values
+                return f'{ans}()' if base.mutable else ans
+            return f'_value({ans})'
+        if not node.is_expression_type():
+            # Params, NumericConstants, etc.
+            return f'_value({self.symbol(node)})'
+        args = [self.constant(arg) for arg in node.args]
+        if node.__class__ in _npv_operators:
+            return '(' + _npv_operators[node.__class__].join(args) + ')'
+        if node.__class__ is NPV_NegationExpression:
+            return f'(-{args[0]})'
+        return f'{self.symbol(node)}._apply_operation(({", ".join(args)},))'
+
+    def scale(self, mult, expr, op='*'):
+        # Store the (new) multiplier in a temporary so that it is only
+        # evaluated once
+        ans = self.tmp()
+        if mult is None:
+            self.emit(f'{ans} = {expr}' if op == '*' else f'{ans} = 1 {op} {expr}')
+        else:
+            self.emit(f'{ans} = {mult} {op} {expr}')
+        return ans
+
+    def var_term(self, var, mult):
+        # Note: this follows LinearBeforeChildDispatcher._before_linear
+        # (which is how the constructed linear constraint bodies are
+        # processed): terms with 0 coefficients are skipped *before*
+        # recording the variable in the var_map.
+        if mult is None:
+            mult = '1'
+        else:
+            self.emit(f'if {mult}:')
+            self.indent += 1
+        self.emit(f'_v = {var}')
+        self.emit('_id = id(_v)')
+        self.emit('if _id in linear:')
+        self.emit(f'    linear[_id] += {mult}')
+        self.emit('elif _id in var_map:')
+        self.emit(f'    linear[_id] = {mult}')
+        self.emit('elif _v.fixed:')
+        self.emit(f'    const += {mult} * check_constant(_v.value, _v)')
+        self.emit('else:')
+        self.emit('    _record_var(visitor, _v)')
+        self.emit(f'    linear[_id] = {mult}')
+        if mult != '1':
+            self.dedent(self.indent - 1)
+
+    def linear(self, node, mult):
+        """Emit the code to add `mult` times the (variable) `node`"""
+        if node.is_variable_type():
+            return self.var_term(self.symbol(node), mult)
+
+        if isinstance(node, GetItemExpression):
+            base, ans = self.getitem(node)
+            if base.ctype is not Var:
+                raise _NonlinearTemplate(node)
+            return self.var_term(ans, mult)
+
+        if node.is_named_expression_type():
+            return self.linear(node.expr, mult)
+
+        node_type = node.__class__
+        if node_type in (SumExpression, LinearExpression):
+            for arg in node.args:
+                if not self.is_constant(arg):
+                    self.linear(arg, mult)
+                elif mult is None:
+                    self.emit(f'const += {self.constant(arg)}')
+                else:
+                    self.emit(f'const += {mult} * {self.constant(arg)}')
+            return
+
+        if node_type is TemplateSumExpression:
+            arg = node._local_args_[0]
+            if self.is_constant(arg):
+                raise _NonlinearTemplate(node)
+            indent = self.indent
+            for iterGroup in node._iters:
+                targets = self.bind_templates(iterGroup)
+                self.emit(f'for {targets} in {self.set_members(iterGroup[0]._set)}:')
+                self.indent += 1
+            self.linear(arg, mult)
+            self.dedent(indent)
+            return
+
+        if node_type is NegationExpression:
+            return self.linear(node.arg(0), self.scale(mult, '-1'))
+
+        if node_type is ProductExpression or node_type is MonomialTermExpression:
+            lhs, rhs = node.args
+            if self.is_constant(lhs):
+                return self.linear(rhs, self.scale(mult, self.constant(lhs)))
+            elif self.is_constant(rhs):
+                return self.linear(lhs, self.scale(mult, self.constant(rhs)))
+
+        if node_type is DivisionExpression:
+            num, den = node.args
+            if self.is_constant(den):
+                return self.linear(num, self.scale(mult, self.constant(den), '/'))
+
+        raise _NonlinearTemplate(node)
+
+
+class LinearTemplateRepn(object):
+    """The compiled (linear) template for the body of an IndexedConstraint
+
+    Parameters
+    ----------
+    body:
+        The template expression for the constraint body
+
+    indices: tuple
+        The :py:class:`IndexTemplate` objects for the constraint index
+
+    """
+
+    __slots__ = ('source', '_fcn')
+
+    def __init__(self, body, indices):
+        gen = _LinearTemplateCodeGenerator()
+        self.source = gen.generate(body, indices)
+        exec(self.source, gen.namespace)
+        self._fcn = gen.namespace['_linear_template']
+
+    def evaluate(self, index, visitor):
+        """Return the LinearRepn of the constraint body at `index`
+
+        Variables encountered in the body are recorded in the
+        visitor's var_map (following the same rules as the
+        :py:class:`LinearRepnVisitor`).
+
+        """
+        ans = visitor.Result()
+        self._fcn(visitor, ans, index)
+        linear = ans.linear
+        for vid in [vid for vid, coef in linear.items() if not coef]:
+            del linear[vid]
+        return ans
+
+
+def compile_linear_template(con):
+    """Compile the rule for an IndexedConstraint into a LinearTemplateRepn
+
+    Returns None if the constraint was not declared using an indexed
+    rule, or if the rule cannot be templatized or does not generate a
+    linear template expression.
+
+    Note that this calls the constraint rule (once), passing
+    :py:class:`IndexTemplate` objects in place of the index values.
+
+    """
+    if con.__class__ is not IndexedConstraint:
+        return None
+    if con.rule.__class__ is not IndexedCallInitializer:
+        return None
+    try:
+        expr, indices = templatize_rule(con.parent_block(), con.rule, con.index_set())
+    except Exception as e:
+        # Rules can contain arbitrary Python logic (loops, conditionals
+        # on the index, non-Pyomo data lookups, ...) that cannot be
+        # evaluated using IndexTemplates.
+        logger.debug("Unable to templatize rule for %s: %s", con.name, e)
+        return None
+    if expr.__class__ is tuple:
+        expr = tuple_to_relational_expr(expr)
+    try:
+        if not expr.is_expression_type(ExpressionType.RELATIONAL):
+            return None
+    except AttributeError:
+        return None
+    # Normalize the relational expression exactly as the
+    # ConstraintData would (so that the template body matches the body
+    # of the constructed constraints).
+    tmp = _GeneralConstraintData()
+    try:
+        tmp.set_value(expr)
+        return LinearTemplateRepn(tmp.body, indices)
+    except (_NonlinearTemplate, ValueError, TypeError, TemplateExpressionError):
+        return None
+
+
+class LinearTemplateCompiler(object):
+    """Generate LinearRepns for constraints using compiled rule templates
+
+    The rule for each IndexedConstraint is templatized and compiled the
+    first time one of its constraints is encountered.  Constraints whose
+    parent component could not be compiled, constraints that were
+    modified (e.g., through :py:meth:`set_value`) or added after the
+    component was constructed, and constraints that cannot be evaluated
+    using the template are walked with the `visitor`.
+
+    This assumes that the rule would still generate the same
+    expressions (i.e., that any Python data used by the rule has not
+    changed since the component was constructed).
+
+    """
+
+    def __init__(self, visitor):
+        self.visitor = visitor
+        self.templates = {}
+
+    def walk_constraint(self, con):
+        """Return the LinearRepn for the body of the constraint `con`"""
+        parent = con.parent_component()
+        if parent is con:
+            # ScalarConstraint: nothing to be gained by templatizing
+            return self.visitor.walk_expression(con.body)
+        try:
+            template = self.templates[parent]
+        except KeyError:
+            template = self.templates[parent] = compile_linear_template(parent)
+        if template is not None and (
+            parent._modified_indices is None
+            or con._index not in parent._modified_indices
+        ):
+            try:
+                return template.evaluate(con._index, self.visitor)
+            except (KeyError, ValueError, TypeError, ArithmeticError):
+                # Fall back on walking the expression (which will either
+                # succeed or generate a more informative exception)
+                pass
+        return self.visitor.walk_expression(con.body)
@@ -10,6 +10,8 @@
 #  ___________________________________________________________________________
 
 import logging
+import shutil
+from contextlib import ExitStack
 from io import StringIO
 from operator import itemgetter, attrgetter
 
@@ -20,6 +22,7 @@ from pyomo.common.config import (
     document_kwargs_from_configdict,
 )
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.tempfiles import TempfileManager
 from pyomo.common.timing import TicTocTimer
 
 from pyomo.core.base import (
@@ -38,14 +41,22 @@ from pyomo.core.base import (
 from pyomo.core.base.component import ActiveComponent
 from pyomo.core.base.label import LPFileLabeler, NumericLabeler
 from pyomo.opt import WriterFactory
-from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear import (
+    LinearBeforeChildDispatcher,
+    LinearRepnVisitor,
+    LinearSubexpressionCache,
+)
+from pyomo.repn.linear_template import LinearTemplateCompiler
 from pyomo.repn.quadratic import QuadraticRepnVisitor
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
+    MatrixConstraintCompiler,
     categorize_valid_components,
+    open_output_file,
     initialize_var_map_from_column_order,
     int_float,
+    matrix_constraint_types,
     ordered_active_constraints,
 )
 
@@ -170,6 +181,58 @@ class LPWriter(object):
             description='DEPRECATED option from LPv1 that has no effect in the LPv2',
         ),
     )
+    CONFIG.declare(
+        'templatize_constraints',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Compile indexed constraint rules as templates',
+            doc="""
+            If True, the rule for each IndexedConstraint is templatized
+            and compiled once, and the compiled template is evaluated
+            for each constraint in the component (instead of walking
+            every constraint body).  Components whose rules cannot be
+            templatized (or are not linear), and constraints that were
+            modified or added after the component was constructed, are
+            processed normally.  This assumes that the rules would
+            still generate the same expressions (i.e., any Python data
+            used by the rules has not changed since construction).""",
+        ),
+    )
+    CONFIG.declare(
+        'cache_subexpressions',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Cache compiled named Expressions on the model',
+            doc="""
+            If True, the compiled (linear) representations of named
+            Expression components are stored in a cache attached to the
+            model and reused by subsequent writes (by this or any other
+            writer that uses the LinearRepnVisitor) as long as the
+            expression, the fixed variable values, and the mutable
+            parameter values they depend on are unchanged.""",
+        ),
+    )
+    CONFIG.declare(
+        'streaming',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write the LP file without retaining per-row state',
+            doc="""
+            If True, the writer does not record the constraint labels in
+            the returned symbol map, and the variable bounds and
+            domains are spilled to temporary files as each variable is
+            first written (and copied to the output stream at the end).
+            The memory used by the writer is then independent of the
+            number of constraints in the model.  Note that the symbol
+            map cannot be used to map solver results (e.g., duals) back
+            to the model constraints, and that the variables appear in
+            the bounds section in the order they first appear in the
+            file.""",
+        ),
+    )
     CONFIG.declare(
         'allow_quadratic_objective',
         ConfigValue(
@@ -204,7 +267,10 @@ class LPWriter(object):
         if 'allow_quadratic_constraint' not in io_options:
             io_options['allow_quadratic_constraint'] = qc
 
-        with open(filename, 'w', newline='') as FILE:
+        # Compression only applies to the file opened here (and not to
+        # ostreams passed to write())
+        filename, FILE = open_output_file(filename, io_options.pop('compression', None))
+        with FILE:
             info = self.write(model, FILE, **io_options)
         return filename, info.symbol_map
 
@@ -238,14 +304,25 @@ class LPWriter(object):
         # representation generates (and disposes of) a large number of
         # small objects.
         with PauseGC():
-            return _LPWriter_impl(ostream, config).write(model)
+            if not config.streaming:
+                return _LPWriter_impl(ostream, config).write(model)
+            with TempfileManager.new_context() as tempfile, ExitStack() as files:
+                spill = [
+                    files.enter_context(
+                        open(tempfile.create_tempfile(suffix=suffix), 'w+')
+                    )
+                    for suffix in ('.bounds', '.general', '.binary')
+                ]
+                return _LPWriter_impl(ostream, config, spill).write(model)
 
 
 class _LPWriter_impl(object):
-    def __init__(self, ostream, config):
+    def __init__(self, ostream, config, spill=None):
         self.ostream = ostream
         self.config = config
         self.symbol_map = None
+        # (bounds, general, binary) spill files used in streaming mode
+        self.spill = spill
 
     def write(self, model):
         timing_logger = logging.getLogger('pyomo.common.timing.writer')
@@ -266,6 +343,13 @@ class _LPWriter_impl(object):
         addSymbol = self.symbol_map.addSymbol
         aliasSymbol = self.symbol_map.alias
         getSymbol = self.symbol_map.getSymbol
+        if self.spill is None:
+            self.getVarSymbol = getSymbol
+            addConSymbol, aliasConSymbol = addSymbol, aliasSymbol
+        else:
+            self.getVarSymbol = self._spill_var_symbol
+            # Do not retain the constraint labels
+            addConSymbol = aliasConSymbol = lambda obj, symbol: None
 
         sorter = FileDeterminism_to_SortComponents(self.config.file_determinism)
         component_map, unknown = categorize_valid_components(
@@ -307,16 +391,28 @@ class _LPWriter_impl(object):
         initialize_var_map_from_column_order(model, self.config, var_map)
         self.var_order = {_id: i for i, _id in enumerate(var_map)}
 
+        if self.config.cache_subexpressions:
+            repn_cache = LinearSubexpressionCache.on(model)
+        else:
+            repn_cache = None
         _qp = self.config.allow_quadratic_objective
         _qc = self.config.allow_quadratic_constraint
         objective_visitor = (QuadraticRepnVisitor if _qp else LinearRepnVisitor)(
-            {}, var_map, self.var_order, sorter
+            {}, var_map, self.var_order, sorter, repn_cache
         )
         constraint_visitor = (QuadraticRepnVisitor if _qc else LinearRepnVisitor)(
             objective_visitor.subexpression_cache if _qp == _qc else {},
             var_map,
             self.var_order,
             sorter,
+            repn_cache,
+        )
+        if self.config.templatize_constraints:
+            template_compiler = LinearTemplateCompiler(constraint_visitor)
+        else:
+            template_compiler = None
+        matrix_compiler = MatrixConstraintCompiler(
+            constraint_visitor, LinearBeforeChildDispatcher._record_var
         )
 
         timer.toc('Initialized column order', level=logging.DEBUG)
@@ -419,7 +515,13 @@ class _LPWriter_impl(object):
                 # slack variable if skip_trivial_constraints is False,
                 # but that seems rather silly.
                 continue
-            repn = constraint_visitor.walk_expression(con.body)
+            if con.__class__ in matrix_constraint_types:
+                repn = constraint_visitor.Result()
+                repn.constant, repn.linear = matrix_compiler.compile_row(con)
+            elif template_compiler is None:
+                repn = constraint_visitor.walk_expression(con.body)
+            else:
+                repn = template_compiler.walk_constraint(con)
             if repn.nonlinear is not None:
                 raise ValueError(
                     f"Model constraint ({con.name}) contains nonlinear terms that "
@@ -455,13 +557,13 @@ class _LPWriter_impl(object):
             if lb is not None:
                 if ub is None:
                     label = f'c_l_{symbol}_'
-                    addSymbol(con, label)
+                    addConSymbol(con, label)
                     ostream.write(f'\n{label}:\n')
                     self.write_expression(ostream, repn, False)
                     ostream.write(f'>= {(lb - offset)!r}\n')
                 elif lb == ub:
                     label = f'c_e_{symbol}_'
-                    addSymbol(con, label)
+                    addConSymbol(con, label)
                     ostream.write(f'\n{label}:\n')
                     self.write_expression(ostream, repn, False)
                     ostream.write(f'= {(lb - offset)!r}\n')
@@ -473,18 +575,18 @@ class _LPWriter_impl(object):
                     buf = buf.getvalue()
                     #
                     label = f'r_l_{symbol}_'
-                    addSymbol(con, label)
+                    addConSymbol(con, label)
                     ostream.write(f'\n{label}:\n')
                     ostream.write(buf)
                     ostream.write(f'>= {(lb - offset)!r}\n')
                     label = f'r_u_{symbol}_'
-                    aliasSymbol(con, label)
+                    aliasConSymbol(con, label)
                     ostream.write(f'\n{label}:\n')
                     ostream.write(buf)
                     ostream.write(f'<= {(ub - offset)!r}\n')
             elif ub is not None:
                 label = f'c_u_{symbol}_'
-                addSymbol(con, label)
+                addConSymbol(con, label)
                 ostream.write(f'\n{label}:\n')
                 self.write_expression(ostream, repn, False)
                 ostream.write(f'<= {(ub - offset)!r}\n')
@@ -506,38 +608,48 @@ class _LPWriter_impl(object):
 
         ostream.write("\nbounds")
 
-        # Track the number of integer and binary variables, so you can
-        # output their status later.
-        integer_vars = []
-        binary_vars = []
-        getSymbolByObjectID = self.symbol_map.byObject.get
-        for vid, v in var_map.items():
-            # Some variables in the var_map may not actually have been
-            # written out to the LP file (e.g., added from col_order, or
-            # multiplied by 0 in the expressions).  Check to see that
-            # the variable is in the symbol_map before outputting.
-            v_symbol = getSymbolByObjectID(vid, None)
-            if not v_symbol:
-                continue
-            if v.is_binary():
-                binary_vars.append(v_symbol)
-            elif v.is_integer():
-                integer_vars.append(v_symbol)
-
-            # Note: Var.bounds guarantees the values are either (finite)
-            # native_numeric_types or None
-            lb, ub = v.bounds
-            lb = '-inf' if lb is None else repr(lb)
-            ub = '+inf' if ub is None else repr(ub)
-            ostream.write(f"\n   {lb} <= {v_symbol} <= {ub}")
-
-        if integer_vars:
-            ostream.write("\ngeneral\n  ")
-            ostream.write("\n  ".join(integer_vars))
-
-        if binary_vars:
-            ostream.write("\nbinary\n  ")
-            ostream.write("\n  ".join(binary_vars))
+        if self.spill is not None:
+            # The bounds and domains were spilled as the variables were
+            # written: copy them to the output stream
+            for header, spill in zip(("", "\ngeneral", "\nbinary"), self.spill):
+                if not spill.tell():
+                    continue
+                ostream.write(header)
+                spill.seek(0)
+                shutil.copyfileobj(spill, ostream)
+        else:
+            # Track the number of integer and binary variables, so you can
+            # output their status later.
+            integer_vars = []
+            binary_vars = []
+            getSymbolByObjectID = self.symbol_map.byObject.get
+            for vid, v in var_map.items():
+                # Some variables in the var_map may not actually have been
+                # written out to the LP file (e.g., added from col_order, or
+                # multiplied by 0 in the expressions).  Check to see that
+                # the variable is in the symbol_map before outputting.
+                v_symbol = getSymbolByObjectID(vid, None)
+                if not v_symbol:
+                    continue
+                if v.is_binary():
+                    binary_vars.append(v_symbol)
+                elif v.is_integer():
+                    integer_vars.append(v_symbol)
+
+                # Note: Var.bounds guarantees the values are either (finite)
+                # native_numeric_types or None
+                lb, ub = v.bounds
+                lb = '-inf' if lb is None else repr(lb)
+                ub = '+inf' if ub is None else repr(ub)
+                ostream.write(f"\n   {lb} <= {v_symbol} <= {ub}")
+
+            if integer_vars:
+                ostream.write("\ngeneral\n  ")
+                ostream.write("\n  ".join(integer_vars))
+
+            if binary_vars:
+                ostream.write("\nbinary\n  ")
+                ostream.write("\n  ".join(binary_vars))
 
         timer.toc("Wrote variable bounds and domains", level=logging.DEBUG)
 
@@ -573,9 +685,27 @@ class _LPWriter_impl(object):
         timer.toc("Generated LP representation", delta=False)
         return info
 
+    def _spill_var_symbol(self, var):
+        symbol = self.symbol_map.byObject.get(id(var), None)
+        if symbol is not None:
+            return symbol
+        symbol = self.symbol_map.getSymbol(var)
+        bounds, general, binary = self.spill
+        # Note: Var.bounds guarantees the values are either (finite)
+        # native_numeric_types or None
+        lb, ub = var.bounds
+        lb = '-inf' if lb is None else repr(lb)
+        ub = '+inf' if ub is None else repr(ub)
+        bounds.write(f"\n   {lb} <= {symbol} <= {ub}")
+        if var.is_binary():
+            binary.write(f"\n  {symbol}")
+        elif var.is_integer():
+            general.write(f"\n  {symbol}")
+        return symbol
+
     def write_expression(self, ostream, expr, is_objective):
         assert not expr.constant
-        getSymbol = self.symbol_map.getSymbol
+        getSymbol = self.getVarSymbol
         getVarOrder = self.var_order.__getitem__
         getVar = self.var_map.__getitem__
 
@@ -34,6 +34,7 @@ from pyomo.core.base import (
     is_fixed,
 )
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.util import open_output_file
 
 logger = logging.getLogger('pyomo.core')
 
@@ -106,6 +107,10 @@ class ProblemWriter_mps(AbstractProblemWriter):
 
         labeler = io_options.pop("labeler", None)
 
+        # Write the file through a compressor ('gzip' or 'zstd').  If
+        # not specified, the format is inferred from the file suffix.
+        compression = io_options.pop("compression", None)
+
         # How much effort do we want to put into ensuring the
         # MPS file is written deterministically for a Pyomo model:
         #    0 : None
@@ -160,7 +165,10 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # are non-circular, everything will be collected
         # immediately anyway.
         with PauseGC() as pgc:
-            with open(output_filename, "w") as output_file:
+            output_filename, output_file = open_output_file(
+                output_filename, compression
+            )
+            with output_file:
                 symbol_map = self._print_model_MPS(
                     model,
                     output_file,
@@ -11,10 +11,12 @@
 
 import ctypes
 import logging
+import multiprocessing
 import os
 from collections import deque, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import nullcontext
-from itertools import filterfalse, product
+from itertools import filterfalse, islice, product, repeat
 from math import log10 as _log10
 from operator import itemgetter, attrgetter, setitem
 
@@ -23,6 +25,8 @@ from pyomo.common.config import (
     ConfigBlock,
     ConfigValue,
     InEnum,
+    NonNegativeInt,
+    PositiveInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.deprecation import deprecation_warning
@@ -45,6 +49,7 @@ from pyomo.core.expr import (
     UnaryFunctionExpression,
     MonomialTermExpression,
     LinearExpression,
+    LinearArrayExpression,
     SumExpression,
     EqualityExpression,
     InequalityExpression,
@@ -89,11 +94,13 @@ from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
     InvalidNumber,
+    MatrixConstraintCompiler,
     apply_node_operation,
     categorize_valid_components,
     complex_number_error,
     initialize_var_map_from_column_order,
     int_float,
+    matrix_constraint_types,
     ordered_active_constraints,
     nan,
     sum_like_expression_types,
@@ -118,6 +125,11 @@ _CONSTANT = ExprType.CONSTANT
 _MONOMIAL = ExprType.MONOMIAL
 _GENERAL = ExprType.GENERAL
 
+# The parallel constraint walker relies on the worker processes
+# inheriting the model (and writer state) from the parent process
+_fork_available = 'fork' in multiprocessing.get_all_start_methods()
+_parallel_walker_state = None
+
 ScalingFactors = namedtuple(
     'ScalingFactors', ['variables', 'constraints', 'objectives']
 )
@@ -317,9 +329,74 @@ class NLWriter(object):
         variable elimination (without fill-in).""",
         ),
     )
+    CONFIG.declare(
+        'incremental',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Reuse compiled expressions from previous writes',
+            doc="""
+        If True, this writer caches the compiled representation of each
+        constraint and objective, along with the Vars, mutable Params,
+        and named Expressions that the expression depends on.
+        Subsequent calls to write() (using the same writer instance)
+        will reuse the cached representation for any component whose
+        expression and dependencies have not changed and only
+        recompile the components that were modified or added.""",
+        ),
+    )
+    CONFIG.declare(
+        'parallel_workers',
+        ConfigValue(
+            default=0,
+            domain=NonNegativeInt,
+            description='Number of processes used to compile constraints',
+            doc="""
+        If greater than 1, the active constraints are split into chunks
+        that are compiled concurrently by a pool of (forked) worker
+        processes and then merged back in the original constraint
+        order.  The resulting NL file is identical to the file
+        generated by the serial writer.  Chunks that reference named
+        Expression or ExternalFunction components (or variables that
+        are not part of the model) are compiled serially.  This option
+        is ignored on platforms that do not support the 'fork' process
+        start method.""",
+        ),
+    )
+    CONFIG.declare(
+        'parallel_chunk_size',
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description='Number of constraints compiled by each parallel task',
+            doc="""
+        Number of constraints in each chunk dispatched to the worker
+        processes when `parallel_workers` is greater than 1.  If None,
+        the constraints are split into 4 chunks per worker.""",
+        ),
+    )
+    CONFIG.declare(
+        'export_suffixes',
+        ConfigValue(
+            default=None,
+            domain=dict,
+            description='Additional export suffix data',
+            doc="""
+        A dict mapping suffix names to mappings (e.g., ComponentMap) of
+        Var, Constraint, or Objective data to numeric values.  The
+        values are written to the NL file as if they were stored in an
+        active EXPORT Suffix (with FLOAT datatype) on the model, and
+        take precedence over the values in the Suffix components on the
+        model.  As with Suffix components, the 'dual' suffix provides
+        the initial constraint duals.  This allows solver interfaces to
+        pass (e.g., warm start) data to the solver without adding
+        components to the model.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
+        self._repn_cache = _NLRepnCache()
 
     def __call__(self, model, filename, solver_capability, io_options):
         if filename is None:
@@ -405,7 +482,8 @@ class NLWriter(object):
         # Pause the GC, as the walker that generates the compiled NL
         # representation generates (and disposes of) a large number of
         # small objects.
-        with _NLWriter_impl(ostream, rowstream, colstream, config) as impl:
+        repn_cache = self._repn_cache if config.incremental else None
+        with _NLWriter_impl(ostream, rowstream, colstream, config, repn_cache) as impl:
             return impl.write(model)
 
     def _generate_symbol_map(self, info):
@@ -530,8 +608,182 @@ class _NoScalingFactor(object):
         return 1
 
 
+class _NLRepnCacheEntry(object):
+    __slots__ = (
+        'component',
+        'expr',
+        'scale',
+        'vars',
+        'params',
+        'named',
+        'state',
+        'recorded',
+        'repn',
+    )
+
+
+class _RecordedVars(dict):
+    """A var_map stand-in that records the variables "touched" by a walk
+
+    :py:meth:`_before_child_handlers._record_var` only records the
+    variable itself (and not all the variables in its parent
+    component) into this map, so after a walk this holds exactly the
+    variables that the walker would have added to the writer's
+    var_map (in order).
+
+    """
+
+    __slots__ = ()
+
+
+class _NLRepnCache(object):
+    """Cache of compiled constraint / objective expressions
+
+    This supports "incremental" NL writing: the compiled
+    :py:class:`AMPLRepn` for each constraint and objective is cached
+    (keyed by the component) along with the list of Vars, mutable
+    Params, and named Expressions that appear in the expression, and
+    the Vars that the walker recorded in the ``var_map``.  When
+    the component is encountered in a subsequent write, the cached
+    representation is reused if the component expression (and scaling
+    factor) is the same object, every named Expression still holds the
+    same expression, and the fixed state / values of the Vars and the
+    values of the Params have not changed.
+
+    Expressions that reference writer-wide data (named subexpressions
+    that will be emitted as "defined variables", or external functions)
+    are not cached and are always recompiled.
+
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.config_key = None
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, config, template):
+        # Changes to options that alter the compiled expressions
+        # invalidate the entire cache
+        key = (template, config.export_defined_variables, config.file_determinism)
+        if key != self.config_key:
+            self.entries = {}
+            self.config_key = key
+        self.hits = self.misses = 0
+        self.seen = set()
+
+    def finish(self):
+        # Drop entries for components that are no longer in the model
+        # (or were not written this time)
+        entries = self.entries
+        if len(entries) != len(self.seen):
+            for _id in [_id for _id in entries if _id not in self.seen]:
+                del entries[_id]
+        self.seen = None
+
+    def walk_expression(self, visitor, expr, comp, comp_type, scale):
+        _id = id(comp)
+        self.seen.add(_id)
+        entry = self.entries.get(_id, None)
+        if (
+            entry is not None
+            and entry.expr is expr
+            and entry.scale == scale
+            and all(e.expr is e_expr for e, e_expr in entry.named)
+            and entry.state == _dependency_state(entry.vars, entry.params)
+        ):
+            self.hits += 1
+            # Replay the recording of the variables in the var_map so
+            # that the column ordering matches a full write
+            _replay_recorded_vars(visitor, entry.recorded)
+            # Note that the writer modifies the expr_info in place, so
+            # we need to return a copy of the cached repn
+            return entry.repn.duplicate()
+
+        self.misses += 1
+        # Walk the expression recording the variables that the walker
+        # adds to the var_map, then add them to the real var_map
+        var_map = visitor.var_map
+        visitor.var_map = recorded = _RecordedVars()
+        try:
+            expr_info = visitor.walk_expression((expr, comp, comp_type, scale))
+        finally:
+            visitor.var_map = var_map
+        recorded = list(recorded.values())
+        _replay_recorded_vars(visitor, recorded)
+        if expr_info.named_exprs:
+            self.entries.pop(_id, None)
+            return expr_info
+        deps = _collect_dependencies(expr)
+        if deps is None:
+            self.entries.pop(_id, None)
+            return expr_info
+        entry = _NLRepnCacheEntry()
+        entry.component = comp
+        entry.expr = expr
+        entry.scale = scale
+        entry.vars, entry.params, entry.named = deps
+        entry.state = _dependency_state(entry.vars, entry.params)
+        entry.recorded = recorded
+        entry.repn = expr_info.duplicate()
+        self.entries[_id] = entry
+        return expr_info
+
+
+def _replay_recorded_vars(visitor, recorded):
+    var_map = visitor.var_map
+    for v in recorded:
+        if id(v) not in var_map:
+            _before_child_handlers._record_var(visitor, v)
+
+
+def _dependency_state(vars_, params):
+    # The compiled expression only depends on the values (and bounds)
+    # of fixed variables and the values of mutable parameters
+    return (
+        [(v.value, v.bounds) if v.fixed else None for v in vars_],
+        [p.value for p in params],
+    )
+
+
+def _collect_dependencies(expr):
+    """Collect the Vars, mutable Params, and named Expressions in an expression
+
+    Returns a tuple of the lists of Vars, mutable Params, and (named
+    Expression, expression) pairs appearing in `expr`, or ``None`` if
+    the expression cannot be cached.
+
+    """
+    vars_ = {}
+    params = {}
+    named = {}
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_types:
+            continue
+        if node.is_expression_type():
+            if node.is_named_expression_type():
+                _id = id(node)
+                if _id in named:
+                    continue
+                named[_id] = (node, node.expr)
+            elif node.__class__ is ExternalFunctionExpression:
+                return None
+            # Push the arguments in reverse order so that they are
+            # processed depth-first in the original order
+            stack.extend(reversed(node.args))
+        elif node.is_variable_type():
+            if id(node) not in vars_:
+                vars_[id(node)] = node
+        elif node.is_parameter_type():
+            if id(node) not in params:
+                params[id(node)] = node
+    return list(vars_.values()), list(params.values()), list(named.values())
+
+
 class _NLWriter_impl(object):
-    def __init__(self, ostream, rowstream, colstream, config):
+    def __init__(self, ostream, rowstream, colstream, config, repn_cache=None):
         self.ostream = ostream
         self.rowstream = rowstream
         self.colstream = colstream
@@ -560,6 +812,7 @@ class _NLWriter_impl(object):
         )
         self.next_V_line_id = 0
         self.pause_gc = None
+        self.repn_cache = repn_cache
 
     def __enter__(self):
         assert AMPLRepn.ActiveVisitor is None
@@ -624,6 +877,10 @@ class _NLWriter_impl(object):
         initialize_var_map_from_column_order(model, self.config, var_map)
         timer.toc('Initialized column order', level=logging.DEBUG)
 
+        repn_cache = self.repn_cache
+        if repn_cache is not None:
+            repn_cache.start(self.config, self.template)
+
         # Collect all defined EXPORT suffixes on the model
         suffix_data = {}
         if component_map[Suffix]:
@@ -639,6 +896,12 @@ class _NLWriter_impl(object):
                     if name not in suffix_data:
                         suffix_data[name] = _SuffixData(name)
                     suffix_data[name].update(suffix)
+        if self.config.export_suffixes:
+            for name, values in self.config.export_suffixes.items():
+                if name not in suffix_data:
+                    suffix_data[name] = _SuffixData(name)
+                suffix_data[name].datatype.add(Suffix.FLOAT)
+                suffix_data[name].values.update(values)
         #
         # Data structures to support variable/constraint scaling
         #
@@ -677,7 +940,14 @@ class _NLWriter_impl(object):
                 else:
                     timer.toc('Objective %s', last_parent, level=logging.DEBUG)
                 last_parent = obj.parent_component()
-            expr_info = visitor.walk_expression((obj.expr, obj, 1, scaling_factor(obj)))
+            if repn_cache is None:
+                expr_info = visitor.walk_expression(
+                    (obj.expr, obj, 1, scaling_factor(obj))
+                )
+            else:
+                expr_info = repn_cache.walk_expression(
+                    visitor, obj.expr, obj, 1, scaling_factor(obj)
+                )
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, obj, 1)
             if expr_info.nonlinear:
@@ -713,7 +983,16 @@ class _NLWriter_impl(object):
         n_complementarity_nz_var_lb = 0
         #
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        matrix_compiler = MatrixConstraintCompiler(
+            visitor, _before_child_handlers._record_var, _fixed_var_value
+        )
+        if self.config.parallel_workers > 1 and _fork_available:
+            con_iter = self._walk_constraints_in_parallel(
+                model, ordered_active_constraints(model, self.config), scaling_factor
+            )
+        else:
+            con_iter = zip(ordered_active_constraints(model, self.config), repeat(None))
+        for con, expr_info in con_iter:
             if with_debug_timing and con.parent_component() is not last_parent:
                 if last_parent is None:
                     timer.toc(None)
@@ -721,7 +1000,20 @@ class _NLWriter_impl(object):
                     timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
             scale = scaling_factor(con)
-            expr_info = visitor.walk_expression((con.body, con, 0, scale))
+            if expr_info is None and con.__class__ in matrix_constraint_types:
+                const, linear = matrix_compiler.compile_row(con)
+                if scale != 1:
+                    const *= scale
+                    for _id in linear:
+                        linear[_id] *= scale
+                expr_info = AMPLRepn(const, linear, None)
+            elif expr_info is None:
+                if repn_cache is None:
+                    expr_info = visitor.walk_expression((con.body, con, 0, scale))
+                else:
+                    expr_info = repn_cache.walk_expression(
+                        visitor, con.body, con, 0, scale
+                    )
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, con, 0)
 
@@ -765,6 +1057,14 @@ class _NLWriter_impl(object):
             timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
         else:
             timer.toc('Processed %s constraints', len(constraints))
+        if repn_cache is not None:
+            repn_cache.finish()
+            timer.toc(
+                'Reused %s cached expressions (%s compiled)',
+                repn_cache.hits,
+                repn_cache.misses,
+                level=logging.DEBUG,
+            )
 
         # This may fetch more bounds than needed, but only in the cases
         # where variables were completely eliminated while walking the
@@ -1606,6 +1906,60 @@ class _NLWriter_impl(object):
         timer.toc("Generated NL representation", delta=False)
         return info
 
+    def _walk_constraints_in_parallel(self, model, constraints, scaling_factor):
+        """Compile the constraint expressions using a pool of processes
+
+        This generates ``(constraint, expr_info)`` tuples in the same
+        order as ``constraints``.  The constraints are split into
+        contiguous chunks that are compiled by forked worker processes
+        (see :py:func:`_walk_constraint_chunk`).  The results are
+        merged in chunk order, so that the variables are added to the
+        ``var_map`` in exactly the order that the serial walker would
+        have encountered them.  Constraints in chunks that the workers
+        could not compile are returned with an ``expr_info`` of
+        ``None`` so that the caller will compile them (serially) in
+        this process.
+
+        """
+        global _parallel_walker_state
+        constraints = list(constraints)
+        n_workers = self.config.parallel_workers
+        chunk_size = self.config.parallel_chunk_size
+        if not chunk_size:
+            chunk_size = -(-len(constraints) // (4 * n_workers))
+        if len(constraints) <= chunk_size:
+            yield from zip(constraints, repeat(None))
+            return
+        chunks = [
+            (start, min(start + chunk_size, len(constraints)))
+            for start in range(0, len(constraints), chunk_size)
+        ]
+        # The workers only communicate variable ids back to this
+        # process, so we need a map to recover the VarData from the id
+        model_vars = {
+            id(v): v for v in model.component_data_objects(Var, descend_into=True)
+        }
+        var_map = self.var_map
+        _parallel_walker_state = self, constraints, scaling_factor
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=multiprocessing.get_context('fork')
+            ) as executor:
+                for (start, stop), result in zip(
+                    chunks, executor.map(_walk_constraint_chunk, chunks)
+                ):
+                    if result is not None:
+                        repns, new_vars = result
+                        if all(_id in model_vars for _id in new_vars):
+                            for _id in new_vars:
+                                if _id not in var_map:
+                                    var_map[_id] = model_vars[_id]
+                            yield from zip(constraints[start:stop], repns)
+                            continue
+                    yield from zip(constraints[start:stop], repeat(None))
+        finally:
+            _parallel_walker_state = None
+
     def _categorize_vars(self, comp_list, linear_by_comp):
         """Categorize compiled expression vars into linear and nonlinear
 
@@ -1939,6 +2293,67 @@ class _NLWriter_impl(object):
         self.next_V_line_id += 1
 
 
+def _walk_constraint_chunk(chunk):
+    """Compile a contiguous block of constraints in a worker process
+
+    This is the task executed by the worker processes created by
+    :py:meth:`_NLWriter_impl._walk_constraints_in_parallel`.  The
+    workers are forked from the writer process, so the model and the
+    writer state (recorded in ``_parallel_walker_state``) are inherited
+    from the parent.  Returns a tuple of the list of compiled
+    :py:class:`AMPLRepn` objects and the list of ids of the variables
+    that were added to the ``var_map`` (in the order they were
+    encountered), or ``None`` if the chunk must be compiled by the
+    parent process.
+
+    """
+    impl, constraints, scaling_factor = _parallel_walker_state
+    visitor = impl.visitor
+    var_map = visitor.var_map
+    n_vars = len(var_map)
+    n_subexpressions = len(visitor.subexpression_cache)
+    n_subexpression_order = len(visitor.subexpression_order)
+    n_external_functions = len(visitor.external_functions)
+    encountered_string_arguments = visitor.encountered_string_arguments
+    start, stop = chunk
+    try:
+        repns = [
+            visitor.walk_expression((con.body, con, 0, scaling_factor(con)))
+            for con in islice(constraints, start, stop)
+        ]
+    except Exception:
+        # Let the parent process regenerate (and report) the error
+        repns = None
+    # Named subexpressions, external functions, and string arguments
+    # are registered in writer-wide data structures that we cannot
+    # (efficiently) merge back into the parent.  Defer these chunks to
+    # the parent process.
+    if (
+        len(visitor.subexpression_cache) != n_subexpressions
+        or len(visitor.external_functions) != n_external_functions
+        or visitor.encountered_string_arguments != encountered_string_arguments
+    ):
+        repns = None
+    new_vars = list(islice(var_map, n_vars, None))
+    # Reset the var_map so that the variables recorded by this chunk
+    # are independent of the other chunks processed by this worker
+    for _id in new_vars:
+        del var_map[_id]
+    if repns is None:
+        # Reset the remaining writer state and request that the parent
+        # process compile this chunk
+        for _dict, n in (
+            (visitor.subexpression_cache, n_subexpressions),
+            (visitor.external_functions, n_external_functions),
+        ):
+            for key in list(islice(_dict, n, None)):
+                del _dict[key]
+        del visitor.subexpression_order[n_subexpression_order:]
+        visitor.encountered_string_arguments = encountered_string_arguments
+        return None
+    return repns, new_vars
+
+
 class NLFragment(object):
     """This is a mock "component" for the nl portion of a named Expression.
 
@@ -2002,6 +2417,29 @@ class AMPLRepn(object):
             (id(self) & 15) << 8 * ctypes.sizeof(ctypes.c_void_p) - 4
         )
 
+    def __getstate__(self):
+        # Explicit (tuple) state is much more efficient to pickle than
+        # the default __slots__ state dict.  This is important for
+        # returning compiled expressions from the parallel walker.
+        return (
+            self.nl,
+            self.mult,
+            self.const,
+            self.linear,
+            self.nonlinear,
+            self.named_exprs,
+        )
+
+    def __setstate__(self, state):
+        (
+            self.nl,
+            self.mult,
+            self.const,
+            self.linear,
+            self.nonlinear,
+            self.named_exprs,
+        ) = state
+
     def duplicate(self):
         ans = self.__class__.__new__(self.__class__)
         ans.nl = self.nl
@@ -2684,6 +3122,7 @@ class AMPLBeforeChildDispatcher(BeforeChildDispatcher):
         # Special linear / summation expressions
         self[MonomialTermExpression] = self._before_monomial
         self[LinearExpression] = self._before_linear
+        self[LinearArrayExpression] = self._before_linear_array
         self[SumExpression] = self._before_general_expression
 
     @staticmethod
@@ -2694,6 +3133,9 @@ class AMPLBeforeChildDispatcher(BeforeChildDispatcher):
         # set when constructing an expression, thereby altering the
         # order in which we would see the variables)
         vm = visitor.var_map
+        if vm.__class__ is _RecordedVars:
+            vm[id(var)] = var
+            return
         try:
             _iter = var.parent_component().values(visitor.sorter)
         except AttributeError:
@@ -2833,6 +3275,37 @@ class AMPLBeforeChildDispatcher(BeforeChildDispatcher):
         else:
             return False, (_CONSTANT, const)
 
+    @staticmethod
+    def _before_linear_array(visitor, child):
+        const = child.constant
+        coefs = child.linear_coefs
+        var_list = child.linear_vars
+        # We can build the linear map directly from the expression
+        # arrays for the common case of nonzero native coefficients and
+        # (unfixed) variables.  Anything else is processed term-by-term.
+        if (
+            const.__class__ not in native_numeric_types
+            or not native_numeric_types.issuperset(map(type, coefs))
+            or 0 in coefs
+        ):
+            return AMPLBeforeChildDispatcher._before_linear(visitor, child)
+        var_map = visitor.var_map
+        ids = list(map(id, var_list))
+        if not all(map(var_map.__contains__, ids)):
+            for _id, var in zip(ids, var_list):
+                if _id not in var_map:
+                    if var.fixed:
+                        return AMPLBeforeChildDispatcher._before_linear(visitor, child)
+                    _before_child_handlers._record_var(visitor, var)
+        linear = dict(zip(ids, coefs))
+        if len(linear) != len(ids):
+            # Repeated variables: accumulate the coefficients
+            return AMPLBeforeChildDispatcher._before_linear(visitor, child)
+        if linear:
+            return False, (_GENERAL, AMPLRepn(const, linear, None))
+        else:
+            return False, (_CONSTANT, const)
+
     @staticmethod
     def _before_named_expression(visitor, child):
         _id = id(child)
@@ -2851,6 +3324,13 @@ class AMPLBeforeChildDispatcher(BeforeChildDispatcher):
 _before_child_handlers = AMPLBeforeChildDispatcher()
 
 
+def _fixed_var_value(visitor, var):
+    _id = id(var)
+    if _id not in visitor.fixed_vars:
+        visitor.cache_fixed_var(_id, var)
+    return visitor.fixed_vars[_id]
+
+
 class AMPLRepnVisitor(StreamBasedExpressionVisitor):
     def __init__(
         self,
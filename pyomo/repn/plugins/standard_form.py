@@ -11,7 +11,8 @@
 
 import collections
 import logging
-from operator import attrgetter
+from array import array
+from operator import attrgetter, neg
 
 from pyomo.common.config import (
     ConfigBlock,
@@ -21,6 +22,7 @@ from pyomo.common.config import (
 )
 from pyomo.common.dependencies import scipy, numpy as np
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.common.timing import TicTocTimer
 
 from pyomo.core.base import (
@@ -35,13 +37,22 @@ from pyomo.core.base import (
     SymbolMap,
     maximize,
 )
+from pyomo.core.expr.numeric_expr import LinearExpression, MonomialTermExpression
 from pyomo.opt import WriterFactory
-from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear import (
+    LinearBeforeChildDispatcher,
+    LinearRepnVisitor,
+    LinearSubexpressionCache,
+)
+from pyomo.repn.quadratic import QuadraticRepnVisitor
+from pyomo.repn.linear_template import LinearTemplateCompiler
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
+    MatrixConstraintCompiler,
     categorize_valid_components,
     initialize_var_map_from_column_order,
+    matrix_constraint_types,
     ordered_active_constraints,
 )
 
@@ -118,6 +129,37 @@ class LinearStandardFormInfo(object):
         return self.rhs
 
 
+class QuadraticStandardFormInfo(LinearStandardFormInfo):
+    """Return type for QuadraticStandardFormCompiler.write()
+
+    In addition to the attributes of :py:class:`LinearStandardFormInfo`,
+    this holds the (symmetric) quadratic blocks of the objectives and
+    constraints.  The quadratic blocks follow the usual QP solver
+    convention: the objectives are `c @ x + 0.5 * x @ Q[i] @ x` and the
+    constraint bodies are `A @ x + 0.5 * x @ Q_rows[r] @ x`.
+
+    Attributes
+    ----------
+    Q : List[scipy.sparse.csc_array]
+
+        The (symmetric) quadratic objective coefficients; one matrix
+        for each row in `c`.  Objectives without quadratic terms have
+        an empty (all-zero) matrix.
+
+    Q_rows : Dict[int, scipy.sparse.csc_array]
+
+        The (symmetric) quadratic coefficients for each row in `A` that
+        contains quadratic terms, keyed by the row index.  Rows that
+        are not in the dict are linear.
+
+    """
+
+    def __init__(self, c, Q, A, Q_rows, rhs, rows, columns, eliminated_vars):
+        super().__init__(c, A, rhs, rows, columns, eliminated_vars)
+        self.Q = Q
+        self.Q_rows = Q_rows
+
+
 @WriterFactory.register(
     'compile_standard_form', 'Compile an LP to standard form (`min cTx s.t. Ax <= b`)'
 )
@@ -194,6 +236,39 @@ class LinearStandardFormCompiler(object):
             appended to the end of this list.""",
         ),
     )
+    CONFIG.declare(
+        'templatize_constraints',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Compile indexed constraint rules as templates',
+            doc="""
+            If True, the rule for each IndexedConstraint is templatized
+            and compiled once, and the compiled template is evaluated
+            for each constraint in the component (instead of walking
+            every constraint body).  Components whose rules cannot be
+            templatized (or are not linear), and constraints that were
+            modified or added after the component was constructed, are
+            processed normally.  This assumes that the rules would
+            still generate the same expressions (i.e., any Python data
+            used by the rules has not changed since construction).""",
+        ),
+    )
+    CONFIG.declare(
+        'cache_subexpressions',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Cache compiled named Expressions on the model',
+            doc="""
+            If True, the compiled (linear) representations of named
+            Expression components are stored in a cache attached to the
+            model and reused by subsequent writes (by this or any other
+            writer that uses the LinearRepnVisitor) as long as the
+            expression, the fixed variable values, and the mutable
+            parameter values they depend on are unchanged.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -225,7 +300,46 @@ class LinearStandardFormCompiler(object):
             return _LinearStandardFormCompiler_impl(config).write(model)
 
 
+@WriterFactory.register(
+    'compile_quadratic_standard_form',
+    'Compile a QP to standard form (`min cTx + 1/2 xTQx s.t. Ax <= b`)',
+)
+class QuadraticStandardFormCompiler(LinearStandardFormCompiler):
+    CONFIG = LinearStandardFormCompiler.CONFIG()
+
+    @document_kwargs_from_configdict(CONFIG)
+    def write(self, model, ostream=None, **options):
+        """Convert a model to standard form (`min cTx + 1/2 xTQx s.t. Ax <= b`)
+
+        Quadratic terms in the constraints are returned as per-row
+        (symmetric) quadratic blocks (see
+        :py:class:`QuadraticStandardFormInfo`).
+
+        Returns
+        -------
+        QuadraticStandardFormInfo
+
+        Parameters
+        ----------
+        model: ConcreteModel
+            The concrete Pyomo model to write out.
+
+        ostream: None
+            This is provided for API compatibility with other writers
+            and is ignored here.
+
+        """
+        config = self.config(options)
+
+        with PauseGC():
+            return _QuadraticStandardFormCompiler_impl(config).write(model)
+
+
 class _LinearStandardFormCompiler_impl(object):
+    _name = 'Linear'
+    _visitor_class = LinearRepnVisitor
+    _collect_quadratic = False
+
     def __init__(self, config):
         self.config = config
 
@@ -259,10 +373,11 @@ class _LinearStandardFormCompiler_impl(object):
         if unknown:
             raise ValueError(
                 "The model ('%s') contains the following active components "
-                "that the Linear Standard Form compiler does not know how to "
+                "that the %s Standard Form compiler does not know how to "
                 "process:\n\t%s"
                 % (
                     model.name,
+                    self._name,
                     "\n\t".join(
                         "%s:\n\t\t%s" % (k, "\n\t\t".join(map(attrgetter('name'), v)))
                         for k, v in unknown.items()
@@ -274,7 +389,18 @@ class _LinearStandardFormCompiler_impl(object):
         initialize_var_map_from_column_order(model, self.config, var_map)
         var_order = {_id: i for i, _id in enumerate(var_map)}
 
-        visitor = LinearRepnVisitor({}, var_map, var_order, sorter)
+        if self.config.cache_subexpressions:
+            repn_cache = LinearSubexpressionCache.on(model)
+        else:
+            repn_cache = None
+        visitor = self._visitor_class({}, var_map, var_order, sorter, repn_cache)
+        if self.config.templatize_constraints:
+            template_compiler = LinearTemplateCompiler(visitor)
+        else:
+            template_compiler = None
+        matrix_compiler = MatrixConstraintCompiler(
+            visitor, LinearBeforeChildDispatcher._record_var
+        )
 
         timer.toc('Initialized column order', level=logging.DEBUG)
 
@@ -316,24 +442,43 @@ class _LinearStandardFormCompiler_impl(object):
                         Objective, active=True, descend_into=False, sort=sorter
                     )
                 )
-        obj_data = []
-        obj_index = []
-        obj_index_ptr = [0]
+        # The compiled objective and constraint coefficients are
+        # appended directly to (growable) typed arrays holding the CSR
+        # data, index, and index pointer vectors.  This avoids creating
+        # (and holding on to) intermediate per-row NumPy arrays, and
+        # the final arrays are passed to scipy without copying (see
+        # _csr_index_arrays()).  The index pointers are 64-bit so that
+        # the number of nonzeros is not limited to 2**31.
+        obj_data = array('d')
+        obj_index = array('i')
+        obj_index_ptr = array('q', [0])
+        # Quadratic terms are collected as lists of (index, multiplier,
+        # (data, row, col)) tuples (and only if this is a quadratic
+        # compiler)
+        collect_quadratic = self._collect_quadratic
+        obj_quadratic = []
+        con_quadratic = []
         for i, obj in enumerate(objectives):
             repn = visitor.walk_expression(obj.expr)
             if repn.nonlinear is not None:
                 raise ValueError(
                     f"Model objective ({obj.name}) contains nonlinear terms that "
-                    "cannot be compiled to standard (linear) form."
+                    f"cannot be compiled to standard ({self._name.lower()}) form."
                 )
-            N = len(repn.linear)
-            obj_data.append(np.fromiter(repn.linear.values(), float, N))
             if obj.sense == maximize:
-                obj_data[-1] *= -1
-            obj_index.append(
-                np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
-            )
-            obj_index_ptr.append(obj_index_ptr[-1] + N)
+                obj_data.extend(map(neg, repn.linear.values()))
+                if collect_quadratic and repn.quadratic:
+                    obj_quadratic.append(
+                        (i, -1, _quadratic_triplets(repn.quadratic, var_order))
+                    )
+            else:
+                obj_data.extend(repn.linear.values())
+                if collect_quadratic and repn.quadratic:
+                    obj_quadratic.append(
+                        (i, 1, _quadratic_triplets(repn.quadratic, var_order))
+                    )
+            obj_index.extend(map(var_order.__getitem__, repn.linear))
+            obj_index_ptr.append(len(obj_index))
             if with_debug_timing:
                 timer.toc('Objective %s', obj, level=logging.DEBUG)
 
@@ -344,11 +489,15 @@ class _LinearStandardFormCompiler_impl(object):
         mixed_form = self.config.mixed_form
         if slack_form and mixed_form:
             raise ValueError("cannot specify both slack_form and mixed_form")
-        rows = []
-        rhs = []
-        con_data = []
-        con_index = []
-        con_index_ptr = [0]
+        # The rows are recorded as the constraint and bound type (and
+        # only converted to RowEntry tuples once the CSR buffers have
+        # been released)
+        row_cons = []
+        row_types = array('b')
+        rhs = array('d')
+        con_data = array('d')
+        con_index = array('i')
+        con_index_ptr = array('q', [0])
         last_parent = None
         for con in ordered_active_constraints(model, self.config):
             if with_debug_timing and con.parent_component() is not last_parent:
@@ -360,24 +509,52 @@ class _LinearStandardFormCompiler_impl(object):
             lb = con.lb
             ub = con.ub
 
-            repn = visitor.walk_expression(con.body)
+            # The (linear) terms for this constraint are appended to
+            # con_data / con_index starting at row_start.  Linear
+            # expressions are compiled directly into the buffers;
+            # everything else is compiled to a LinearRepn by the visitor.
+            row_start = len(con_index)
+            offset = None
+            if con.__class__ in matrix_constraint_types:
+                repn = visitor.Result()
+                repn.constant, repn.linear = matrix_compiler.compile_row(con)
+            elif template_compiler is None:
+                body = con.body
+                if body.__class__ is LinearExpression:
+                    offset = _append_linear_terms(
+                        visitor, body.args, con_data, con_index
+                    )
+                if offset is None:
+                    repn = visitor.walk_expression(body)
+            else:
+                repn = template_compiler.walk_constraint(con)
 
             if lb is None and ub is None:
                 # Note: you *cannot* output trivial (unbounded)
                 # constraints in matrix format.  I suppose we could add a
                 # slack variable, but that seems rather silly.
+                del con_data[row_start:], con_index[row_start:]
                 continue
-            if repn.nonlinear is not None:
-                raise ValueError(
-                    f"Model constraint ({con.name}) contains nonlinear terms that "
-                    "cannot be compiled to standard (linear) form."
-                )
-
-            # Pull out the constant: we will move it to the bounds
-            offset = repn.constant
-            repn.constant = 0
 
-            if not repn.linear:
+            quadratic = None
+            if offset is None:
+                if repn.nonlinear is not None:
+                    raise ValueError(
+                        f"Model constraint ({con.name}) contains nonlinear "
+                        "terms that cannot be compiled to standard "
+                        f"({self._name.lower()}) form."
+                    )
+                # Pull out the constant: we will move it to the bounds
+                offset = repn.constant
+                linear = repn.linear
+                con_data.extend(linear.values())
+                con_index.extend(map(var_order.__getitem__, linear))
+                if collect_quadratic and repn.quadratic:
+                    quadratic = _quadratic_triplets(repn.quadratic, var_order)
+                    first_row = len(row_types)
+            row_end = len(con_index)
+
+            if quadratic is None and row_start == row_end:
                 if (lb is None or lb <= offset) and (ub is None or ub >= offset):
                     continue
                 raise InfeasibleError(
@@ -385,31 +562,27 @@ class _LinearStandardFormCompiler_impl(object):
                 )
 
             if mixed_form:
-                N = len(repn.linear)
-                _data = np.fromiter(repn.linear.values(), float, N)
-                _index = np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
                 if ub == lb:
-                    rows.append(RowEntry(con, 0))
+                    row_cons.append(con)
+                    row_types.append(0)
                     rhs.append(ub - offset)
-                    con_data.append(_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    con_index_ptr.append(row_end)
                 else:
                     if ub is not None:
-                        rows.append(RowEntry(con, 1))
+                        row_cons.append(con)
+                        row_types.append(1)
                         rhs.append(ub - offset)
-                        con_data.append(_data)
-                        con_index.append(_index)
-                        con_index_ptr.append(con_index_ptr[-1] + N)
+                        con_index_ptr.append(row_end)
                     if lb is not None:
-                        rows.append(RowEntry(con, -1))
+                        if ub is not None:
+                            # Repeat the row
+                            con_data.extend(con_data[row_start:row_end])
+                            con_index.extend(con_index[row_start:row_end])
+                        row_cons.append(con)
+                        row_types.append(-1)
                         rhs.append(lb - offset)
-                        con_data.append(_data)
-                        con_index.append(_index)
-                        con_index_ptr.append(con_index_ptr[-1] + N)
+                        con_index_ptr.append(len(con_index))
             elif slack_form:
-                _data = list(repn.linear.values())
-                _index = list(map(var_order.__getitem__, repn.linear))
                 if lb == ub:  # TODO: add tolerance?
                     rhs.append(ub - offset)
                 else:
@@ -426,28 +599,38 @@ class _LinearStandardFormCompiler_impl(object):
                             v.lb = lb - ub
                     var_map[id(v)] = v
                     var_order[id(v)] = slack_col = len(var_order)
-                    _data.append(1)
-                    _index.append(slack_col)
-                rows.append(RowEntry(con, 1))
-                con_data.append(np.array(_data))
-                con_index.append(np.array(_index))
-                con_index_ptr.append(con_index_ptr[-1] + len(_index))
+                    con_data.append(1)
+                    con_index.append(slack_col)
+                row_cons.append(con)
+                row_types.append(1)
+                con_index_ptr.append(len(con_index))
             else:
-                N = len(repn.linear)
-                _data = np.fromiter(repn.linear.values(), float, N)
-                _index = np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
                 if ub is not None:
-                    rows.append(RowEntry(con, 1))
+                    row_cons.append(con)
+                    row_types.append(1)
                     rhs.append(ub - offset)
-                    con_data.append(_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    con_index_ptr.append(row_end)
                 if lb is not None:
-                    rows.append(RowEntry(con, -1))
+                    if ub is not None:
+                        # Repeat the (negated) row
+                        con_data.extend(map(neg, con_data[row_start:row_end]))
+                        con_index.extend(con_index[row_start:row_end])
+                    else:
+                        con_data[row_start:] = array(
+                            'd', map(neg, con_data[row_start:])
+                        )
+                    row_cons.append(con)
+                    row_types.append(-1)
                     rhs.append(offset - lb)
-                    con_data.append(-_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    con_index_ptr.append(len(con_index))
+
+            if quadratic is not None:
+                # Only the "standard" form negates rows (for lower bounds)
+                for r in range(first_row, len(row_types)):
+                    if slack_form or mixed_form:
+                        con_quadratic.append((r, 1, quadratic))
+                    else:
+                        con_quadratic.append((r, row_types[r], quadratic))
 
         if with_debug_timing:
             # report the last constraint
@@ -455,15 +638,31 @@ class _LinearStandardFormCompiler_impl(object):
 
         # Get the variable list
         columns = list(var_map.values())
-        # Convert the compiled data to scipy sparse matrices
+        # The variable maps are no longer needed: release them before
+        # building the sparse matrices (the conversion from CSR to CSC
+        # determines the peak memory used by the compiler)
+        var_map.clear()
+        var_order.clear()
+        # Convert the compiled data to scipy sparse matrices.  Note that
+        # np.frombuffer() does not copy the underlying arrays.
+        obj_index, obj_index_ptr = _csr_index_arrays(obj_index, obj_index_ptr)
         c = scipy.sparse.csr_array(
-            (np.concatenate(obj_data), np.concatenate(obj_index), obj_index_ptr),
+            (np.frombuffer(obj_data, float), obj_index, obj_index_ptr),
             [len(obj_index_ptr) - 1, len(columns)],
         ).tocsc()
+        con_index, con_index_ptr = _csr_index_arrays(con_index, con_index_ptr)
         A = scipy.sparse.csr_array(
-            (np.concatenate(con_data), np.concatenate(con_index), con_index_ptr),
-            [len(rows), len(columns)],
+            (np.frombuffer(con_data, float), con_index, con_index_ptr),
+            [len(row_types), len(columns)],
         ).tocsc()
+        del obj_data, obj_index, obj_index_ptr, con_data, con_index, con_index_ptr
+        # Linear expressions that contain the same variable more than
+        # once generate repeated entries: sum them (this is a no-op
+        # (after an O(nnz) check) if there are no repeated entries)
+        A.sum_duplicates()
+        rhs = np.frombuffer(rhs, float)
+        rows = list(map(RowEntry, row_cons, row_types))
+        del row_cons, row_types
 
         # Some variables in the var_map may not actually appear in the
         # objective or constraints (e.g., added from col_order, or
@@ -473,6 +672,12 @@ class _LinearStandardFormCompiler_impl(object):
         c_ip = c.indptr
         A_ip = A.indptr
         active_var_mask = (A_ip[1:] > A_ip[:-1]) | (c_ip[1:] > c_ip[:-1])
+        if collect_quadratic:
+            # Variables that only appear in quadratic terms are active
+            for _, _, (_, q_row, _) in obj_quadratic:
+                active_var_mask[q_row] = True
+            for _, _, (_, q_row, _) in con_quadratic:
+                active_var_mask[q_row] = True
 
         # Masks on NumPy arrays are very fast.  Build the reduced A
         # indptr and then check if we actually have to manipulate the
@@ -490,16 +695,168 @@ class _LinearStandardFormCompiler_impl(object):
                 (A.data, A.indices, reduced_A_indptr), [A.shape[0], nCol]
             )
 
+        if collect_quadratic:
+            # Map the original column indices onto the reduced columns
+            col_map = np.cumsum(active_var_mask) - 1
+            Q = [
+                scipy.sparse.csc_array((len(columns), len(columns)))
+                for i in range(c.shape[0])
+            ]
+            for i, mult, triplets in obj_quadratic:
+                Q[i] = _quadratic_csc_array(mult, triplets, col_map, len(columns))
+            Q_rows = {
+                r: _quadratic_csc_array(mult, triplets, col_map, len(columns))
+                for r, mult, triplets in con_quadratic
+            }
+
         if self.config.nonnegative_vars:
-            c, A, columns, eliminated_vars = _csc_to_nonnegative_vars(c, A, columns)
+            if collect_quadratic:
+                # Append the identity to A so that the transformation
+                # also returns the substitution matrix T (x_old = T @
+                # x_new) that we need to map the quadratic blocks onto
+                # the new columns
+                nRow = A.shape[0]
+                A = scipy.sparse.vstack(
+                    (A, scipy.sparse.identity(A.shape[1])), format='csc'
+                )
+                c, A, columns, eliminated_vars = _csc_to_nonnegative_vars(c, A, columns)
+                T = A[nRow:]
+                A = A[:nRow]
+                Q = [(T.T @ q @ T).tocsc() for q in Q]
+                Q_rows = {r: (T.T @ q @ T).tocsc() for r, q in Q_rows.items()}
+            else:
+                c, A, columns, eliminated_vars = _csc_to_nonnegative_vars(c, A, columns)
         else:
             eliminated_vars = []
 
-        info = LinearStandardFormInfo(c, A, rhs, rows, columns, eliminated_vars)
-        timer.toc("Generated linear standard form representation", delta=False)
+        if collect_quadratic:
+            info = QuadraticStandardFormInfo(
+                c, Q, A, Q_rows, rhs, rows, columns, eliminated_vars
+            )
+        else:
+            info = LinearStandardFormInfo(c, A, rhs, rows, columns, eliminated_vars)
+        timer.toc(
+            "Generated %s standard form representation", self._name.lower(), delta=False
+        )
         return info
 
 
+class _QuadraticStandardFormCompiler_impl(_LinearStandardFormCompiler_impl):
+    _name = 'Quadratic'
+    _visitor_class = QuadraticRepnVisitor
+    _collect_quadratic = True
+
+
+def _append_linear_terms(visitor, args, data, index):
+    """Append the terms of a LinearExpression to CSR data / index buffers
+
+    This compiles the arguments of a :py:class:`LinearExpression`
+    directly into the `data` and `index` buffers (without building a
+    :py:class:`LinearRepn`), following the same variable recording and
+    fixed variable conventions as the :py:class:`LinearRepnVisitor`.
+    Repeated variables generate repeated entries (which are summed by
+    scipy).
+
+    Returns the constant term, or ``None`` (after removing any entries
+    that were appended) if the expression contains terms that should
+    be processed by the visitor.
+
+    """
+    var_order = visitor.var_order
+    start = len(index)
+    const = 0
+    for arg in args:
+        if arg.__class__ is MonomialTermExpression:
+            coef, var = arg._args_
+            if coef.__class__ not in native_numeric_types:
+                try:
+                    coef = visitor.check_constant(visitor.evaluate(coef), coef)
+                except (ValueError, ArithmeticError):
+                    break
+            if not coef:
+                # Leave multiplication by 0 (and nan) to the visitor
+                break
+        elif arg.__class__ in native_numeric_types:
+            const += arg
+            continue
+        elif arg.is_variable_type():
+            coef = 1
+            var = arg
+        else:
+            break
+        col = var_order.get(id(var), None)
+        if col is None:
+            if var.fixed:
+                const += coef * visitor.check_constant(var.value, var)
+                continue
+            LinearBeforeChildDispatcher._record_var(visitor, var)
+            col = var_order[id(var)]
+        data.append(coef)
+        index.append(col)
+    else:
+        return const
+    del data[start:], index[start:]
+    return None
+
+
+def _csr_index_arrays(index, index_ptr):
+    """Return NumPy views of the CSR index and index pointer buffers
+
+    The column indices are collected as 32-bit integers and the index
+    pointers as 64-bit integers.  scipy requires both to have the same
+    type, so this converts the (short) index pointer array to 32-bit
+    integers if the number of nonzeros allows it, and otherwise
+    converts the indices to 64-bit integers.
+
+    """
+    index = np.frombuffer(index, np.intc)
+    index_ptr = np.frombuffer(index_ptr, np.int64)
+    if index_ptr[-1] <= np.iinfo(np.intc).max:
+        return index, index_ptr.astype(np.intc)
+    return index.astype(np.int64), index_ptr
+
+
+def _quadratic_triplets(quadratic, var_order):
+    """Convert a QuadraticRepn.quadratic dict to symmetric COO triplets
+
+    The returned (data, row, col) arrays (in terms of the `var_order`
+    column indices) define the symmetric matrix Q such that the
+    quadratic terms are `0.5 * x @ Q @ x`.
+
+    """
+    data = []
+    row = []
+    col = []
+    for (vid1, vid2), coef in quadratic.items():
+        if not coef:
+            continue
+        i = var_order[vid1]
+        j = var_order[vid2]
+        if i == j:
+            data.append(2 * coef)
+            row.append(i)
+            col.append(i)
+        else:
+            data.extend((coef, coef))
+            row.extend((i, j))
+            col.extend((j, i))
+    return (
+        np.array(data, dtype=float),
+        np.array(row, dtype=np.intc),
+        np.array(col, dtype=np.intc),
+    )
+
+
+def _quadratic_csc_array(mult, triplets, col_map, nCol):
+    data, row, col = triplets
+    if mult != 1:
+        data = mult * data
+    # Note: converting from COO sums any duplicate entries
+    return scipy.sparse.coo_array(
+        (data, (col_map[row], col_map[col])), [nCol, nCol]
+    ).tocsc()
+
+
 def _csc_to_nonnegative_vars(c, A, columns):
     eliminated_vars = []
     new_columns = []
@@ -1132,6 +1132,7 @@ _repn_collectors = {
     EXPR.AbsExpression: _collect_nonl,
     EXPR.NegationExpression: _collect_negation,
     EXPR.LinearExpression: _collect_linear,
+    EXPR.LinearArrayExpression: _collect_linear,
     EXPR.InequalityExpression: _collect_comparison,
     EXPR.RangedExpression: _collect_comparison,
     EXPR.EqualityExpression: _collect_comparison,
@@ -1531,6 +1532,7 @@ _linear_repn_collectors = {
     #EXPR.AbsExpression                          : _linear_collect_nonl,
     EXPR.NegationExpression                     : _linear_collect_negation,
     EXPR.LinearExpression                       : _linear_collect_linear,
+    EXPR.LinearArrayExpression                  : _linear_collect_linear,
     #EXPR.InequalityExpression                   : _linear_collect_comparison,
     #EXPR.RangedExpression                       : _linear_collect_comparison,
     #EXPR.EqualityExpression                     : _linear_collect_comparison,
@@ -23,6 +23,7 @@ import pyomo.repn.plugins.nl_writer as nl_writer
 from pyomo.repn.util import InvalidNumber
 from pyomo.repn.tests.nl_diff import nl_diff
 
+from pyomo.common.collections import ComponentMap
 from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.errors import MouseTrap
 from pyomo.common.log import LoggingIntercept
@@ -42,6 +43,7 @@ from pyomo.environ import (
     Suffix,
     Constraint,
     Expression,
+    linear_sum,
 )
 import pyomo.environ as pyo
 
@@ -579,6 +581,38 @@ class Test_AMPLRepnVisitor(unittest.TestCase):
         self.assertEqual(repn.linear, {id(m.x): 5, id(m.y): 7, id(m.z): 8})
         self.assertEqual(repn.nonlinear, None)
 
+    def test_linear_array(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.y = Var(initialize=4)
+        m.p = Param(initialize=5, mutable=True)
+
+        info = INFO()
+        with LoggingIntercept() as LOG:
+            repn = info.visitor.walk_expression(
+                (linear_sum([2, 3], [m.x[2], m.x[1]], 1), None, None, 1)
+            )
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual(repn.nl, None)
+        self.assertEqual(repn.mult, 1)
+        self.assertEqual(repn.const, 1)
+        self.assertEqual(repn.linear, {id(m.x[2]): 2, id(m.x[1]): 3})
+        self.assertEqual(repn.nonlinear, None)
+        self.assertEqual(list(info.var_map), [id(m.x[1]), id(m.x[2])])
+
+        m.y.fix()
+        info = INFO()
+        with LoggingIntercept() as LOG:
+            repn = info.visitor.walk_expression(
+                (linear_sum([m.p, 2, 1], [m.x[1], m.y, m.x[1]], m.p), None, None, 1)
+            )
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual(repn.nl, None)
+        self.assertEqual(repn.mult, 1)
+        self.assertEqual(repn.const, 13)
+        self.assertEqual(repn.linear, {id(m.x[1]): 6})
+        self.assertEqual(repn.nonlinear, None)
+
     def test_eval_pow(self):
         m = ConcreteModel()
         m.x = Var(initialize=4)
@@ -985,6 +1019,33 @@ class Test_NLWriter(unittest.TestCase):
             OUT.close()
             os.close(r)
 
+    def test_export_suffixes_option(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        m.y = Var(initialize=2)
+        m.o = Objective(expr=m.x**2 + m.y)
+        m.c = Constraint(expr=m.x + m.y >= 1)
+        m.zL = Suffix(direction=Suffix.EXPORT)
+        m.zL[m.x] = 1.0
+
+        export_suffixes = {
+            'zL': ComponentMap([(m.x, 0.5), (m.y, 2.5)]),
+            'dual': ComponentMap([(m.c, 3.0)]),
+        }
+        OUT = io.StringIO()
+        nl_writer.NLWriter().write(m, OUT, export_suffixes=export_suffixes)
+
+        # The equivalent model using Suffix components
+        m.zL[m.x] = 0.5
+        m.zL[m.y] = 2.5
+        m.dual = Suffix(direction=Suffix.EXPORT)
+        m.dual[m.c] = 3.0
+        REF = io.StringIO()
+        nl_writer.NLWriter().write(m, REF)
+        self.assertEqual(OUT.getvalue(), REF.getvalue())
+        self.assertIn("S4 2 zL\n", OUT.getvalue())
+        self.assertIn("d1\n0 3.0\n", OUT.getvalue())
+
     def test_suffix_warning_new_components(self):
         m = ConcreteModel()
         m.junk = Suffix(direction=Suffix.EXPORT)
@@ -2169,3 +2230,156 @@ G1 3	#o2
                 OUT.getvalue(),
             )
         )
+
+    @unittest.skipUnless(nl_writer._fork_available, "parallel writer requires fork")
+    def test_parallel_workers(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(20)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1)
+        m.y = Var(m.I)
+        m.z = Var(m.I, domain=pyo.Binary)
+        m.f = Var(initialize=3)
+        m.f.fix()
+        m.s = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor[m.x[3]] = 2
+        m.c = Constraint(
+            m.I, rule=lambda m, i: m.x[i] ** 2 + log(m.y[i]) + m.f * m.z[i] <= 10 + i
+        )
+        m.d = Constraint(
+            m.I, rule=lambda m, i: m.x[i] + 2 * m.y[i % 20 + 1] - m.z[i] == i
+        )
+        m.e = Constraint(expr=m.y[1] == 5)
+        m.scaling_factor[m.c[4]] = 0.5
+        m.s[m.d[2]] = 1
+        m.o = Objective(expr=sum(m.x.values()))
+
+        for options in ({}, {'symbolic_solver_labels': True}):
+            serial = io.StringIO()
+            s_info = nl_writer.NLWriter().write(m, serial, **options)
+            parallel = io.StringIO()
+            p_info = nl_writer.NLWriter().write(
+                m, parallel, parallel_workers=3, parallel_chunk_size=7, **options
+            )
+            self.assertEqual(serial.getvalue(), parallel.getvalue())
+            self.assertEqual(s_info.variables, p_info.variables)
+            self.assertEqual(s_info.constraints, p_info.constraints)
+            self.assertEqual(s_info.scaling, p_info.scaling)
+
+    @unittest.skipUnless(nl_writer._fork_available, "parallel writer requires fork")
+    def test_parallel_workers_serial_fallback(self):
+        # Chunks that reference named expressions (or variables not in
+        # the model) are compiled in the writer process
+        other = ConcreteModel()
+        other.y = Var()
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(10)
+        m.x = Var(m.I)
+        m.E = Expression(expr=m.x[1] * m.x[2])
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] ** 2 + m.x[i % 10 + 1] <= i)
+        m.d = Constraint(expr=m.E + m.x[3] >= 0)
+        m.e = Constraint(expr=m.x[4] * other.y >= 0)
+        m.f = Constraint(m.I, rule=lambda m, i: m.x[i] * m.x[i % 10 + 1] >= m.E)
+        m.o = Objective(expr=m.x[1])
+
+        serial = io.StringIO()
+        nl_writer.NLWriter().write(m, serial, symbolic_solver_labels=True)
+        parallel = io.StringIO()
+        nl_writer.NLWriter().write(
+            m,
+            parallel,
+            symbolic_solver_labels=True,
+            parallel_workers=2,
+            parallel_chunk_size=3,
+        )
+        self.assertEqual(serial.getvalue(), parallel.getvalue())
+
+    def test_incremental(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(5)
+        m.p = Param(m.I, mutable=True, initialize=1)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1)
+        m.y = Var(m.I)
+        m.E = Expression(expr=m.x[1] + m.y[1])
+        m.c = Constraint(
+            m.I, rule=lambda m, i: m.x[i] ** 2 + m.p[i] * log(m.y[i]) <= 10 + i
+        )
+        m.d = Constraint(m.I, rule=lambda m, i: m.x[i] + m.p[i] * m.y[i] == m.E)
+        m.o = Objective(expr=sum(m.x.values()))
+
+        writer = nl_writer.NLWriter()
+        writer.config.incremental = True
+        cache = writer._repn_cache
+
+        def check(hits, misses):
+            OUT = io.StringIO()
+            writer.write(m, OUT, linear_presolve=False)
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(m, REF, linear_presolve=False)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+            self.assertEqual((cache.hits, cache.misses), (hits, misses))
+
+        check(0, 11)
+        check(11, 0)
+        # Changing a mutable Param only recompiles the dependent constraints
+        m.p[2] = 5
+        check(9, 2)
+        # Fixing a variable recompiles the constraints where it appears
+        m.y[3].fix(1)
+        check(9, 2)
+        m.y[3].value = 2
+        check(9, 2)
+        m.y[3].unfix()
+        check(9, 2)
+        # Changing a named Expression recompiles the constraints using it
+        m.E.expr = 2 * m.x[2]
+        check(6, 5)
+        # Changing a constraint expression recompiles only that constraint
+        m.c[4].set_value(m.x[4] ** 3 <= 1)
+        check(10, 1)
+        # New components are compiled and deleted components are dropped
+        m.del_component(m.d)
+        m.d = Constraint(expr=m.x[1] + m.y[5] >= 0)
+        check(6, 1)
+        self.assertEqual(len(cache.entries), 7)
+        # Changing the writer options invalidates the cache
+        OUT = io.StringIO()
+        writer.write(m, OUT, symbolic_solver_labels=True)
+        self.assertEqual((cache.hits, cache.misses), (0, 7))
+
+    def test_incremental_zero_coefficient(self):
+        # The walker does not record variables multiplied by a zero
+        # coefficient: cache hits must add exactly the same variables
+        # (in the same order) to the var_map as a full write
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=0)
+        m.x = Var([1, 2], bounds=(1, 10))
+        m.y = Var([1, 2], bounds=(1, 10))
+        m.c1 = Constraint(expr=m.p * m.y[1] + m.x[1] + log(m.x[2]) <= 5)
+        m.c2 = Constraint(expr=m.x[2] + m.y[2] ** 2 <= 5)
+        m.z = Var(bounds=(0, 1))
+        m.o = Objective(expr=m.z)
+
+        writer = nl_writer.NLWriter()
+        writer.config.incremental = True
+        cache = writer._repn_cache
+
+        def check(hits, misses):
+            OUT = io.StringIO()
+            writer.write(m, OUT, symbolic_solver_labels=True, linear_presolve=False)
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(
+                m, REF, symbolic_solver_labels=True, linear_presolve=False
+            )
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+            self.assertEqual((cache.hits, cache.misses), (hits, misses))
+
+        check(0, 3)
+        # Replaying c1 must not record y (before x) in the var_map
+        check(3, 0)
+        m.c2.set_value(m.y[2] ** 2 + m.x[2] <= 5)
+        check(2, 1)
+        m.p = 1
+        check(2, 1)
+        m.p = 0
+        check(2, 1)
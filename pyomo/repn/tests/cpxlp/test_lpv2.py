@@ -9,15 +9,19 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import gzip
+import os
 from io import StringIO
 
 import pyomo.common.unittest as unittest
 
 from pyomo.common.log import LoggingIntercept
+from pyomo.common.tempfiles import TempfileManager
 
 import pyomo.environ as pyo
 
 from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.repn.util import zstandard, zstandard_available
 
 
 class TestLPv2(unittest.TestCase):
@@ -139,3 +143,153 @@ end
         self.assertEqual(LOG.getvalue(), "")
 
         self.assertEqual(ref, OUT.getvalue())
+
+    def test_templatize_constraints(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.Set(initialize=[1, 2, 3])
+        m.J = pyo.Set(initialize=['a', 'b'])
+        m.x = pyo.Var(m.I, m.J, bounds=(0, 10))
+        m.y = pyo.Var(m.I)
+        m.p = pyo.Param(m.I, m.J, initialize=lambda m, i, j: i + len(j) / 4)
+        m.c = pyo.Constraint(
+            m.I, rule=lambda m, i: sum(m.p[i, j] * m.x[i, j] for j in m.J) - m.y[i] <= i
+        )
+        m.d = pyo.Constraint(
+            m.I, rule=lambda m, i: m.y[i] - (m.y[i + 1] if i < 3 else 0) == 1
+        )
+        m.e = pyo.Constraint(m.J, rule=lambda m, j: (-1, m.x[1, j] + m.x[2, j], 1))
+        m.o = pyo.Objective(expr=sum(m.y.values()))
+
+        ref = StringIO()
+        LPWriter().write(m, ref, symbolic_solver_labels=True)
+        OUT = StringIO()
+        with LoggingIntercept() as LOG:
+            LPWriter().write(
+                m, OUT, symbolic_solver_labels=True, templatize_constraints=True
+            )
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual(ref.getvalue(), OUT.getvalue())
+
+        # Constraints modified after construction are not generated
+        # from the rule template
+        m.c[2].set_value(5 * m.x[2, 'a'] >= 2)
+        ref = StringIO()
+        LPWriter().write(m, ref, symbolic_solver_labels=True)
+        OUT = StringIO()
+        LPWriter().write(
+            m, OUT, symbolic_solver_labels=True, templatize_constraints=True
+        )
+        self.assertIn("+5 x(2_a)\n>= 2", OUT.getvalue())
+        self.assertEqual(ref.getvalue(), OUT.getvalue())
+
+    def test_streaming(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(-1, 5))
+        m.y = pyo.Var(domain=pyo.Binary)
+        m.z = pyo.Var(domain=pyo.Integers, bounds=(0, None))
+        m.o = pyo.Objective(expr=sum(m.x.values()))
+        m.c = pyo.Constraint(expr=m.x[1] + m.x[2] >= 1)
+        m.d = pyo.Constraint(expr=pyo.inequality(-2, m.x[2] - m.y + m.z, 2))
+        m.e = pyo.Constraint(expr=m.x[3] + m.z == 4)
+
+        ref = StringIO()
+        ref_info = LPWriter().write(m, ref, symbolic_solver_labels=True)
+        OUT = StringIO()
+        info = LPWriter().write(m, OUT, symbolic_solver_labels=True, streaming=True)
+        # The variables are written in column order, so the files match
+        self.assertEqual(ref.getvalue(), OUT.getvalue())
+        # ... but the constraint symbols are not retained
+        self.assertEqual(len(ref_info.symbol_map.bySymbol), 9)
+        self.assertEqual(len(info.symbol_map.bySymbol), 6)
+        for con in (m.c, m.d, m.e):
+            self.assertNotIn(id(con), info.symbol_map.byObject)
+        self.assertIs(info.symbol_map.bySymbol['x(1)'], m.x[1])
+
+        # Variables in the bounds section appear in the order that they
+        # were first written
+        m.o.expr = m.z + m.x[1]
+        OUT = StringIO()
+        LPWriter().write(m, OUT, streaming=True)
+        self.assertIn(
+            "\nbounds"
+            "\n   0 <= x2 <= +inf"
+            "\n   -1 <= x3 <= 5"
+            "\n   -1 <= x5 <= 5"
+            "\n   0 <= x7 <= 1"
+            "\n   -1 <= x9 <= 5"
+            "\ngeneral"
+            "\n  x2"
+            "\nbinary"
+            "\n  x7"
+            "\nend\n",
+            OUT.getvalue(),
+        )
+
+    def test_cache_subexpressions(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(-1, 5))
+        m.p = pyo.Param(mutable=True, initialize=2)
+        m.cost = pyo.Expression(expr=m.p * m.x[1] + m.x[2] + 3 * m.x[3])
+        m.o = pyo.Objective(expr=m.cost)
+        m.c = pyo.Constraint(expr=m.cost <= 10)
+
+        def check():
+            ref = StringIO()
+            LPWriter().write(m, ref)
+            OUT = StringIO()
+            LPWriter().write(m, OUT, cache_subexpressions=True)
+            self.assertEqual(ref.getvalue(), OUT.getvalue())
+
+        check()
+        self.assertEqual(len(m._linear_subexpression_cache), 1)
+        check()
+        m.p = 4
+        check()
+        m.x[2].fix(1)
+        check()
+        m.cost = m.x[1]
+        check()
+        # The cache is not copied when the model is cloned
+        self.assertIsNone(m.clone()._linear_subexpression_cache)
+
+    def test_compression(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(-1, 5))
+        m.o = pyo.Objective(expr=sum(m.x.values()))
+        m.c = pyo.Constraint(expr=m.x[1] + 2 * m.x[2] >= 1)
+        ref = StringIO()
+        LPWriter().write(m, ref, symbolic_solver_labels=True)
+
+        with TempfileManager.new_context() as tempfile:
+            tmpdir = tempfile.mkdtemp()
+            # The compression is inferred from the file name...
+            fname = os.path.join(tmpdir, 'a.lp.gz')
+            ans, smap = m.write(fname, io_options={'symbolic_solver_labels': True})
+            self.assertEqual(ans, fname)
+            with gzip.open(fname, 'rt') as FILE:
+                self.assertEqual(ref.getvalue(), FILE.read())
+
+            # ... or the suffix is added to the file name
+            fname = os.path.join(tmpdir, 'b.lp')
+            ans, smap = m.write(
+                fname,
+                io_options={'symbolic_solver_labels': True, 'compression': 'gzip'},
+            )
+            self.assertEqual(ans, fname + '.gz')
+            self.assertFalse(os.path.exists(fname))
+            with gzip.open(ans, 'rt') as FILE:
+                self.assertEqual(ref.getvalue(), FILE.read())
+
+            if zstandard_available:
+                ans, smap = m.write(
+                    fname,
+                    io_options={'symbolic_solver_labels': True, 'compression': 'zstd'},
+                )
+                self.assertEqual(ans, fname + '.zst')
+                with zstandard.open(ans, 'rt') as FILE:
+                    self.assertEqual(ref.getvalue(), FILE.read())
+
+            with self.assertRaisesRegex(
+                ValueError, "Unrecognized output compression format 'bogus'"
+            ):
+                m.write(fname, io_options={'compression': 'bogus'})
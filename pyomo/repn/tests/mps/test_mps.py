@@ -12,6 +12,7 @@
 # Test the canonical expressions
 #
 
+import gzip
 import os
 import random
 
@@ -245,6 +246,28 @@ class TestMPSOrdering(unittest.TestCase):
 
         self._check_baseline(model, int_marker=True)
 
+    def test_compression(self):
+        model = ConcreteModel()
+        model.x1 = Var(within=NonNegativeIntegers)
+        model.x2 = Var(within=NonNegativeReals)
+        model.obj = Objective(expr=3 * model.x1 + 2 * model.x2)
+        model.const1 = Constraint(expr=4 * model.x1 + 3 * model.x2 >= 10)
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(test_fname)
+        self._cleanup(test_fname + ".gz")
+        model.write(test_fname, format="mps")
+        with open(test_fname) as FILE:
+            ref = FILE.read()
+        fname, smap = model.write(
+            test_fname, format="mps", io_options={"compression": "gzip"}
+        )
+        self.assertEqual(fname, test_fname + ".gz")
+        with gzip.open(fname, "rt") as FILE:
+            self.assertEqual(ref, FILE.read())
+        self._cleanup(test_fname)
+        self._cleanup(fname)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,6 +30,7 @@ from pyomo.environ import (
     ExternalFunction,
     cos,
     log,
+    linear_sum,
 )
 
 nan = float('nan')
@@ -776,6 +777,53 @@ class TestLinear(unittest.TestCase):
         self.assertEqual(repn.linear, {})
         self.assertEqual(repn.nonlinear, None)
 
+    def test_linear_array(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        m.y = Var()
+        m.p = Param(mutable=True, initialize=4)
+
+        # Arrays are mapped directly
+        e = linear_sum([3, 2.5], [m.x[2], m.x[0]], 5)
+        cfg = VisitorConfig()
+        repn = LinearRepnVisitor(*cfg).walk_expression(e)
+        self.assertEqual(
+            cfg.var_map, {id(m.x[0]): m.x[0], id(m.x[1]): m.x[1], id(m.x[2]): m.x[2]}
+        )
+        self.assertEqual(cfg.var_order, {id(m.x[0]): 0, id(m.x[1]): 1, id(m.x[2]): 2})
+        self.assertEqual(repn.multiplier, 1)
+        self.assertEqual(repn.constant, 5)
+        self.assertEqual(repn.linear, {id(m.x[2]): 3, id(m.x[0]): 2.5})
+        self.assertEqual(list(repn.linear), [id(m.x[2]), id(m.x[0])])
+        self.assertEqual(repn.nonlinear, None)
+
+        # ... and give the same result as the term-by-term processing
+        for e in (
+            linear_sum([3, m.p, 0], [m.x[2], m.x[0], m.y], m.p),
+            linear_sum([1, 2, 3], [m.x[0], m.y, m.x[0]]),
+            linear_sum([], []),
+        ):
+            cfg = VisitorConfig()
+            repn = LinearRepnVisitor(*cfg).walk_expression(e)
+            ref_cfg = VisitorConfig()
+            ref = LinearRepnVisitor(*ref_cfg).walk_expression(LinearExpression(e.args))
+            self.assertEqual(repn.constant, ref.constant)
+            self.assertEqual(repn.linear, ref.linear)
+            self.assertEqual(cfg.var_map, ref_cfg.var_map)
+
+        m.y.fix(2)
+        e = linear_sum([3, 2], [m.x[1], m.y], 1)
+        cfg = VisitorConfig()
+        repn = LinearRepnVisitor(*cfg).walk_expression(e)
+        self.assertEqual(repn.constant, 5)
+        self.assertEqual(repn.linear, {id(m.x[1]): 3})
+
+        e = linear_sum([3, 2], [m.y, m.y], 1)
+        cfg = VisitorConfig()
+        repn = LinearRepnVisitor(*cfg).walk_expression(e)
+        self.assertEqual(repn.constant, 11)
+        self.assertEqual(repn.linear, {})
+
     def test_trig(self):
         m = ConcreteModel()
         m.x = Var()
@@ -910,6 +958,64 @@ class TestLinear(unittest.TestCase):
         self.assertEqual(repn.linear, {})
         self.assertEqual(repn.nonlinear, None)
 
+    def test_named_expr_repn_cache(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        m.p = Param(mutable=True, initialize=2)
+        m.e = Expression(expr=m.p * m.x[0] + 3 * m.x[1] + m.x[2])
+        m.f = Expression(expr=m.e + 1)
+        cache = linear.LinearSubexpressionCache()
+
+        def walk(expr):
+            cfg = VisitorConfig()
+            visitor = LinearRepnVisitor(*cfg, repn_cache=cache)
+            return cfg, visitor.walk_expression(expr)
+
+        cfg, repn = walk(m.f * 2)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(repn.constant, 2)
+        self.assertEqual(repn.linear, {id(m.x[0]): 4, id(m.x[1]): 6, id(m.x[2]): 2})
+
+        # The cached repns are reused (and the var_map is populated)
+        cache_entry = cache._cache[LinearRepn, id(m.f)][0]
+        cfg, repn = walk(m.f * 2)
+        self.assertIs(cfg.subexpr[id(m.f)], cache_entry)
+        self.assertNotIn(id(m.e), cfg.subexpr)
+        self.assertEqual(
+            cfg.var_map, {id(m.x[0]): m.x[0], id(m.x[1]): m.x[1], id(m.x[2]): m.x[2]}
+        )
+        self.assertEqual(repn.linear, {id(m.x[0]): 4, id(m.x[1]): 6, id(m.x[2]): 2})
+
+        # Changing a mutable parameter invalidates the entries
+        m.p = 5
+        cfg, repn = walk(m.f * 2)
+        self.assertIsNot(cfg.subexpr[id(m.f)], cache_entry)
+        self.assertEqual(repn.linear, {id(m.x[0]): 10, id(m.x[1]): 6, id(m.x[2]): 2})
+
+        # ... as does fixing a variable
+        m.x[2].fix(4)
+        cfg, repn = walk(m.f * 2)
+        self.assertEqual(repn.constant, 10)
+        self.assertEqual(repn.linear, {id(m.x[0]): 10, id(m.x[1]): 6})
+        m.x[2].value = 5
+        cfg, repn = walk(m.f * 2)
+        self.assertEqual(repn.constant, 12)
+        m.x[2].unfix()
+        cfg, repn = walk(m.f * 2)
+        self.assertEqual(repn.constant, 2)
+        self.assertEqual(repn.linear, {id(m.x[0]): 10, id(m.x[1]): 6, id(m.x[2]): 2})
+
+        # ... or changing a (nested) named expression
+        m.e = m.x[0]
+        cfg, repn = walk(m.f * 2)
+        self.assertEqual(repn.linear, {id(m.x[0]): 2})
+
+        # Nonlinear subexpressions are not cached
+        cache.clear()
+        m.e = m.x[0] ** 3
+        cfg, repn = walk(m.f * 2)
+        self.assertEqual(len(cache), 0)
+
     def test_pow_expr(self):
         m = ConcreteModel()
         m.x = Var()
@@ -0,0 +1,156 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear_template import (
+    LinearTemplateCompiler,
+    LinearTemplateRepn,
+    compile_linear_template,
+)
+
+from pyomo.environ import ConcreteModel, Constraint, Expression, Param, Set, Var
+
+
+def _build_model():
+    m = ConcreteModel()
+    m.I = Set(initialize=[1, 2, 3])
+    m.J = Set(initialize=['a', 'bb'])
+    m.x = Var(m.I, m.J)
+    m.y = Var(m.I)
+    m.z = Var()
+    m.p = Param(m.I, m.J, initialize=lambda m, i, j: i * len(j) + 0.5, mutable=True)
+    m.q = Param(m.I, initialize=lambda m, i: 2 * i)
+    m.e = Expression(expr=2 * m.z + 1)
+    return m
+
+
+class TestLinearTemplate(unittest.TestCase):
+    def _check_repns(self, m, con):
+        # Compare the template results against the LinearRepnVisitor
+        # (using separate var_maps, so the var_map ordering is verified
+        # as well)
+        vm_ref = {}
+        ref_visitor = LinearRepnVisitor({}, vm_ref, {}, None)
+        vm = {}
+        compiler = LinearTemplateCompiler(LinearRepnVisitor({}, vm, {}, None))
+        for cdata in con.values():
+            ref = ref_visitor.walk_expression(cdata.body)
+            repn = compiler.walk_constraint(cdata)
+            self.assertEqual(repn.constant, ref.constant)
+            self.assertEqual(repn.linear, ref.linear)
+            self.assertEqual(list(repn.linear), list(ref.linear))
+            self.assertIsNone(repn.nonlinear)
+            self.assertEqual(repn.multiplier, 1)
+        self.assertEqual(list(vm), list(vm_ref))
+        return compiler
+
+    def test_sum_over_set(self):
+        m = _build_model()
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: sum(m.p[i, j] * m.x[i, j] for j in m.J)
+            + 3 * m.y[i]
+            - m.q[i] * (m.y[i] + 1)
+            <= m.q[i],
+        )
+        self.assertIsInstance(compile_linear_template(m.c), LinearTemplateRepn)
+        compiler = self._check_repns(m, m.c)
+        self.assertIsNotNone(compiler.templates[m.c])
+
+    def test_multidimensional_index(self):
+        m = _build_model()
+        m.c = Constraint(
+            m.I,
+            m.J,
+            rule=lambda m, i, j: (-1, m.x[i, j] / m.q[i] - m.y[i] - m.e, m.p[i, j]),
+        )
+        self.assertIsInstance(compile_linear_template(m.c), LinearTemplateRepn)
+        self._check_repns(m, m.c)
+
+    def test_index_arithmetic_and_fixed_vars(self):
+        m = _build_model()
+        m.y[2].fix(5)
+        m.c = Constraint(
+            [1, 2], rule=lambda m, i: -m.y[i + 1] + 2 * m.y[i] - m.z / 4 == m.q[i]
+        )
+        self.assertIsInstance(compile_linear_template(m.c), LinearTemplateRepn)
+        self._check_repns(m, m.c)
+
+    def test_zero_coefficients(self):
+        m = _build_model()
+        m.p[1, 'a'] = 0
+        m.c = Constraint(
+            m.I, rule=lambda m, i: m.p[i, 'a'] * m.x[i, 'a'] + m.y[i] - m.y[i] >= 0
+        )
+        self.assertIsInstance(compile_linear_template(m.c), LinearTemplateRepn)
+        self._check_repns(m, m.c)
+
+    def test_constant_sum_coefficient(self):
+        m = _build_model()
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: sum(m.p[i, j] for j in m.J) * m.y[i]
+            + sum(m.q[k] for k in m.I) * m.z
+            >= sum(m.p[i, j] for j in m.J),
+        )
+        self.assertIsInstance(compile_linear_template(m.c), LinearTemplateRepn)
+        self._check_repns(m, m.c)
+
+    def test_missing_data_falls_back(self):
+        m = _build_model()
+        # Default values are not stored in the Param _data dict, so
+        # those constraints are walked
+        m.r = Param(m.I, initialize={1: 5}, default=2)
+        m.c = Constraint(m.I, rule=lambda m, i: m.r[i] * m.y[i] >= 0)
+        self.assertEqual(len(m.r._data), 1)
+        self.assertIsInstance(compile_linear_template(m.c), LinearTemplateRepn)
+        self._check_repns(m, m.c)
+
+    def test_not_templatizable(self):
+        m = _build_model()
+        # Python logic that depends on the index value
+        m.c = Constraint(
+            m.I, rule=lambda m, i: m.y[i] + (m.y[i + 1] if i < 3 else 0) == 1
+        )
+        self.assertIsNone(compile_linear_template(m.c))
+        # Nonlinear template
+        m.d = Constraint(m.I, rule=lambda m, i: m.y[i] ** 2 <= 4)
+        self.assertIsNone(compile_linear_template(m.d))
+        # Not declared using a rule
+        m.f = Constraint(m.I)
+        for i in m.I:
+            m.f[i] = m.y[i] >= 0
+        self.assertIsNone(compile_linear_template(m.f))
+
+        compiler = self._check_repns(m, m.c)
+        self.assertIsNone(compiler.templates[m.c])
+        self._check_repns(m, m.f)
+
+    def test_modified_constraints_fall_back(self):
+        m = _build_model()
+        m.K = Set(initialize=[1, 2, 3])
+        m.c = Constraint(m.K, rule=lambda m, i: 2 * m.y[i] >= m.q[i])
+        m.c[2].set_value(5 * m.y[2] >= 2)
+        m.c[3] = m.z >= 1
+        del m.c[1]
+        # Constraints added after construction are not generated by
+        # the rule
+        m.K.add(4)
+        m.c[4] = m.y[1] + m.z >= 0
+        self.assertEqual(m.c._modified_indices, {2, 3, 4})
+        compiler = self._check_repns(m, m.c)
+        self.assertIsNotNone(compiler.templates[m.c])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,13 +10,20 @@
 #  ___________________________________________________________________________
 #
 
+from array import array
+
 import pyomo.common.unittest as unittest
 
 import pyomo.environ as pyo
 
 from pyomo.common.dependencies import numpy as np, scipy_available, numpy_available
 from pyomo.common.log import LoggingIntercept
-from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.repn.plugins.standard_form import (
+    LinearStandardFormCompiler,
+    QuadraticStandardFormCompiler,
+    _csr_index_arrays,
+)
 
 for sol in ['glpk', 'cbc', 'gurobi', 'cplex', 'xpress']:
     linear_solver = pyo.SolverFactory(sol)
@@ -44,6 +51,88 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         self.assertTrue(np.all(repn.rhs == np.array([-3, 5])))
         self.assertEqual(repn.rows, [(m.c, -1), (m.d, 1)])
         self.assertEqual(repn.columns, [m.x, m.y[1], m.y[3]])
+        self.assertEqual(repn.A.indptr.dtype, repn.A.indices.dtype)
+
+    def test_csr_index_arrays(self):
+        index, index_ptr = _csr_index_arrays(array('i', [0, 2, 1]), array('q', [0, 3]))
+        self.assertEqual(index.dtype, np.intc)
+        self.assertEqual(index_ptr.dtype, np.intc)
+        self.assertEqual(list(index), [0, 2, 1])
+        self.assertEqual(list(index_ptr), [0, 3])
+        # The number of nonzeros is not limited to 2**31
+        index, index_ptr = _csr_index_arrays(
+            array('i', [0, 2, 1]), array('q', [0, 3, 2**31])
+        )
+        self.assertEqual(index.dtype, np.int64)
+        self.assertEqual(index_ptr.dtype, np.int64)
+        self.assertEqual(list(index), [0, 2, 1])
+        self.assertEqual(list(index_ptr), [0, 3, 2**31])
+
+    def test_linear_expression_terms(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.y = pyo.Var([1, 2, 3])
+        m.z = pyo.Var()
+        m.z.fix(2)
+        m.p = pyo.Param(mutable=True, initialize=3)
+        # repeated variables, a fixed variable, a mutable coefficient,
+        # and a constant
+        m.c = pyo.Constraint(
+            expr=m.x + 2 * m.y[1] - m.x + 3 * m.x + m.p * m.y[3] + m.z + 4 >= 1
+        )
+        m.d = pyo.Constraint(expr=pyo.inequality(-1, m.y[2] + m.y[2] + m.x, 5))
+        # (processed by the visitor)
+        m.e = pyo.Constraint(expr=0 * m.y[3] + m.x <= 2)
+        # (trivial constraint)
+        m.f = pyo.Constraint(expr=(None, m.x + m.y[2], None))
+        for con in (m.c, m.d, m.e, m.f):
+            self.assertIs(con.body.__class__, LinearExpression)
+
+        repn = LinearStandardFormCompiler().write(m)
+        self.assertEqual(repn.rows, [(m.c, -1), (m.d, 1), (m.d, -1), (m.e, 1)])
+        self.assertEqual(repn.columns, [m.x, m.y[1], m.y[2], m.y[3]])
+        self.assertTrue(
+            np.all(
+                repn.A
+                == np.array(
+                    [[-3, -2, 0, -3], [1, 0, 2, 0], [-1, 0, -2, 0], [1, 0, 0, 0]]
+                )
+            )
+        )
+        self.assertEqual(repn.A.nnz, 8)
+        self.assertTrue(repn.A.has_canonical_format)
+        self.assertTrue(np.all(repn.rhs == np.array([5, 5, 1, 2])))
+
+        repn = LinearStandardFormCompiler().write(m, mixed_form=True)
+        self.assertEqual(repn.rows, [(m.c, -1), (m.d, 1), (m.d, -1), (m.e, 1)])
+        self.assertTrue(
+            np.all(
+                repn.A
+                == np.array([[3, 2, 0, 3], [1, 0, 2, 0], [1, 0, 2, 0], [1, 0, 0, 0]])
+            )
+        )
+        self.assertEqual(repn.A.nnz, 8)
+        self.assertTrue(np.all(repn.rhs == np.array([-5, 5, -1, 2])))
+
+        repn = LinearStandardFormCompiler().write(m, slack_form=True)
+        self.assertEqual(repn.rows, [(m.c, 1), (m.d, 1), (m.e, 1)])
+        self.assertEqual(
+            [v.name for v in repn.columns],
+            ['x', 'y[1]', 'y[2]', 'y[3]', '_slack_0', '_slack_1', '_slack_2'],
+        )
+        self.assertTrue(
+            np.all(
+                repn.A
+                == np.array(
+                    [
+                        [3, 2, 0, 3, 1, 0, 0],
+                        [1, 0, 2, 0, 0, 1, 0],
+                        [1, 0, 0, 0, 0, 0, 1],
+                    ]
+                )
+            )
+        )
+        self.assertTrue(np.all(repn.rhs == np.array([-5, -1, 2])))
 
     def test_almost_dense_linear_model(self):
         m = pyo.ConcreteModel()
@@ -309,3 +398,193 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         ref = np.array([[1, -1, 0, 5, -5, 0, 0, 0, 0], [-1, 1, 0, 0, 0, -15, 0, 0, 0]])
         self.assertTrue(np.all(repn.c == ref))
         self._verify_solution(soln, repn, True)
+
+    def test_templatize_constraints(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.Set(initialize=[1, 2, 3, 4])
+        m.x = pyo.Var(m.I)
+        m.y = pyo.Var(m.I)
+        m.p = pyo.Param(m.I, initialize=lambda m, i: 2 * i, mutable=True)
+        m.c = pyo.Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] - m.y[i] >= i)
+        m.d = pyo.Constraint(
+            [1, 2, 3], rule=lambda m, i: (0, m.x[i + 1] - m.x[i] + 3 * m.y[i], m.p[i])
+        )
+        m.o = pyo.Objective(expr=sum(m.x.values()))
+
+        for form in ({}, {'slack_form': True}, {'mixed_form': True}):
+            ref = LinearStandardFormCompiler().write(m, **form)
+            repn = LinearStandardFormCompiler().write(
+                m, templatize_constraints=True, **form
+            )
+            self.assertTrue(np.all(repn.c.todense() == ref.c.todense()))
+            self.assertTrue(np.all(repn.A.todense() == ref.A.todense()))
+            self.assertTrue(np.all(repn.rhs == ref.rhs))
+            self.assertEqual(repn.rows, ref.rows)
+            self.assertEqual(
+                [v.name for v in repn.columns], [v.name for v in ref.columns]
+            )
+
+
+@unittest.skipUnless(
+    scipy_available & numpy_available, "standard_form requires scipy and numpy"
+)
+class TestQuadraticStandardFormCompiler(unittest.TestCase):
+    def _model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(-1, 3))
+        m.y = pyo.Var(bounds=(0, None))
+        m.z = pyo.Var()
+        m.w = pyo.Var()
+        m.o = pyo.Objective(
+            expr=m.x**2 + 3 * m.x * m.y + m.y + 2 * m.z * m.z, sense=pyo.maximize
+        )
+        m.c = pyo.Constraint(expr=pyo.inequality(-1, m.x * m.z + m.y, 4))
+        m.d = pyo.Constraint(expr=m.x + m.z >= 1)
+        m.e = pyo.Constraint(expr=m.w**2 <= 2)
+        return m
+
+    def test_quadratic_model(self):
+        m = self._model()
+        repn = QuadraticStandardFormCompiler().write(m)
+
+        self.assertEqual(repn.columns, [m.x, m.y, m.z, m.w])
+        self.assertEqual(repn.rows, [(m.c, 1), (m.c, -1), (m.d, -1), (m.e, 1)])
+        self.assertTrue(np.all(repn.c == np.array([[0, -1, 0, 0]])))
+        self.assertEqual(len(repn.Q), 1)
+        self.assertTrue(
+            np.all(
+                repn.Q[0]
+                == np.array(
+                    [[-2, -3, 0, 0], [-3, 0, 0, 0], [0, 0, -4, 0], [0, 0, 0, 0]]
+                )
+            )
+        )
+        self.assertTrue(
+            np.all(
+                repn.A
+                == np.array([[0, 1, 0, 0], [0, -1, 0, 0], [-1, 0, -1, 0], [0, 0, 0, 0]])
+            )
+        )
+        self.assertTrue(np.all(repn.rhs == np.array([4, 1, -1, 2])))
+        self.assertEqual(sorted(repn.Q_rows), [0, 1, 3])
+        ref = np.array([[0, 0, 1, 0], [0, 0, 0, 0], [1, 0, 0, 0], [0, 0, 0, 0]])
+        self.assertTrue(np.all(repn.Q_rows[0] == ref))
+        self.assertTrue(np.all(repn.Q_rows[1] == -ref))
+        ref = np.array([[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 2]])
+        self.assertTrue(np.all(repn.Q_rows[3] == ref))
+        self.assertEqual(repn.eliminated_vars, [])
+
+    def test_linear_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.y = pyo.Var([1, 2, 3])
+        m.c = pyo.Constraint(expr=m.x + 2 * m.y[1] >= 3)
+        m.d = pyo.Constraint(expr=m.y[1] + 4 * m.y[3] <= 5)
+        m.o = pyo.Objective(expr=m.x + m.y[3])
+
+        ref = LinearStandardFormCompiler().write(m)
+        repn = QuadraticStandardFormCompiler().write(m)
+
+        self.assertTrue(np.all(repn.c.todense() == ref.c.todense()))
+        self.assertTrue(np.all(repn.A.todense() == ref.A.todense()))
+        self.assertTrue(np.all(repn.rhs == ref.rhs))
+        self.assertEqual(repn.rows, ref.rows)
+        self.assertEqual(repn.columns, ref.columns)
+        self.assertEqual(len(repn.Q), 1)
+        self.assertEqual(repn.Q[0].nnz, 0)
+        self.assertEqual(repn.Q[0].shape, (3, 3))
+        self.assertEqual(repn.Q_rows, {})
+
+    def test_nonlinear_error(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x**3 <= 5)
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Model constraint \(c\) contains nonlinear terms that cannot "
+            r"be compiled to standard \(quadratic\) form.",
+        ):
+            QuadraticStandardFormCompiler().write(m)
+
+    def test_alternative_forms(self):
+        m = self._model()
+        rng = np.random.default_rng(42)
+        for form in (
+            {},
+            {'slack_form': True},
+            {'mixed_form': True},
+            {'nonnegative_vars': True},
+        ):
+            repn = QuadraticStandardFormCompiler().write(m, **form)
+            n = len(repn.columns)
+            for q in repn.Q + list(repn.Q_rows.values()):
+                self.assertEqual(q.shape, (n, n))
+                self.assertEqual(abs(q - q.T).sum(), 0)
+
+            # Evaluate the compiled representation at a random point
+            # and compare against the original model
+            x = rng.random(n)
+            for v, val in zip(repn.columns, x):
+                v.set_value(val, skip_validation=True)
+            for v, expr in repn.eliminated_vars:
+                v.set_value(pyo.value(expr), skip_validation=True)
+            obj = repn.c @ x + 0.5 * x @ repn.Q[0] @ x
+            self.assertAlmostEqual(obj[0], -pyo.value(m.o))
+            body = repn.A @ x
+            for r, q in repn.Q_rows.items():
+                body[r] += 0.5 * x @ q @ x
+            slacks = {str(v): v for v in repn.columns}
+            for i, ((con, mult), val) in enumerate(zip(repn.rows, body)):
+                if form.get('slack_form'):
+                    # The slack variables absorb the difference
+                    slack = slacks[f'_slack_{i}'].value
+                    self.assertAlmostEqual(val, pyo.value(con.body) + slack)
+                    continue
+                if form.get('mixed_form'):
+                    mult = 1
+                self.assertAlmostEqual(val, mult * pyo.value(con.body))
+
+        repn = QuadraticStandardFormCompiler().write(m, slack_form=True)
+        self.assertEqual(repn.rows, [(m.c, 1), (m.d, 1), (m.e, 1)])
+        self.assertEqual(
+            list(map(str, repn.columns)),
+            ['x', 'y', 'z', '_slack_0', '_slack_1', 'w', '_slack_2'],
+        )
+        self.assertEqual(
+            [v.bounds for v in repn.columns],
+            [
+                (-1, 3),
+                (0, None),
+                (None, None),
+                (-5, 0),
+                (None, 0),
+                (None, None),
+                (0, None),
+            ],
+        )
+        self.assertTrue(
+            np.all(
+                repn.A
+                == np.array(
+                    [
+                        [0, 1, 0, 1, 0, 0, 0],
+                        [1, 0, 1, 0, 1, 0, 0],
+                        [0, 0, 0, 0, 0, 0, 1],
+                    ]
+                )
+            )
+        )
+        self.assertTrue(np.all(repn.rhs == np.array([-1, 1, 2])))
+        self.assertTrue(np.all(repn.c == np.array([[0, -1, 0, 0, 0, 0, 0]])))
+        Q = np.zeros((7, 7))
+        Q[:2, :2] = [[-2, -3], [-3, 0]]
+        Q[2, 2] = -4
+        self.assertTrue(np.all(repn.Q[0] == Q))
+        # The slack columns do not appear in the quadratic terms
+        self.assertEqual(sorted(repn.Q_rows), [0, 2])
+        Q = np.zeros((7, 7))
+        Q[0, 2] = Q[2, 0] = 1
+        self.assertTrue(np.all(repn.Q_rows[0] == Q))
+        Q = np.zeros((7, 7))
+        Q[5, 5] = 2
+        self.assertTrue(np.all(repn.Q_rows[2] == Q))
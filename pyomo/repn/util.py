@@ -12,12 +12,14 @@
 import collections
 import enum
 import functools
+import gzip
 import itertools
 import logging
 import operator
 import sys
 
 from pyomo.common.collections import Sequence, ComponentMap, ComponentSet
+from pyomo.common.dependencies import attempt_import
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.errors import DeveloperError, InvalidValueError
 from pyomo.common.numeric_types import (
@@ -41,10 +43,14 @@ from pyomo.core.base import (
 )
 from pyomo.core.base.component import ActiveComponent
 from pyomo.core.base.expression import _ExpressionData
+from pyomo.core.base.matrix_constraint import _MatrixConstraintData
+from pyomo.repn.beta.matrix import _LinearMatrixConstraintData
 from pyomo.core.expr.numvalue import is_fixed, value
 import pyomo.core.expr as EXPR
 import pyomo.core.kernel as kernel
 
+zstandard, zstandard_available = attempt_import('zstandard')
+
 logger = logging.getLogger('pyomo.core')
 
 valid_expr_ctypes_minlp = {Var, Param, Expression, Objective}
@@ -60,6 +66,15 @@ _named_subexpression_types = (
     kernel.objective.objective,
 )
 
+# Map of supported output compression formats to the file suffix that
+# identifies them.  Note that 'gzip' is the format that the LP/MPS
+# readers in CBC and GLPK understand natively (when built with zlib).
+compression_suffixes = {'gzip': '.gz', 'zstd': '.zst'}
+
+# Constraint data types whose rows are stored in CSR format (see
+# MatrixConstraintCompiler)
+matrix_constraint_types = {_MatrixConstraintData, _LinearMatrixConstraintData}
+
 HALT_ON_EVALUATION_ERROR = False
 nan = float('nan')
 int_float = {int, float}
@@ -579,6 +594,49 @@ def FileDeterminism_to_SortComponents(file_determinism):
     return SortComponents.UNSORTED
 
 
+def open_output_file(filename, compression=None):
+    """Open a (possibly compressed) text file for writing a model
+
+    If `compression` is ``None``, the compression format is inferred
+    from the suffix of `filename` (so, ``model.lp.gz`` is written
+    through gzip).  Otherwise, the compression suffix is appended to
+    `filename` if it is not already present.
+
+    Returns
+    -------
+    (str, io.TextIOBase)
+        The name of the file actually written and the open stream
+
+    """
+    if compression is None:
+        for compression, suffix in compression_suffixes.items():
+            if filename.endswith(suffix):
+                break
+        else:
+            return filename, open(filename, 'w', newline='')
+    elif compression not in compression_suffixes:
+        raise ValueError(
+            f"Unrecognized output compression format '{compression}': "
+            f"expected one of {sorted(compression_suffixes)}"
+        )
+    suffix = compression_suffixes[compression]
+    if not filename.endswith(suffix):
+        filename += suffix
+    if compression == 'gzip':
+        # The default compresslevel (9) is several times slower than
+        # level 1 while only saving a few percent more on the
+        # (very repetitive) LP/MPS formats.
+        return filename, gzip.open(filename, 'wt', compresslevel=1, newline='')
+    if not zstandard_available:
+        raise RuntimeError(
+            "Writing zstd-compressed model files requires the 'zstandard' "
+            "package, which is not available"
+        )
+    return filename, zstandard.open(
+        filename, 'wt', cctx=zstandard.ZstdCompressor(level=3), newline=''
+    )
+
+
 def initialize_var_map_from_column_order(model, config, var_map):
     column_order = config.column_order
     sorter = FileDeterminism_to_SortComponents(config.file_determinism)
@@ -670,6 +728,138 @@ def ordered_active_constraints(model, config):
     return sorted(constraints, key=lambda x: _row_getter(id(x), _n))
 
 
+class MatrixConstraintCompiler(object):
+    """Compile the rows of MatrixConstraint components directly from
+    their CSR data.
+
+    Writers normally reach each row of a
+    :py:class:`~pyomo.core.base.matrix_constraint.MatrixConstraint` (or
+    :py:class:`~pyomo.repn.beta.matrix.MatrixConstraint`, as generated
+    by ``compile_block_linear_constraints()``) through its ``body``
+    property, which builds (and the writer then
+    walks) a LinearExpression for every row.  This compiler converts
+    the CSR arrays of each MatrixConstraint to Python lists once (per
+    write) and generates the ``(constant, linear)`` terms for each row
+    directly, following the same variable recording and fixed variable
+    conventions as the writer's visitor.
+
+    Parameters
+    ----------
+    visitor:
+        The writer's expression visitor (provides ``var_map`` and
+        ``check_constant()``)
+
+    record_var: function
+        ``record_var(visitor, var)``: add an unfixed variable to the
+        visitor's ``var_map``
+
+    fixed_var_value: function
+        ``fixed_var_value(visitor, var)``: return the (checked) value of
+        a fixed variable (defaults to ``visitor.check_constant(var.value,
+        var)``)
+
+    """
+
+    def __init__(self, visitor, record_var, fixed_var_value=None):
+        self.visitor = visitor
+        self.record_var = record_var
+        if fixed_var_value is None:
+            fixed_var_value = _fixed_var_value
+        self.fixed_var_value = fixed_var_value
+        self._csr = {}
+
+    def _get_csr(self, comp):
+        ans = self._csr.get(id(comp), None)
+        if ans is not None:
+            return ans
+        if hasattr(comp, '_A_data'):
+            # pyomo.core.base.matrix_constraint.MatrixConstraint
+            data, indices, indptr, x = (
+                comp._A_data,
+                comp._A_indices,
+                comp._A_indptr,
+                comp._x,
+            )
+        else:
+            # pyomo.repn.beta.matrix.MatrixConstraint
+            data, indices, indptr, x = (
+                comp._vals,
+                comp._jcols,
+                comp._prows,
+                comp._varmap,
+            )
+        x = [x[j] for j in range(len(x))]
+        check_constant = self.visitor.check_constant
+        data = _as_list(data)
+        if not all(c.__class__ in native_numeric_types for c in data):
+            data = [
+                (
+                    c
+                    if c.__class__ in native_numeric_types
+                    else check_constant(value(c), c)
+                )
+                for c in data
+            ]
+        # Note: holding the component prevents its id() from being reused
+        ans = self._csr[id(comp)] = (
+            comp,
+            data,
+            _as_list(indices),
+            _as_list(indptr),
+            x,
+            list(map(id, x)),
+        )
+        return ans
+
+    def compile_row(self, con):
+        """Return the ``(constant, linear)`` terms for a MatrixConstraint row"""
+        _, data, indices, indptr, x, x_ids = self._get_csr(con.parent_component())
+        visitor = self.visitor
+        var_map = visitor.var_map
+        i = con._index
+        start = indptr[i]
+        end = indptr[i + 1]
+        # Fast path: all the variables in this row have already been
+        # recorded, and there are no zero (or duplicate) coefficients
+        ids = list(map(x_ids.__getitem__, indices[start:end]))
+        coefs = data[start:end]
+        if all(coefs) and all(map(var_map.__contains__, ids)):
+            linear = dict(zip(ids, coefs))
+            if len(linear) == len(ids):
+                return 0, linear
+        const = 0
+        linear = {}
+        for p in range(start, end):
+            coef = data[p]
+            if not coef:
+                continue
+            v = x[indices[p]]
+            _id = id(v)
+            if _id in linear:
+                linear[_id] += coef
+            elif _id in var_map:
+                linear[_id] = coef
+            elif v.fixed:
+                const += coef * self.fixed_var_value(visitor, v)
+            else:
+                self.record_var(visitor, v)
+                linear[_id] = coef
+        return const, linear
+
+
+def _fixed_var_value(visitor, var):
+    return visitor.check_constant(var.value, var)
+
+
+def _as_list(data):
+    try:
+        # numpy arrays: this is much faster than iterating over the
+        # array (and returns native Python types)
+        return data.tolist()
+    except AttributeError:
+        return list(data)
+
+
 # Copied from cpxlp.py:
 # Keven Hunter made a nice point about using %.16g in his attachment
 # to ticket #4319. I am adjusting this to %.17g as this mocks the
@@ -75,12 +75,16 @@ class PyomoMIPConverter(object):
                         **io_options
                     )
                 else:
-                    (problem_filename, symbol_map_id) = instance.write(
+                    (written_filename, symbol_map_id) = instance.write(
                         filename=problem_filename,
                         format=ProblemFormat.cpxlp,
                         solver_capability=capabilities,
                         io_options=io_options,
                     )
+                    if written_filename != problem_filename:
+                        # The writer added a suffix (e.g., for compression)
+                        TempfileManager.add_tempfile(written_filename)
+                        problem_filename = written_filename
                 return (problem_filename,), symbol_map_id
             else:
                 #
@@ -181,12 +185,16 @@ class PyomoMIPConverter(object):
                         **io_options
                     )
                 else:
-                    (problem_filename, symbol_map_id) = instance.write(
+                    (written_filename, symbol_map_id) = instance.write(
                         filename=problem_filename,
                         format=args[1],
                         solver_capability=capabilities,
                         io_options=io_options,
                     )
+                    if written_filename != problem_filename:
+                        # The writer added a suffix (e.g., for compression)
+                        TempfileManager.add_tempfile(written_filename)
+                        problem_filename = written_filename
                 return (problem_filename,), symbol_map_id
             else:
                 #
@@ -331,8 +331,10 @@ class CBCSHELL(SystemCallSolver):
         # the prefix of the problem filename is required because CBC has a specific
         # and automatic convention for generating the output solution filename.
         # the extracted prefix is the same name as the input filename, e.g., minus
-        # the ".lp" extension.
+        # the ".lp" extension (and any compression extension, e.g., ".lp.gz").
         problem_filename_prefix = problem_files[0]
+        if problem_filename_prefix.endswith('.gz'):
+            problem_filename_prefix = problem_filename_prefix[:-3]
         if '.' in problem_filename_prefix:
             tmp = problem_filename_prefix.split('.')
             if len(tmp) > 2:
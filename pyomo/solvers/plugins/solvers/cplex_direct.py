@@ -917,33 +917,21 @@ class CPLEXDirect(DirectSolver):
                 )
 
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_ndx_map
-        if vars_to_load is None:
-            vals = self._solver_model.solution.get_values()
-            vars_to_load = var_map.keys()
-        else:
-            cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-            vals = self._solver_model.solution.get_values(cplex_vars_to_load)
-
-        for pyomo_var, val in zip(vars_to_load, vals):
-            if self._referenced_variables[pyomo_var] > 0:
-                pyomo_var.set_value(val, skip_validation=True)
+        self._load_var_attribute(
+            self._solver_model.solution.get_values,
+            vars_to_load,
+            var_map=self._pyomo_var_to_ndx_map,
+        )
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.solution.get_reduced_costs(cplex_vars_to_load)
-
-        for i, pyomo_var in enumerate(vars_to_load):
-            if ref_vars[pyomo_var] > 0:
-                rc[pyomo_var] = vals[i]
+        self._load_var_attribute(
+            self._solver_model.solution.get_reduced_costs,
+            vars_to_load,
+            suffix=self._pyomo_model.rc,
+            var_map=self._pyomo_var_to_ndx_map,
+        )
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -962,9 +950,9 @@ class CPLEXDirect(DirectSolver):
             )
             vals = self._solver_model.solution.get_dual_values(linear_cons_to_load)
 
-        for i, cplex_con in enumerate(linear_cons_to_load):
-            pyomo_con = reverse_con_map[cplex_con]
-            dual[pyomo_con] = vals[i]
+        self._load_suffix_values(
+            dual, [reverse_con_map[con] for con in linear_cons_to_load], vals
+        )
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
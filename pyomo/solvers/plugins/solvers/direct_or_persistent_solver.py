@@ -9,19 +9,30 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import logging
+
 from pyomo.core.base.PyomoModel import Model
 from pyomo.core.base.block import Block, _BlockData
+from pyomo.core.base.var import _GeneralVarData, _ArrayVarData
 from pyomo.core.kernel.block import IBlock
+from pyomo.core.kernel.variable import variable
 from pyomo.opt.base.solvers import OptSolver
 from pyomo.core.base import SymbolMap, NumericLabeler, TextLabeler
 import pyomo.common
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import ComponentMap, ComponentSet, Bunch
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.timing import TicTocTimer
 import pyomo.opt.base.solvers
 from pyomo.opt.base.formats import ResultsFormat
 from pyomo.core.staleflag import StaleFlagManager
 
+timing_logger = logging.getLogger('pyomo.common.timing.solution')
+
+# VarData types whose value and stale flag can be written directly
+_simple_var_types = (_GeneralVarData, variable)
+
 
 class DirectOrPersistentSolver(OptSolver):
     """
@@ -295,6 +306,114 @@ class DirectOrPersistentSolver(OptSolver):
         self._load_vars(vars_to_load)
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
+    def _solver_vars_to_load(self, vars_to_load=None, var_map=None):
+        """Return the referenced pyomo variables in `vars_to_load` and the
+        corresponding solver variables (or column indices).
+
+        Variables that do not appear in any constraint or objective are
+        skipped.  If `vars_to_load` is None, all variables in the solver
+        model are returned (in the order they were added).
+
+        Parameters
+        ----------
+        vars_to_load: list of Var
+        var_map: ComponentMap
+            The map from pyomo variables to solver variables (defaults
+            to ``_pyomo_var_to_solver_var_map``)
+        """
+        if var_map is None:
+            var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
+        pyomo_vars = []
+        solver_vars = []
+        if vars_to_load is None:
+            for var, solver_var in var_map.items():
+                if ref_vars[var] > 0:
+                    pyomo_vars.append(var)
+                    solver_vars.append(solver_var)
+        else:
+            for var in vars_to_load:
+                if ref_vars[var] > 0:
+                    pyomo_vars.append(var)
+                    solver_vars.append(var_map[var])
+        return pyomo_vars, solver_vars
+
+    def _load_var_attribute(
+        self, get_values, vars_to_load=None, suffix=None, var_map=None
+    ):
+        """Load a solver variable attribute into the pyomo model
+
+        This is the shared implementation of :meth:`_load_vars` and
+        :meth:`_load_rc`.  The referenced pyomo variables are mapped to
+        their solver variables (see :meth:`_solver_vars_to_load`), and
+        `get_values` is called once with the list of solver variables to
+        retrieve the attribute values (as a list or numpy array).  The
+        values are then loaded into `suffix` or, if `suffix` is None,
+        into the variable values.
+
+        The time spent in each phase is reported to the
+        ``pyomo.common.timing.solution`` logger.
+        """
+        timer = TicTocTimer(logger=timing_logger)
+        pyomo_vars, solver_vars = self._solver_vars_to_load(vars_to_load, var_map)
+        timer.toc('Mapped %s variables to the solver model', len(pyomo_vars))
+        vals = get_values(solver_vars)
+        timer.toc('Retrieved the solver values')
+        if suffix is None:
+            self._load_var_values(pyomo_vars, vals)
+            timer.toc('Loaded %s variable values', len(pyomo_vars))
+        else:
+            self._load_suffix_values(suffix, pyomo_vars, vals)
+            timer.toc('Loaded %s values into Suffix %s', len(pyomo_vars), suffix.name)
+
+    def _load_var_values(self, vars_to_load, vals):
+        """Set the values of the pyomo variables `vars_to_load`
+
+        Values returned by the solver are neither validated nor unit
+        converted, so (for the common VarData types) they are written
+        directly into the VarData (or into the Var array storage) instead
+        of going through :meth:`set_value`.  The stale flags are updated
+        once for the whole batch: all loaded variables are marked as not
+        stale.
+        """
+        if numpy_available and isinstance(vals, np.ndarray):
+            vals = vals.tolist()
+        simple_vars = []
+        simple_vals = []
+        arrays = {}
+        current = 0
+        for var, val in zip(vars_to_load, vals):
+            if isinstance(var, _simple_var_types):
+                simple_vars.append(var)
+                simple_vals.append(val)
+                if var._stale > current:
+                    current = var._stale
+            elif var.__class__ is _ArrayVarData:
+                storage = var._storage
+                if id(storage) not in arrays:
+                    arrays[id(storage)] = (storage, [], [])
+                arrays[id(storage)][1].append(var._pos)
+                arrays[id(storage)][2].append(val)
+            else:
+                var.set_value(val, skip_validation=True)
+        for storage, pos, array_vals in arrays.values():
+            current = max(current, int(storage.stale[pos].max()))
+        # As in set_value(), the global stale flag only advances if we
+        # are updating a variable that is not stale
+        flag = StaleFlagManager.get_flag(current)
+        for var, val in zip(simple_vars, simple_vals):
+            var._value = val
+            var._stale = flag
+        for storage, pos, array_vals in arrays.values():
+            storage.value[pos] = array_vals
+            storage.stale[pos] = flag
+
+    def _load_suffix_values(self, suffix, components, vals):
+        """Store the solver values `vals` for `components` in `suffix`"""
+        if numpy_available and isinstance(vals, np.ndarray):
+            vals = vals.tolist()
+        suffix.update_values(zip(components, vals), expand=False)
+
     """ This method should be implemented by subclasses."""
 
     def warm_start_capable(self):
@@ -997,33 +997,19 @@ class GurobiDirect(DirectSolver):
         self._needs_updated = True
 
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getAttr("X", gurobi_vars_to_load)
-
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                var.set_value(val, skip_validation=True)
+        self._load_var_attribute(
+            lambda gurobi_vars: self._solver_model.getAttr("X", gurobi_vars),
+            vars_to_load,
+        )
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getAttr("Rc", gurobi_vars_to_load)
-
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
+        self._load_var_attribute(
+            lambda gurobi_vars: self._solver_model.getAttr("Rc", gurobi_vars),
+            vars_to_load,
+            suffix=self._pyomo_model.rc,
+        )
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -1051,13 +1037,15 @@ class GurobiDirect(DirectSolver):
         if self._version_major >= 5:
             quadratic_vals = self._solver_model.getAttr("QCPi", quadratic_cons_to_load)
 
-        for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
-            pyomo_con = reverse_con_map[gurobi_con]
-            dual[pyomo_con] = val
+        self._load_suffix_values(
+            dual, [reverse_con_map[con] for con in linear_cons_to_load], linear_vals
+        )
         if self._version_major >= 5:
-            for gurobi_con, val in zip(quadratic_cons_to_load, quadratic_vals):
-                pyomo_con = reverse_con_map[gurobi_con]
-                dual[pyomo_con] = val
+            self._load_suffix_values(
+                dual,
+                [reverse_con_map[con] for con in quadratic_cons_to_load],
+                quadratic_vals,
+            )
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
@@ -16,7 +16,7 @@ import itertools
 import operator
 import pyomo.core.base.var
 import pyomo.core.base.constraint
-from pyomo.common.dependencies import attempt_import
+from pyomo.common.dependencies import attempt_import, numpy as np, numpy_available
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.core import is_fixed, value, minimize, maximize
 from pyomo.core.base.suffix import Suffix
@@ -1076,38 +1076,36 @@ class MOSEKDirect(DirectSolver):
                 mosek.iparam.mio_construct_sol, mosek.onoffkey.on
             )
 
-    def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
+    def _get_column_values(self, get_values, mosek_vars):
+        # MOSEK returns the values for all columns in a single array:
+        # select the columns (indices) for mosek_vars
+        vals = [0.0] * self._solver_model.getnumvar()
+        get_values(vals)
+        if numpy_available:
+            return np.array(vals)[mosek_vars]
+        return [vals[i] for i in mosek_vars]
 
-        mosek_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        var_vals = [0.0] * len(mosek_vars_to_load)
-        self._solver_model.getxx(self._whichsol, var_vals)
+    def _load_vars(self, vars_to_load=None):
+        def get_values(vals):
+            self._solver_model.getxx(self._whichsol, vals)
 
-        for var, val in zip(vars_to_load, var_vals):
-            if ref_vars[var] > 0:
-                var.set_value(val, skip_validation=True)
+        self._load_var_attribute(
+            lambda mosek_vars: self._get_column_values(get_values, mosek_vars),
+            vars_to_load,
+        )
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        mosek_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = [0.0] * len(mosek_vars_to_load)
-        self._solver_model.getreducedcosts(
-            self._whichsol, 0, len(mosek_vars_to_load), vals
-        )
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
+        def get_values(vals):
+            self._solver_model.getreducedcosts(self._whichsol, 0, len(vals), vals)
+
+        self._load_var_attribute(
+            lambda mosek_vars: self._get_column_values(get_values, mosek_vars),
+            vars_to_load,
+            suffix=self._pyomo_model.rc,
+        )
 
     def _load_duals(self, objs_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -1123,9 +1121,9 @@ class MOSEKDirect(DirectSolver):
             mosek_cons_to_load = range(self._solver_model.getnumcon())
             vals = [0.0] * len(mosek_cons_to_load)
             self._solver_model.gety(self._whichsol, vals)
-            for mosek_con, val in zip(mosek_cons_to_load, vals):
-                pyomo_con = reverse_con_map[mosek_con]
-                dual[pyomo_con] = val
+            self._load_suffix_values(
+                dual, [reverse_con_map[con] for con in mosek_cons_to_load], vals
+            )
             """TODO wrong length, needs to be getnumvars()
             # cones
             mosek_cones_to_load = range(self._solver_model.getnumcone())
@@ -978,33 +978,14 @@ class XpressDirect(DirectSolver):
         self._solver_model.addmipsol(mipsolval, mipsolcol)
 
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        xpress_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getSolution(xpress_vars_to_load)
-
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                var.set_value(val, skip_validation=True)
+        self._load_var_attribute(self._solver_model.getSolution, vars_to_load)
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        xpress_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getRCost(xpress_vars_to_load)
-
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
+        self._load_var_attribute(
+            self._solver_model.getRCost, vars_to_load, suffix=self._pyomo_model.rc
+        )
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -1018,8 +999,7 @@ class XpressDirect(DirectSolver):
         xpress_cons_to_load = [con_map[pyomo_con] for pyomo_con in cons_to_load]
         vals = self._solver_model.getDual(xpress_cons_to_load)
 
-        for pyomo_con, val in zip(cons_to_load, vals):
-            dual[pyomo_con] = val
+        self._load_suffix_values(dual, cons_to_load, vals)
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
@@ -0,0 +1,138 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import logging
+
+import pyomo.common.unittest as unittest
+import pyomo.kernel as pmo
+from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.log import LoggingIntercept
+from pyomo.environ import ConcreteModel, Var, Suffix
+from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import (
+    DirectOrPersistentSolver,
+)
+
+
+class MockDirectSolver(DirectOrPersistentSolver):
+    """A direct solver whose "solver model" is a list of column values"""
+
+    def __init__(self, model, variables, referenced=None):
+        super().__init__(type='mock_direct')
+        self._pyomo_model = model
+        self._solver_model = []
+        for i, var in enumerate(variables):
+            self._pyomo_var_to_solver_var_map[var] = i
+            self._referenced_variables[var] = 1
+            self._solver_model.append(10.0 * (i + 1))
+        if referenced is not None:
+            referenced = ComponentSet(referenced)
+            for var in variables:
+                if var not in referenced:
+                    self._referenced_variables[var] = 0
+        self.requested = None
+
+    def _get_values(self, cols):
+        self.requested = cols
+        return np.array(self._solver_model)[cols] if numpy_available else None
+
+    def _load_vars(self, vars_to_load=None):
+        self._load_var_attribute(self._get_values, vars_to_load)
+
+    def _load_rc(self, vars_to_load=None):
+        if not hasattr(self._pyomo_model, 'rc'):
+            self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
+        self._load_var_attribute(
+            lambda cols: [-self._solver_model[i] for i in cols],
+            vars_to_load,
+            suffix=self._pyomo_model.rc,
+        )
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestBulkSolutionLoading(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.y = Var([1, 2], storage='array')
+        m.z = Var()
+        return m
+
+    def test_load_vars(self):
+        m = self._model()
+        variables = [m.x[1], m.y[2], m.x[2], m.y[1], m.z, m.x[3]]
+        opt = MockDirectSolver(m, variables, referenced=variables[:-1])
+        opt.load_vars()
+        self.assertEqual(opt.requested, [0, 1, 2, 3, 4])
+        self.assertEqual(m.x[1].value, 10)
+        self.assertEqual(m.y[2].value, 20)
+        self.assertEqual(m.x[2].value, 30)
+        self.assertEqual(m.y[1].value, 40)
+        self.assertEqual(m.z.value, 50)
+        # unreferenced variables are not loaded
+        self.assertIsNone(m.x[3].value)
+        self.assertIs(type(m.x[1].value), float)
+        self.assertEqual([v.stale for v in variables], [False] * 5 + [True])
+
+        # Loading a subset marks all other variables as stale
+        opt.load_vars([m.y[1], m.x[3], m.x[2]])
+        self.assertEqual(opt.requested, [3, 2])
+        self.assertEqual(
+            [v.stale for v in variables], [True, True, False, False, True, True]
+        )
+        # ... and the (delayed) stale flag behaves as if set_value() was
+        # called: updating a stale variable does not advance the flag,
+        # but updating a loaded variable does
+        m.x[1].value = 5
+        self.assertEqual(
+            [v.stale for v in variables], [False, True, False, False, True, True]
+        )
+        m.x[2].value = 5
+        self.assertEqual(
+            [v.stale for v in variables], [True, True, False, True, True, True]
+        )
+
+    def test_load_kernel_vars(self):
+        b = pmo.block()
+        b.x = pmo.variable()
+        b.y = pmo.variable()
+        opt = MockDirectSolver(b, [b.x, b.y])
+        opt.load_vars([b.y])
+        self.assertIsNone(b.x.value)
+        self.assertEqual(b.y.value, 20)
+        self.assertFalse(b.y.stale)
+
+    def test_load_rc(self):
+        m = self._model()
+        variables = [m.x[1], m.x[2], m.z]
+        opt = MockDirectSolver(m, variables, referenced=variables[1:])
+        opt._load_rc()
+        self.assertEqual(len(m.rc), 2)
+        self.assertEqual(m.rc[m.x[2]], -20)
+        self.assertEqual(m.rc[m.z], -30)
+
+    def test_timing(self):
+        m = self._model()
+        opt = MockDirectSolver(m, list(m.x.values()))
+        with LoggingIntercept(
+            module='pyomo.common.timing.solution', level=logging.INFO
+        ) as LOG:
+            opt.load_vars()
+        self.assertRegex(
+            LOG.getvalue(),
+            r'\[\+ *\d+\.\d+\] Mapped 3 variables to the solver model\n'
+            r'\[\+ *\d+\.\d+\] Retrieved the solver values\n'
+            r'\[\+ *\d+\.\d+\] Loaded 3 variable values\n',
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
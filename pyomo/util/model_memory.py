@@ -0,0 +1,238 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""This module contains functions to estimate the memory used by a Pyomo model."""
+
+import enum
+import logging
+import sys
+from collections import Counter
+from itertools import islice
+
+from pyomo.common.collections import Bunch
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.numeric_types import native_types
+from pyomo.core.base.block import Block
+from pyomo.core.expr.numeric_expr import LinearArrayExpression
+from pyomo.core.pyomoobject import PyomoObject
+
+default_logger = logging.getLogger('pyomo.util.model_memory')
+default_logger.setLevel(logging.INFO)
+
+_CATEGORIES = ('component', 'index', 'data', 'expression')
+_container_types = (list, tuple, dict, set, frozenset)
+
+
+class ModelMemoryReport(Bunch):
+    """Stores the (approximate) memory used by a model.
+
+    The report attributes bytes to each component in the block
+    hierarchy (``components``, keyed by component name):
+
+    - ``component``: the component object itself
+    - ``index``: the keys of the component data dictionary
+    - ``data``: the component data objects (and the values they hold)
+    - ``expression``: the expression trees held by the component data
+
+    along with the number of expression nodes (``expression_nodes``).
+    The same information is aggregated by component type (``ctypes``),
+    so the ``Set`` entry accounts for the index sets and the ``Suffix``
+    entry for the Suffix maps, and over the whole model (``total``).
+    ``expression_nodes`` counts the expression nodes by expression type.
+
+    Sizes are computed using :py:func:`sys.getsizeof`.  Each object is
+    only counted once: objects shared by several components are
+    attributed to the first component that references them, and
+    objects that are not part of the model (e.g., global Sets like
+    Reals) are not counted.
+
+    """
+
+    pass
+
+
+def _new_entry(**kwds):
+    return Bunch(
+        component=0, index=0, data=0, expression=0, total=0, expression_nodes=0, **kwds
+    )
+
+
+class _MemoryCounter(object):
+    def __init__(self):
+        self.seen = set()
+        self.expression_nodes = Counter()
+
+    def count_object(self, obj, entry, category, skip=()):
+        """Count an object and the (non-component) values it holds"""
+        if id(obj) in self.seen:
+            return
+        self.seen.add(id(obj))
+        entry[category] += sys.getsizeof(obj)
+        auto_slots = getattr(obj.__class__, '__auto_slots__', None)
+        if auto_slots is not None:
+            slots = auto_slots.slots
+        else:
+            slots = getattr(obj.__class__, '__slots__', ())
+            if slots.__class__ is str:
+                slots = (slots,)
+        for attr in slots:
+            if attr not in skip:
+                self.count_value(getattr(obj, attr, None), entry, category)
+        fields = getattr(obj, '__dict__', None)
+        if fields is not None and id(fields) not in self.seen:
+            self.seen.add(id(fields))
+            entry[category] += sys.getsizeof(fields)
+            for attr, val in fields.items():
+                if attr not in skip:
+                    self.count_value(val, entry, category)
+
+    def count_value(self, val, entry, category):
+        if id(val) in self.seen:
+            return
+        if val.__class__ in native_types:
+            self.seen.add(id(val))
+            entry[category] += sys.getsizeof(val)
+        elif isinstance(val, _container_types):
+            self.seen.add(id(val))
+            entry[category] += sys.getsizeof(val)
+            if isinstance(val, dict):
+                for k, v in val.items():
+                    self.count_value(k, entry, category)
+                    self.count_value(v, entry, category)
+            else:
+                for v in val:
+                    self.count_value(v, entry, category)
+        elif isinstance(val, PyomoObject):
+            # Components and component data are counted with their
+            # parent component.  Only expressions are attributed to the
+            # component data that holds them.
+            if val.is_expression_type() and not val.is_named_expression_type():
+                self.count_expression(val, entry)
+        elif numpy_available and isinstance(val, np.ndarray):
+            self.seen.add(id(val))
+            entry[category] += sys.getsizeof(val)
+        elif (
+            val.__class__.__module__.startswith('pyomo.')
+            and not isinstance(val, (type, enum.Enum))
+            and not callable(val)
+        ):
+            # Helper objects (e.g., initializers or array storage)
+            self.count_object(val, entry, category)
+
+    def count_expression(self, expr, entry):
+        nodes = self.expression_nodes
+        seen = self.seen
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            if node.__class__ in native_types:
+                seen.add(id(node))
+                entry.expression += sys.getsizeof(node)
+                continue
+            if not isinstance(node, PyomoObject) or not node.is_expression_type():
+                # Leaf nodes (Vars, Params) are counted with their
+                # components
+                continue
+            if node.is_named_expression_type():
+                # Named expressions are counted with their components
+                continue
+            seen.add(id(node))
+            nodes[node.__class__.__name__] += 1
+            entry.expression_nodes += 1
+            entry.expression += sys.getsizeof(node)
+            if isinstance(node, LinearArrayExpression):
+                # Do not generate the args for array-based expressions
+                for arg in (node._linear_coefs, node._linear_vars):
+                    seen.add(id(arg))
+                    entry.expression += sys.getsizeof(arg)
+                stack.append(node._constant)
+                stack.extend(node._linear_coefs)
+                continue
+            args = node._args_
+            if id(args) not in seen:
+                seen.add(id(args))
+                entry.expression += sys.getsizeof(args)
+            stack.extend(islice(args, node.nargs()))
+
+    def count_component(self, comp):
+        entry = _new_entry(ctype=comp.ctype.__name__)
+        self.count_object(comp, entry, 'component', skip=('_data',))
+        anonymous_sets = getattr(comp, '_anonymous_sets', None)
+        if anonymous_sets is not None:
+            # Implicitly declared sets (e.g., for Var([1, 2, 3])) are
+            # attributed to the component index
+            for _set in anonymous_sets:
+                self.count_object(_set, entry, 'index')
+        if comp.is_indexed() and not comp.is_reference():
+            _data = comp._data
+            if id(_data) not in self.seen:
+                self.seen.add(id(_data))
+                entry.index += sys.getsizeof(_data)
+            for idx, obj in _data.items():
+                self.count_value(idx, entry, 'index')
+                self.count_object(obj, entry, 'data')
+        entry.total = sum(entry[category] for category in _CATEGORIES)
+        return entry
+
+
+def model_memory_report(block):
+    """Build a report of the (approximate) memory used by a model.
+
+    Parameters
+    ----------
+    block: BlockData
+        The block to report on.  The report includes all components in
+        the block hierarchy (including deactivated components).
+
+    Returns
+    -------
+    ModelMemoryReport
+
+    """
+    counter = _MemoryCounter()
+    report = ModelMemoryReport()
+    report.components = {}
+    report.ctypes = {}
+    report.total = _new_entry()
+
+    def _record(name, entry):
+        report.components[name] = entry
+        ctype = report.ctypes.get(entry.ctype, None)
+        if ctype is None:
+            ctype = report.ctypes[entry.ctype] = _new_entry(count=0)
+        ctype.count += 1
+        for key in _CATEGORIES + ('total', 'expression_nodes'):
+            ctype[key] += entry[key]
+            report.total[key] += entry[key]
+
+    # The root block's own storage (component declarations, etc.)
+    root = _new_entry(ctype=block.parent_component().ctype.__name__)
+    counter.count_object(block, root, 'data')
+    root.total = root.data
+    _record(block.name, root)
+
+    blocks = [block]
+    while blocks:
+        blk = blocks.pop()
+        for comp in blk.component_objects(descend_into=False):
+            _record(comp.name, counter.count_component(comp))
+            if isinstance(comp, Block) and not comp.is_reference():
+                blocks.extend(comp.values())
+
+    report.expression_nodes = dict(counter.expression_nodes)
+    return report
+
+
+def log_model_memory_report(block, logger=default_logger):
+    """Generate a report logging the memory used by a model."""
+    logger.info(model_memory_report(block))
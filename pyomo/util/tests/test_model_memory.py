@@ -0,0 +1,148 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Tests for the model memory report utility."""
+
+import logging
+
+import pyomo.common.unittest as unittest
+from pyomo.common.log import LoggingIntercept
+from pyomo.core import (
+    Block,
+    ConcreteModel,
+    Constraint,
+    Expression,
+    Objective,
+    Param,
+    RangeSet,
+    Set,
+    Suffix,
+    Var,
+    exp,
+    linear_sum,
+)
+from pyomo.util.model_memory import model_memory_report, log_model_memory_report
+
+_CATEGORIES = ('component', 'index', 'data', 'expression')
+
+
+class TestModelMemoryReport(unittest.TestCase):
+    """Tests for model memory report utility."""
+
+    def _model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(10)
+        m.J = Set(initialize=['a', 'b'])
+        m.x = Var(m.I, m.J, bounds=(0, 1))
+        m.y = Var([1, 2])
+        m.p = Param(m.I, initialize=lambda m, i: i * 1.5, mutable=True)
+        m.c = Constraint(
+            m.I, rule=lambda m, i: sum(m.x[i, j] for j in m.J) * m.p[i] <= exp(m.y[1])
+        )
+        m.e = Expression(expr=m.y[1] ** 2)
+        m.o = Objective(expr=m.e + linear_sum([1, 2], [m.y[1], m.y[2]]))
+        m.b = Block()
+        m.b.z = Var()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        return m
+
+    def test_empty_model(self):
+        report = model_memory_report(ConcreteModel())
+        self.assertEqual(list(report.components), ['unknown'])
+        self.assertEqual(report.total.expression, 0)
+        self.assertEqual(report.total.expression_nodes, 0)
+        self.assertEqual(report.expression_nodes, {})
+        self.assertGreater(report.total.total, 0)
+
+    def test_model(self):
+        m = self._model()
+        report = model_memory_report(m)
+        self.assertEqual(
+            list(report.components),
+            ['unknown', 'I', 'J', 'x', 'y', 'p', 'c', 'e', 'o', 'b', 'dual', 'b.z'],
+        )
+        # The totals are consistent
+        for entry in report.components.values():
+            self.assertEqual(entry.total, sum(entry[c] for c in _CATEGORIES))
+        for key in _CATEGORIES + ('total', 'expression_nodes'):
+            self.assertEqual(
+                report.total[key], sum(e[key] for e in report.components.values())
+            )
+            self.assertEqual(
+                report.total[key], sum(e[key] for e in report.ctypes.values())
+            )
+        self.assertEqual(report.ctypes['Var'].count, 3)
+        self.assertEqual(report.ctypes['Block'].count, 2)
+
+        # Each constraint holds the relational expression
+        #   Inequality(Product(Linear(x, x), p), UnaryFunction(y))
+        # and the (normalized) body
+        #   Sum(Product(...), Negation(UnaryFunction(y)))
+        self.assertEqual(report.components['c'].expression_nodes, 60)
+        self.assertEqual(report.components['e'].expression_nodes, 1)
+        # The objective does not count the (named) expression e
+        self.assertEqual(report.components['o'].expression_nodes, 2)
+        self.assertEqual(
+            report.expression_nodes,
+            {
+                'InequalityExpression': 10,
+                'ProductExpression': 10,
+                'LinearExpression': 10,
+                'UnaryFunctionExpression': 10,
+                'NegationExpression': 10,
+                'PowExpression': 1,
+                'SumExpression': 11,
+                'LinearArrayExpression': 1,
+            },
+        )
+        self.assertEqual(report.components['x'].expression, 0)
+        self.assertGreater(report.components['x'].index, 0)
+        self.assertGreater(report.components['x'].data, 0)
+        self.assertGreater(report.components['c'].expression, 0)
+
+        # Suffix data is attributed to the Suffix
+        empty = report.components['dual'].total
+        for c in m.c.values():
+            m.dual[c] = 1.5
+        report = model_memory_report(m)
+        self.assertGreater(report.components['dual'].total, empty)
+        self.assertEqual(report.ctypes['Suffix'].total, report.components['dual'].total)
+
+    def test_shared_expressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        e = m.x**2 + 1
+        m.c1 = Constraint(expr=e <= 5)
+        m.c2 = Constraint(expr=e >= 1)
+        report = model_memory_report(m)
+        # The shared expression is only counted (once) by c1
+        self.assertEqual(report.components['c1'].expression_nodes, 3)
+        self.assertEqual(report.components['c2'].expression_nodes, 1)
+        self.assertEqual(report.expression_nodes['InequalityExpression'], 2)
+
+    def test_sub_block(self):
+        m = self._model()
+        report = model_memory_report(m.b)
+        self.assertEqual(list(report.components), ['b', 'b.z'])
+        self.assertEqual(report.total.expression_nodes, 0)
+
+    def test_log_model_memory_report(self):
+        m = self._model()
+        with LoggingIntercept(
+            module='pyomo.util.model_memory', level=logging.INFO
+        ) as LOG:
+            log_model_memory_report(m)
+        self.assertIn('expression_nodes', LOG.getvalue())
+        self.assertIn('Constraint', LOG.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
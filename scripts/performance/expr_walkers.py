@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark the throughput of the expression walkers.
+
+This times the principal StreamBasedExpressionVisitor-based walkers
+(the linear, quadratic, and AMPL repn visitors, the FBBT bounds visitor,
+identify_variables, and symbolic / numeric differentiation) on a fixed
+corpus of generated expressions.  Results are reported as a table and
+(optionally) saved as JSON.  Passing a previously saved JSON file with
+--baseline compares the run against that baseline and exits with a
+nonzero status if any walker is slower than the baseline by more than
+--threshold.
+
+Examples:
+
+    # record a baseline
+    python expr_walkers.py -o baseline.json
+    # ... change the walkers ...
+    python expr_walkers.py --baseline baseline.json
+
+"""
+
+import argparse
+import gc
+import math
+import platform
+import random
+import sys
+import time
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+import pyomo.environ as pyo
+from pyomo.contrib.fbbt.fbbt import compute_bounds_on_expr
+from pyomo.core.expr.calculus.diff_with_pyomo import reverse_ad, reverse_sd
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.quadratic import QuadraticRepnVisitor
+from pyomo.repn.plugins import nl_writer
+from pyomo.version import version as pyomo_version
+
+# Bump this whenever the corpus or the walker drivers change: results
+# generated with different versions are not comparable
+BENCHMARK_VERSION = 1
+
+#
+# Expression corpus
+#
+
+
+def _model(n):
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var(range(n), bounds=(1, 2), initialize=1.5)
+    m.y = pyo.Var(range(n), bounds=(1, 2), initialize=1.25)
+    m.p = pyo.Param(range(n), initialize=lambda m, i: 1 + i % 7, mutable=True)
+    return m
+
+
+def deep_sum(n):
+    """Deeply nested (non-flattened) sums of products"""
+    m = _model(n)
+    exprs = []
+    depth = 100
+    for j in range(0, n, depth):
+        e = m.x[j]
+        for i in range(j + 1, min(j + depth, n)):
+            e = m.x[i] + 2 * (e + m.p[i] * m.y[i])
+        exprs.append(e)
+    return m, exprs
+
+
+def large_sum(n):
+    """A single large sum of monomials (and mutable coefficients)"""
+    m = _model(n)
+    return m, [sum(m.p[i] * m.x[i] + 3 * m.y[i] for i in range(n))]
+
+
+def linear_expression(n):
+    """Large LinearExpression objects with native coefficients"""
+    m = _model(n)
+    rng = random.Random(0)
+    exprs = []
+    for j in range(10):
+        exprs.append(
+            LinearExpression(
+                constant=j,
+                linear_coefs=[rng.uniform(-1, 1) for i in range(n)],
+                linear_vars=[m.x[i] for i in range(n)],
+            )
+        )
+    return m, exprs
+
+
+def bilinear(n):
+    """Bilinear and square terms (the quadratic visitor's bread and butter)"""
+    m = _model(n)
+    exprs = [
+        sum(m.x[i] * m.y[i] + m.x[i] * m.x[(i + 1) % n] for i in range(n)),
+        sum(m.p[i] * m.x[i] ** 2 - m.y[i] * m.y[i] for i in range(n)),
+    ]
+    return m, exprs
+
+
+def exp_log(n):
+    """Many short nested exp/log/trig expressions"""
+    m = _model(n)
+    exprs = [
+        pyo.exp(pyo.log(m.x[i] + 1) * m.y[i])
+        + pyo.log(1 + pyo.exp(-m.x[i] * m.p[i]))
+        - pyo.sin(m.y[i]) / m.x[i]
+        for i in range(n)
+    ]
+    return m, exprs
+
+
+CORPUS = {
+    'deep_sum': deep_sum,
+    'large_sum': large_sum,
+    'linear_expression': linear_expression,
+    'bilinear': bilinear,
+    'exp_log': exp_log,
+}
+
+#
+# Walker drivers.  Each driver returns a function that walks a list of
+# expressions.  The drivers create a new visitor for each call (just as
+# the writers create one visitor for each model)
+#
+
+
+def linear_walker():
+    def walk(exprs):
+        visitor = LinearRepnVisitor({}, {}, {}, None)
+        for e in exprs:
+            visitor.walk_expression(e)
+
+    return walk
+
+
+def quadratic_walker():
+    def walk(exprs):
+        visitor = QuadraticRepnVisitor({}, {}, {}, None)
+        for e in exprs:
+            visitor.walk_expression(e)
+
+    return walk
+
+
+def ampl_walker():
+    def walk(exprs):
+        visitor = nl_writer.AMPLRepnVisitor(
+            nl_writer.text_nl_template, {}, [], {}, {}, set(), False, True, None
+        )
+        # AMPLRepn objects look up the template on the active visitor
+        nl_writer.AMPLRepn.ActiveVisitor = visitor
+        try:
+            for e in exprs:
+                visitor.walk_expression((e, None, None, 1))
+        finally:
+            nl_writer.AMPLRepn.ActiveVisitor = None
+
+    return walk
+
+
+def fbbt_walker():
+    def walk(exprs):
+        for e in exprs:
+            compute_bounds_on_expr(e)
+
+    return walk
+
+
+def identify_variables_walker():
+    def walk(exprs):
+        for e in exprs:
+            for v in identify_variables(e):
+                pass
+
+    return walk
+
+
+def reverse_ad_walker():
+    def walk(exprs):
+        for e in exprs:
+            reverse_ad(e)
+
+    return walk
+
+
+def reverse_sd_walker():
+    def walk(exprs):
+        for e in exprs:
+            reverse_sd(e)
+
+    return walk
+
+
+WALKERS = {
+    'linear': linear_walker,
+    'quadratic': quadratic_walker,
+    'ampl': ampl_walker,
+    'fbbt': fbbt_walker,
+    'identify_variables': identify_variables_walker,
+    'reverse_ad': reverse_ad_walker,
+    'reverse_sd': reverse_sd_walker,
+}
+
+
+def calibrate(repeat):
+    """Time a fixed pure-Python workload
+
+    This is used to (roughly) normalize timings collected on different
+    machines (see --normalize).
+
+    """
+    best = None
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        d = {}
+        for i in range(200000):
+            d[i % 1000] = d.get(i % 1000, 0) + math.sqrt(i)
+        toc = time.perf_counter() - tic
+        if best is None or toc < best:
+            best = toc
+    return best
+
+
+def run(corpus, walkers, size, repeat):
+    results = {}
+    for c_name in corpus:
+        m, exprs = CORPUS[c_name](size)
+        for w_name in walkers:
+            walk = WALKERS[w_name]()
+            times = []
+            for _ in range(repeat):
+                gc.collect()
+                tic = time.perf_counter()
+                walk(exprs)
+                times.append(time.perf_counter() - tic)
+            results[f'{c_name}/{w_name}'] = {
+                'min': min(times),
+                'mean': sum(times) / len(times),
+                'times': times,
+            }
+            print(f"{c_name + '/' + w_name:40} {min(times):10.4f}", flush=True)
+        del m, exprs
+    return results
+
+
+def compare(base, test, threshold, normalize):
+    """Compare two result sets; return the list of regressed benchmarks"""
+    scale = 1
+    if normalize:
+        scale = base['calibration'] / test['calibration']
+    if base['size'] != test['size'] or base['version'] != test['version']:
+        print(
+            "WARNING: baseline was generated with a different benchmark "
+            "version or corpus size; results are not comparable"
+        )
+    regressions = []
+    print()
+    print(f"{'benchmark':40} {'base (s)':>10} {'test (s)':>10} {'change':>8}")
+    for name, data in test['results'].items():
+        if name not in base['results']:
+            print(f"{name:40} {'--':>10} {data['min']:10.4f} {'--':>8}")
+            continue
+        b = base['results'][name]['min']
+        t = data['min'] * scale
+        change = (t - b) / b
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:40} {b:10.4f} {t:10.4f} {100 * change:7.1f}%{flag}")
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        '-n', '--size', type=int, default=5000, help='Corpus size (default: 5000)'
+    )
+    parser.add_argument(
+        '-r',
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of times to time each benchmark (default: 5)',
+    )
+    parser.add_argument(
+        '-c',
+        '--corpus',
+        action='append',
+        choices=list(CORPUS),
+        help='Corpus entries to run (default: all)',
+    )
+    parser.add_argument(
+        '-w',
+        '--walker',
+        action='append',
+        choices=list(WALKERS),
+        help='Walkers to run (default: all)',
+    )
+    parser.add_argument(
+        '-o', '--output', default=None, help='Store the results (as JSON) in OUTPUT'
+    )
+    parser.add_argument(
+        '-b', '--baseline', default=None, help='Compare against a stored baseline'
+    )
+    parser.add_argument(
+        '-t',
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Relative slowdown (vs. the baseline) that is reported as '
+        'a regression (default: 0.1)',
+    )
+    parser.add_argument(
+        '--normalize',
+        action='store_true',
+        help='Scale the timings by the ratio of the calibration times '
+        '(when comparing runs from different machines)',
+    )
+    options = parser.parse_args(argv[1:])
+
+    data = {
+        'version': BENCHMARK_VERSION,
+        'time': time.time(),
+        'python_implementation': platform.python_implementation(),
+        'python_version': tuple(sys.version_info),
+        'platform': platform.system(),
+        'hostname': platform.node(),
+        'pyomo': pyomo_version,
+        'size': options.size,
+        'calibration': calibrate(options.repeat),
+        'results': run(
+            options.corpus or list(CORPUS),
+            options.walker or list(WALKERS),
+            options.size,
+            options.repeat,
+        ),
+    }
+
+    if options.output:
+        print(f"Writing results to {options.output}")
+        with open(options.output, 'w') as OUT:
+            json.dump(data, OUT, indent=2)
+
+    if options.baseline:
+        with open(options.baseline, 'r') as IN:
+            base = json.load(IN)
+        regressions = compare(base, data, options.threshold, options.normalize)
+        if regressions:
+            print(
+                "\n%s benchmark(s) regressed by more than %.0f%%:\n    %s"
+                % (
+                    len(regressions),
+                    100 * options.threshold,
+                    "\n    ".join(regressions),
+                )
+            )
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
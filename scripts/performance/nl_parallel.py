@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark the parallel (sharded) constraint compilation in the NL writer.
+
+For each worker count, this reports the time to generate the NL file,
+the speedup relative to the serial writer, and verifies that the
+generated file is identical to the file generated by the serial writer.
+
+"""
+
+import argparse
+import io
+import os
+import time
+
+import pyomo.environ as pyo
+from pyomo.repn.plugins.nl_writer import NLWriter
+
+
+def build_model(n):
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.x = pyo.Var(m.I, bounds=(0, 10), initialize=1)
+    m.y = pyo.Var(m.I, initialize=0.5)
+    m.nonlinear = pyo.Constraint(
+        m.I,
+        rule=lambda m, i: m.x[i] ** 2
+        + pyo.exp(m.y[i]) * m.x[i]
+        + pyo.sin(m.y[i] + m.x[i])
+        <= 10 + i,
+    )
+    m.linear = pyo.Constraint(
+        m.I, rule=lambda m, i: m.x[i] + 2 * m.y[i % n + 1] - 3 * m.y[i] == i
+    )
+    m.obj = pyo.Objective(expr=sum(m.x.values()))
+    return m
+
+
+def time_write(m, workers, repeat):
+    best = None
+    for _ in range(repeat):
+        OUT = io.StringIO()
+        tic = time.perf_counter()
+        NLWriter().write(m, OUT, parallel_workers=workers, linear_presolve=False)
+        toc = time.perf_counter() - tic
+        if best is None or toc < best:
+            best = toc
+    return best, OUT.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--rows', type=int, default=100000)
+    parser.add_argument('-w', '--workers', type=int, nargs='+', default=[2, 4, 8])
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    tic = time.perf_counter()
+    m = build_model(args.rows)
+    print(
+        "Built model with %s constraints in %.2f s (%s CPUs available)"
+        % (2 * args.rows, time.perf_counter() - tic, os.cpu_count())
+    )
+
+    serial, baseline = time_write(m, 0, args.repeat)
+    print("%8s %10s %8s %10s" % ('workers', 'time (s)', 'speedup', 'identical'))
+    print("%8s %10.3f %8.2f %10s" % ('serial', serial, 1, True))
+    for n in args.workers:
+        t, nl = time_write(m, n, args.repeat)
+        print("%8d %10.3f %8.2f %10s" % (n, t, serial / t, nl == baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark positional operations on large ordered (time) Sets.
+
+This times the operations that dynamic (pyomo.dae) and rolling-horizon
+models perform on large sorted and insertion-ordered Sets: building
+the set, ord() / at() / next() / prev() lookups, interleaving
+appends (and removals from the front of the set) with lookups, and
+ContinuousSet.find_nearest_index().
+
+"""
+
+import argparse
+import gc
+import random
+import time
+
+import pyomo.environ as pyo
+from pyomo.dae import ContinuousSet
+
+
+def timeit(label, fcn, *args):
+    gc.collect()
+    tic = time.perf_counter()
+    fcn(*args)
+    toc = time.perf_counter() - tic
+    print(f"{label:45} {toc:10.4f}", flush=True)
+    return toc
+
+
+def build(m, name, n, ordered):
+    m.add_component(name, pyo.Set(ordered=ordered))
+    s = m.component(name)
+    s.construct()
+    for i in range(n):
+        s.add(i * 0.5)
+    return s
+
+
+def lookups(s, points):
+    for p in points:
+        i = s.ord(p)
+        s.at(i)
+        if i > 1:
+            s.prev(p)
+        if i < len(s):
+            s.next(p)
+
+
+def rolling_horizon(s, steps):
+    # Append new time points to the end of the horizon (and drop the
+    # oldest points), querying the set after each step
+    t = s.last()
+    for i in range(steps):
+        t += 0.5
+        s.add(t)
+        s.remove(s.first())
+        s.prev(t)
+        s.ord(t)
+
+
+def random_adds(s, points):
+    # Add (interior) points and query the set after each addition
+    for p in points:
+        s.add(p)
+        s.ord(p)
+
+
+def nearest(cs, points):
+    for p in points:
+        cs.find_nearest_index(p)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-n', '--size', type=int, default=1000000, help='Set size (default: 1e6)'
+    )
+    parser.add_argument(
+        '-k',
+        '--queries',
+        type=int,
+        default=10000,
+        help='Number of lookups / updates (default: 1e4)',
+    )
+    args = parser.parse_args()
+    n = args.size
+    rng = random.Random(0)
+    points = [rng.randrange(n) * 0.5 for _ in range(args.queries)]
+
+    m = pyo.ConcreteModel()
+    for ordered in (pyo.Set.SortedOrder, pyo.Set.InsertionOrder):
+        kind = 'sorted' if ordered is pyo.Set.SortedOrder else 'insertion'
+        name = kind + '_' + str(n)
+        timeit(f"{kind}: build (add) {n}", build, m, name, n, ordered)
+        s = m.component(name)
+        timeit(f"{kind}: ord/at/next/prev x{args.queries}", lookups, s, points)
+        timeit(f"{kind}: rolling horizon x1000", rolling_horizon, s, 1000)
+        m.del_component(s)
+
+    s = build(m, 'interior', n, pyo.Set.SortedOrder)
+    new_points = [p + 0.25 for p in points[:1000]]
+    timeit("sorted: interior add + ord x1000", random_adds, s, new_points)
+    m.del_component(s)
+
+    m.t = ContinuousSet(initialize=[i * 0.5 for i in range(n)])
+    targets = [p + 0.1 for p in points]
+    timeit(f"ContinuousSet: find_nearest_index x{args.queries}", nearest, m.t, targets)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark the time and peak memory of the LinearStandardFormCompiler.
+
+This generates a random sparse LP with a fixed number of nonzeros per
+row and reports the time to compile the model to standard form, along
+with the peak memory allocated by the compiler (as reported by
+tracemalloc, which tracks both Python and NumPy allocations).
+
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+import pyomo.environ as pyo
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+
+
+def build_model(n_rows, n_cols, nnz_per_row, seed=0):
+    rng = random.Random(seed)
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var(range(n_cols), bounds=(-10, 10))
+    m.c = pyo.ConstraintList()
+    for i in range(n_rows):
+        cols = rng.sample(range(n_cols), nnz_per_row)
+        body = sum(rng.uniform(-1, 1) * m.x[j] for j in cols)
+        if i % 3:
+            m.c.add(body <= rng.uniform(0, 1))
+        else:
+            m.c.add(pyo.inequality(-1, body, 1))
+    m.obj = pyo.Objective(expr=sum(m.x[j] for j in range(0, n_cols, 7)))
+    return m
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-r', '--rows', type=int, default=100000)
+    parser.add_argument('-c', '--cols', type=int, default=50000)
+    parser.add_argument('-k', '--nnz-per-row', type=int, default=10)
+    parser.add_argument('--slack-form', action='store_true')
+    parser.add_argument('--mixed-form', action='store_true')
+    args = parser.parse_args()
+
+    tic = time.perf_counter()
+    m = build_model(args.rows, args.cols, args.nnz_per_row)
+    print(
+        "Built model (%s rows, %s columns, %s nonzeros) in %.2f s"
+        % (
+            args.rows,
+            args.cols,
+            args.rows * args.nnz_per_row,
+            time.perf_counter() - tic,
+        )
+    )
+    options = {'slack_form': args.slack_form, 'mixed_form': args.mixed_form}
+
+    gc.collect()
+    tic = time.perf_counter()
+    LinearStandardFormCompiler().write(m, **options)
+    print("Compile time: %.2f s" % (time.perf_counter() - tic,))
+
+    gc.collect()
+    tracemalloc.start()
+    repn = LinearStandardFormCompiler().write(m, **options)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("Peak memory:  %.1f MB" % (peak / 2**20,))
+    print("Result size:  %.1f MB" % (current / 2**20,))
+    print("A: %s, %s nonzeros" % (repn.A.shape, repn.A.nnz))
+
+
+if __name__ == '__main__':
+    main()